@@ -0,0 +1,580 @@
+#!/usr/bin/env python3
+"""
+ASR Archive - Append-only ASR archive with a sidecar offset index
+Keeps report_id -> (byte offset, length) for asr_archive.jsonl in asr_archive.jsonl.idx so a
+status lookup is one seek and one parse; the index is rebuilt from the JSONL with mmap if lost.
+Each time period is sealed into a gzip segment listed in asr_archive.manifest.json with its time
+range and report IDs, so range queries and exports only decompress the segments they overlap
+"""
+
+import os
+import gzip
+import json
+import mmap
+import atexit
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple, Iterator, Union
+
+from jsonl_sink import JSONLSink
+
+# Archive entries are written as {"asr": {"report_id": ..., so the ID can be read without parsing the line
+REPORT_ID_PREFIX = b'{"asr": {"report_id": "'
+ARCHIVED_AT_KEY = b'"archived_at": "'
+
+# Segment period -> strftime key of archived_at
+SEGMENT_PERIODS = {'hour': '%Y%m%d%H', 'day': '%Y%m%d', 'week': '%GW%V'}
+
+TimeBound = Union[datetime, str, float, None]
+
+
+def _epoch(value: TimeBound) -> Optional[float]:
+    """Epoch seconds of a datetime, ISO timestamp or number"""
+    if value is None or isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return value.timestamp()
+
+
+class ASRArchive:
+    """JSONL archive of ASR entries with an offset index kept current as batches are flushed
+
+    Offsets point into the active file, which the archive seals into a compressed segment
+    instead of letting the sink rotate it. segment_period (hour, day, week or None) and
+    segment_max_bytes decide when the active file is sealed; sealed segments are written as
+    gzip members of block_lines lines so a lookup decompresses a single block.
+    """
+
+    def __init__(self, path: str = 'asr_archive.jsonl', index_path: Optional[str] = None,
+                 segment_period: Optional[str] = 'day', segment_max_bytes: Optional[int] = None,
+                 block_lines: int = 256, compress_level: int = 6, **sink_options):
+        if segment_period is not None and segment_period not in SEGMENT_PERIODS:
+            raise ValueError(f"Unknown segment period: {segment_period} (expected one of {', '.join(SEGMENT_PERIODS)})")
+
+        self.path = path
+        self.index_path = index_path or f"{path}.idx"
+        self.segment_period = segment_period
+        self.segment_max_bytes = segment_max_bytes
+        self.block_lines = block_lines
+        self.compress_level = compress_level
+        self.logger = logging.getLogger('asr_archive')
+
+        root = path[:-len('.jsonl')] if path.endswith('.jsonl') else path
+        self.manifest_path = f"{root}.manifest.json"
+        self.segments_dir = f"{root}.segments"
+
+        self.offsets: Dict[str, Tuple[int, int]] = {}
+        self.indexed_bytes = 0
+        self.lock = threading.RLock()
+        self._index_file = None
+
+        # Sealed segments and report_id -> (segment number, line number)
+        self.segments: List[Dict[str, Any]] = []
+        self.sealed: Dict[str, Tuple[int, int]] = {}
+        self.active_period: Optional[str] = None
+        self.active_entries = 0
+        self.append_lock = threading.RLock()
+
+        # Metrics
+        self.lookups = 0
+        self.rebuilds = 0
+        self.seals = 0
+
+        self.load_manifest()
+        self.load_index()
+        self.active_entries = len(self.offsets)
+        self.active_period = self._period(self._first_archived_at())
+
+        sink_options.pop('rotate_max_bytes', None)
+        sink_options.pop('rotate_daily', None)
+        self.sink = JSONLSink(path, on_flush=self._index_batch, **sink_options)
+
+    def append(self, entry: Dict[str, Any]):
+        """Buffer an archive entry, sealing the active file first if the entry starts a new segment;
+        it is indexed when its batch reaches disk"""
+        period = self._period(entry.get('archived_at'))
+        with self.append_lock:
+            if self.active_entries and (period != self.active_period or self._active_full()):
+                self.seal()
+            self.active_period = period
+            self.active_entries += 1
+            self.sink.write(entry)
+
+    def _period(self, archived_at: Optional[str]) -> Optional[str]:
+        if self.segment_period is None or not archived_at:
+            return None
+        try:
+            return datetime.fromisoformat(archived_at.replace('Z', '+00:00')).strftime(SEGMENT_PERIODS[self.segment_period])
+        except ValueError:
+            return None
+
+    def _active_full(self) -> bool:
+        return self.segment_max_bytes is not None and self.indexed_bytes >= self.segment_max_bytes
+
+    def get(self, report_id: str) -> Optional[Dict[str, Any]]:
+        """Read the archive entry for a report, or None if it was never archived"""
+        self.lookups += 1
+        location = self.offsets.get(report_id)
+        if location is None:
+            entry = self._get_sealed(report_id)
+            if entry is not None:
+                return entry
+
+            # The entry may still be buffered, or written by another process
+            self.sink.flush()
+            self.catch_up()
+            location = self.offsets.get(report_id)
+            if location is None:
+                return None
+
+        entry = self._read(*location)
+        if entry is None or entry.get('asr', {}).get('report_id') != report_id:
+            # The active file may have been sealed since the offset was read
+            entry = self._get_sealed(report_id)
+            if entry is not None:
+                return entry
+
+            self.logger.warning(f"Stale archive index entry for {report_id}, rebuilding")
+            self.rebuild_index()
+            location = self.offsets.get(report_id)
+            entry = self._read(*location) if location else None
+        return entry
+
+    def _get_sealed(self, report_id: str) -> Optional[Dict[str, Any]]:
+        """Read a report from its sealed segment, decompressing only the block that holds it"""
+        with self.lock:
+            placed = self.sealed.get(report_id)
+            if placed is None:
+                return None
+            segment = self.segments[placed[0]]
+
+        block, line = divmod(placed[1], segment['block_lines'])
+        offset, length = segment['blocks'][block]
+        try:
+            with open(os.path.join(self.segments_dir, segment['file']), 'rb') as f:
+                f.seek(offset)
+                lines = gzip.decompress(f.read(length)).split(b'\n')
+            return json.loads(lines[line])
+        except (OSError, ValueError, IndexError) as e:
+            self.logger.error(f"Error reading {report_id} from segment {segment['file']}: {e}")
+            return None
+
+    def _read(self, offset: int, length: int) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(offset)
+                return json.loads(f.read(length))
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _index_batch(self, placed: List[Tuple[Dict[str, Any], int, int]]):
+        """Index a flushed batch and append it to the sidecar"""
+        with self.lock:
+            if placed[0][1] > self.indexed_bytes:
+                # Lines were written that this index has not seen
+                self.catch_up(placed[0][1])
+
+            # A concurrent catch-up may already have indexed part of the batch
+            self._add([(entry['asr']['report_id'], offset, length) for entry, offset, length in placed
+                       if offset >= self.indexed_bytes])
+
+    def _add(self, located: List[Tuple[str, int, int]]):
+        if not located:
+            return
+        for report_id, offset, length in located:
+            self.offsets.setdefault(report_id, (offset, length))
+        self.indexed_bytes = located[-1][1] + located[-1][2]
+
+        if self._index_file is None:
+            self._index_file = open(self.index_path, 'a')
+        self._index_file.write(''.join(f"{report_id}\t{offset}\t{length}\n" for report_id, offset, length in located))
+        self._index_file.flush()
+
+    def load_index(self):
+        """Load the sidecar index, then rebuild or extend it to match the archive"""
+        with self.lock:
+            self.offsets = {}
+            self.indexed_bytes = 0
+            try:
+                with open(self.index_path, 'r') as f:
+                    for line in f:
+                        parts = line.rstrip('\n').split('\t')
+                        if len(parts) != 3:
+                            break
+                        report_id, offset, length = parts[0], int(parts[1]), int(parts[2])
+                        self.offsets.setdefault(report_id, (offset, length))
+                        self.indexed_bytes = max(self.indexed_bytes, offset + length)
+            except FileNotFoundError:
+                self.indexed_bytes = -1
+            except ValueError:
+                self.indexed_bytes = -1
+
+            size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+            if size == 0:
+                if self.offsets:
+                    open(self.index_path, 'w').close()
+                self.offsets = {}
+                self.indexed_bytes = 0
+            elif self.indexed_bytes < 0 or self.indexed_bytes > size or not self._ends_line(self.indexed_bytes):
+                # Missing, unreadable or stale sidecar
+                self.rebuild_index()
+            elif self.indexed_bytes < size:
+                self.catch_up()
+
+    def _ends_line(self, position: int) -> bool:
+        """Whether position is the start of a line in the archive"""
+        if position == 0:
+            return True
+        with open(self.path, 'rb') as f:
+            f.seek(position - 1)
+            return f.read(1) == b'\n'
+
+    def rebuild_index(self):
+        """Rebuild the sidecar index from the archive with a memory-mapped scan"""
+        with self.lock:
+            self.rebuilds += 1
+            if self._index_file is not None:
+                self._index_file.close()
+                self._index_file = None
+
+            self.offsets = {}
+            self.indexed_bytes = 0
+            located = self._scan(0)
+
+            temp_path = f"{self.index_path}.tmp"
+            with open(temp_path, 'w') as f:
+                f.write(''.join(f"{report_id}\t{offset}\t{length}\n" for report_id, offset, length in located))
+            os.replace(temp_path, self.index_path)
+
+            for report_id, offset, length in located:
+                self.offsets.setdefault(report_id, (offset, length))
+            if located:
+                self.indexed_bytes = located[-1][1] + located[-1][2]
+            self.logger.info(f"Rebuilt archive index: {len(self.offsets)} reports")
+
+    def catch_up(self, end: Optional[int] = None):
+        """Index complete lines written past the indexed end of the archive"""
+        with self.lock:
+            self._add(self._scan(self.indexed_bytes, end))
+
+    def _scan(self, start: int, end: Optional[int] = None) -> List[Tuple[str, int, int]]:
+        """Locate every complete archive line between start and end"""
+        try:
+            f = open(self.path, 'rb')
+        except FileNotFoundError:
+            return []
+
+        located = []
+        with f:
+            size = os.fstat(f.fileno()).st_size
+            end = size if end is None else min(end, size)
+            if end <= start:
+                return []
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                position = start
+                while position < end:
+                    line_end = mm.find(b'\n', position, end)
+                    if line_end == -1:
+                        break   # partial line still being written
+                    report_id = self._report_id(mm, position, line_end)
+                    if report_id is not None:
+                        located.append((report_id, position, line_end + 1 - position))
+                    position = line_end + 1
+
+        return located
+
+    @staticmethod
+    def _report_id(mm: mmap.mmap, start: int, end: int) -> Optional[str]:
+        id_start = start + len(REPORT_ID_PREFIX)
+        if mm[start:id_start] == REPORT_ID_PREFIX:
+            id_end = mm.find(b'"', id_start, end)
+            if id_end != -1 and mm[id_end + 1:id_end + 2] == b',' and b'\\' not in mm[id_start:id_end]:
+                return mm[id_start:id_end].decode()
+
+        # Unusual layout or escaped characters: parse the line
+        try:
+            return json.loads(mm[start:end])['asr']['report_id']
+        except (ValueError, KeyError, TypeError):
+            return None
+
+    def _first_archived_at(self) -> Optional[str]:
+        try:
+            with open(self.path, 'rb') as f:
+                return self._archived_at(f.readline())
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def _archived_at(line: bytes) -> Optional[str]:
+        # archived_at follows the report, so search from the end of the line
+        start = line.rfind(ARCHIVED_AT_KEY)
+        if start != -1:
+            start += len(ARCHIVED_AT_KEY)
+            end = line.find(b'"', start)
+            if end != -1:
+                return line[start:end].decode()
+
+        try:
+            return json.loads(line)['archived_at']
+        except (ValueError, KeyError, TypeError):
+            return None
+
+    def load_manifest(self):
+        """Load the segment manifest and finish a seal that was interrupted"""
+        with self.lock:
+            try:
+                with open(self.manifest_path, 'r') as f:
+                    self.segments = json.load(f)['segments']
+            except FileNotFoundError:
+                self.segments = []
+            except (ValueError, KeyError) as e:
+                self.logger.error(f"Unreadable archive manifest {self.manifest_path}: {e}")
+                self.segments = []
+
+            self.sealed = {}
+            for number, segment in enumerate(self.segments):
+                for line, report_id in enumerate(segment['report_ids']):
+                    self.sealed.setdefault(report_id, (number, line))
+
+            sealing = f"{self.path}.sealing"
+            if os.path.exists(sealing):
+                with open(sealing, 'rb') as f:
+                    first = f.readline()
+                report_id = self._report_id(first, 0, len(first) - 1) if first.endswith(b'\n') else None
+                if report_id is not None and report_id not in self.sealed:
+                    self._seal_file(sealing, self._period(self._archived_at(first)))
+                else:
+                    os.remove(sealing)
+
+    def _save_manifest(self):
+        temp_path = f"{self.manifest_path}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump({'segments': self.segments}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.manifest_path)
+
+    def seal(self) -> Optional[Dict[str, Any]]:
+        """Compress the active file into a segment and start a new active file
+
+        Returns the segment's manifest entry, or None if the active file was empty.
+        """
+        with self.append_lock:
+            self.sink.release()
+            if not os.path.exists(self.path) or os.path.getsize(self.path) == 0:
+                return None
+
+            with self.lock:
+                # Lookups wait for the segment rather than miss the moved reports
+                sealing = f"{self.path}.sealing"
+                os.replace(self.path, sealing)
+                if self._index_file is not None:
+                    self._index_file.close()
+                    self._index_file = None
+                open(self.index_path, 'w').close()
+                self.offsets = {}
+                self.indexed_bytes = 0
+
+                segment = self._seal_file(sealing, self.active_period)
+                self.active_entries = 0
+                self.active_period = None
+                return segment
+
+    def _seal_file(self, source_path: str, period: Optional[str]) -> Dict[str, Any]:
+        os.makedirs(self.segments_dir, exist_ok=True)
+        base = os.path.basename(self.manifest_path)[:-len('.manifest.json')]
+        stem = f"{base}.{period or datetime.now().strftime('%Y%m%d-%H%M%S')}"
+        name = f"{stem}.jsonl.gz"
+        counter = 1
+        while os.path.exists(os.path.join(self.segments_dir, name)):
+            name = f"{stem}-{counter}.jsonl.gz"
+            counter += 1
+
+        report_ids = []
+        blocks = []
+        first_epoch = last_epoch = None
+        first_at = last_at = None
+        raw_bytes = 0
+        temp_path = os.path.join(self.segments_dir, f"{name}.tmp")
+        with open(source_path, 'rb') as source, open(temp_path, 'wb') as out:
+            block = []
+
+            def write_block():
+                data = gzip.compress(b''.join(block), self.compress_level)
+                blocks.append([out.tell(), len(data)])
+                out.write(data)
+                block.clear()
+
+            for line in source:
+                if not line.endswith(b'\n'):
+                    break   # partial line left by a crash
+                report_id = self._report_id(line, 0, len(line) - 1)
+                if report_id is None:
+                    continue
+
+                archived_at = self._archived_at(line)
+                try:
+                    epoch = _epoch(archived_at)
+                except (ValueError, TypeError):
+                    epoch = None
+                if epoch is not None:
+                    if first_epoch is None or epoch < first_epoch:
+                        first_epoch, first_at = epoch, archived_at
+                    if last_epoch is None or epoch > last_epoch:
+                        last_epoch, last_at = epoch, archived_at
+
+                report_ids.append(report_id)
+                raw_bytes += len(line)
+                block.append(line)
+                if len(block) == self.block_lines:
+                    write_block()
+            if block:
+                write_block()
+
+            out.flush()
+            os.fsync(out.fileno())
+            compressed_bytes = out.tell()
+        os.replace(temp_path, os.path.join(self.segments_dir, name))
+
+        segment = {
+            'file': name,
+            'period': period,
+            'start': first_at,
+            'end': last_at,
+            'start_epoch': first_epoch,
+            'end_epoch': last_epoch,
+            'reports': len(report_ids),
+            'raw_bytes': raw_bytes,
+            'compressed_bytes': compressed_bytes,
+            'block_lines': self.block_lines,
+            'blocks': blocks,
+            'report_ids': report_ids
+        }
+
+        with self.lock:
+            number = len(self.segments)
+            self.segments.append(segment)
+            for line, report_id in enumerate(report_ids):
+                self.sealed.setdefault(report_id, (number, line))
+            self._save_manifest()
+        os.remove(source_path)
+
+        self.seals += 1
+        self.logger.info(f"Sealed {len(report_ids)} reports into {name} "
+                         f"({raw_bytes} -> {compressed_bytes} bytes)")
+        return segment
+
+    def query(self, start: TimeBound = None, end: TimeBound = None) -> Iterator[Dict[str, Any]]:
+        """Stream archive entries archived in [start, end), reading only overlapping segments"""
+        for line in self._lines_between(start, end):
+            yield json.loads(line)
+
+    def export(self, out_path: str, start: TimeBound = None, end: TimeBound = None) -> int:
+        """Stream entries archived in [start, end) to a JSONL file (gzip if it ends in .gz); returns the count"""
+        count = 0
+        opener = gzip.open if out_path.endswith('.gz') else open
+        with opener(out_path, 'wb') as out:
+            for line in self._lines_between(start, end):
+                out.write(line)
+                count += 1
+        return count
+
+    def _lines_between(self, start: TimeBound, end: TimeBound) -> Iterator[bytes]:
+        start_epoch, end_epoch = _epoch(start), _epoch(end)
+
+        with self.lock:
+            segments = list(self.segments)
+        for segment in segments:
+            if segment['start_epoch'] is None:
+                continue
+            if start_epoch is not None and segment['end_epoch'] < start_epoch:
+                continue
+            if end_epoch is not None and segment['start_epoch'] >= end_epoch:
+                continue
+            with gzip.open(os.path.join(self.segments_dir, segment['file']), 'rb') as f:
+                yield from self._filter_lines(f, start_epoch, end_epoch)
+
+        self.sink.flush()
+        try:
+            f = open(self.path, 'rb')
+        except FileNotFoundError:
+            return
+        with f:
+            yield from self._filter_lines(f, start_epoch, end_epoch)
+
+    def _filter_lines(self, lines, start_epoch: Optional[float], end_epoch: Optional[float]) -> Iterator[bytes]:
+        for line in lines:
+            if not line.endswith(b'\n'):
+                break
+            try:
+                epoch = _epoch(self._archived_at(line))
+            except (ValueError, TypeError):
+                continue
+            if epoch is None:
+                continue
+            if (start_epoch is None or epoch >= start_epoch) and (end_epoch is None or epoch < end_epoch):
+                yield line
+
+    def flush(self):
+        """Write buffered entries and index them"""
+        self.sink.flush()
+
+    def close(self):
+        """Flush and close the archive and its index"""
+        self.sink.close()
+        with self.lock:
+            if self._index_file is not None:
+                self._index_file.close()
+                self._index_file = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get archive and index statistics"""
+        return {
+            'path': self.path,
+            'index_path': self.index_path,
+            'indexed_reports': len(self.offsets),
+            'indexed_bytes': self.indexed_bytes,
+            'lookups': self.lookups,
+            'rebuilds': self.rebuilds,
+            'segments': len(self.segments),
+            'sealed_reports': len(self.sealed),
+            'segment_raw_bytes': sum(segment['raw_bytes'] for segment in self.segments),
+            'segment_compressed_bytes': sum(segment['compressed_bytes'] for segment in self.segments),
+            'seals': self.seals,
+            'sink': self.sink.get_stats()
+        }
+
+
+# Shared archives, one per file
+_archives: Dict[str, ASRArchive] = {}
+_archives_lock = threading.Lock()
+
+
+def get_archive(path: str = 'asr_archive.jsonl', **options) -> ASRArchive:
+    """Get the shared archive for a file, creating it with options on first use"""
+    key = os.path.abspath(path)
+    with _archives_lock:
+        archive = _archives.get(key)
+        if archive is None or archive.sink._closed:
+            archive = ASRArchive(path, **options)
+            _archives[key] = archive
+        return archive
+
+
+def close_all_archives():
+    """Flush and close every shared archive"""
+    with _archives_lock:
+        archives = list(_archives.values())
+        _archives.clear()
+
+    for archive in archives:
+        try:
+            archive.close()
+        except Exception as e:
+            logging.getLogger('asr_archive').error(f"Error closing archive {archive.path}: {e}")
+
+
+atexit.register(close_all_archives)
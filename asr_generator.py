@@ -11,7 +11,7 @@ import uuid
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Iterator
 from dataclasses import dataclass, asdict
 from dataclasses_json import dataclass_json
 import threading
@@ -20,9 +20,11 @@ import os
 import base64
 
 # Import DREDD components
-from dredd_dispatch import DREDDDispatcher
-from ticket_generator import SovereignDataTicketingSystem
-from chronicle_linker import ChronicleLinker
+from dredd_dispatch import DREDDDispatcher, get_dredd_dispatcher
+from ticket_generator import SovereignDataTicketingSystem, get_dts
+from chronicle_linker import ChronicleLinker, get_chronicle_linker
+from asr_archive import get_archive
+from asr_worker_pool import ASRWorkerPool
 
 @dataclass_json
 @dataclass
@@ -53,18 +55,80 @@ class ASRTrigger:
     trigger_data: Dict[str, Any]
 
 class ASRGenerator:
-    def __init__(self, config_file: str = "asr_config.json"):
+    def __init__(self, config_file: str = "asr_config.json", dredd_dispatcher: Optional[DREDDDispatcher] = None,
+                 ticket_system: Optional[SovereignDataTicketingSystem] = None,
+                 chronicle_linker: Optional[ChronicleLinker] = None):
         self.config = self.load_config(config_file)
-        self.dredd_dispatcher = DREDDDispatcher()
-        self.ticket_system = SovereignDataTicketingSystem()
-        self.chronicle_linker = ChronicleLinker()
+        self.processing_mode = self.config.get('processing', {}).get('mode', 'thread')
         self.logger = logging.getLogger('asr_generator')
         self.active_sessions = {}
-        self.asr_queue = queue.Queue()
         self.running = False
-        
-        # Start processing
-        self.start_processing()
+        self.stop_event = threading.Event()
+        
+        # Bounded, prioritized trigger queue served by the worker pool
+        pool_config = self.config.get('worker_pool', {})
+        self.worker_pool = ASRWorkerPool(
+            self,
+            workers=pool_config.get('workers', 4),
+            queue_size=pool_config.get('queue_size', 1000),
+            full_policy=pool_config.get('full_policy', 'block'),
+            put_timeout=pool_config.get('put_timeout', 5.0),
+            priorities=pool_config.get('priorities', {'manual_trigger': 0, 'post_orchestration': 0}),
+            deliver=self.config['dredd_integration'].get('auto_deliver', True)
+        )
+        
+        # Collaborators are injected or resolved on first use; processing threads start with the first trigger
+        self._dredd_dispatcher = dredd_dispatcher
+        self._ticket_system = ticket_system
+        self._chronicle_linker = chronicle_linker
+        self._archive = None
+        self.ticket_system_wired = False
+        self.dependency_lock = threading.RLock()
+        self.processing_started = False
+        
+    @property
+    def dredd_dispatcher(self) -> DREDDDispatcher:
+        """DREDD dispatcher used for delivery (the shared one unless injected)"""
+        if self._dredd_dispatcher is None:
+            with self.dependency_lock:
+                if self._dredd_dispatcher is None:
+                    self._dredd_dispatcher = get_dredd_dispatcher()
+        return self._dredd_dispatcher
+        
+    @property
+    def chronicle_linker(self) -> ChronicleLinker:
+        """Chronicle linker used for observational matches (the shared one unless injected)"""
+        if self._chronicle_linker is None:
+            with self.dependency_lock:
+                if self._chronicle_linker is None:
+                    if self.processing_mode == 'thread':
+                        self._chronicle_linker = get_chronicle_linker()
+                    else:
+                        self._chronicle_linker = ChronicleLinker(mode=self.processing_mode)
+        return self._chronicle_linker
+        
+    @property
+    def ticket_system(self) -> SovereignDataTicketingSystem:
+        """Ticketing system feeding the chronicle linker (the shared one unless injected)"""
+        if not self.ticket_system_wired:
+            with self.dependency_lock:
+                if not self.ticket_system_wired:
+                    if self._ticket_system is None:
+                        if self.processing_mode == 'thread':
+                            self._ticket_system = get_dts()
+                        else:
+                            self._ticket_system = SovereignDataTicketingSystem(mode=self.processing_mode)
+                    self._ticket_system.add_ticket_listener(self.chronicle_linker.observe_ticket)
+                    self.ticket_system_wired = True
+        return self._ticket_system
+        
+    @property
+    def archive(self):
+        """Indexed asr_archive.jsonl with its sealed, compressed segments"""
+        if self._archive is None:
+            self._archive = get_archive('asr_archive.jsonl', **self.config.get('jsonl_sink', {}),
+                                        **self.config.get('archive', {}))
+        return self._archive
         
     def load_config(self, config_file: str) -> Dict[str, Any]:
         """Load ASR configuration"""
@@ -102,12 +166,32 @@ class ASRGenerator:
                     'default_sigil': 'asr-receiver-01',
                     'encryption_level': 'high',
                     'auto_deliver': True,
+                    'stream_threshold_bytes': 262144,  # larger reports are sent as chunked streams
+                    'recipient_timeout': 30,  # per-recipient deadline, retries included
                     'recipients': {
                         'djinn_council': 'glyph-hash-djinn-council',
                         'sovereign_archive': 'glyph-hash-sovereign-archive',
                         'watch_guard': 'glyph-hash-watch-guard'
                     }
                 },
+                'processing': {
+                    'mode': 'thread'
+                },
+                'worker_pool': {
+                    'workers': 4,
+                    'queue_size': 1000,
+                    'full_policy': 'block',  # block, drop or reject
+                    'put_timeout': 5.0,
+                    'priorities': {
+                        'manual_trigger': 0,
+                        'post_orchestration': 0
+                    }
+                },
+                'archive': {
+                    'segment_period': 'day',  # hour, day, week or None
+                    'segment_max_bytes': None,
+                    'block_lines': 256
+                },
                 'report_structure': {
                     'include_entropy_graphs': True,
                     'include_resonance_maps': True,
@@ -116,13 +200,31 @@ class ASRGenerator:
                 }
             }
             
-    def start_processing(self):
-        """Start ASR processing threads"""
+    def ensure_processing(self):
+        """Start the processing threads once, on first use"""
+        if self.processing_started:
+            return
+        with self.dependency_lock:
+            if not self.processing_started:
+                self.start_processing()
+                
+    def submit_trigger(self, trigger: ASRTrigger) -> bool:
+        """Queue a trigger for ASR generation; False when the full queue refused or shed it"""
+        self.ensure_processing()
+        if self.worker_pool.submit(trigger):
+            return True
+            
+        self.logger.warning(f"ASR queue full, trigger not queued: {trigger.trigger_id}")
+        return False
+        
+    def start_processing(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        """Start the ASR worker pool and session monitor"""
+        self.processing_started = True
         self.running = True
+        self.stop_event.clear()
         
-        # Start ASR processor
-        self.asr_processor = threading.Thread(target=self._process_asr_queue, daemon=True)
-        self.asr_processor.start()
+        # Start ASR workers; deliveries run on loop, or on the pool's own loop thread
+        self.worker_pool.start(loop)
         
         # Start session monitor
         self.session_monitor = threading.Thread(target=self._monitor_sessions, daemon=True)
@@ -147,6 +249,7 @@ class ASRGenerator:
             }
             
             self.active_sessions[session_id] = session_data
+            self.ensure_processing()
             
             self.logger.info(f"Session started: {session_id} ({session_type})")
             return True
@@ -180,7 +283,8 @@ class ASRGenerator:
             )
             
             # Add to ASR queue
-            self.asr_queue.put(trigger)
+            if not self.submit_trigger(trigger):
+                return None
             
             self.logger.info(f"Session ended: {session_id}, ASR triggered")
             return trigger.trigger_id
@@ -209,7 +313,8 @@ class ASRGenerator:
             )
             
             # Add to ASR queue
-            self.asr_queue.put(trigger)
+            if not self.submit_trigger(trigger):
+                return None
             
             self.logger.info(f"Job-based ASR triggered: {job_id} ({job_type})")
             return trigger.trigger_id
@@ -238,7 +343,8 @@ class ASRGenerator:
             )
             
             # Add to ASR queue
-            self.asr_queue.put(trigger)
+            if not self.submit_trigger(trigger):
+                return None
             
             self.logger.info(f"Manual ASR triggered for session: {session_id}")
             return trigger.trigger_id
@@ -267,7 +373,8 @@ class ASRGenerator:
             )
             
             # Add to ASR queue
-            self.asr_queue.put(trigger)
+            if not self.submit_trigger(trigger):
+                return None
             
             self.logger.info(f"Post-orchestration ASR triggered: {operation_type}")
             return trigger.trigger_id
@@ -276,31 +383,6 @@ class ASRGenerator:
             self.logger.error(f"Error triggering post-orchestration ASR: {e}")
             return None
             
-    def _process_asr_queue(self):
-        """Process ASR triggers from queue"""
-        while self.running:
-            try:
-                # Get trigger from queue
-                trigger = self.asr_queue.get(timeout=1)
-                
-                # Generate ASR
-                asr = self.generate_asr(trigger)
-                
-                if asr:
-                    # Deliver via DREDD
-                    self.deliver_asr_via_dredd(asr)
-                    
-                    # Archive report
-                    self.archive_asr(asr)
-                    
-                else:
-                    self.logger.error(f"Failed to generate ASR for trigger: {trigger.trigger_id}")
-                    
-            except queue.Empty:
-                continue
-            except Exception as e:
-                self.logger.error(f"Error processing ASR queue: {e}")
-                
     def generate_asr(self, trigger: ASRTrigger) -> Optional[AcclimationSequencingReport]:
         """Generate Acclimation Sequencing Report from trigger"""
         
@@ -308,8 +390,9 @@ class ASRGenerator:
             # Generate report ID
             report_id = f"ASR-{trigger.session_id}-{int(time.time())}"
             
-            # Collect sovereign actions
-            sovereign_actions = self.collect_sovereign_actions(trigger.session_id)
+            # Collect sovereign actions, ticket chronicle and observational matches in one pass
+            session_sections = self.collect_session_sections(trigger.session_id)
+            sovereign_actions = session_sections['sovereign_actions']
             
             # Collect security evolution
             security_evolution = self.collect_security_evolution(trigger.session_id)
@@ -317,14 +400,12 @@ class ASRGenerator:
             # Collect resonance performance
             resonance_performance = self.collect_resonance_performance(trigger.session_id)
             
-            # Collect observational matches
-            observational_matches = self.collect_observational_matches(trigger.session_id)
+            observational_matches = session_sections['observational_matches']
             
             # Calculate entropy stability index
             entropy_stability_index = self.calculate_entropy_stability_index(trigger.session_id)
             
-            # Collect ticket chronicle
-            ticket_chronicle = self.collect_ticket_chronicle(trigger.session_id)
+            ticket_chronicle = session_sections['ticket_chronicle']
             
             # Collect attached glyphs
             attached_glyphs = self.collect_attached_glyphs(trigger.session_id)
@@ -361,29 +442,71 @@ class ASRGenerator:
             self.logger.error(f"Error generating ASR: {e}")
             return None
             
-    def collect_sovereign_actions(self, session_id: str) -> List[Dict[str, Any]]:
-        """Collect sovereign actions for the session"""
+    def collect_session_sections(self, session_id: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Build the ticket-derived ASR sections in one pass over the session's tickets
+        
+        Cost follows the session's ticket and link counts, not the size of the ledger.
+        """
         
         actions = []
+        chronicle = []
+        matches = []
         
-        # Get tickets from ticket system
         if hasattr(self.ticket_system, 'ticket_ledger'):
-            session_tickets = [
-                ticket for ticket in self.ticket_system.ticket_ledger
-                if ticket.session_id == session_id
-            ]
-            
-            for ticket in session_tickets:
-                actions.append({
-                    'ticket_id': ticket.ticket_id,
-                    'action_type': ticket.action_type,
-                    'timestamp': ticket.timestamp,
-                    'interface_context': ticket.interface_context,
-                    'system_impact': ticket.system_impact,
-                    'causal_certainty': ticket.causal_certainty
-                })
-                
-        return actions
+            links_for_ticket = self.chronicle_linker.get_causal_links_for_ticket
+            
+            for ticket in self.ticket_system.ticket_ledger.by_session(session_id):
+                actions.append(self._sovereign_action_entry(ticket))
+                chronicle.append(self._ticket_chronicle_entry(ticket))
+                for link in links_for_ticket(ticket.ticket_id):
+                    matches.append(self._observational_match_entry(link))
+                    
+        return {
+            'sovereign_actions': actions,
+            'ticket_chronicle': chronicle,
+            'observational_matches': matches
+        }
+        
+    @staticmethod
+    def _sovereign_action_entry(ticket) -> Dict[str, Any]:
+        return {
+            'ticket_id': ticket.ticket_id,
+            'action_type': ticket.action_type,
+            'timestamp': ticket.timestamp,
+            'interface_context': ticket.interface_context,
+            'system_impact': ticket.system_impact,
+            'causal_certainty': ticket.causal_certainty
+        }
+        
+    @staticmethod
+    def _ticket_chronicle_entry(ticket) -> Dict[str, Any]:
+        return {
+            'ticket_id': ticket.ticket_id,
+            'action_type': ticket.action_type,
+            'timestamp': ticket.timestamp,
+            'system_impact': ticket.system_impact,
+            'chronicle_status': ticket.chronicle_status,
+            'linked_effects': list(ticket.linked_effects)
+        }
+        
+    @staticmethod
+    def _observational_match_entry(link) -> Dict[str, Any]:
+        return {
+            'match_id': link.link_id,
+            'intent_ticket': link.ticket_id,
+            'effect_event': link.effect_event,
+            'response_time': link.response_time,
+            'causal_certainty': link.causal_certainty,
+            'entropy_similarity': link.entropy_similarity
+        }
+        
+    def collect_sovereign_actions(self, session_id: str) -> List[Dict[str, Any]]:
+        """Collect sovereign actions for the session"""
+        
+        # Get tickets from ticket system
+        if not hasattr(self.ticket_system, 'ticket_ledger'):
+            return []
+        return [self._sovereign_action_entry(ticket) for ticket in self.ticket_system.ticket_ledger.by_session(session_id)]
         
     def collect_security_evolution(self, session_id: str) -> List[Dict[str, Any]]:
         """Collect security evolution data for the session"""
@@ -446,26 +569,12 @@ class ASRGenerator:
     def collect_observational_matches(self, session_id: str) -> List[Dict[str, Any]]:
         """Collect observational matches for the session"""
         
-        matches = []
-        
-        # Get causal matches from chronicle linker
-        if hasattr(self.chronicle_linker, 'causal_links'):
-            session_matches = [
-                match for match in self.chronicle_linker.causal_links
-                if match.intent_ticket.startswith(f"TKT-{session_id}")
-            ]
-            
-            for match in session_matches:
-                matches.append({
-                    'match_id': match.match_id,
-                    'intent_ticket': match.intent_ticket,
-                    'effect_event': match.effect_event,
-                    'response_time': match.response_time,
-                    'causal_certainty': match.causal_certainty,
-                    'entropy_similarity': match.entropy_similarity
-                })
-                
-        return matches
+        # Get causal links for the session's tickets from the chronicle linker
+        return [
+            self._observational_match_entry(link)
+            for ticket in self.ticket_system.ticket_ledger.by_session(session_id)
+            for link in self.chronicle_linker.get_causal_links_for_ticket(ticket.ticket_id)
+        ]
         
     def calculate_entropy_stability_index(self, session_id: str) -> Dict[str, Any]:
         """Calculate entropy stability index for the session"""
@@ -485,26 +594,10 @@ class ASRGenerator:
     def collect_ticket_chronicle(self, session_id: str) -> List[Dict[str, Any]]:
         """Collect ticket chronicle for the session"""
         
-        tickets = []
-        
         # Get tickets from ticket system
-        if hasattr(self.ticket_system, 'ticket_ledger'):
-            session_tickets = [
-                ticket for ticket in self.ticket_system.ticket_ledger
-                if ticket.session_id == session_id
-            ]
-            
-            for ticket in session_tickets:
-                tickets.append({
-                    'ticket_id': ticket.ticket_id,
-                    'action_type': ticket.action_type,
-                    'timestamp': ticket.timestamp,
-                    'system_impact': ticket.system_impact,
-                    'chronicle_status': ticket.chronicle_status,
-                    'linked_effects': ticket.linked_effects
-                })
-                
-        return tickets
+        if not hasattr(self.ticket_system, 'ticket_ledger'):
+            return []
+        return [self._ticket_chronicle_entry(ticket) for ticket in self.ticket_system.ticket_ledger.by_session(session_id)]
         
     def collect_attached_glyphs(self, session_id: str) -> List[Dict[str, Any]]:
         """Collect attached glyphs for the session"""
@@ -562,32 +655,50 @@ class ASRGenerator:
         signature_str = json.dumps(signature_data, sort_keys=True)
         return hashlib.sha256(signature_str.encode()).hexdigest()[:16]
         
-    async def deliver_asr_via_dredd(self, asr: AcclimationSequencingReport):
-        """Deliver ASR via DREDD infrastructure"""
+    def serialize_asr(self, asr: AcclimationSequencingReport) -> bytes:
+        """Serialize an ASR once to the UTF-8 JSON bytes sent over DREDD"""
+        return asr.to_json().encode()
+        
+    async def deliver_asr_via_dredd(self, asr: AcclimationSequencingReport, payload: Optional[bytes] = None):
+        """Deliver ASR via DREDD infrastructure
+        
+        Recipients are delivered to concurrently. Reports larger than stream_threshold_bytes
+        are sent as chunked DREDD streams so encryption and framing never hold more than one
+        chunk beyond the serialized report.
+        """
         
         try:
-            # Convert ASR to JSON
-            asr_json = asr.to_json()
+            # Serialize unless the caller already did, off the event loop
+            if payload is None:
+                payload = self.serialize_asr(asr)
             
             # Get recipients from config
-            recipients = self.config['dredd_integration']['recipients']
-            
-            # Send to each recipient
-            for recipient_name, sigil_target in recipients.items():
-                success = await self.dredd_dispatcher.send_message(
-                    asr_json,
-                    sigil_target,
-                    ttl=7200,  # 2 hours
-                    resonance_level=self.config['dredd_integration']['encryption_level']
-                )
-                
-                if success:
-                    self.logger.info(f"ASR delivered to {recipient_name} via {sigil_target}")
+            dredd_integration = self.config['dredd_integration']
+            level = dredd_integration['encryption_level']
+            recipients = {name: (sigil_target, level) for name, sigil_target in dredd_integration['recipients'].items()}
+            stream = len(payload) > dredd_integration.get('stream_threshold_bytes', 256 * 1024)
+            
+            # Fan out to every recipient at once, each with its own deadline and retries
+            results = await self.dredd_dispatcher.send_to_recipients(
+                payload if stream else payload.decode(),
+                recipients,
+                ttl=7200,  # 2 hours
+                timeout=dredd_integration.get('recipient_timeout'),
+                stream=stream
+            )
+            
+            for recipient_name, result in results.items():
+                if result['accepted']:
+                    self.logger.info(f"ASR delivered to {recipient_name} via {result['target_sigil']}")
                 else:
-                    self.logger.error(f"Failed to deliver ASR to {recipient_name}")
+                    self.logger.error(f"Failed to deliver ASR to {recipient_name}: {result['reason']} "
+                                      f"after {result['attempts']} attempts")
+                    
+            return results
                     
         except Exception as e:
             self.logger.error(f"Error delivering ASR via DREDD: {e}")
+            return {}
             
     def archive_asr(self, asr: AcclimationSequencingReport):
         """Archive ASR for future reference"""
@@ -601,8 +712,7 @@ class ASRGenerator:
             }
             
             # Write to archive file
-            with open('asr_archive.jsonl', 'a') as f:
-                f.write(json.dumps(archive_entry) + '\n')
+            self.archive.append(archive_entry)
                 
             self.logger.info(f"ASR archived: {asr.report_id}")
             
@@ -625,7 +735,7 @@ class ASRGenerator:
                         if session_duration > max_duration:
                             self.end_session(session_id, "session_timeout")
                             
-                time.sleep(60)  # Check every minute
+                self.stop_event.wait(60)  # Check every minute
                 
             except Exception as e:
                 self.logger.error(f"Error monitoring sessions: {e}")
@@ -634,38 +744,78 @@ class ASRGenerator:
         """Get status of a specific ASR"""
         
         try:
-            # Check archive for ASR
-            with open('asr_archive.jsonl', 'r') as f:
-                for line in f:
-                    archive_entry = json.loads(line)
-                    if archive_entry['asr']['report_id'] == report_id:
-                        return {
-                            'report_id': report_id,
-                            'status': 'archived',
-                            'archived_at': archive_entry['archived_at'],
-                            'summary': archive_entry['asr']['summary_statistics']
-                        }
-                        
-            return None
+            # Look the ASR up through the archive's offset index
+            archive_entry = self.archive.get(report_id)
+            if archive_entry is None:
+                return None
+                
+            return {
+                'report_id': report_id,
+                'status': 'archived',
+                'archived_at': archive_entry['archived_at'],
+                'summary': archive_entry['asr']['summary_statistics']
+            }
             
-        except FileNotFoundError:
-            return None
         except Exception as e:
             self.logger.error(f"Error getting ASR status: {e}")
             return None
             
-    def shutdown(self):
+    def query_asrs(self, start=None, end=None) -> Iterator[Dict[str, Any]]:
+        """Stream archived ASR entries archived between start and end (datetimes or ISO timestamps)"""
+        return self.archive.query(start, end)
+        
+    def export_asrs(self, output_path: str, start=None, end=None) -> int:
+        """Export archived ASR entries in a time range to JSONL (gzip for .gz paths); returns the count"""
+        count = self.archive.export(output_path, start, end)
+        self.logger.info(f"Exported {count} archived ASRs to {output_path}")
+        return count
+            
+    async def start_async(self):
+        """Start ASR delivery on the running loop shared with the DREDD dispatcher
+        
+        Ticketing and chronicle processing join the loop as tasks when they run in asyncio
+        mode; in thread mode they keep their own threads, started on first use.
+        """
+        for subsystem in (self.ticket_system, self.chronicle_linker):
+            if subsystem.mode == 'asyncio':
+                await subsystem.start_async()
+        with self.dependency_lock:
+            if not self.processing_started:
+                self.start_processing(asyncio.get_running_loop())
+                
+    async def shutdown_async(self, drain: bool = True):
+        """Drain and stop the asyncio-mode subsystems, then shut down the generator"""
+        for subsystem in (self.ticket_system, self.chronicle_linker):
+            if subsystem.mode == 'asyncio':
+                await subsystem.shutdown_async(drain)
+        
+        # Deliveries run on this loop, so wait for the pool off-loop
+        await asyncio.get_running_loop().run_in_executor(None, self.worker_pool.stop, drain)
+        self.shutdown()
+        
+    def get_worker_stats(self) -> Dict[str, Any]:
+        """Get ASR worker pool queue, throughput and stage latency statistics"""
+        return self.worker_pool.get_stats()
+        
+    def shutdown(self, drain: bool = True):
         """Shutdown the ASR generator"""
+        
+        # Finish queued triggers and deliveries before stopping
+        self.worker_pool.stop(drain)
         self.running = False
+        self.stop_event.set()
         
         # Wait for threads to finish
-        if hasattr(self, 'asr_processor'):
-            self.asr_processor.join(timeout=5)
         if hasattr(self, 'session_monitor'):
             self.session_monitor.join(timeout=5)
+            
+        # Flush buffered archive entries
+        if self._archive is not None:
+            self._archive.flush()
 
 # Global instance
 asr_generator = None
+_asr_generator_lock = threading.Lock()
 
 def initialize_asr_generator():
     """Initialize the global ASR generator"""
@@ -673,6 +823,14 @@ def initialize_asr_generator():
     asr_generator = ASRGenerator()
     return asr_generator
 
+def get_asr_generator() -> ASRGenerator:
+    """Get the shared ASR generator, creating it on first use"""
+    if asr_generator is None:
+        with _asr_generator_lock:
+            if asr_generator is None:
+                initialize_asr_generator()
+    return asr_generator
+
 def start_session(session_id: str, session_type: str = "sovereign_control") -> bool:
     """Start a new session"""
     if asr_generator is None:
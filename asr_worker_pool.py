@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+ASR Worker Pool - Concurrent Acclimation Sequencing Report generation
+Workers take triggers from a bounded priority queue, collect and archive reports on threads
+and hand delivery to an asyncio event loop, recording per-stage latency histograms
+"""
+
+import time
+import heapq
+import asyncio
+import logging
+import threading
+import queue
+import concurrent.futures
+from typing import Dict, List, Any, Optional, Tuple
+
+FULL_POLICIES = ('block', 'drop', 'reject')
+
+# Latency bucket upper bounds in seconds
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, float('inf'))
+
+
+class TriggerQueue:
+    """Bounded priority queue; lower priority values are served first, FIFO within a priority
+
+    When full, 'block' makes producers wait (up to put_timeout), 'drop' sheds the least
+    urgent entry to admit a more urgent one, and 'reject' refuses the new entry.
+    """
+
+    def __init__(self, maxsize: int = 1000, full_policy: str = 'block', put_timeout: Optional[float] = None):
+        if full_policy not in FULL_POLICIES:
+            raise ValueError(f"Unknown queue full policy: {full_policy} (expected one of {', '.join(FULL_POLICIES)})")
+
+        self.maxsize = maxsize
+        self.full_policy = full_policy
+        self.put_timeout = put_timeout
+        self._heap: List[Tuple[int, int, float, Any]] = []
+        self._seq = 0
+        self._unfinished = 0
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._all_done = threading.Condition(self._lock)
+
+        # Metrics
+        self.accepted = 0
+        self.dropped = 0
+        self.rejected = 0
+
+    def put(self, item: Any, priority: int = 1) -> bool:
+        """Queue an item; returns False when it was refused or shed"""
+        with self._lock:
+            if len(self._heap) >= self.maxsize:
+                if self.full_policy == 'block':
+                    deadline = None if self.put_timeout is None else time.monotonic() + self.put_timeout
+                    while len(self._heap) >= self.maxsize:
+                        remaining = None if deadline is None else deadline - time.monotonic()
+                        if remaining is not None and remaining <= 0:
+                            self.rejected += 1
+                            return False
+                        self._not_full.wait(remaining)
+
+                elif self.full_policy == 'drop':
+                    # Least urgent, then newest, entry
+                    worst = max(range(len(self._heap)), key=lambda i: (self._heap[i][0], self._heap[i][1]))
+                    if self._heap[worst][0] <= priority:
+                        self.dropped += 1
+                        return False
+                    self._heap[worst] = self._heap[-1]
+                    self._heap.pop()
+                    heapq.heapify(self._heap)
+                    self._unfinished -= 1
+                    self.dropped += 1
+
+                else:
+                    self.rejected += 1
+                    return False
+
+            heapq.heappush(self._heap, (priority, self._seq, time.monotonic(), item))
+            self._seq += 1
+            self._unfinished += 1
+            self.accepted += 1
+            self._not_empty.notify()
+            return True
+
+    def get(self, timeout: Optional[float] = None) -> Tuple[Any, float]:
+        """Take the most urgent item and how long it waited; raises queue.Empty on timeout"""
+        with self._lock:
+            if not self._heap:
+                self._not_empty.wait(timeout)
+                if not self._heap:
+                    raise queue.Empty
+
+            _, _, queued_at, item = heapq.heappop(self._heap)
+            self._not_full.notify()
+            return item, time.monotonic() - queued_at
+
+    def task_done(self):
+        """Mark a taken item as fully processed"""
+        with self._lock:
+            self._unfinished -= 1
+            if self._unfinished <= 0:
+                self._all_done.notify_all()
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued item has been processed"""
+        with self._lock:
+            return self._all_done.wait_for(lambda: self._unfinished <= 0, timeout)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._heap)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with approximate quantiles"""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        """Record one observation"""
+        index = 0
+        while seconds > self.buckets[index]:
+            index += 1
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.total += seconds
+            if seconds > self.max:
+                self.max = seconds
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th observation (capped at the observed max)"""
+        with self._lock:
+            if not self.count:
+                return 0.0
+            rank = q * self.count
+            seen = 0
+            for bound, count in zip(self.buckets, self.counts):
+                seen += count
+                if seen >= rank:
+                    return min(bound, self.max)
+            return self.max
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get counts and summary statistics, in milliseconds"""
+        with self._lock:
+            count, total, maximum = self.count, self.total, self.max
+            buckets = {('+Inf' if bound == float('inf') else f"{bound * 1e3:g}"): c
+                       for bound, c in zip(self.buckets, self.counts)}
+
+        return {
+            'count': count,
+            'mean_ms': total / count * 1e3 if count else 0.0,
+            'p50_ms': self.quantile(0.5) * 1e3,
+            'p95_ms': self.quantile(0.95) * 1e3,
+            'p99_ms': self.quantile(0.99) * 1e3,
+            'max_ms': maximum * 1e3,
+            'buckets_ms': buckets
+        }
+
+
+class ASRWorkerPool:
+    """Runs ASR triggers through generation, archiving and DREDD delivery concurrently"""
+
+    STAGES = ('queue_wait', 'generate', 'serialize', 'archive', 'deliver', 'total')
+
+    def __init__(self, generator, workers: int = 4, queue_size: int = 1000, full_policy: str = 'block',
+                 put_timeout: Optional[float] = 5.0, priorities: Optional[Dict[str, int]] = None,
+                 default_priority: int = 1, deliver: bool = True):
+        self.generator = generator
+        self.workers = workers
+        self.priorities = priorities or {}
+        self.default_priority = default_priority
+        self.deliver = deliver
+        self.triggers = TriggerQueue(queue_size, full_policy, put_timeout)
+        self.histograms = {stage: LatencyHistogram() for stage in self.STAGES}
+        self.logger = logging.getLogger('asr_worker_pool')
+
+        self.running = False
+        self.threads: List[threading.Thread] = []
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.loop_thread: Optional[threading.Thread] = None
+        self.pending_deliveries: set = set()
+        self.lock = threading.Lock()
+
+        # Metrics
+        self.processed = 0
+        self.failed = 0
+        self.delivered = 0
+        self.delivery_errors = 0
+
+    def start(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        """Start the workers; deliveries run on loop, or on a dedicated loop thread"""
+        self.running = True
+
+        if loop is None:
+            self.loop = asyncio.new_event_loop()
+            self.loop_thread = threading.Thread(target=self.loop.run_forever, name="asr-delivery", daemon=True)
+            self.loop_thread.start()
+        else:
+            self.loop = loop
+
+        for i in range(self.workers):
+            worker = threading.Thread(target=self._work, name=f"asr-worker-{i}", daemon=True)
+            worker.start()
+            self.threads.append(worker)
+
+    def submit(self, trigger) -> bool:
+        """Queue a trigger at its type's priority"""
+        priority = self.priorities.get(trigger.trigger_type, self.default_priority)
+        return self.triggers.put(trigger, priority)
+
+    def _work(self):
+        while self.running:
+            try:
+                trigger, waited = self.triggers.get(timeout=1)
+            except queue.Empty:
+                continue
+
+            try:
+                self.histograms['queue_wait'].record(waited)
+                self.process(trigger, time.perf_counter() - waited)
+            except Exception as e:
+                self._count('failed')
+                self.logger.error(f"Error processing ASR trigger {trigger.trigger_id}: {e}")
+            finally:
+                self.triggers.task_done()
+
+    def process(self, trigger, started: float):
+        """Generate and archive a report on this thread and schedule its delivery"""
+        stage_start = time.perf_counter()
+        asr = self.generator.generate_asr(trigger)
+        self.histograms['generate'].record(time.perf_counter() - stage_start)
+
+        if not asr:
+            self._count('failed')
+            self.logger.error(f"Failed to generate ASR for trigger: {trigger.trigger_id}")
+            return
+
+        if self.deliver:
+            self._schedule_delivery(asr, started)
+
+        stage_start = time.perf_counter()
+        self.generator.archive_asr(asr)
+        self.histograms['archive'].record(time.perf_counter() - stage_start)
+
+        self._count('processed')
+        if not self.deliver:
+            self.histograms['total'].record(time.perf_counter() - started)
+
+    def _schedule_delivery(self, asr, started: float):
+        # Serialize on the worker so the delivery loop only waits on the network
+        stage_start = time.perf_counter()
+        payload = self.generator.serialize_asr(asr)
+        self.histograms['serialize'].record(time.perf_counter() - stage_start)
+
+        delivery_start = time.perf_counter()
+        future = asyncio.run_coroutine_threadsafe(self.generator.deliver_asr_via_dredd(asr, payload), self.loop)
+        with self.lock:
+            self.pending_deliveries.add(future)
+
+        def delivered(done):
+            now = time.perf_counter()
+            with self.lock:
+                self.pending_deliveries.discard(done)
+            if done.cancelled() or done.exception() is not None:
+                self._count('delivery_errors')
+                self.logger.error(f"Error delivering ASR {asr.report_id}: {None if done.cancelled() else done.exception()}")
+            else:
+                self._count('delivered')
+            self.histograms['deliver'].record(now - delivery_start)
+            self.histograms['total'].record(now - started)
+
+        future.add_done_callback(delivered)
+
+    def _count(self, metric: str):
+        with self.lock:
+            setattr(self, metric, getattr(self, metric) + 1)
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """Wait for queued triggers and scheduled deliveries to finish"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if not self.triggers.join(timeout):
+            return False
+
+        while True:
+            # Finished deliveries, failed ones included, may not have been discarded yet
+            with self.lock:
+                pending = [future for future in self.pending_deliveries if not future.done()]
+            if not pending:
+                return True
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            _, not_done = concurrent.futures.wait(pending, timeout=remaining)
+            if not_done:
+                return False
+
+    def stop(self, drain: bool = True, timeout: float = 30.0):
+        """Stop the workers, optionally after draining, and the delivery loop if the pool owns it"""
+        if drain and self.running:
+            if not self.drain(timeout):
+                self.logger.warning("ASR worker pool stopped before draining")
+
+        self.running = False
+        for worker in self.threads:
+            worker.join(timeout=5)
+        self.threads = []
+
+        if self.loop_thread is not None:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.loop_thread.join(timeout=5)
+            self.loop.close()
+            self.loop_thread = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue, throughput and per-stage latency statistics"""
+        with self.lock:
+            pending = len(self.pending_deliveries)
+
+        return {
+            'workers': self.workers,
+            'queue_depth': len(self.triggers),
+            'queue_size': self.triggers.maxsize,
+            'full_policy': self.triggers.full_policy,
+            'accepted': self.triggers.accepted,
+            'dropped': self.triggers.dropped,
+            'rejected': self.triggers.rejected,
+            'processed': self.processed,
+            'failed': self.failed,
+            'delivered': self.delivered,
+            'delivery_errors': self.delivery_errors,
+            'pending_deliveries': pending,
+            'latency': {stage: histogram.snapshot() for stage, histogram in self.histograms.items()}
+        }
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Benchmark Fixtures - Synthetic DREDD traffic and local stand-ins shared by tests and benchmarks
+Frame and sigilgram generators, adversarial probe traffic, a recording dispatcher and local
+relay servers, so performance_benchmarks.py does not depend on the test modules
+"""
+
+import json
+import time
+import base64
+import random
+import asyncio
+import hashlib
+import secrets
+import threading
+from datetime import datetime, timedelta
+
+import websockets
+from cryptography.fernet import Fernet
+
+from dredd_crypto import xor_with_key
+from dredd_dispatch import DREDDDispatcher
+from sigilgram_parser import SigilGramParser
+
+# Adversarial payloads as sent by mkp_intrusion_probe.py
+PROBE_PAYLOADS = [
+    {"signature": "bad-signature", "message": "malicious-message", "sigil": "invalid-sigil",
+     "session_key": "invalid-session-key"},
+    {"signature": "wrong", "message": "intruder", "sigil": "bad", "session_key": "nope"},
+    {"signature": "fake", "message": "attack", "sigil": "wrong", "session_key": "bad"},
+]
+MIRROR_DEPTH_LIMIT = 5
+
+
+def make_frame(message_id: str, sigil: str = 'glyph-hash-watch-guard', message_type: str = 'ASR') -> str:
+    return json.dumps({
+        'dredd_message': {
+            'metadata': {'message_id': message_id, 'message_type': message_type,
+                         'created_at': '2025-06-23T16:23:41', 'resonance_level': 'high'},
+            'targeting': {'sigil_target': sigil, 'resonance_requirements': {'required_sigil': True}},
+            'asr_payload': {'report_id': f"ASR-{message_id}",
+                            'summary_statistics': {'session_effectiveness_score': 0.9}}
+        },
+        'envelope': {'envelope_id': f"envelope_{message_id}", 'target_sigil': sigil}
+    })
+
+
+def make_adversarial_frames(count: int, lawful_ids, rng: random.Random):
+    """Probe traffic: raw probe payloads, DREDD frames for bad sigils, replays and junk"""
+    frames = []
+    for i in range(count):
+        payload = dict(PROBE_PAYLOADS[i % len(PROBE_PAYLOADS)], mirror_depth=i % (MIRROR_DEPTH_LIMIT + 2))
+        kind = i % 5
+        if kind == 0:
+            frames.append(json.dumps(payload))
+        elif kind == 1:
+            frames.append(make_frame(f"probe_{i}", payload['sigil']))
+        elif kind == 2:
+            frames.append(make_frame(rng.choice(lawful_ids)))
+        elif kind == 3:
+            frames.append(hashlib.sha256(payload['message'].encode()).digest() * 4)
+        else:
+            frames.append('{"dredd_message": {"metadata": ' + json.dumps(payload))
+    return frames
+
+
+def make_aged_frame(message_id: str, age: float) -> str:
+    frame = json.loads(make_frame(message_id))
+    frame['dredd_message']['metadata']['created_at'] = (datetime.now() - timedelta(seconds=age)).isoformat()
+    return json.dumps(frame)
+
+
+def make_sigilgram(parser: SigilGramParser, message_id: str, content: str,
+                   target_sigil: str = 'glyph-hash-01', entropy_score: float = 0.9) -> dict:
+    """Build a sigilgram the parser accepts, encrypted for its session"""
+    entropy_encoded = base64.b64encode(json.dumps({
+        'timestamp': int(time.time()),
+        'random_seed': secrets.token_hex(32),
+        'entropy_score': entropy_score,
+        'resonance_challenge': secrets.token_hex(16)
+    }).encode()).decode()
+
+    classical_key = Fernet.generate_key()
+    encrypted_content = Fernet(classical_key).encrypt(content.encode())
+    combined = {
+        'encrypted_key': base64.b64encode(xor_with_key(classical_key, parser.generate_quantum_key(target_sigil))).decode(),
+        'encrypted_content': base64.b64encode(encrypted_content).decode(),
+        'quantum_signature': '0' * 64
+    }
+    now = datetime.now().isoformat()
+
+    return {
+        'dredd_message': {
+            'metadata': {'message_id': message_id, 'created_at': now, 'resonance_level': 'high'},
+            'targeting': {'sigil_target': target_sigil, 'resonance_requirements': {'required_sigil': True}},
+            'entropy_header': {'encoded': entropy_encoded},
+            'encrypted_content': {
+                'encoded': base64.b64encode(json.dumps(combined).encode()).decode(),
+                'encryption_info': {'algorithm': 'quantum_hybrid', 'kyber_enabled': True,
+                                    'dilithium_enabled': True, 'classical_fallback': True}
+            },
+            'mirror_trap': {'trap_id': f"trap_{message_id}", 'entropy_fingerprint': secrets.token_hex(32),
+                            'trigger_conditions': {'invalid_sigil': True}},
+            'delivery_config': {'ttl': 3600},
+            'resonance_validation': {
+                'echo_signature': parser.generate_echo_signature(message_id, target_sigil, entropy_encoded)
+            },
+            'stealth_config': {'dispersal_enabled': True, 'fragment_count': 3, 'reassembly_nodes': ['node-1']},
+            'compliance': {'audit_trail': True, 'encryption_standard': 'quantum_resistant', 'access_logging': True}
+        },
+        'envelope': {'envelope_id': f"envelope_{message_id}", 'target_sigil': target_sigil,
+                     'message_hash': '1' * 64, 'created_at': now, 'expires_at': now},
+        'validation': {
+            'message_integrity': {'content_hash': '2' * 64, 'signature': '3' * 24, 'timestamp': now},
+            'resonance_verification': {'sigil_valid': True, 'entropy_sufficient': True,
+                                       'resonance_level_appropriate': True, 'session_key_valid': True}
+        }
+    }
+
+
+class RecordingDispatcher(DREDDDispatcher):
+    """DREDD dispatcher whose relay sends are replaced by recording awaited sends"""
+
+    def __init__(self, delay: float = 0.0):
+        super().__init__('missing_dredd_config.json')
+        self.delay = delay
+        self.sent = []
+        self.lock = threading.Lock()
+
+    async def send_message(self, content, target_sigil, ttl=3600, resonance_level="medium", shared=None):
+        await asyncio.sleep(self.delay)
+        with self.lock:
+            self.sent.append(target_sigil)
+        return True
+
+
+class RelayServers:
+    """Local relays on their own loop thread; each connection gets a burst of frames, then is closed"""
+
+    def __init__(self, count: int, frames_per_connection: int = 3, age: float = 2.0):
+        self.frames_per_connection = frames_per_connection
+        self.age = age
+        self.connections = [0] * count
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        self.servers = [asyncio.run_coroutine_threadsafe(self._serve(i), self.loop).result() for i in range(count)]
+        self.endpoints = [f"ws://localhost:{server.sockets[0].getsockname()[1]}/dredd/inbox"
+                          for server in self.servers]
+
+    async def _serve(self, index: int):
+        async def handler(websocket):
+            self.connections[index] += 1
+            connection = self.connections[index]
+            for i in range(self.frames_per_connection):
+                await websocket.send(make_aged_frame(f"relay{index}_conn{connection}_{i}", self.age))
+            await websocket.close()
+
+        return await websockets.serve(handler, 'localhost', 0)
+
+    def close(self):
+        async def shutdown():
+            for server in self.servers:
+                server.close()
+                await server.wait_closed()
+
+        asyncio.run_coroutine_threadsafe(shutdown(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout=5)
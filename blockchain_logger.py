@@ -13,6 +13,7 @@ from typing import Dict, List, Any, Optional, Union
 from dataclasses import dataclass, asdict
 from enum import Enum
 import logging
+from jsonl_sink import get_sink
 
 class AnomalySeverity(Enum):
     LOW = "low"
@@ -58,6 +59,7 @@ class MKPBlockchainLogger:
         self.anomalies: List[ResonanceAnomaly] = []
         self.anomaly_patterns: Dict[str, Dict[str, Any]] = {}
         self.logger = logging.getLogger('mkp_blockchain_logger')
+        self.anomaly_sink = get_sink('mkp_anomalies.jsonl')
         
         # Initialize anomaly patterns
         self._initialize_anomaly_patterns()
@@ -297,8 +299,7 @@ class MKPBlockchainLogger:
             'blockchain_tx': anomaly.blockchain_tx
         }
         
-        with open('mkp_anomalies.jsonl', 'a') as f:
-            f.write(json.dumps(log_entry) + '\n')
+        self.anomaly_sink.write(log_entry)
             
     def get_anomaly_statistics(self) -> Dict[str, Any]:
         """Get anomaly statistics"""
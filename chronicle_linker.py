@@ -14,7 +14,10 @@ from dataclasses import dataclass, asdict
 import threading
 import queue
 import re
+import sys
+import bisect
 import hashlib
+from collections import deque, OrderedDict
 
 @dataclass
 class EffectEvent:
@@ -40,21 +43,370 @@ class CausalLink:
     link_strength: float
     created_at: str
 
+_TOKEN_PATTERN = re.compile(r'[A-Z]?[a-z]+|[A-Z]+(?![a-z])')
+
+
+def context_tokens(*texts: str) -> frozenset:
+    """Lower-case word tokens from identifiers, camel case and free text (numbers dropped)"""
+    return frozenset(
+        sys.intern(token.lower())
+        for text in texts if text
+        for token in _TOKEN_PATTERN.findall(text)
+    )
+
+
+class WindowTicket:
+    """A ticket held in the matching window"""
+    __slots__ = ('ticket_id', 'action_type', 'epoch', 'tokens')
+    
+    def __init__(self, ticket_id: str, action_type: str, epoch: float, tokens: frozenset):
+        self.ticket_id = ticket_id
+        self.action_type = action_type
+        self.epoch = epoch
+        self.tokens = tokens
+
+
+class ObservedEffect:
+    """An effect event with the features used for matching"""
+    __slots__ = ('event_id', 'event_type', 'source_system', 'epoch', 'tokens', 'pattern_system', 'pattern_name')
+    
+    def __init__(self, event_id: str, event_type: str, source_system: str, epoch: float, tokens: frozenset,
+                 pattern_system: Optional[str], pattern_name: Optional[str]):
+        self.event_id = event_id
+        self.event_type = event_type
+        self.source_system = source_system
+        self.epoch = epoch
+        self.tokens = tokens
+        self.pattern_system = pattern_system
+        self.pattern_name = pattern_name
+
+
+class TicketWindow:
+    """Sliding time window of recent tickets indexed by action_type"""
+    
+    def __init__(self, window_seconds: float, max_tickets: int):
+        self.window_seconds = window_seconds
+        self.max_tickets = max_tickets
+        self._lock = threading.Lock()
+        self._by_action_type: Dict[str, deque] = {}
+        self._by_id: Dict[str, WindowTicket] = {}
+        self._arrivals: deque = deque()
+        
+    def add(self, ticket: WindowTicket):
+        """Add a ticket, evicting the oldest when the window is full"""
+        with self._lock:
+            if ticket.ticket_id in self._by_id:
+                return
+            self._by_id[ticket.ticket_id] = ticket
+            self._by_action_type.setdefault(ticket.action_type, deque()).append(ticket)
+            self._arrivals.append(ticket)
+            while len(self._arrivals) > self.max_tickets:
+                self._evict_oldest()
+                
+    def _evict_oldest(self):
+        ticket = self._arrivals.popleft()
+        self._by_id.pop(ticket.ticket_id, None)
+        tickets = self._by_action_type.get(ticket.action_type)
+        if tickets:
+            if tickets[0] is ticket:
+                tickets.popleft()
+            else:
+                tickets.remove(ticket)
+            if not tickets:
+                del self._by_action_type[ticket.action_type]
+                
+    def expire(self, now: float) -> int:
+        """Drop tickets that fell out of the window"""
+        cutoff = now - self.window_seconds
+        expired = 0
+        with self._lock:
+            while self._arrivals and self._arrivals[0].epoch < cutoff:
+                self._evict_oldest()
+                expired += 1
+        return expired
+        
+    def get(self, ticket_id: str) -> Optional[WindowTicket]:
+        return self._by_id.get(ticket_id)
+        
+    def candidates(self, action_types, effect_epoch: float, limit_per_action: Optional[int] = None) -> List[WindowTicket]:
+        """Tickets of the given action types performed within the window before effect_epoch, newest first"""
+        cutoff = effect_epoch - self.window_seconds
+        found = []
+        with self._lock:
+            for action_type in action_types:
+                tickets = self._by_action_type.get(action_type)
+                if not tickets:
+                    continue
+                # Stop at the first ticket older than the window or once the limit is reached
+                taken = 0
+                for ticket in reversed(tickets):
+                    if ticket.epoch < cutoff or taken == limit_per_action:
+                        break
+                    if ticket.epoch <= effect_epoch:
+                        found.append(ticket)
+                        taken += 1
+        return found
+        
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+
+class CausalLinkStore:
+    """Causal links indexed by ticket, effect and source system, ordered by strength and time"""
+    
+    BUCKET_SECONDS = 60
+    
+    def __init__(self, max_links: int = 100000):
+        self.max_links = max_links
+        self._lock = threading.RLock()
+        self._links: "OrderedDict[str, CausalLink]" = OrderedDict()
+        self._meta: Dict[str, Tuple[float, int, str]] = {}  # link_id -> (epoch, seq, source_system)
+        self._by_ticket: Dict[str, Dict[str, None]] = {}
+        self._by_effect: Dict[str, Dict[str, None]] = {}
+        self._by_system: Dict[str, Dict[str, None]] = {}
+        self._seq = 0
+        
+        # (link_strength, seq, link_id) kept sorted, weakest first, overall and per system
+        self._by_strength: List[Tuple[float, int, str]] = []
+        self._strength_by_system: Dict[str, List[Tuple[float, int, str]]] = {}
+        
+        # (epoch, seq, link_id) in creation order; evicted entries are skipped via _time_head
+        self._by_time: List[Tuple[float, int, str]] = []
+        self._time_head = 0
+        
+        # minute -> source_system -> [count, certainty_sum, strength_sum]
+        self._buckets: Dict[int, Dict[str, List[float]]] = {}
+        self._bucket_keys: List[int] = []
+        
+    def add(self, link: CausalLink, source_system: str):
+        """Store a link, replacing one with the same link_id and evicting the oldest when full"""
+        epoch = datetime.fromisoformat(link.created_at.replace('Z', '+00:00')).timestamp()
+        with self._lock:
+            if link.link_id in self._links:
+                self.remove(link.link_id)
+                
+            self._seq += 1
+            seq = self._seq
+            self._links[link.link_id] = link
+            self._meta[link.link_id] = (epoch, seq, source_system)
+            self._by_ticket.setdefault(link.ticket_id, {})[link.link_id] = None
+            self._by_effect.setdefault(link.effect_event, {})[link.link_id] = None
+            self._by_system.setdefault(source_system, {})[link.link_id] = None
+            strength_entry = (link.link_strength, seq, link.link_id)
+            bisect.insort(self._by_strength, strength_entry)
+            bisect.insort(self._strength_by_system.setdefault(source_system, []), strength_entry)
+            
+            time_entry = (epoch, seq, link.link_id)
+            if len(self._by_time) == self._time_head or self._by_time[-1] <= time_entry:
+                self._by_time.append(time_entry)
+            else:
+                bisect.insort(self._by_time, time_entry, lo=self._time_head)
+                
+            self._update_bucket(epoch, source_system, link, 1)
+            
+            while len(self._links) > self.max_links:
+                self.remove(next(iter(self._links)))
+                
+    def remove(self, link_id: str) -> Optional[CausalLink]:
+        """Remove a link from the store and every index"""
+        with self._lock:
+            link = self._links.pop(link_id, None)
+            if link is None:
+                return None
+                
+            epoch, seq, source_system = self._meta.pop(link_id)
+            self._discard(self._by_ticket, link.ticket_id, link_id)
+            self._discard(self._by_effect, link.effect_event, link_id)
+            self._discard(self._by_system, source_system, link_id)
+            
+            entry = (link.link_strength, seq, link_id)
+            self._delete_sorted(self._by_strength, entry)
+            system_strengths = self._strength_by_system.get(source_system)
+            if system_strengths is not None:
+                self._delete_sorted(system_strengths, entry)
+                if not system_strengths:
+                    del self._strength_by_system[source_system]
+                    
+            # Oldest links leave from the head; others are skipped when read
+            while self._time_head < len(self._by_time) and not self._valid(*self._by_time[self._time_head][1:]):
+                self._time_head += 1
+            if self._time_head > 1024 and self._time_head > len(self._by_time) // 2:
+                self._by_time = self._by_time[self._time_head:]
+                self._time_head = 0
+                
+            self._update_bucket(epoch, source_system, link, -1)
+            return link
+            
+    @staticmethod
+    def _delete_sorted(entries: List[Tuple[float, int, str]], entry: Tuple[float, int, str]):
+        index = bisect.bisect_left(entries, entry)
+        if index < len(entries) and entries[index] == entry:
+            del entries[index]
+            
+    @staticmethod
+    def _discard(index: Dict[str, Dict[str, None]], key: str, link_id: str):
+        bucket = index.get(key)
+        if bucket is not None:
+            bucket.pop(link_id, None)
+            if not bucket:
+                del index[key]
+                
+    def _update_bucket(self, epoch: float, source_system: str, link: CausalLink, sign: int):
+        minute = int(epoch // self.BUCKET_SECONDS)
+        bucket = self._buckets.get(minute)
+        if bucket is None:
+            bucket = self._buckets[minute] = {}
+            bisect.insort(self._bucket_keys, minute)
+            
+        stats = bucket.setdefault(source_system, [0, 0.0, 0.0])
+        stats[0] += sign
+        stats[1] += sign * link.causal_certainty
+        stats[2] += sign * link.link_strength
+        
+        if stats[0] == 0:
+            del bucket[source_system]
+            if not bucket:
+                del self._buckets[minute]
+                del self._bucket_keys[bisect.bisect_left(self._bucket_keys, minute)]
+                
+    def _valid(self, seq: int, link_id: str) -> bool:
+        meta = self._meta.get(link_id)
+        return meta is not None and meta[1] == seq
+        
+    def for_ticket(self, ticket_id: str) -> List[CausalLink]:
+        """Links for a ticket, oldest first"""
+        with self._lock:
+            return [self._links[link_id] for link_id in self._by_ticket.get(ticket_id, {})]
+            
+    def for_effect(self, effect_event: str) -> List[CausalLink]:
+        """Links for an effect event, oldest first"""
+        with self._lock:
+            return [self._links[link_id] for link_id in self._by_effect.get(effect_event, {})]
+            
+    def for_system(self, source_system: str) -> List[CausalLink]:
+        """Links for a source system, oldest first"""
+        with self._lock:
+            return [self._links[link_id] for link_id in self._by_system.get(source_system, {})]
+            
+    def source_system_of(self, link_id: str) -> Optional[str]:
+        meta = self._meta.get(link_id)
+        return meta[2] if meta else None
+        
+    def above(self, min_strength: float) -> List[CausalLink]:
+        """Links with link_strength >= min_strength, strongest first"""
+        with self._lock:
+            start = bisect.bisect_left(self._by_strength, (min_strength,))
+            return [self._links[link_id] for _, _, link_id in reversed(self._by_strength[start:])]
+            
+    def top(self, k: int, source_system: Optional[str] = None, since: Optional[float] = None) -> List[CausalLink]:
+        """The k strongest links, optionally for one system and created after since (epoch seconds)"""
+        found = []
+        with self._lock:
+            entries = self._by_strength if source_system is None else self._strength_by_system.get(source_system, [])
+            for _, _, link_id in reversed(entries):
+                if len(found) >= k:
+                    break
+                if since is not None and self._meta[link_id][0] <= since:
+                    continue
+                found.append(self._links[link_id])
+        return found
+        
+    def since(self, start: float) -> List[CausalLink]:
+        """Links created after start (epoch seconds), oldest first"""
+        with self._lock:
+            index = bisect.bisect_right(self._by_time, (start, float('inf')), lo=self._time_head)
+            return [self._links[link_id] for _, seq, link_id in self._by_time[index:] if self._valid(seq, link_id)]
+            
+    def system_totals(self, start: float) -> Dict[str, List[float]]:
+        """[count, certainty_sum, strength_sum] per source system for links created after start"""
+        first_minute = int(start // self.BUCKET_SECONDS) + 1
+        totals: Dict[str, List[float]] = {}
+        with self._lock:
+            # Whole minutes from the aggregates, the partial minute at the cutoff from the time index
+            for minute in self._bucket_keys[bisect.bisect_left(self._bucket_keys, first_minute):]:
+                for system, stats in self._buckets[minute].items():
+                    total = totals.setdefault(system, [0, 0.0, 0.0])
+                    total[0] += stats[0]
+                    total[1] += stats[1]
+                    total[2] += stats[2]
+                    
+            lo = bisect.bisect_right(self._by_time, (start, float('inf')), lo=self._time_head)
+            hi = bisect.bisect_left(self._by_time, (first_minute * self.BUCKET_SECONDS,), lo=lo)
+            for _, seq, link_id in self._by_time[lo:hi]:
+                if not self._valid(seq, link_id):
+                    continue
+                link = self._links[link_id]
+                total = totals.setdefault(self._meta[link_id][2], [0, 0.0, 0.0])
+                total[0] += 1
+                total[1] += link.causal_certainty
+                total[2] += link.link_strength
+                
+        return {system: stats for system, stats in totals.items() if stats[0]}
+        
+    def __contains__(self, link_id: str) -> bool:
+        return link_id in self._links
+        
+    def __len__(self) -> int:
+        return len(self._links)
+        
+    def __iter__(self):
+        with self._lock:
+            return iter(list(self._links.values()))
+            
+PROCESSING_MODES = ('thread', 'asyncio')
+
+
 class ChronicleLinker:
-    def __init__(self, config_file: str = "chronicle_config.json"):
+    def __init__(self, config_file: str = "chronicle_config.json", mode: Optional[str] = None):
         self.config = self.load_config(config_file)
-        self.effect_queue = queue.Queue()
-        self.causal_links = []
-        self.observational_relay = []
+        settings = self.config['linking_settings']
+        processing = self.config.get('processing', {})
+        self.mode = mode or processing.get('mode', 'thread')
+        if self.mode not in PROCESSING_MODES:
+            raise ValueError(f"Unknown processing mode: {self.mode}")
+        self.queue_size = processing.get('queue_size', 10000)
+        self.effect_queue = asyncio.Queue(maxsize=self.queue_size) if self.mode == 'asyncio' else queue.Queue()
+        self.match_queue = queue.Queue()
+        self.causal_links = CausalLinkStore(settings.get('max_causal_links', 100000))
+        self.observational_relay = deque(maxlen=settings.get('max_relay_entries', 10000))
         self.logger = logging.getLogger('chronicle_linker')
         self.running = False
         
         # System event patterns
         self.watchguard_patterns = self.load_watchguard_patterns()
         self.mkp_patterns = self.load_mkp_patterns()
+        self.compiled_patterns = [
+            (system, name, re.compile(pattern))
+            for system, patterns in (('watchguard', self.watchguard_patterns), ('mkp', self.mkp_patterns))
+            for name, pattern in patterns.items()
+        ]
         
-        # Start processing
-        self.start_processing()
+        # Expected effects per action type, and the reverse index used to find candidates
+        self.effect_mapping = {
+            action_type: frozenset(effects)
+            for action_type, effects in self.config.get('effect_mapping', {}).items()
+        }
+        self.actions_by_effect: Dict[str, set] = {}
+        for action_type, effects in self.effect_mapping.items():
+            for effect_kind in effects:
+                self.actions_by_effect.setdefault(effect_kind, set()).add(action_type)
+                
+        # Streaming match state
+        self.ticket_window = TicketWindow(
+            settings.get('match_window_seconds', 120.0),
+            settings.get('max_window_tickets', 100000)
+        )
+        self.recent_effects: "OrderedDict[str, ObservedEffect]" = OrderedDict()
+        self.max_recent_effects = settings.get('max_recent_effects', 100000)
+        self.max_candidates_per_action = settings.get('max_candidates_per_action', 16)
+        self.interface_tokens: Dict[str, frozenset] = {}
+        self.effects_lock = threading.Lock()
+        
+        # Processing threads start on the first capture; asyncio mode starts with start_async()
+        self.processing_started = False
+        self.start_lock = threading.Lock()
+        self.async_tasks: List[asyncio.Task] = []
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
         
     def load_config(self, config_file: str) -> Dict[str, Any]:
         """Load chronicle linker configuration"""
@@ -67,7 +419,17 @@ class ChronicleLinker:
                     'response_time_threshold': 30.0,
                     'causal_certainty_threshold': 0.7,
                     'entropy_similarity_threshold': 0.6,
-                    'max_link_age_hours': 24
+                    'max_link_age_hours': 24,
+                    'match_window_seconds': 120.0,
+                    'max_window_tickets': 100000,
+                    'max_recent_effects': 100000,
+                    'max_candidates_per_action': 16,
+                    'max_causal_links': 100000,
+                    'max_relay_entries': 10000
+                },
+                'processing': {
+                    'mode': 'thread',
+                    'queue_size': 10000
                 },
                 'system_patterns': {
                     'watchguard': {
@@ -102,8 +464,17 @@ class ChronicleLinker:
         """Load MKP event patterns"""
         return self.config['system_patterns']['mkp']
         
+    def ensure_processing(self):
+        """Start the processing threads once, on first use (thread mode)"""
+        if self.processing_started or self.mode != 'thread':
+            return
+        with self.start_lock:
+            if not self.processing_started:
+                self.start_processing()
+                
     def start_processing(self):
         """Start effect processing threads"""
+        self.processing_started = True
         self.running = True
         
         # Start effect processor
@@ -123,44 +494,85 @@ class ChronicleLinker:
         """Capture an effect event from WatchGuard or MKP systems"""
         
         try:
-            # Generate event ID
-            event_id = f"{source_system.upper()}-{int(time.time())}-{hash(description) % 1000}"
-            
-            # Create entropy signature
-            entropy_data = {
-                'event_type': event_type,
-                'source_system': source_system,
-                'description': description,
-                'timestamp': int(time.time()),
-                'affected_entities': affected_entities
-            }
-            entropy_signature = self.generate_entropy_signature(entropy_data)
-            
-            # Create effect event
-            effect_event = EffectEvent(
-                event_id=event_id,
-                event_type=event_type,
-                source_system=source_system,
-                timestamp=datetime.now().isoformat(),
-                description=description,
-                affected_entities=affected_entities,
-                severity=severity,
-                entropy_signature=entropy_signature,
-                resonance_level=self.determine_resonance_level(severity, source_system)
-            )
+            effect_event = self.build_effect_event(event_type, source_system, description, affected_entities, severity)
             
             # Add to queue for processing
-            self.effect_queue.put(effect_event)
-            
+            if self.mode == 'asyncio':
+                self.enqueue_async(effect_event)
+            else:
+                self.ensure_processing()
+                self.effect_queue.put(effect_event)
+                
             # Log capture
-            self.logger.info(f"Effect event captured: {event_id} - {event_type}")
+            self.logger.info(f"Effect event captured: {effect_event.event_id} - {event_type}")
             
-            return event_id
+            return effect_event.event_id
             
         except Exception as e:
             self.logger.error(f"Error capturing effect event: {e}")
             return None
             
+    def enqueue_async(self, effect_event: EffectEvent):
+        """Queue an effect in asyncio mode from the loop thread or any other thread
+        
+        On the loop (or before start_async) a full queue raises asyncio.QueueFull; other
+        threads hand the effect to the loop, which logs and drops it if the queue is full.
+        """
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+            
+        if self.loop is None or running is self.loop:
+            self.effect_queue.put_nowait(effect_event)
+        else:
+            self.loop.call_soon_threadsafe(self._put_from_thread, effect_event)
+            
+    def _put_from_thread(self, effect_event: EffectEvent):
+        try:
+            self.effect_queue.put_nowait(effect_event)
+        except asyncio.QueueFull:
+            self.logger.error(f"Effect queue full, dropped effect: {effect_event.event_id}")
+            
+    async def capture_effect_event_async(self, event_type: str, source_system: str, description: str,
+                                         affected_entities: List[str], severity: str = "medium") -> str:
+        """Capture an effect event, waiting for queue space when matching falls behind"""
+        effect_event = self.build_effect_event(event_type, source_system, description, affected_entities, severity)
+        await self.effect_queue.put(effect_event)
+        
+        self.logger.info(f"Effect event captured: {effect_event.event_id} - {event_type}")
+        return effect_event.event_id
+        
+    def build_effect_event(self, event_type: str, source_system: str, description: str,
+                           affected_entities: List[str], severity: str = "medium") -> EffectEvent:
+        """Build an effect event with its entropy signature and resonance level"""
+        
+        # Generate event ID
+        event_id = f"{source_system.upper()}-{int(time.time())}-{hash(description) % 1000}"
+        
+        # Create entropy signature
+        entropy_data = {
+            'event_type': event_type,
+            'source_system': source_system,
+            'description': description,
+            'timestamp': int(time.time()),
+            'affected_entities': affected_entities
+        }
+        entropy_signature = self.generate_entropy_signature(entropy_data)
+        
+        # Create effect event
+        return EffectEvent(
+            event_id=event_id,
+            event_type=event_type,
+            source_system=source_system,
+            timestamp=datetime.now().isoformat(),
+            description=description,
+            affected_entities=affected_entities,
+            severity=severity,
+            entropy_signature=entropy_signature,
+            resonance_level=self.determine_resonance_level(severity, source_system)
+        )
+            
     def generate_entropy_signature(self, data: Dict[str, Any]) -> str:
         """Generate entropy signature for effect event"""
         data_str = json.dumps(data, sort_keys=True)
@@ -204,26 +616,34 @@ class ChronicleLinker:
                 # Get effect from queue
                 effect = self.effect_queue.get(timeout=1)
                 
-                # Validate effect
-                if self.validate_effect(effect):
-                    # Add to observational relay
-                    self.observational_relay.append({
-                        'type': 'effect_event',
-                        'effect': asdict(effect),
-                        'captured_at': datetime.now().isoformat()
-                    })
-                    
-                    # Log processing
-                    self.logger.info(f"Effect processed: {effect.event_id}")
-                    
-                else:
-                    self.logger.warning(f"Invalid effect rejected: {effect.event_id}")
+                # Hand valid effects over for causal matching
+                if self.process_effect(effect):
+                    self.match_queue.put(effect)
                     
             except queue.Empty:
                 continue
             except Exception as e:
                 self.logger.error(f"Error processing effect: {e}")
                 
+    def process_effect(self, effect: EffectEvent) -> bool:
+        """Validate an effect and add it to the observational relay"""
+        
+        # Validate effect
+        if self.validate_effect(effect):
+            # Add to observational relay
+            self.observational_relay.append({
+                'type': 'effect_event',
+                'effect': asdict(effect),
+                'captured_at': datetime.now().isoformat()
+            })
+            
+            # Log processing
+            self.logger.info(f"Effect processed: {effect.event_id}")
+            return True
+            
+        self.logger.warning(f"Invalid effect rejected: {effect.event_id}")
+        return False
+                
     def validate_effect(self, effect: EffectEvent) -> bool:
         """Validate effect event"""
         
@@ -246,28 +666,121 @@ class ChronicleLinker:
         """Link causal events with sovereign tickets"""
         while self.running:
             try:
-                # This would typically monitor the live ticket stream
-                # and attempt to link effects with recent tickets
-                
-                # For now, simulate linking
-                time.sleep(5)
+                effect = self.match_queue.get(timeout=1)
+                self.match_effect(effect)
                 
+            except queue.Empty:
+                continue
             except Exception as e:
                 self.logger.error(f"Error linking causal events: {e}")
                 
     def _process_observational_relay(self):
-        """Process observational relay entries"""
+        """Expire tickets and effects that fell out of the matching window"""
         while self.running:
             try:
-                # Process relay entries
-                # This would typically involve analyzing patterns
-                # and generating causal links
-                
-                time.sleep(2)
+                self.expire_observations(time.time())
+                time.sleep(1)
                 
             except Exception as e:
                 self.logger.error(f"Error processing observational relay: {e}")
                 
+    def expire_observations(self, now: float):
+        """Drop window tickets and recent effects that are too old to match"""
+        self.ticket_window.expire(now)
+        
+        cutoff = now - self.config['linking_settings']['max_link_age_hours'] * 3600
+        with self.effects_lock:
+            while self.recent_effects:
+                event_id, observed = next(iter(self.recent_effects.items()))
+                if observed.epoch >= cutoff:
+                    break
+                del self.recent_effects[event_id]
+                
+    def observe_ticket(self, ticket) -> WindowTicket:
+        """Add a sovereign ticket to the matching window"""
+        epoch = getattr(ticket, 'epoch', None)
+        if epoch is None:
+            epoch = datetime.fromisoformat(ticket.timestamp.replace('Z', '+00:00')).timestamp()
+            
+        tokens = self.interface_tokens.get(ticket.interface_context)
+        if tokens is None:
+            tokens = context_tokens(ticket.interface_context)
+            if len(self.interface_tokens) < 4096:
+                self.interface_tokens[ticket.interface_context] = tokens
+                
+        window_ticket = WindowTicket(ticket.ticket_id, sys.intern(ticket.action_type), epoch, tokens)
+        self.ticket_window.add(window_ticket)
+        return window_ticket
+        
+    def classify_effect(self, effect: EffectEvent) -> Tuple[Optional[str], Optional[str]]:
+        """Match an effect against the WatchGuard and MKP pattern tables"""
+        for system, name, pattern in self.compiled_patterns:
+            if pattern.search(effect.description) or pattern.search(effect.event_id):
+                return system, name
+        return None, None
+        
+    def observe_effect(self, effect: EffectEvent) -> ObservedEffect:
+        """Record an effect and the features used to score it"""
+        pattern_system, pattern_name = self.classify_effect(effect)
+        observed = ObservedEffect(
+            effect.event_id,
+            sys.intern(effect.event_type),
+            sys.intern(effect.source_system.lower()),
+            datetime.fromisoformat(effect.timestamp.replace('Z', '+00:00')).timestamp(),
+            context_tokens(effect.event_type, effect.description, *effect.affected_entities),
+            pattern_system,
+            pattern_name
+        )
+        
+        with self.effects_lock:
+            self.recent_effects[effect.event_id] = observed
+            self.recent_effects.move_to_end(effect.event_id)
+            while len(self.recent_effects) > self.max_recent_effects:
+                self.recent_effects.popitem(last=False)
+                
+        return observed
+        
+    def match_effect(self, effect: EffectEvent) -> Optional[CausalLink]:
+        """Link an effect to the most likely causing ticket in the window"""
+        observed = self.observe_effect(effect)
+        
+        # Only action types expected to produce this kind of effect are candidates
+        action_types = set(self.actions_by_effect.get(observed.event_type, ()))
+        if observed.pattern_name:
+            action_types.update(self.actions_by_effect.get(observed.pattern_name, ()))
+        if not action_types:
+            return None
+            
+        # Score candidates newest first; pattern certainty only depends on the action type
+        best = None
+        best_certainty = self.config['linking_settings']['causal_certainty_threshold']
+        pattern_certainties = {}
+        context_certainties = {}
+        for ticket in self.ticket_window.candidates(action_types, observed.epoch, self.max_candidates_per_action):
+            pattern_certainty = pattern_certainties.get(ticket.action_type)
+            if pattern_certainty is None:
+                pattern_certainty = pattern_certainties[ticket.action_type] = \
+                    self._pattern_certainty(ticket.action_type, observed)
+                    
+            time_certainty = self.calculate_time_certainty(observed.epoch - ticket.epoch)
+            if (time_certainty * 0.4) + (pattern_certainty * 0.4) + 0.2 < best_certainty:
+                continue
+                
+            # Tickets from the same interface share one token set
+            context_certainty = context_certainties.get(ticket.tokens)
+            if context_certainty is None:
+                context_certainty = context_certainties[ticket.tokens] = \
+                    0.4 + 0.6 * self._token_overlap(ticket.tokens, observed.tokens)
+                    
+            certainty = (time_certainty * 0.4) + (pattern_certainty * 0.4) + (context_certainty * 0.2)
+            if certainty > best_certainty or (certainty == best_certainty and best is None):
+                best, best_certainty = ticket, certainty
+                
+        if best is None:
+            return None
+            
+        return self.attempt_causal_link(best.ticket_id, observed.event_id, observed.epoch - best.epoch)
+        
     def attempt_causal_link(self, ticket_id: str, effect_event: str, 
                           response_time: float) -> Optional[CausalLink]:
         """Attempt to create a causal link between ticket and effect"""
@@ -303,7 +816,9 @@ class ChronicleLinker:
             )
             
             # Add to causal links
-            self.causal_links.append(causal_link)
+            effect = self.recent_effects.get(effect_event)
+            source_system = effect.source_system if effect else self.extract_source_system(effect_event)
+            self.causal_links.add(causal_link, source_system)
             
             # Log link creation
             self.logger.info(f"Causal link created: {causal_link.link_id} (certainty: {causal_certainty:.2f})")
@@ -318,15 +833,8 @@ class ChronicleLinker:
         """Calculate causal certainty between ticket and effect"""
         
         # Base certainty from response time
-        if response_time <= 5:
-            time_certainty = 0.95
-        elif response_time <= 15:
-            time_certainty = 0.85
-        elif response_time <= 30:
-            time_certainty = 0.70
-        else:
-            time_certainty = 0.50
-            
+        time_certainty = self.calculate_time_certainty(response_time)
+        
         # Pattern matching certainty
         pattern_certainty = self.calculate_pattern_certainty(ticket_id, effect_event)
         
@@ -338,32 +846,74 @@ class ChronicleLinker:
         
         return min(certainty, 1.0)
         
+    @staticmethod
+    def calculate_time_certainty(response_time: float) -> float:
+        """Certainty tier for a ticket-to-effect response time"""
+        if response_time <= 5:
+            return 0.95
+        elif response_time <= 15:
+            return 0.85
+        elif response_time <= 30:
+            return 0.70
+        else:
+            return 0.50
+            
+    def _lookup(self, ticket_id: str, effect_event: str) -> Tuple[Optional[WindowTicket], Optional[ObservedEffect]]:
+        return self.ticket_window.get(ticket_id), self.recent_effects.get(effect_event)
+        
     def calculate_pattern_certainty(self, ticket_id: str, effect_event: str) -> float:
         """Calculate pattern matching certainty"""
         
-        # This would analyze the ticket action type and effect event type
-        # to determine if they follow expected patterns
+        ticket, effect = self._lookup(ticket_id, effect_event)
+        if ticket is None or effect is None:
+            return 0.5
+            
+        return self._pattern_certainty(ticket.action_type, effect)
         
-        # For now, return a base certainty
-        return 0.8
+    def _pattern_certainty(self, action_type: str, effect: ObservedEffect) -> float:
+        # Does the action type list this effect as an expected outcome?
+        expected = self.effect_mapping.get(action_type, frozenset())
+        if effect.event_type in expected:
+            certainty = 0.9
+        elif effect.pattern_name in expected:
+            certainty = 0.75
+        else:
+            return 0.3
+            
+        # Pattern table agreement with the reporting system
+        if effect.pattern_system is not None:
+            certainty += 0.1 if effect.pattern_system == effect.source_system else -0.1
+            
+        return min(certainty, 1.0)
         
     def calculate_context_certainty(self, ticket_id: str, effect_event: str) -> float:
         """Calculate context similarity certainty"""
         
-        # This would analyze the context of both ticket and effect
-        # to determine similarity
+        ticket, effect = self._lookup(ticket_id, effect_event)
+        if ticket is None or effect is None:
+            return 0.5
+            
+        return 0.4 + 0.6 * self._token_overlap(ticket.tokens, effect.tokens)
         
-        # For now, return a base certainty
-        return 0.7
+    @staticmethod
+    def _token_overlap(first: frozenset, second: frozenset) -> float:
+        if not first or not second:
+            return 0.0
+        return len(first & second) / min(len(first), len(second))
         
     def calculate_entropy_similarity(self, ticket_id: str, effect_event: str) -> float:
         """Calculate entropy similarity between ticket and effect"""
         
-        # This would compare entropy signatures and patterns
-        # between the ticket and effect event
+        ticket, effect = self._lookup(ticket_id, effect_event)
+        if ticket is None or effect is None:
+            return 0.5
+            
+        # Timing within the response threshold, then shared context
+        threshold = self.config['linking_settings']['response_time_threshold']
+        response_time = effect.epoch - ticket.epoch
+        time_similarity = max(0.0, 1.0 - abs(response_time) / threshold)
         
-        # For now, return a base similarity
-        return 0.75
+        return (time_similarity * 0.7) + (self._token_overlap(ticket.tokens, effect.tokens) * 0.3)
         
     def generate_resonance_fingerprint(self, ticket_id: str, effect_event: str) -> str:
         """Generate resonance fingerprint for ticket-effect pair"""
@@ -380,49 +930,46 @@ class ChronicleLinker:
         
     def get_causal_links_for_ticket(self, ticket_id: str) -> List[CausalLink]:
         """Get all causal links for a specific ticket"""
-        return [link for link in self.causal_links if link.ticket_id == ticket_id]
+        return self.causal_links.for_ticket(ticket_id)
         
     def get_causal_links_for_effect(self, effect_event: str) -> List[CausalLink]:
         """Get all causal links for a specific effect"""
-        return [link for link in self.causal_links if link.effect_event == effect_event]
+        return self.causal_links.for_effect(effect_event)
+        
+    def get_causal_links_for_system(self, source_system: str) -> List[CausalLink]:
+        """Get all causal links for a source system"""
+        return self.causal_links.for_system(source_system)
         
     def get_strongest_causal_links(self, min_strength: float = 0.8) -> List[CausalLink]:
-        """Get causal links above minimum strength threshold"""
-        return [link for link in self.causal_links if link.link_strength >= min_strength]
+        """Get causal links above minimum strength threshold, strongest first"""
+        return self.causal_links.above(min_strength)
+        
+    def get_top_causal_links(self, k: int = 10, source_system: Optional[str] = None) -> List[CausalLink]:
+        """Get the k strongest causal links, optionally for one source system"""
+        return self.causal_links.top(k, source_system)
         
     def generate_causal_report(self, hours: int = 24) -> Dict[str, Any]:
         """Generate causal analysis report"""
         
-        cutoff_time = datetime.now() - timedelta(hours=hours)
+        cutoff = time.time() - hours * 3600
         
-        # Filter links by time
-        recent_links = [
-            link for link in self.causal_links
-            if datetime.fromisoformat(link.created_at.replace('Z', '+00:00')) > cutoff_time
-        ]
+        # Per-system aggregates over the window
+        system_totals = self.causal_links.system_totals(cutoff)
         
         # Calculate statistics
-        total_links = len(recent_links)
-        avg_certainty = sum(link.causal_certainty for link in recent_links) / max(total_links, 1)
-        avg_strength = sum(link.link_strength for link in recent_links) / max(total_links, 1)
-        
-        # Group by source system
-        system_links = {}
-        for link in recent_links:
-            # Extract source system from effect event
-            source_system = self.extract_source_system(link.effect_event)
-            if source_system not in system_links:
-                system_links[source_system] = []
-            system_links[source_system].append(link)
-            
+        total_links = sum(stats[0] for stats in system_totals.values())
+        avg_certainty = sum(stats[1] for stats in system_totals.values()) / max(total_links, 1)
+        avg_strength = sum(stats[2] for stats in system_totals.values()) / max(total_links, 1)
+        
         # Calculate system statistics
-        system_stats = {}
-        for system, links in system_links.items():
-            system_stats[system] = {
-                'link_count': len(links),
-                'avg_certainty': sum(link.causal_certainty for link in links) / len(links),
-                'avg_strength': sum(link.link_strength for link in links) / len(links)
+        system_stats = {
+            system: {
+                'link_count': stats[0],
+                'avg_certainty': stats[1] / stats[0],
+                'avg_strength': stats[2] / stats[0]
             }
+            for system, stats in system_totals.items()
+        }
             
         return {
             'report_period': f"Last {hours} hours",
@@ -430,7 +977,7 @@ class ChronicleLinker:
             'avg_causal_certainty': avg_certainty,
             'avg_link_strength': avg_strength,
             'system_breakdown': system_stats,
-            'strongest_links': [asdict(link) for link in sorted(recent_links, key=lambda x: x.link_strength, reverse=True)[:10]],
+            'strongest_links': [asdict(link) for link in self.causal_links.top(10, since=cutoff)],
             'generated_at': datetime.now().isoformat()
         }
         
@@ -448,6 +995,50 @@ class ChronicleLinker:
         else:
             return 'unknown'
             
+    async def start_async(self):
+        """Start effect processing as tasks on the running event loop (asyncio mode)"""
+        if self.mode != 'asyncio':
+            raise RuntimeError("start_async requires asyncio processing mode")
+            
+        self.running = True
+        self.loop = asyncio.get_running_loop()
+        self.async_tasks = [
+            asyncio.create_task(self._process_effects_async()),
+            asyncio.create_task(self._process_observational_relay_async())
+        ]
+        
+    async def _process_effects_async(self):
+        """Validate and match effects from the asyncio queue in one step"""
+        while True:
+            effect = await self.effect_queue.get()
+            try:
+                if self.process_effect(effect):
+                    self.match_effect(effect)
+            except Exception as e:
+                self.logger.error(f"Error processing effect: {e}")
+            finally:
+                self.effect_queue.task_done()
+                
+    async def _process_observational_relay_async(self):
+        """Expire tickets and effects that fell out of the matching window"""
+        while True:
+            try:
+                self.expire_observations(time.time())
+            except Exception as e:
+                self.logger.error(f"Error processing observational relay: {e}")
+            await asyncio.sleep(1)
+            
+    async def shutdown_async(self, drain: bool = True):
+        """Drain queued effects and stop the processing tasks (asyncio mode)"""
+        if drain and self.async_tasks:
+            await self.effect_queue.join()
+            
+        self.running = False
+        for task in self.async_tasks:
+            task.cancel()
+        await asyncio.gather(*self.async_tasks, return_exceptions=True)
+        self.async_tasks = []
+        
     def shutdown(self):
         """Shutdown the chronicle linker"""
         self.running = False
@@ -462,6 +1053,7 @@ class ChronicleLinker:
 
 # Global instance
 chronicle_linker = None
+_chronicle_linker_lock = threading.Lock()
 
 def initialize_chronicle_linker():
     """Initialize the global chronicle linker"""
@@ -469,6 +1061,14 @@ def initialize_chronicle_linker():
     chronicle_linker = ChronicleLinker()
     return chronicle_linker
 
+def get_chronicle_linker() -> ChronicleLinker:
+    """Get the shared chronicle linker, creating it on first use"""
+    if chronicle_linker is None:
+        with _chronicle_linker_lock:
+            if chronicle_linker is None:
+                initialize_chronicle_linker()
+    return chronicle_linker
+
 def capture_effect(event_type: str, source_system: str, description: str,
                   affected_entities: List[str], severity: str = "medium") -> str:
     """Capture an effect event"""
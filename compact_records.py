@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Compact Records - Slotted, memory-lean variants of the ticketing and chronicle records
+Timestamps are held as epoch floats and categorical fields are interned; every variant
+converts to and from its dataclass and serializes to the same JSON shape
+"""
+
+import sys
+from datetime import datetime, timezone, timedelta
+from typing import Dict, List, Any, Optional, Tuple, Union
+
+from ticket_generator import SovereignTicket, IntentMirror, CausalMatch
+from chronicle_linker import EffectEvent, CausalLink
+from blockchain_logger import ResonanceAnomaly, AnomalySeverity
+
+_timezones: Dict[str, timezone] = {'Z': timezone.utc}
+
+
+def _timezone_for(suffix: str) -> timezone:
+    tz = _timezones.get(suffix)
+    if tz is None:
+        sign = -1 if suffix[0] == '-' else 1
+        hours, minutes = int(suffix[1:3]), int(suffix[4:6])
+        tz = _timezones[suffix] = timezone(sign * timedelta(hours=hours, minutes=minutes))
+    return tz
+
+
+def encode_timestamp(value: str) -> Tuple[Union[float, str], Optional[str]]:
+    """Encode an ISO timestamp as (epoch, timezone suffix)
+
+    Timestamps that would not decode back to the identical string are kept as strings.
+    """
+    try:
+        dt = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (ValueError, TypeError, AttributeError):
+        return value, None
+
+    suffix = None
+    if dt.tzinfo is not None:
+        if value.endswith('Z'):
+            suffix = 'Z'
+        elif len(value) > 6 and value[-6] in '+-' and value[-3] == ':':
+            suffix = sys.intern(value[-6:])
+        else:
+            return value, None
+
+    epoch = dt.timestamp()
+    if decode_timestamp(epoch, suffix) != value:
+        return value, None
+    return epoch, suffix
+
+
+def decode_timestamp(epoch: Union[float, str], suffix: Optional[str]) -> str:
+    """Decode an (epoch, timezone suffix) pair back to its ISO timestamp"""
+    if isinstance(epoch, str):
+        return epoch
+    if suffix is None:
+        return datetime.fromtimestamp(epoch).isoformat()
+    return datetime.fromtimestamp(epoch, _timezone_for(suffix)).replace(tzinfo=None).isoformat() + suffix
+
+
+def _intern(value):
+    return sys.intern(value) if type(value) is str else value
+
+
+def _slots(fields: Tuple[str, ...], timestamp_fields: Tuple[str, ...]) -> Tuple[str, ...]:
+    slots = []
+    for name in fields:
+        if name in timestamp_fields:
+            slots.extend((f"_{name}", f"_{name}_tz"))
+        else:
+            slots.append(name)
+    return tuple(slots)
+
+
+def _timestamp_property(name: str) -> property:
+    epoch_slot, tz_slot = f"_{name}", f"_{name}_tz"
+
+    def getter(self) -> str:
+        return decode_timestamp(getattr(self, epoch_slot), getattr(self, tz_slot))
+
+    def setter(self, value: str):
+        epoch, suffix = encode_timestamp(value)
+        setattr(self, epoch_slot, epoch)
+        setattr(self, tz_slot, suffix)
+
+    return property(getter, setter, doc=f"{name} as an ISO timestamp")
+
+
+class CompactRecord:
+    """Base for slotted records; subclasses declare their fields and record type"""
+
+    __slots__ = ()
+
+    record_type = None
+    fields: Tuple[str, ...] = ()
+    timestamp_fields: Tuple[str, ...] = ()
+    interned_fields: Tuple[str, ...] = ()
+    defaults: Dict[str, Any] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name in cls.timestamp_fields:
+            setattr(cls, name, _timestamp_property(name))
+
+    def __init__(self, **values):
+        for name in self.fields:
+            value = values[name] if name in values else self.defaults[name]
+            if name in self.interned_fields:
+                value = _intern(value)
+            setattr(self, name, value)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]):
+        """Build a compact record from the record's JSON shape"""
+        return cls(**{name: data[name] for name in cls.fields if name in data})
+
+    @classmethod
+    def from_record(cls, record):
+        """Build a compact record from its dataclass"""
+        return cls(**{name: getattr(record, name) for name in cls.fields})
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to the record's JSON shape"""
+        return {name: getattr(self, name) for name in self.fields}
+
+    def to_record(self):
+        """Convert back to the dataclass"""
+        return self.record_type(**{name: getattr(self, name) for name in self.fields})
+
+    @property
+    def epoch(self) -> float:
+        """Primary timestamp as epoch seconds"""
+        epoch = getattr(self, f"_{self.timestamp_fields[0]}")
+        if isinstance(epoch, str):
+            return datetime.fromisoformat(epoch.replace('Z', '+00:00')).timestamp()
+        return epoch
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, CompactRecord):
+            return type(self) is type(other) and self.to_dict() == other.to_dict()
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        values = ', '.join(f"{name}={getattr(self, name)!r}" for name in self.fields)
+        return f"{type(self).__name__}({values})"
+
+
+class CompactSovereignTicket(CompactRecord):
+    record_type = SovereignTicket
+    fields = ('ticket_id', 'action_type', 'performed_by', 'timestamp', 'entropy_hash',
+              'interface_context', 'resonance_signature', 'intent_hash', 'sovereign_fingerprint',
+              'linked_effects', 'causal_certainty', 'system_impact', 'mirror_depth',
+              'chronicle_status', 'session_id')
+    timestamp_fields = ('timestamp',)
+    interned_fields = ('action_type', 'performed_by', 'interface_context', 'resonance_signature',
+                       'system_impact', 'chronicle_status', 'session_id')
+    defaults = {'session_id': None}
+    __slots__ = _slots(fields, timestamp_fields)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = super().to_dict()
+        data['linked_effects'] = list(self.linked_effects)
+        return data
+
+
+class CompactIntentMirror(CompactRecord):
+    record_type = IntentMirror
+    fields = ('intent_id', 'sovereign_action', 'context_hash', 'timestamp', 'entropy_signature',
+              'resonance_level', 'linked_ticket', 'effect_tracking')
+    timestamp_fields = ('timestamp',)
+    interned_fields = ('sovereign_action', 'resonance_level')
+    __slots__ = _slots(fields, timestamp_fields)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = super().to_dict()
+        data['effect_tracking'] = [dict(effect) for effect in self.effect_tracking]
+        return data
+
+
+class CompactCausalMatch(CompactRecord):
+    record_type = CausalMatch
+    fields = ('match_id', 'intent_ticket', 'effect_event', 'response_time', 'causal_certainty',
+              'entropy_similarity', 'resonance_fingerprint', 'matched_at')
+    timestamp_fields = ('matched_at',)
+    interned_fields = ('effect_event',)
+    __slots__ = _slots(fields, timestamp_fields)
+
+
+class CompactEffectEvent(CompactRecord):
+    record_type = EffectEvent
+    fields = ('event_id', 'event_type', 'source_system', 'timestamp', 'description',
+              'affected_entities', 'severity', 'entropy_signature', 'resonance_level')
+    timestamp_fields = ('timestamp',)
+    interned_fields = ('event_type', 'source_system', 'severity', 'resonance_level')
+    __slots__ = _slots(fields, timestamp_fields)
+
+    def __init__(self, **values):
+        super().__init__(**values)
+        self.affected_entities = tuple(_intern(entity) for entity in self.affected_entities)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = super().to_dict()
+        data['affected_entities'] = list(self.affected_entities)
+        return data
+
+    def to_record(self) -> EffectEvent:
+        record = super().to_record()
+        record.affected_entities = list(self.affected_entities)
+        return record
+
+
+class CompactCausalLink(CompactRecord):
+    record_type = CausalLink
+    fields = ('link_id', 'ticket_id', 'effect_event', 'response_time', 'causal_certainty',
+              'entropy_similarity', 'resonance_fingerprint', 'link_strength', 'created_at')
+    timestamp_fields = ('created_at',)
+    interned_fields = ('ticket_id', 'effect_event')
+    __slots__ = _slots(fields, timestamp_fields)
+
+
+class CompactResonanceAnomaly(CompactRecord):
+    record_type = ResonanceAnomaly
+    fields = ('timestamp', 'gate_id', 'anomaly_type', 'severity', 'entropy_score', 'resonance_level',
+              'echo_signature', 'mirror_depth', 'reason', 'evidence', 'blockchain_hash', 'blockchain_tx')
+    timestamp_fields = ('timestamp',)
+    interned_fields = ('gate_id', 'anomaly_type', 'resonance_level', 'reason')
+    defaults = {'blockchain_hash': None, 'blockchain_tx': None}
+    __slots__ = _slots(fields, timestamp_fields)
+
+    def __init__(self, **values):
+        super().__init__(**values)
+        self.severity = AnomalySeverity(self.severity)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to the anomaly log entry shape (severity as its value)"""
+        data = super().to_dict()
+        data['severity'] = self.severity.value
+        return data
+
+
+COMPACT_TYPES = {
+    SovereignTicket: CompactSovereignTicket,
+    IntentMirror: CompactIntentMirror,
+    CausalMatch: CompactCausalMatch,
+    EffectEvent: CompactEffectEvent,
+    CausalLink: CompactCausalLink,
+    ResonanceAnomaly: CompactResonanceAnomaly,
+}
+
+
+def compact(record) -> CompactRecord:
+    """Convert a dataclass record to its compact variant"""
+    if isinstance(record, CompactRecord):
+        return record
+    return COMPACT_TYPES[type(record)].from_record(record)
+
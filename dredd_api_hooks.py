@@ -285,13 +285,7 @@ class DREDDServiceIntegrator:
             content_str = json.dumps(content, default=str)
             
             # Determine TTL based on encryption level
-            ttl_map = {
-                'low': 1800,      # 30 minutes
-                'medium': 3600,   # 1 hour
-                'high': 7200,     # 2 hours
-                'critical': 14400 # 4 hours
-            }
-            ttl = ttl_map.get(encryption_level, 3600)
+            ttl = self.get_ttl_for_level(encryption_level)
             
             # Send message
             success = await self.dispatcher.send_message(
@@ -309,6 +303,17 @@ class DREDDServiceIntegrator:
             self.logger.error(f"Error sending service message: {e}")
             return False
             
+    def get_ttl_for_level(self, encryption_level: str) -> int:
+        """Get message TTL for an encryption level"""
+        
+        ttl_map = {
+            'low': 1800,      # 30 minutes
+            'medium': 3600,   # 1 hour
+            'high': 7200,     # 2 hours
+            'critical': 14400 # 4 hours
+        }
+        return ttl_map.get(encryption_level, 3600)
+        
     async def receive_service_messages(self, service_name: str, timeout: int = 30) -> List[Dict[str, Any]]:
         """Receive messages for a service"""
         
@@ -455,26 +460,44 @@ class DREDDServiceIntegrator:
         if target_services is None:
             target_services = list(self.hooks.keys())
             
+        # Create broadcast message
+        broadcast_content = {
+            'type': 'service_broadcast',
+            'event_type': event_type,
+            'event_data': event_data,
+            'source_service': 'DREDD_Integrator',
+            'timestamp': datetime.now().isoformat(),
+            'target_services': target_services
+        }
+        content_str = json.dumps(broadcast_content, default=str)
+        
+        # Send one batched dispatch for every hooked service
+        batch_services = []
+        batch_items = []
         for service_name in target_services:
             if service_name in self.hooks:
                 hook = self.hooks[service_name]
+                batch_services.append(service_name)
+                batch_items.append((
+                    content_str,
+                    hook.sigil_target,
+                    self.get_ttl_for_level(hook.encryption_level),
+                    hook.encryption_level
+                ))
                 
-                # Create broadcast message
-                broadcast_content = {
-                    'type': 'service_broadcast',
-                    'event_type': event_type,
-                    'event_data': event_data,
-                    'source_service': 'DREDD_Integrator',
-                    'timestamp': datetime.now().isoformat(),
-                    'target_services': target_services
-                }
-                
-                # Send message
-                success = await self.send_service_message(
-                    service_name, broadcast_content, hook.sigil_target, hook.encryption_level
-                )
-                
-                results[service_name] = success
+        try:
+            batch_results = await self.dispatcher.send_batch(batch_items) if batch_items else []
+        except Exception as e:
+            self.logger.error(f"Error broadcasting service event: {e}")
+            batch_results = [{'accepted': False} for _ in batch_items]
+            
+        for service_name, batch_result in zip(batch_services, batch_results):
+            results[service_name] = batch_result['accepted']
+            
+            if batch_result['accepted']:
+                self.logger.info(f"DREDD broadcast sent to {service_name}")
+            else:
+                self.logger.error(f"Failed to broadcast DREDD event to {service_name}")
                 
         return results
         
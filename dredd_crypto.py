@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+DREDD Crypto - Shared quantum key derivation helpers for DREDD dispatch and parsing
+Provides a bounded, time-bucketed cache so PBKDF2 key derivation runs once per sigil and bucket,
+a whole-buffer XOR stream shared by encryption and decryption, and chunked payload encryption
+so large messages are encrypted, framed and reassembled a chunk at a time
+"""
+
+import time
+import hmac
+import base64
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple, Iterator
+from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+QUANTUM_KEY_SALT = b'dredd_quantum_salt'
+QUANTUM_KEY_ITERATIONS = 100000
+QUANTUM_KEY_LENGTH = 32
+
+CHUNKED_FORMAT = 'chunked'
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def derive_quantum_key(target_sigil: str, session_key: str, time_bucket: int) -> bytes:
+    """Derive quantum-resistant key material with PBKDF2"""
+    key_material = f"{target_sigil}:{session_key}:{time_bucket}"
+
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=QUANTUM_KEY_LENGTH,
+        salt=QUANTUM_KEY_SALT,
+        iterations=QUANTUM_KEY_ITERATIONS,
+    )
+
+    return kdf.derive(key_material.encode())
+
+
+def xor_with_key(data: bytes, quantum_key: bytes) -> bytes:
+    """XOR data with a repeating quantum key in a single big-integer operation"""
+    length = len(data)
+    if length == 0:
+        return b''
+    if not quantum_key:
+        raise ValueError("quantum_key must not be empty")
+
+    # Tile the key across the payload, then XOR both buffers as integers
+    repeats, remainder = divmod(length, len(quantum_key))
+    key_stream = quantum_key * repeats + quantum_key[:remainder]
+
+    result = int.from_bytes(data, 'little') ^ int.from_bytes(key_stream, 'little')
+    return result.to_bytes(length, 'little')
+
+
+class QuantumKeyCache:
+    """LRU cache of derived quantum keys keyed by (target_sigil, session_key, time bucket)
+
+    With enabled=False every lookup derives its key; keys still follow the time bucket.
+    """
+
+    def __init__(self, max_size: int = 1000, bucket_seconds: int = 1, enabled: bool = True):
+        self.max_size = max(int(max_size), 1)
+        self.bucket_seconds = max(int(bucket_seconds), 1)
+        self.enabled = enabled
+        self._keys: "OrderedDict[Tuple[str, str, int], bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def current_bucket(self, now: Optional[float] = None) -> int:
+        """Get the start of the time bucket containing now"""
+        if now is None:
+            now = time.time()
+        return int(now) // self.bucket_seconds * self.bucket_seconds
+
+    def get_key(self, target_sigil: str, session_key: str, now: Optional[float] = None) -> bytes:
+        """Get the quantum key for the current bucket, deriving it on a miss"""
+        cache_key = (target_sigil, session_key, self.current_bucket(now))
+        if not self.enabled:
+            with self._lock:
+                self.misses += 1
+            return derive_quantum_key(*cache_key)
+
+        with self._lock:
+            quantum_key = self._keys.get(cache_key)
+            if quantum_key is not None:
+                self._keys.move_to_end(cache_key)
+                self.hits += 1
+                return quantum_key
+            self.misses += 1
+
+        # Derive outside the lock so concurrent sigils do not serialize on PBKDF2
+        quantum_key = derive_quantum_key(*cache_key)
+
+        with self._lock:
+            self._keys[cache_key] = quantum_key
+            self._keys.move_to_end(cache_key)
+            while len(self._keys) > self.max_size:
+                self._keys.popitem(last=False)
+                self.evictions += 1
+
+        return quantum_key
+
+    def invalidate_session(self, session_key: str) -> int:
+        """Drop every cached key derived from a session key"""
+        with self._lock:
+            stale = [key for key in self._keys if key[1] == session_key]
+            for key in stale:
+                del self._keys[key]
+            self.invalidations += len(stale)
+
+        return len(stale)
+
+    def clear(self):
+        """Drop all cached keys"""
+        with self._lock:
+            self.invalidations += len(self._keys)
+            self._keys.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache hit/miss counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'enabled': self.enabled,
+                'size': len(self._keys),
+                'max_size': self.max_size,
+                'bucket_seconds': self.bucket_seconds,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
+
+
+def encrypt_chunks(payload: bytes, quantum_key: bytes,
+                   chunk_size: int = DEFAULT_CHUNK_SIZE) -> Tuple[Dict[str, Any], Iterator[Dict[str, Any]]]:
+    """Encrypt a payload as a descriptor and a lazy sequence of chunk frames
+
+    The classical key is generated and wrapped with the quantum key once; each frame carries one
+    Fernet token (already URL-safe base64) and its HMAC, and is only built when iterated.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    classical_key = Fernet.generate_key()
+    chunk_count = max((len(payload) + chunk_size - 1) // chunk_size, 1)
+    descriptor = {
+        'format': CHUNKED_FORMAT,
+        'encrypted_key': base64.b64encode(xor_with_key(classical_key, quantum_key)).decode(),
+        'chunk_size': chunk_size,
+        'chunk_count': chunk_count,
+        'total_bytes': len(payload),
+        'content_hash': hashlib.sha256(payload).hexdigest()
+    }
+
+    def frames() -> Iterator[Dict[str, Any]]:
+        fernet = Fernet(classical_key)
+        view = memoryview(payload)
+        for index in range(chunk_count):
+            token = fernet.encrypt(bytes(view[index * chunk_size:(index + 1) * chunk_size]))
+            yield {
+                'index': index,
+                'data': token.decode(),
+                'signature': hmac.new(quantum_key, token, hashlib.sha256).hexdigest()
+            }
+
+    return descriptor, frames()
+
+
+class ChunkDecryptor:
+    """Reassembles a chunked payload incrementally, verifying and decrypting frames as they arrive
+
+    Frames may arrive out of order; they are held encrypted until their predecessors are in.
+    """
+
+    def __init__(self, descriptor: Dict[str, Any], quantum_key: bytes):
+        if descriptor.get('format') != CHUNKED_FORMAT:
+            raise ValueError(f"Not a chunked payload: {descriptor.get('format')}")
+
+        self.quantum_key = quantum_key
+        self.chunk_count = descriptor['chunk_count']
+        self.total_bytes = descriptor['total_bytes']
+        self.content_hash = descriptor['content_hash']
+        self.fernet = Fernet(xor_with_key(base64.b64decode(descriptor['encrypted_key']), quantum_key))
+
+        self.next_index = 0
+        self.received_bytes = 0
+        self._pending: Dict[int, bytes] = {}
+        self._digest = hashlib.sha256()
+
+    def feed(self, frame: Dict[str, Any]) -> List[bytes]:
+        """Accept one frame; returns the plaintext chunks it completes, in order"""
+        index = frame['index']
+        if not 0 <= index < self.chunk_count:
+            raise ValueError(f"Chunk index {index} outside 0..{self.chunk_count - 1}")
+
+        token = frame['data'].encode()
+        expected = hmac.new(self.quantum_key, token, hashlib.sha256).hexdigest()
+        if not hmac.compare_digest(expected, frame.get('signature', '')):
+            raise ValueError(f"Invalid signature on chunk {index}")
+        if index >= self.next_index:
+            self._pending[index] = token
+
+        completed = []
+        while self.next_index in self._pending:
+            chunk = self.fernet.decrypt(self._pending.pop(self.next_index))
+            self._digest.update(chunk)
+            self.received_bytes += len(chunk)
+            self.next_index += 1
+            completed.append(chunk)
+        return completed
+
+    @property
+    def complete(self) -> bool:
+        return self.next_index == self.chunk_count
+
+    def finish(self):
+        """Check that every chunk arrived and the reassembled payload matches its hash"""
+        if not self.complete:
+            raise ValueError(f"Incomplete payload: {self.next_index}/{self.chunk_count} chunks")
+        if self.received_bytes != self.total_bytes or self._digest.hexdigest() != self.content_hash:
+            raise ValueError("Reassembled payload does not match its content hash")
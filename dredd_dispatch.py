@@ -7,20 +7,24 @@ Send/receive sigil-bound messages with quantum-hybrid encryption and mirror-awar
 import json
 import time
 import hashlib
+import hmac
 import base64
 import argparse
 import asyncio
 import websockets
 import threading
+import random
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.primitives.asymmetric import rsa, padding
 import secrets
 import logging
+from contextlib import AsyncExitStack
+
+from dredd_crypto import QuantumKeyCache, xor_with_key, encrypt_chunks, DEFAULT_CHUNK_SIZE
+from dredd_relay_pool import DREDDRelayPool
 
 @dataclass
 class DREDDMessage:
@@ -53,11 +57,33 @@ class DREDDDispatcher:
         self.logger = logging.getLogger('dredd_dispatch')
         self.active_channels = {}
         
+        # Quantum key cache
+        cache_config = self.config.get('performance', {}).get('caching', {})
+        self.key_cache = QuantumKeyCache(
+            max_size=cache_config.get('max_size', 1000),
+            bucket_seconds=cache_config.get('key_bucket_seconds', 60),
+            enabled=cache_config.get('enabled', True)
+        )
+        
+        # Persistent relay connections
+        pool_config = self.config.get('performance', {}).get('connection_pooling', {})
+        self.relay_pool = None
+        if pool_config.get('enabled', True):
+            self.relay_pool = DREDDRelayPool(
+                connect_timeout=pool_config.get('connection_timeout', 30),
+                request_timeout=pool_config.get('request_timeout', 30),
+                health_check_interval=pool_config.get('health_check_interval', 15),
+                backoff_base=pool_config.get('backoff_base', 0.5),
+                backoff_max=pool_config.get('backoff_max', 30)
+            )
+        
     def load_config(self, config_file: str) -> Dict[str, Any]:
         """Load DREDD configuration"""
         try:
             with open(config_file, 'r') as f:
-                return json.load(f)
+                config = json.load(f)
+            # dredd_config.json nests its settings under a top-level "dredd_config" key
+            return config.get('dredd_config', config)
         except FileNotFoundError:
             # Default configuration
             return {
@@ -80,6 +106,30 @@ class DREDDDispatcher:
                     'trap_enabled': True,
                     'noise_injection': True,
                     'entropy_validation': True
+                },
+                'performance': {
+                    'caching': {
+                        'enabled': True,
+                        'max_size': 1000,
+                        'key_bucket_seconds': 60
+                    },
+                    'connection_pooling': {
+                        'enabled': True,
+                        'connection_timeout': 30,
+                        'request_timeout': 30,
+                        'health_check_interval': 15,
+                        'backoff_base': 0.5,
+                        'backoff_max': 30
+                    },
+                    'streaming': {
+                        'chunk_size': DEFAULT_CHUNK_SIZE
+                    },
+                    'delivery': {
+                        'recipient_timeout': 30,
+                        'retries': 2,
+                        'retry_backoff_base': 0.5,
+                        'retry_backoff_max': 5
+                    }
                 }
             }
             
@@ -87,9 +137,38 @@ class DREDDDispatcher:
         """Generate a new session key for DREDD operations"""
         return Fernet.generate_key().decode()
         
+    def rotate_session_key(self) -> str:
+        """Rotate the session key and invalidate keys derived from the old one"""
+        old_session_key = self.session_key
+        self.session_key = self.generate_session_key()
+        
+        invalidated = self.key_cache.invalidate_session(old_session_key)
+        self.logger.info(f"Session key rotated, {invalidated} cached quantum keys invalidated")
+        
+        return self.session_key
+        
+    def get_key_cache_stats(self) -> Dict[str, Any]:
+        """Get quantum key cache hit/miss counters"""
+        return self.key_cache.get_stats()
+        
+    def get_pool_metrics(self) -> Dict[str, Any]:
+        """Get relay connection pool metrics"""
+        if self.relay_pool is None:
+            return {'enabled': False}
+        return {'enabled': True, **self.relay_pool.get_metrics()}
+        
+    async def close(self):
+        """Close pooled relay connections"""
+        if self.relay_pool is not None:
+            await self.relay_pool.close()
+        
     def create_dredd_message(self, content: str, target_sigil: str, 
-                           ttl: int = 3600, resonance_level: str = "medium") -> DREDDMessage:
-        """Create a new DREDD message with quantum-hybrid encryption"""
+                           ttl: int = 3600, resonance_level: str = "medium",
+                           shared: Optional[Tuple[bytes, bytes, str]] = None) -> DREDDMessage:
+        """Create a new DREDD message with quantum-hybrid encryption
+        
+        shared, from encrypt_shared, reuses content already encrypted for other recipients.
+        """
         
         # Generate message ID
         message_id = f"dredd_{int(time.time())}_{secrets.token_hex(8)}"
@@ -98,7 +177,7 @@ class DREDDDispatcher:
         entropy_header = self.generate_entropy_header()
         
         # Encrypt content with quantum-hybrid approach
-        encrypted_content = self.quantum_hybrid_encrypt(content, target_sigil)
+        encrypted_content = self.quantum_hybrid_encrypt(content, target_sigil, shared)
         
         # Create mirror trap
         mirror_trap = self.create_mirror_trap(target_sigil, message_id)
@@ -118,6 +197,35 @@ class DREDDDispatcher:
             resonance_level=resonance_level
         )
         
+    def create_stream_message(self, payload: bytes, target_sigil: str, ttl: int = 3600,
+                              resonance_level: str = "medium",
+                              chunk_size: Optional[int] = None) -> Tuple[DREDDMessage, Any]:
+        """Create a DREDD message whose content travels as encrypted chunk frames
+        
+        The message carries the chunk descriptor in place of the encrypted content; the
+        returned frame iterator encrypts each chunk only when it is about to be sent.
+        """
+        if chunk_size is None:
+            chunk_size = self.config.get('performance', {}).get('streaming', {}).get('chunk_size', DEFAULT_CHUNK_SIZE)
+            
+        message_id = f"dredd_{int(time.time())}_{secrets.token_hex(8)}"
+        entropy_header = self.generate_entropy_header()
+        descriptor, frames = encrypt_chunks(payload, self.generate_quantum_key(target_sigil), chunk_size)
+        
+        message = DREDDMessage(
+            message_id=message_id,
+            sigil_target=target_sigil,
+            entropy_header=entropy_header,
+            encrypted_content=base64.b64encode(json.dumps(descriptor).encode()).decode(),
+            mirror_trap=self.create_mirror_trap(target_sigil, message_id),
+            timestamp=datetime.now().isoformat(),
+            ttl=ttl,
+            echo_signature=self.generate_echo_signature(message_id, target_sigil, entropy_header),
+            resonance_level=resonance_level
+        )
+        
+        return message, frames
+        
     def generate_entropy_header(self) -> str:
         """Generate entropy header for message validation"""
         entropy_data = {
@@ -130,18 +238,27 @@ class DREDDDispatcher:
         entropy_json = json.dumps(entropy_data, sort_keys=True)
         return base64.b64encode(entropy_json.encode()).decode()
         
-    def quantum_hybrid_encrypt(self, content: str, target_sigil: str) -> str:
+    def encrypt_shared(self, content: str) -> Tuple[bytes, bytes, str]:
+        """Encrypt content once with a fresh classical key for recipients of one key policy
+        
+        Returns (classical key, encrypted content, base64 encrypted content); each recipient
+        then only wraps the classical key and signs with its own quantum key. Only share it
+        between recipients of the same sigil and resonance level: anyone who unwraps the
+        classical key can recover the quantum key it was wrapped with for another recipient.
+        """
+        classical_key = Fernet.generate_key()
+        encrypted_content = Fernet(classical_key).encrypt(content.encode())
+        return classical_key, encrypted_content, base64.b64encode(encrypted_content).decode()
+        
+    def quantum_hybrid_encrypt(self, content: str, target_sigil: str,
+                               shared: Optional[Tuple[bytes, bytes, str]] = None) -> str:
         """Encrypt content using quantum-hybrid approach"""
         
         # Generate quantum-resistant key material
         quantum_key = self.generate_quantum_key(target_sigil)
         
-        # Create classical encryption key
-        classical_key = Fernet.generate_key()
-        fernet = Fernet(classical_key)
-        
-        # Encrypt content with classical encryption
-        encrypted_content = fernet.encrypt(content.encode())
+        # Encrypt content with classical encryption, unless already encrypted for another recipient
+        classical_key, encrypted_content, encoded_content = shared or self.encrypt_shared(content)
         
         # Encrypt classical key with quantum-resistant encryption
         encrypted_key = self.encrypt_with_quantum_key(classical_key, quantum_key)
@@ -149,7 +266,7 @@ class DREDDDispatcher:
         # Combine encrypted key and content
         combined = {
             'encrypted_key': base64.b64encode(encrypted_key).decode(),
-            'encrypted_content': base64.b64encode(encrypted_content).decode(),
+            'encrypted_content': encoded_content,
             'quantum_signature': self.generate_quantum_signature(encrypted_content, quantum_key)
         }
         
@@ -160,18 +277,8 @@ class DREDDDispatcher:
         # This would integrate with actual quantum-resistant algorithms
         # For now, using a hybrid approach with strong classical cryptography
         
-        # Derive key from sigil and session
-        key_material = f"{target_sigil}:{self.session_key}:{int(time.time())}"
-        
-        # Use PBKDF2 for key derivation
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=b'dredd_quantum_salt',
-            iterations=100000,
-        )
-        
-        return kdf.derive(key_material.encode())
+        # Derive key from sigil, session and time bucket (PBKDF2, cached per bucket)
+        return self.key_cache.get_key(target_sigil, self.session_key)
         
     def encrypt_with_quantum_key(self, data: bytes, quantum_key: bytes) -> bytes:
         """Encrypt data with quantum-resistant key"""
@@ -180,18 +287,14 @@ class DREDDDispatcher:
         
         # Simple XOR encryption for demonstration
         # In production, this would use Kyber or Dilithium
-        encrypted = bytearray(len(data))
-        for i in range(len(data)):
-            encrypted[i] = data[i] ^ quantum_key[i % len(quantum_key)]
-            
-        return bytes(encrypted)
+        return xor_with_key(data, quantum_key)
         
     def generate_quantum_signature(self, data: bytes, quantum_key: bytes) -> str:
         """Generate quantum-resistant signature"""
         # This would use actual quantum-resistant signatures
         # For now, using HMAC with quantum key material
         
-        signature = hashlib.hmac.new(
+        signature = hmac.new(
             quantum_key,
             data,
             hashlib.sha256
@@ -268,12 +371,13 @@ class DREDDDispatcher:
         return selected_nodes
         
     async def send_message(self, content: str, target_sigil: str, 
-                          ttl: int = 3600, resonance_level: str = "medium") -> bool:
+                          ttl: int = 3600, resonance_level: str = "medium",
+                          shared: Optional[Tuple[bytes, bytes, str]] = None) -> bool:
         """Send a DREDD message to target sigil"""
         
         try:
             # Create DREDD message
-            dredd_message = self.create_dredd_message(content, target_sigil, ttl, resonance_level)
+            dredd_message = self.create_dredd_message(content, target_sigil, ttl, resonance_level, shared)
             
             # Create sigil envelope
             envelope = self.create_sigil_envelope(dredd_message)
@@ -292,18 +396,90 @@ class DREDDDispatcher:
             self.logger.error(f"Error sending DREDD message: {e}")
             return False
             
+    async def send_to_recipients(self, content, recipients: Dict[str, Tuple[str, str]], ttl: int = 3600,
+                                 timeout: Optional[float] = None, retries: Optional[int] = None,
+                                 stream: bool = False) -> Dict[str, Dict[str, Any]]:
+        """Deliver one payload to several recipients concurrently
+        
+        recipients maps a recipient name to (target_sigil, resonance_level). Each recipient
+        gets its own deadline (timeout seconds covering every attempt) and retries failed
+        sends with jittered exponential backoff, so a slow relay only delays its own
+        recipient. Message content is encrypted once per key policy (sigil and resonance
+        level) and shared within it; stream=True sends bytes content as chunked streams
+        instead, which are encrypted per recipient.
+        Returns a result per recipient with accepted, attempts, elapsed and reason.
+        """
+        delivery_config = self.config.get('performance', {}).get('delivery', {})
+        if timeout is None:
+            timeout = delivery_config.get('recipient_timeout', 30)
+        if retries is None:
+            retries = delivery_config.get('retries', 2)
+        backoff_base = delivery_config.get('retry_backoff_base', 0.5)
+        backoff_max = delivery_config.get('retry_backoff_max', 5)
+        
+        # Recipients only share a classical key when they share the key that wraps it
+        shared = {} if stream else {policy: self.encrypt_shared(content) for policy in set(recipients.values())}
+        
+        async def attempt(target_sigil: str, resonance_level: str) -> bool:
+            if stream:
+                return await self.send_stream(content, target_sigil, ttl, resonance_level)
+            return await self.send_message(content, target_sigil, ttl, resonance_level,
+                                           shared[(target_sigil, resonance_level)])
+            
+        async def deliver(name: str, target_sigil: str, resonance_level: str) -> Dict[str, Any]:
+            start = time.monotonic()
+            deadline = start + timeout
+            result = {'recipient': name, 'target_sigil': target_sigil, 'accepted': False,
+                      'attempts': 0, 'elapsed': 0.0, 'reason': None}
+            
+            while True:
+                result['attempts'] += 1
+                try:
+                    if await asyncio.wait_for(attempt(target_sigil, resonance_level), deadline - time.monotonic()):
+                        result['accepted'] = True
+                        result['reason'] = None
+                        break
+                    result['reason'] = 'rejected'
+                except asyncio.TimeoutError:
+                    result['reason'] = 'timeout'
+                    
+                if result['attempts'] > retries:
+                    break
+                delay = min(backoff_max, backoff_base * (2 ** (result['attempts'] - 1)))
+                delay = random.uniform(delay / 2, delay)
+                if time.monotonic() + delay >= deadline:
+                    break
+                await asyncio.sleep(delay)
+                
+            result['elapsed'] = time.monotonic() - start
+            return result
+            
+        results = await asyncio.gather(*[
+            deliver(name, target_sigil, resonance_level)
+            for name, (target_sigil, resonance_level) in recipients.items()
+        ])
+        
+        accepted = sum(1 for result in results if result['accepted'])
+        self.logger.info(f"DREDD fan-out: {accepted}/{len(results)} recipients accepted")
+        
+        return {result['recipient']: result for result in results}
+        
     async def dispatch_to_nodes(self, message: DREDDMessage, envelope: SigilEnvelope) -> bool:
         """Dispatch message to relay nodes"""
         
         async def send_to_node(node_url: str) -> bool:
             try:
-                async with websockets.connect(node_url) as websocket:
-                    payload = {
-                        'type': 'dredd_message',
-                        'message': asdict(message),
-                        'envelope': asdict(envelope)
-                    }
+                payload = {
+                    'type': 'dredd_message',
+                    'message': asdict(message),
+                    'envelope': asdict(envelope)
+                }
+                
+                if self.relay_pool is not None:
+                    response_data = await self.relay_pool.request(node_url, payload, message.message_id)
+                    return response_data.get('status') == 'accepted'
                     
+                async with websockets.connect(node_url) as websocket:
                     await websocket.send(json.dumps(payload))
                     response = await websocket.recv()
                     
@@ -321,6 +497,174 @@ class DREDDDispatcher:
         # Return True if at least one node accepted
         return any(result for result in results if isinstance(result, bool) and result)
         
+    async def send_stream(self, payload: bytes, target_sigil: str, ttl: int = 3600,
+                          resonance_level: str = "medium", chunk_size: Optional[int] = None) -> bool:
+        """Send a large payload to target sigil as a stream of encrypted chunk frames"""
+        
+        try:
+            message, frames = self.create_stream_message(payload, target_sigil, ttl, resonance_level, chunk_size)
+            envelope = self.create_sigil_envelope(message)
+            
+            success = await self.dispatch_stream_to_nodes(message, envelope, frames)
+            
+            if success:
+                self.logger.info(f"DREDD stream sent: {message.message_id} to {target_sigil} ({len(payload)} bytes)")
+                return True
+            else:
+                self.logger.error(f"Failed to send DREDD stream: {message.message_id}")
+                return False
+                
+        except Exception as e:
+            self.logger.error(f"Error sending DREDD stream: {e}")
+            return False
+            
+    async def dispatch_stream_to_nodes(self, message: DREDDMessage, envelope: SigilEnvelope, frames) -> bool:
+        """Send a stream header and then each chunk frame to every delivery node
+        
+        Each chunk is encrypted once, sent to all nodes still accepting the stream and
+        acknowledged before the next is built, so only one chunk is in memory at a time.
+        """
+        
+        async with AsyncExitStack() as stack:
+            senders = {}
+            for node_url in envelope.delivery_nodes:
+                try:
+                    senders[node_url] = await self._stream_sender(node_url, message.message_id, stack)
+                except Exception as e:
+                    self.logger.error(f"Failed to open stream to node {node_url}: {e}")
+                    
+            async def send_frame(node_url: str, payload: Dict[str, Any]) -> bool:
+                try:
+                    response_data = await senders[node_url](payload)
+                    return response_data.get('status') == 'accepted'
+                except Exception as e:
+                    self.logger.error(f"Failed to stream to node {node_url}: {e}")
+                    return False
+                    
+            async def send_to_live(payload: Dict[str, Any]):
+                live = list(senders)
+                results = await asyncio.gather(*[send_frame(node_url, payload) for node_url in live])
+                for node_url, accepted in zip(live, results):
+                    if not accepted:
+                        del senders[node_url]
+                        
+            await send_to_live({
+                'type': 'dredd_stream_start',
+                'message': asdict(message),
+                'envelope': asdict(envelope)
+            })
+            for frame in frames:
+                if not senders:
+                    break
+                await send_to_live({'type': 'dredd_chunk', 'message_id': message.message_id, **frame})
+                
+            return bool(senders)
+            
+    async def _stream_sender(self, node_url: str, message_id: str, stack: AsyncExitStack):
+        """Get a coroutine function that sends one stream frame to a node and returns its response"""
+        if self.relay_pool is not None:
+            async def send(payload: Dict[str, Any]) -> Dict[str, Any]:
+                return await self.relay_pool.request(node_url, payload, message_id)
+            return send
+            
+        websocket = await stack.enter_async_context(websockets.connect(node_url))
+        
+        async def send(payload: Dict[str, Any]) -> Dict[str, Any]:
+            await websocket.send(json.dumps(payload))
+            return json.loads(await websocket.recv())
+        return send
+        
+    async def send_batch(self, items: List[Tuple], resonance_level: str = "medium") -> List[Dict[str, Any]]:
+        """Send many DREDD messages, shipping one framed payload per relay node
+        
+        Each item is (content, target_sigil, ttl) or (content, target_sigil, ttl, resonance_level).
+        Returns one result per item, in order, with the per-node accept/reject status.
+        """
+        
+        results = []
+        node_groups: Dict[str, List[Tuple[int, DREDDMessage, SigilEnvelope]]] = {}
+        
+        for index, item in enumerate(items):
+            content, target_sigil, ttl = item[:3]
+            level = item[3] if len(item) > 3 else resonance_level
+            
+            try:
+                message = self.create_dredd_message(content, target_sigil, ttl, level)
+                envelope = self.create_sigil_envelope(message)
+            except Exception as e:
+                self.logger.error(f"Error creating batched DREDD message for {target_sigil}: {e}")
+                results.append({
+                    'message_id': None,
+                    'target_sigil': target_sigil,
+                    'accepted': False,
+                    'reason': 'message_creation_failed',
+                    'nodes': {}
+                })
+                continue
+                
+            results.append({
+                'message_id': message.message_id,
+                'target_sigil': target_sigil,
+                'accepted': False,
+                'reason': 'rejected' if envelope.delivery_nodes else 'no_delivery_nodes',
+                'nodes': {}
+            })
+            
+            for node_url in envelope.delivery_nodes:
+                node_groups.setdefault(node_url, []).append((index, message, envelope))
+                
+        async def send_group(node_url: str, group: List[Tuple[int, DREDDMessage, SigilEnvelope]]):
+            batch_id = f"batch_{int(time.time())}_{secrets.token_hex(8)}"
+            payload = {
+                'type': 'dredd_batch',
+                'batch_id': batch_id,
+                'messages': [
+                    {'message': asdict(message), 'envelope': asdict(envelope)}
+                    for _, message, envelope in group
+                ]
+            }
+            
+            statuses = {}
+            try:
+                if self.relay_pool is not None:
+                    response_data = await self.relay_pool.request(node_url, payload, batch_id)
+                else:
+                    async with websockets.connect(node_url) as websocket:
+                        await websocket.send(json.dumps(payload))
+                        response_data = json.loads(await websocket.recv())
+                        
+                statuses = {
+                    result.get('message_id'): result
+                    for result in response_data.get('results', [])
+                }
+                
+            except Exception as e:
+                self.logger.error(f"Failed to send batch {batch_id} to node {node_url}: {e}")
+                
+            for index, message, _ in group:
+                status = statuses.get(message.message_id)
+                result = results[index]
+                
+                if status is None:
+                    result['nodes'][node_url] = 'failed'
+                    if not result['accepted']:
+                        result['reason'] = 'relay_unavailable'
+                elif status.get('status') == 'accepted':
+                    result['nodes'][node_url] = 'accepted'
+                    result['accepted'] = True
+                    result['reason'] = None
+                else:
+                    result['nodes'][node_url] = status.get('status', 'rejected')
+                    if not result['accepted']:
+                        result['reason'] = status.get('reason', 'rejected')
+                        
+        await asyncio.gather(*[send_group(node, group) for node, group in node_groups.items()])
+        
+        accepted = sum(1 for result in results if result['accepted'])
+        self.logger.info(f"DREDD batch sent: {accepted}/{len(results)} messages accepted via {len(node_groups)} nodes")
+        
+        return results
+        
     async def receive_messages(self, target_sigil: str, timeout: int = 30) -> List[DREDDMessage]:
         """Receive messages for target sigil"""
         
@@ -421,11 +765,20 @@ class DREDDDispatcher:
     def decrypt_with_quantum_key(self, encrypted_data: bytes, quantum_key: bytes) -> bytes:
         """Decrypt data with quantum-resistant key"""
         # Reverse the XOR encryption
-        decrypted = bytearray(len(encrypted_data))
-        for i in range(len(encrypted_data)):
-            decrypted[i] = encrypted_data[i] ^ quantum_key[i % len(quantum_key)]
-            
-        return bytes(decrypted)
+        return xor_with_key(encrypted_data, quantum_key)
+
+# Global instance
+dredd_dispatcher = None
+_dredd_dispatcher_lock = threading.Lock()
+
+def get_dredd_dispatcher() -> DREDDDispatcher:
+    """Get the shared DREDD dispatcher, creating it on first use"""
+    global dredd_dispatcher
+    if dredd_dispatcher is None:
+        with _dredd_dispatcher_lock:
+            if dredd_dispatcher is None:
+                dredd_dispatcher = DREDDDispatcher()
+    return dredd_dispatcher
 
 async def main():
     """Main CLI interface for DREDD dispatch"""
@@ -479,6 +832,8 @@ async def main():
                     print("Content: [Decryption failed]")
         else:
             print("📭 No messages received")
+            
+    await dispatcher.close()
 
 if __name__ == "__main__":
     asyncio.run(main()) 
\ No newline at end of file
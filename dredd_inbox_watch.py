@@ -6,6 +6,8 @@ Allows internal actors to receive ASRs in-session and respond with acknowledgmen
 
 import asyncio
 import json
+import math
+import random
 import logging
 import time
 import hashlib
@@ -16,31 +18,341 @@ import threading
 import queue
 import os
 import base64
+import secrets
+from collections import OrderedDict
 
 # Import DREDD components
-from dredd_dispatch import DREDDDispatcher
-from asr_generator import ASRGenerator, AcclimationSequencingReport
+from dredd_dispatch import DREDDDispatcher, get_dredd_dispatcher
+from asr_generator import ASRGenerator, AcclimationSequencingReport, get_asr_generator
+from inbox_prefilter import InboxPrefilter
+from jsonl_sink import get_sink
+
+# Sigils the inbox serves, by recipient type
+SIGIL_RECIPIENT_TYPES = {
+    'glyph-hash-djinn-council': 'djinn_council',
+    'glyph-hash-sovereign-archive': 'sovereign_archive',
+    'glyph-hash-watch-guard': 'watch_guard',
+    'glyph-hash-lattice-core': 'lattice_core',
+    'glyph-hash-mkp': 'mirror_keyring_protocol',
+    'glyph-hash-resonance-scanner': 'resonance_scanner',
+    'glyph-hash-entropy-monitor': 'entropy_monitor',
+    'glyph-hash-chronicle-linker': 'chronicle_linker'
+}
+
+# Id fields of the entries kept in asr_responses
+RESPONSE_ID_FIELDS = ('response_id', 'acknowledgment_id', 'escalation_id')
+
+def response_id_of(entry: Dict[str, Any]) -> Optional[str]:
+    """Id of a response, acknowledgment or escalation entry"""
+    for field in RESPONSE_ID_FIELDS:
+        if field in entry:
+            return entry[field]
+    return None
+
+class RingStore:
+    """Fixed-capacity entries in arrival order, indexed by id and by report_id
+    
+    When full the oldest entry is evicted and passed to on_evict. Counts per status are kept
+    as entries are added, evicted and updated through set_status, so status and recency
+    queries never scan the store.
+    """
+    
+    def __init__(self, capacity: int, key: Callable[[Dict[str, Any]], Optional[str]],
+                 report_id: Callable[[Dict[str, Any]], Optional[str]],
+                 on_evict: Optional[Callable[[Dict[str, Any]], None]] = None):
+        self.capacity = capacity
+        self.key = key
+        self.report_id = report_id
+        self.on_evict = on_evict
+        self._lock = threading.RLock()
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._by_report: Dict[str, Dict[str, None]] = {}
+        self._status_counts: Dict[str, int] = {}
+        self._seq = 0
+        
+        # Metrics
+        self.added = 0
+        self.duplicates = 0
+        self.evicted = 0
+        
+    def add(self, entry: Dict[str, Any]) -> bool:
+        """Store an entry; returns False if one with the same id is already stored"""
+        evicted = None
+        with self._lock:
+            key = self.key(entry)
+            if key is None:
+                self._seq += 1
+                key = f"_entry_{self._seq}"
+            elif key in self._entries:
+                self.duplicates += 1
+                return False
+                
+            self._entries[key] = entry
+            report_id = self.report_id(entry)
+            if report_id is not None:
+                self._by_report.setdefault(report_id, {})[key] = None
+            self._count(entry.get('status'), 1)
+            self.added += 1
+            
+            if len(self._entries) > self.capacity:
+                evicted = self._remove(next(iter(self._entries)))
+                self.evicted += 1
+                
+        if evicted is not None and self.on_evict is not None:
+            self.on_evict(evicted)
+        return True
+        
+    def remove(self, entry: Dict[str, Any]) -> bool:
+        """Drop an entry that is still stored; returns False if it is not"""
+        with self._lock:
+            key = self.key(entry)
+            if key is None or self._entries.get(key) is not entry:
+                return False
+            self._remove(key)
+            return True
+            
+    def _remove(self, key: str) -> Dict[str, Any]:
+        entry = self._entries.pop(key)
+        report_id = self.report_id(entry)
+        keys = self._by_report.get(report_id)
+        if keys is not None:
+            keys.pop(key, None)
+            if not keys:
+                del self._by_report[report_id]
+        self._count(entry.get('status'), -1)
+        return entry
+        
+    def _count(self, status: Optional[str], delta: int):
+        count = self._status_counts.get(status, 0) + delta
+        if count:
+            self._status_counts[status] = count
+        else:
+            self._status_counts.pop(status, None)
+            
+    def set_status(self, entry: Dict[str, Any], status: str):
+        """Update an entry's status, keeping the counts in step if it is still stored"""
+        with self._lock:
+            key = self.key(entry)
+            if key is not None and self._entries.get(key) is entry:
+                self._count(entry.get('status'), -1)
+                self._count(status, 1)
+            entry['status'] = status
+            
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._entries.get(key)
+            
+    def for_report(self, report_id: str) -> List[Dict[str, Any]]:
+        """Stored entries for a report, oldest first"""
+        with self._lock:
+            return [self._entries[key] for key in self._by_report.get(report_id, ())]
+            
+    def count(self, status: str) -> int:
+        with self._lock:
+            return self._status_counts.get(status, 0)
+            
+    def recent(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Newest entries first"""
+        with self._lock:
+            entries = []
+            for key in reversed(self._entries):
+                if len(entries) >= limit:
+                    break
+                entries.append(self._entries[key])
+            return entries
+            
+    def __len__(self) -> int:
+        return len(self._entries)
+        
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+        
+    def __iter__(self):
+        with self._lock:
+            return iter(list(self._entries.values()))
+            
+    def get_stats(self) -> Dict[str, Any]:
+        """Get size, eviction and status statistics"""
+        with self._lock:
+            return {
+                'stored': len(self._entries),
+                'capacity': self.capacity,
+                'added': self.added,
+                'duplicates': self.duplicates,
+                'evicted': self.evicted,
+                'reports': len(self._by_report),
+                'by_status': dict(self._status_counts)
+            }
+
+class EndpointStats:
+    """Connection state, message rate and delivery lag for one listener endpoint
+    
+    The rate is an exponentially decayed count of frames per second over rate_window;
+    lag is the time from a message's creation to its arrival here.
+    """
+    
+    def __init__(self, endpoint: str, rate_window: float = 60.0):
+        self.endpoint = endpoint
+        self.rate_window = rate_window
+        self.state = 'idle'
+        self.connects = 0
+        self.disconnects = 0
+        self.errors = 0
+        self.last_error: Optional[str] = None
+        self.connected_at: Optional[float] = None
+        
+        self.frames = 0
+        self.dropped = 0
+        self._rate = 0.0
+        self._rate_at: Optional[float] = None
+        
+        self.lag_count = 0
+        self.lag_total = 0.0
+        self.lag_max = 0.0
+        self.last_lag = 0.0
+        
+    def connected(self):
+        self.state = 'connected'
+        self.connects += 1
+        self.connected_at = time.monotonic()
+        
+    def disconnected(self, error: Optional[Exception] = None):
+        if self.state == 'connected':
+            self.disconnects += 1
+        if error is not None:
+            self.errors += 1
+            self.last_error = str(error)
+        self.state = 'disconnected'
+        
+    def _decayed_rate(self, now: float) -> float:
+        if self._rate_at is None:
+            return 0.0
+        return self._rate * math.exp(-(now - self._rate_at) / self.rate_window)
+        
+    def record_frame(self, message_data: Optional[Dict[str, Any]]):
+        """Count one frame; message_data is None for frames the prefilter dropped"""
+        now = time.monotonic()
+        self._rate = self._decayed_rate(now) + 1 / self.rate_window
+        self._rate_at = now
+        self.frames += 1
+        
+        if message_data is None:
+            self.dropped += 1
+            return
+            
+        created_at = self.created_at(message_data)
+        if created_at is not None:
+            lag = max((datetime.now() - created_at).total_seconds(), 0.0)
+            self.lag_count += 1
+            self.lag_total += lag
+            self.lag_max = max(self.lag_max, lag)
+            self.last_lag = lag
+            
+    @staticmethod
+    def created_at(message_data: Dict[str, Any]) -> Optional[datetime]:
+        """Creation time of an inbox or relay frame, as naive local time"""
+        dredd_message = message_data.get('dredd_message')
+        if isinstance(dredd_message, dict):
+            value = dredd_message.get('metadata', {}).get('created_at')
+        else:
+            value = (message_data.get('message') or {}).get('timestamp')
+        try:
+            created_at = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except (AttributeError, ValueError):
+            return None
+        if created_at.tzinfo is not None:
+            created_at = created_at.astimezone().replace(tzinfo=None)
+        return created_at
+        
+    def snapshot(self) -> Dict[str, Any]:
+        """Get connection, rate and lag statistics"""
+        now = time.monotonic()
+        return {
+            'state': self.state,
+            'connects': self.connects,
+            'disconnects': self.disconnects,
+            'errors': self.errors,
+            'last_error': self.last_error,
+            'connected_for': now - self.connected_at if self.state == 'connected' else 0.0,
+            'frames': self.frames,
+            'dropped': self.dropped,
+            'frames_per_sec': self._decayed_rate(now),
+            'lag_mean': self.lag_total / self.lag_count if self.lag_count else 0.0,
+            'lag_max': self.lag_max,
+            'lag_last': self.last_lag
+        }
 
 class DREDDInboxWatcher:
-    def __init__(self, config_file: str = "dredd_inbox_config.json"):
+    def __init__(self, config_file: str = "dredd_inbox_config.json", dredd_dispatcher: Optional[DREDDDispatcher] = None,
+                 asr_generator: Optional[ASRGenerator] = None):
         self.config = self.load_config(config_file)
-        self.dredd_dispatcher = DREDDDispatcher()
-        self.asr_generator = ASRGenerator()
         self.logger = logging.getLogger('dredd_inbox_watcher')
         
-        # Inbox state
-        self.inbox_messages = []
-        self.asr_responses = []
+        # Collaborators are injected or resolved to the shared instances on first use
+        self._dredd_dispatcher = dredd_dispatcher
+        self._asr_generator = asr_generator
+        
+        # Inbox state, bounded; evicted responses can spill to the response archive
+        inbox_settings = self.config['inbox_settings']
+        self.archive_file = inbox_settings.get('archive_file', 'asr_response_archive.jsonl')
+        self.archive_lock = threading.Lock()
+        self.inbox_messages = RingStore(
+            inbox_settings.get('inbox_capacity', 10000),
+            key=lambda entry: entry.get('message_id'),
+            report_id=lambda entry: (entry.get('asr_data') or {}).get('report_id')
+        )
+        self.asr_responses = RingStore(
+            inbox_settings.get('response_capacity', 10000),
+            key=response_id_of,
+            report_id=lambda entry: entry.get('original_asr_id'),
+            on_evict=self._spill_response if inbox_settings.get('spill_evicted_responses', True) else None
+        )
         self.active_listeners = {}
         self.response_handlers = {}
         
-        # Processing queues
-        self.inbox_queue = queue.Queue()
-        self.response_queue = queue.Queue()
+        # Bounded processing queues; listeners wait up to handoff_timeout for room, then drop
+        listener_settings = self.config.get('listener_settings', {})
+        self.inbox_queue = queue.Queue(listener_settings.get('handoff_queue_size', 1000))
+        self.response_queue = queue.Queue(listener_settings.get('handoff_queue_size', 1000))
+        self.handoff_timeout = listener_settings.get('handoff_timeout', 5.0)
+        self.handoff_drops = 0
+        
+        # Listener reconnects back off exponentially with jitter
+        self.reconnect_backoff_base = listener_settings.get('reconnect_backoff_base', 0.5)
+        self.reconnect_backoff_max = listener_settings.get('reconnect_backoff_max', 30.0)
+        self.rate_window = listener_settings.get('rate_window', 60.0)
+        
+        # Drops junk, mistargeted and replayed frames before they are handled
+        prefilter_config = self.config.get('prefilter', {})
+        self.prefilter = InboxPrefilter(
+            prefilter_config.get('known_sigils', list(SIGIL_RECIPIENT_TYPES)),
+            max_frame_bytes=prefilter_config.get('max_frame_bytes', 1024 * 1024),
+            replay_capacity=prefilter_config.get('replay_capacity', 100000),
+            replay_error_rate=prefilter_config.get('replay_error_rate', 0.0001),
+            header_scan_bytes=prefilter_config.get('header_scan_bytes', 4096)
+        )
         
-        # Running state
+        # Running state; every listener is a task on one event loop
         self.running = False
         self.listeners = []
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.loop_thread: Optional[threading.Thread] = None
+        self.supervisor = None
+        self.supervisor_task: Optional[asyncio.Task] = None
+        
+    @property
+    def dredd_dispatcher(self) -> DREDDDispatcher:
+        """DREDD dispatcher used for responses and escalations"""
+        if self._dredd_dispatcher is None:
+            self._dredd_dispatcher = get_dredd_dispatcher()
+        return self._dredd_dispatcher
+        
+    @property
+    def asr_generator(self) -> ASRGenerator:
+        """ASR generator for report follow-ups"""
+        if self._asr_generator is None:
+            self._asr_generator = get_asr_generator()
+        return self._asr_generator
         
     def load_config(self, config_file: str) -> Dict[str, Any]:
         """Load inbox watcher configuration"""
@@ -54,12 +366,30 @@ class DREDDInboxWatcher:
                     'max_messages': 100,
                     'auto_acknowledge': True,
                     'response_timeout': 3600,  # 1 hour
-                    'archive_responses': True
+                    'archive_responses': True,
+                    'archive_file': 'asr_response_archive.jsonl',
+                    'inbox_capacity': 10000,
+                    'response_capacity': 10000,
+                    'spill_evicted_responses': True
                 },
                 'listener_endpoints': [
                     'ws://localhost:8080/dredd/inbox',
                     'ws://localhost:8081/dredd/inbox'
                 ],
+                'listener_settings': {
+                    'reconnect_backoff_base': 0.5,  # seconds
+                    'reconnect_backoff_max': 30,
+                    'handoff_queue_size': 1000,
+                    'handoff_timeout': 5,
+                    'rate_window': 60
+                },
+                'prefilter': {
+                    'known_sigils': list(SIGIL_RECIPIENT_TYPES),
+                    'max_frame_bytes': 1024 * 1024,
+                    'replay_capacity': 100000,
+                    'replay_error_rate': 0.0001,
+                    'header_scan_bytes': 4096
+                },
                 'asr_handlers': {
                     'djinn_council': {
                         'enabled': True,
@@ -122,8 +452,11 @@ class DREDDInboxWatcher:
                 }
             }
             
-    def start_watching(self):
-        """Start the inbox watcher"""
+    def start_watching(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        """Start the inbox watcher
+        
+        Every listener endpoint runs as a task on loop, or on a dedicated loop thread.
+        """
         self.running = True
         
         # Start processing threads
@@ -134,14 +467,13 @@ class DREDDInboxWatcher:
         self.response_processor.start()
         
         # Start listeners
-        for endpoint in self.config['listener_endpoints']:
-            listener = threading.Thread(
-                target=self._start_listener,
-                args=(endpoint,),
-                daemon=True
-            )
-            listener.start()
-            self.listeners.append(listener)
+        if loop is None:
+            self.loop = asyncio.new_event_loop()
+            self.loop_thread = threading.Thread(target=self.loop.run_forever, name="dredd-inbox-listeners", daemon=True)
+            self.loop_thread.start()
+        else:
+            self.loop = loop
+        self.supervisor = asyncio.run_coroutine_threadsafe(self._supervise_listeners(), self.loop)
             
         self.logger.info("DREDD Inbox Watcher started")
         
@@ -149,6 +481,22 @@ class DREDDInboxWatcher:
         """Stop the inbox watcher"""
         self.running = False
         
+        # Cancel the listeners, then stop the loop if the watcher owns it
+        if self.supervisor is not None:
+            stopped = asyncio.run_coroutine_threadsafe(self._stop_listeners(self.supervisor), self.loop)
+            self.supervisor = None
+            if self.loop_thread is not None:
+                try:
+                    stopped.result(timeout=5)
+                except Exception as e:
+                    self.logger.error(f"Error stopping listeners: {e}")
+            
+        if self.loop_thread is not None:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.loop_thread.join(timeout=5)
+            self.loop.close()
+            self.loop_thread = None
+        
         # Wait for threads to finish
         if hasattr(self, 'inbox_processor'):
             self.inbox_processor.join(timeout=5)
@@ -157,35 +505,127 @@ class DREDDInboxWatcher:
             
         self.logger.info("DREDD Inbox Watcher stopped")
         
+    async def _supervise_listeners(self):
+        """Run one listener task per endpoint until cancelled"""
+        self.supervisor_task = asyncio.current_task()
+        self.listeners = [
+            asyncio.create_task(self._run_listener(endpoint), name=f"dredd-inbox:{endpoint}")
+            for endpoint in self.config['listener_endpoints']
+        ]
+        try:
+            await asyncio.gather(*self.listeners)
+        finally:
+            for listener in self.listeners:
+                listener.cancel()
+            await asyncio.gather(*self.listeners, return_exceptions=True)
+            
+    async def _stop_listeners(self, supervisor):
+        """Cancel the supervisor and wait for every listener to close"""
+        task, self.supervisor_task = self.supervisor_task, None
+        if task is None:
+            # Not started yet
+            supervisor.cancel()
+            return
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        
+    async def _run_listener(self, endpoint: str):
+        """Keep an endpoint connected, reconnecting with jittered exponential backoff"""
+        stats = self.active_listeners[endpoint] = EndpointStats(endpoint, self.rate_window)
+        delay = self.reconnect_backoff_base
+        
+        try:
+            while self.running:
+                connects = stats.connects
+                try:
+                    stats.state = 'connecting'
+                    await self._start_listener(endpoint)
+                    stats.disconnected()
+                except asyncio.CancelledError:
+                    stats.disconnected()
+                    raise
+                except Exception as e:
+                    stats.disconnected(e)
+                    self.logger.error(f"Error connecting to {endpoint}: {e}")
+                    
+                if not self.running:
+                    break
+                if stats.connects > connects:
+                    # The connection was up, so start backing off afresh
+                    delay = self.reconnect_backoff_base
+                    
+                stats.state = 'backoff'
+                await asyncio.sleep(random.uniform(delay / 2, delay))
+                delay = min(delay * 2, self.reconnect_backoff_max)
+        finally:
+            stats.state = 'stopped'
+            
     async def _start_listener(self, endpoint: str):
-        """Start listening on a specific endpoint"""
+        """Listen on a specific endpoint until the connection closes"""
+        async with websockets.connect(endpoint) as websocket:
+            stats = self.active_listeners.get(endpoint)
+            if stats is not None:
+                stats.connected()
+            self.logger.info(f"Connected to DREDD inbox: {endpoint}")
+            
+            async for message in websocket:
+                if not self.running:
+                    break
+                    
+                await self._handle_frame(message, endpoint)
+                
+    async def _handoff(self, target: queue.Queue, item: Dict[str, Any]) -> bool:
+        """Put item on a bounded processing queue without blocking the event loop
+        
+        While the queue is full the calling listener stops reading, pushing back on its relay;
+        after handoff_timeout the item is dropped.
+        """
+        deadline = time.monotonic() + self.handoff_timeout
+        while True:
+            try:
+                target.put_nowait(item)
+                return True
+            except queue.Full:
+                if time.monotonic() >= deadline:
+                    self.handoff_drops += 1
+                    self.logger.warning("Processing queue full, dropping inbox item")
+                    return False
+                await asyncio.sleep(0.01)
+                
+    def _run_on_loop(self, coroutine):
+        """Schedule a coroutine on the listener loop from a processing thread"""
+        if self.loop is None or self.loop.is_closed():
+            coroutine.close()
+            self.logger.error("Inbox watcher is not running; cannot send via DREDD")
+            return None
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+        
+    async def _handle_frame(self, frame, endpoint: str) -> bool:
+        """Prefilter one raw frame and dispatch it; returns False if it was dropped"""
+        # Parse and screen message
+        message_data = self.prefilter.check(frame)
+        stats = self.active_listeners.get(endpoint)
+        if stats is not None:
+            stats.record_frame(message_data)
+        if message_data is None:
+            return False
+            
         try:
-            async with websockets.connect(endpoint) as websocket:
-                self.logger.info(f"Connected to DREDD inbox: {endpoint}")
+            # Check if it's an ASR message
+            if self._is_asr_message(message_data):
+                accepted = await self._handle_asr_message(message_data)
+            else:
+                # Handle other message types
+                accepted = await self._handle_generic_message(message_data)
+                
+            # Only ids of accepted frames count as replays; a dropped frame may be redelivered
+            if accepted:
+                self.prefilter.record(message_data)
                 
-                async for message in websocket:
-                    if not self.running:
-                        break
-                        
-                    try:
-                        # Parse message
-                        message_data = json.loads(message)
-                        
-                        # Check if it's an ASR message
-                        if self._is_asr_message(message_data):
-                            await self._handle_asr_message(message_data)
-                        else:
-                            # Handle other message types
-                            await self._handle_generic_message(message_data)
-                            
-                    except json.JSONDecodeError:
-                        self.logger.error(f"Invalid JSON message from {endpoint}")
-                    except Exception as e:
-                        self.logger.error(f"Error processing message from {endpoint}: {e}")
-                        
         except Exception as e:
-            self.logger.error(f"Error connecting to {endpoint}: {e}")
-            
+            self.logger.error(f"Error processing message from {endpoint}: {e}")
+        return True
+        
     def _is_asr_message(self, message_data: Dict[str, Any]) -> bool:
         """Check if message is an ASR"""
         return (
@@ -193,8 +633,8 @@ class DREDDInboxWatcher:
             message_data.get('message_type') == 'ASR'
         )
         
-    async def _handle_asr_message(self, message_data: Dict[str, Any]):
-        """Handle incoming ASR message"""
+    async def _handle_asr_message(self, message_data: Dict[str, Any]) -> bool:
+        """Handle incoming ASR message; returns True once it is accepted for processing"""
         try:
             # Extract ASR data
             asr_data = self._extract_asr_data(message_data)
@@ -209,15 +649,22 @@ class DREDDInboxWatcher:
                     'status': 'received'
                 }
                 
-                self.inbox_messages.append(inbox_entry)
+                if not self.inbox_messages.add(inbox_entry):
+                    self.logger.info(f"Duplicate ASR message ignored: {inbox_entry['message_id']}")
+                    return False
                 
-                # Add to processing queue
-                self.inbox_queue.put(inbox_entry)
+                # Add to processing queue; a dropped entry must not block its redelivery
+                if not await self._handoff(self.inbox_queue, inbox_entry):
+                    self.inbox_messages.remove(inbox_entry)
+                    return False
                 
                 self.logger.info(f"ASR received: {asr_data.get('report_id', 'unknown')}")
                 
+            return True
+                
         except Exception as e:
             self.logger.error(f"Error handling ASR message: {e}")
+            return False
             
     def _extract_asr_data(self, message_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Extract ASR data from DREDD message"""
@@ -249,30 +696,32 @@ class DREDDInboxWatcher:
             self.logger.error(f"Error extracting ASR data: {e}")
             return None
             
-    async def _handle_generic_message(self, message_data: Dict[str, Any]):
-        """Handle non-ASR messages"""
+    async def _handle_generic_message(self, message_data: Dict[str, Any]) -> bool:
+        """Handle non-ASR messages; returns True once it is accepted for processing"""
         try:
             message_type = message_data.get('dredd_message', {}).get('metadata', {}).get('message_type', 'unknown')
             self.logger.info(f"Generic message received: {message_type}")
             
             # Handle different message types
             if message_type == 'ASR_ACKNOWLEDGMENT':
-                await self._handle_asr_acknowledgment(message_data)
+                return await self._handle_asr_acknowledgment(message_data)
             elif message_type == 'ASR_RESPONSE':
-                await self._handle_asr_response(message_data)
+                return await self._handle_asr_response(message_data)
             elif message_type == 'ASR_ESCALATION':
-                await self._handle_asr_escalation(message_data)
+                return await self._handle_asr_escalation(message_data)
             else:
                 self.logger.info(f"Unhandled message type: {message_type}")
+                return True
                 
         except Exception as e:
             self.logger.error(f"Error handling generic message: {e}")
+            return False
             
-    async def _handle_asr_acknowledgment(self, message_data: Dict[str, Any]):
+    async def _handle_asr_acknowledgment(self, message_data: Dict[str, Any]) -> bool:
         """Handle ASR acknowledgment"""
         try:
             ack_data = {
-                'acknowledgment_id': f"ACK-{int(time.time())}",
+                'acknowledgment_id': f"ACK-{int(time.time())}-{secrets.token_hex(4)}",
                 'received_at': datetime.now().isoformat(),
                 'original_asr_id': message_data.get('payload', {}).get('payload_hash'),
                 'acknowledging_recipient': message_data.get('payload', {}).get('recipient'),
@@ -280,17 +729,19 @@ class DREDDInboxWatcher:
                 'status': 'acknowledged'
             }
             
-            self.asr_responses.append(ack_data)
+            self.asr_responses.add(ack_data)
             self.logger.info(f"ASR acknowledged by {ack_data['acknowledging_recipient']}")
+            return True
             
         except Exception as e:
             self.logger.error(f"Error handling ASR acknowledgment: {e}")
+            return False
             
-    async def _handle_asr_response(self, message_data: Dict[str, Any]):
+    async def _handle_asr_response(self, message_data: Dict[str, Any]) -> bool:
         """Handle ASR response"""
         try:
             response_data = {
-                'response_id': f"RESP-{int(time.time())}",
+                'response_id': f"RESP-{int(time.time())}-{secrets.token_hex(4)}",
                 'received_at': datetime.now().isoformat(),
                 'original_asr_id': message_data.get('payload', {}).get('payload_hash'),
                 'responding_recipient': message_data.get('payload', {}).get('recipient'),
@@ -300,19 +751,23 @@ class DREDDInboxWatcher:
                 'status': 'received'
             }
             
-            self.asr_responses.append(response_data)
-            self.response_queue.put(response_data)
+            self.asr_responses.add(response_data)
+            if not await self._handoff(self.response_queue, response_data):
+                self.asr_responses.remove(response_data)
+                return False
             
             self.logger.info(f"ASR response received from {response_data['responding_recipient']}")
+            return True
             
         except Exception as e:
             self.logger.error(f"Error handling ASR response: {e}")
+            return False
             
-    async def _handle_asr_escalation(self, message_data: Dict[str, Any]):
+    async def _handle_asr_escalation(self, message_data: Dict[str, Any]) -> bool:
         """Handle ASR escalation request"""
         try:
             escalation_data = {
-                'escalation_id': f"ESC-{int(time.time())}",
+                'escalation_id': f"ESC-{int(time.time())}-{secrets.token_hex(4)}",
                 'received_at': datetime.now().isoformat(),
                 'original_asr_id': message_data.get('payload', {}).get('payload_hash'),
                 'escalating_recipient': message_data.get('payload', {}).get('recipient'),
@@ -321,13 +776,17 @@ class DREDDInboxWatcher:
                 'status': 'escalated'
             }
             
-            self.asr_responses.append(escalation_data)
-            self.response_queue.put(escalation_data)
+            self.asr_responses.add(escalation_data)
+            if not await self._handoff(self.response_queue, escalation_data):
+                self.asr_responses.remove(escalation_data)
+                return False
             
             self.logger.warning(f"ASR escalation requested by {escalation_data['escalating_recipient']}: {escalation_data['escalation_reason']}")
+            return True
             
         except Exception as e:
             self.logger.error(f"Error handling ASR escalation: {e}")
+            return False
             
     def _process_inbox_queue(self):
         """Process messages from inbox queue"""
@@ -381,25 +840,14 @@ class DREDDInboxWatcher:
                         self._trigger_escalation(asr_data, recipient_type)
                         
             # Update status
-            inbox_entry['status'] = 'processed'
+            self.inbox_messages.set_status(inbox_entry, 'processed')
             
         except Exception as e:
             self.logger.error(f"Error processing ASR: {e}")
             
     def _get_recipient_type(self, sigil: str) -> Optional[str]:
         """Get recipient type from sigil"""
-        sigil_mapping = {
-            'glyph-hash-djinn-council': 'djinn_council',
-            'glyph-hash-sovereign-archive': 'sovereign_archive',
-            'glyph-hash-watch-guard': 'watch_guard',
-            'glyph-hash-lattice-core': 'lattice_core',
-            'glyph-hash-mkp': 'mirror_keyring_protocol',
-            'glyph-hash-resonance-scanner': 'resonance_scanner',
-            'glyph-hash-entropy-monitor': 'entropy_monitor',
-            'glyph-hash-chronicle-linker': 'chronicle_linker'
-        }
-        
-        return sigil_mapping.get(sigil)
+        return SIGIL_RECIPIENT_TYPES.get(sigil)
         
     def _should_escalate(self, asr_data: Dict[str, Any], handler_config: Dict[str, Any]) -> bool:
         """Check if ASR should be escalated"""
@@ -422,7 +870,7 @@ class DREDDInboxWatcher:
                 template = self.config['response_templates'][response_template]
                 
                 response_data = {
-                    'response_id': f"AUTO-RESP-{int(time.time())}",
+                    'response_id': f"AUTO-RESP-{int(time.time())}-{secrets.token_hex(4)}",
                     'generated_at': datetime.now().isoformat(),
                     'original_asr_id': asr_data.get('report_id'),
                     'responding_recipient': recipient_type,
@@ -436,10 +884,10 @@ class DREDDInboxWatcher:
                 }
                 
                 # Add to responses
-                self.asr_responses.append(response_data)
+                self.asr_responses.add(response_data)
                 
                 # Send response via DREDD
-                asyncio.create_task(self._send_response_via_dredd(response_data))
+                self._run_on_loop(self._send_response_via_dredd(response_data))
                 
                 self.logger.info(f"Auto-response generated for {recipient_type}")
                 
@@ -450,7 +898,7 @@ class DREDDInboxWatcher:
         """Trigger escalation for ASR"""
         try:
             escalation_data = {
-                'escalation_id': f"ESC-{int(time.time())}",
+                'escalation_id': f"ESC-{int(time.time())}-{secrets.token_hex(4)}",
                 'triggered_at': datetime.now().isoformat(),
                 'original_asr_id': asr_data.get('report_id'),
                 'triggering_recipient': recipient_type,
@@ -461,10 +909,10 @@ class DREDDInboxWatcher:
             }
             
             # Add to responses
-            self.asr_responses.append(escalation_data)
+            self.asr_responses.add(escalation_data)
             
             # Send escalation via DREDD
-            asyncio.create_task(self._send_escalation_via_dredd(escalation_data))
+            self._run_on_loop(self._send_escalation_via_dredd(escalation_data))
             
             self.logger.warning(f"Escalation triggered for ASR {asr_data.get('report_id')}")
             
@@ -505,10 +953,10 @@ class DREDDInboxWatcher:
             )
             
             if success:
-                response_data['status'] = 'sent'
+                self.asr_responses.set_status(response_data, 'sent')
                 self.logger.info(f"Response sent via DREDD: {response_data['response_id']}")
             else:
-                response_data['status'] = 'failed'
+                self.asr_responses.set_status(response_data, 'failed')
                 self.logger.error(f"Failed to send response via DREDD: {response_data['response_id']}")
                 
         except Exception as e:
@@ -548,10 +996,10 @@ class DREDDInboxWatcher:
             )
             
             if success:
-                escalation_data['status'] = 'sent'
+                self.asr_responses.set_status(escalation_data, 'sent')
                 self.logger.info(f"Escalation sent via DREDD: {escalation_data['escalation_id']}")
             else:
-                escalation_data['status'] = 'failed'
+                self.asr_responses.set_status(escalation_data, 'failed')
                 self.logger.error(f"Failed to send escalation via DREDD: {escalation_data['escalation_id']}")
                 
         except Exception as e:
@@ -562,61 +1010,83 @@ class DREDDInboxWatcher:
         try:
             # Update response status
             response_data['processed_at'] = datetime.now().isoformat()
-            response_data['status'] = 'processed'
+            self.asr_responses.set_status(response_data, 'processed')
             
             # Log response
-            self.logger.info(f"Response processed: {response_data['response_id']} from {response_data.get('responding_recipient', 'unknown')}")
+            self.logger.info(f"Response processed: {response_id_of(response_data)} from {response_data.get('responding_recipient', 'unknown')}")
             
-            # Archive if configured
+            # Archive if configured, unless it was already spilled on eviction
             if self.config['inbox_settings']['archive_responses']:
                 self._archive_response(response_data)
                 
         except Exception as e:
             self.logger.error(f"Error processing response: {e}")
             
-    def _archive_response(self, response_data: Dict[str, Any]):
-        """Archive response data"""
+    def _archive_response(self, response_data: Dict[str, Any], reason: str = 'processed'):
+        """Archive a snapshot of response data, once per response"""
         try:
-            archive_entry = {
-                'response': response_data,
-                'archived_at': datetime.now().isoformat(),
-                'archive_id': f"ARCHIVE-RESP-{response_data['response_id']}"
-            }
-            
-            # Write to archive file
-            with open('asr_response_archive.jsonl', 'a') as f:
-                f.write(json.dumps(archive_entry) + '\n')
+            response_id = response_id_of(response_data)
+            with self.archive_lock:
+                if 'archived_at' in response_data:
+                    return
+                    
+                # The sink serializes later, so write a copy that later status changes cannot alter
+                archived_at = datetime.now().isoformat()
+                archive_entry = {
+                    'response': dict(response_data),
+                    'archived_at': archived_at,
+                    'archive_id': f"ARCHIVE-RESP-{response_id}",
+                    'archive_reason': reason
+                }
+                response_data['archived_at'] = archived_at
                 
-            self.logger.info(f"Response archived: {response_data['response_id']}")
+            # Append to the archive file; the shared sink writes it in the background
+            get_sink(self.archive_file).write(archive_entry)
+                
+            self.logger.info(f"Response archived: {response_id}")
             
         except Exception as e:
             self.logger.error(f"Error archiving response: {e}")
             
+    def _spill_response(self, response_data: Dict[str, Any]):
+        """Archive a response leaving the store, unless it was already archived"""
+        self._archive_response(response_data, reason='evicted')
+            
     def get_inbox_status(self) -> Dict[str, Any]:
         """Get status of inbox"""
         return {
             'total_messages': len(self.inbox_messages),
             'total_responses': len(self.asr_responses),
-            'unprocessed_messages': len([m for m in self.inbox_messages if m['status'] == 'received']),
-            'unprocessed_responses': len([r for r in self.asr_responses if r['status'] == 'received']),
+            'unprocessed_messages': self.inbox_messages.count('received'),
+            'unprocessed_responses': self.asr_responses.count('received'),
+            'message_store': self.inbox_messages.get_stats(),
+            'response_store': self.asr_responses.get_stats(),
+            'prefilter': self.prefilter.get_stats(),
+            'inbox_queue_depth': self.inbox_queue.qsize(),
+            'response_queue_depth': self.response_queue.qsize(),
+            'handoff_drops': self.handoff_drops,
+            'listeners': {endpoint: stats.snapshot() for endpoint, stats in self.active_listeners.items()},
             'running': self.running
         }
         
     def get_recent_messages(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent messages from inbox"""
-        return sorted(
-            self.inbox_messages,
-            key=lambda x: x['received_at'],
-            reverse=True
-        )[:limit]
+        return self.inbox_messages.recent(limit)
         
     def get_recent_responses(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent responses"""
-        return sorted(
-            self.asr_responses,
-            key=lambda x: x.get('received_at', x.get('generated_at', '')),
-            reverse=True
-        )[:limit]
+        return self.asr_responses.recent(limit)
+        
+    def get_message(self, message_id: str) -> Optional[Dict[str, Any]]:
+        """Get an inbox message by message_id"""
+        return self.inbox_messages.get(message_id)
+        
+    def get_report_activity(self, report_id: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Get the inbox messages and responses held for a report"""
+        return {
+            'messages': self.inbox_messages.for_report(report_id),
+            'responses': self.asr_responses.for_report(report_id)
+        }
 
 # Global instance
 inbox_watcher = None
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+DREDD Relay Pool - Long-lived WebSocket connections to DREDD relay nodes
+Keeps one socket per relay node and event loop, correlates responses by message_id (or batch_id) and
+reconnects with backoff
+"""
+
+import json
+import time
+import random
+import asyncio
+import logging
+import threading
+import websockets
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List
+
+
+class RelayConnection:
+    """A single pooled connection to one relay node"""
+
+    def __init__(self, node_url: str):
+        self.node_url = node_url
+        self.websocket = None
+        self.pending: "OrderedDict[str, asyncio.Future]" = OrderedDict()
+        self.reader_task: Optional[asyncio.Task] = None
+        self.health_task: Optional[asyncio.Task] = None
+        self.connect_lock = asyncio.Lock()
+        self.send_lock = asyncio.Lock()
+        self.consecutive_failures = 0
+        self.next_attempt_at = 0.0
+        self.connected_once = False
+
+    @property
+    def is_open(self) -> bool:
+        return (
+            self.websocket is not None and
+            self.reader_task is not None and
+            not self.reader_task.done()
+        )
+
+
+class DREDDRelayPool:
+    def __init__(self, connect_timeout: float = 30.0, request_timeout: float = 30.0,
+                 health_check_interval: float = 15.0, backoff_base: float = 0.5,
+                 backoff_max: float = 30.0):
+        self.connect_timeout = connect_timeout
+        self.request_timeout = request_timeout
+        self.health_check_interval = health_check_interval
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.logger = logging.getLogger('dredd_relay_pool')
+
+        # Sockets belong to the loop that opened them, so each loop using the pool gets its own
+        self.connections: Dict[asyncio.AbstractEventLoop, Dict[str, RelayConnection]] = {}
+        self._lock = threading.Lock()
+
+        # Metrics
+        self.reconnects = 0
+        self.connect_failures = 0
+        self.health_check_failures = 0
+        self.requests_sent = 0
+        self.requests_failed = 0
+
+    def _loop_connection(self, node_url: str) -> RelayConnection:
+        """Get the running loop's connection record for a relay node, creating it if needed"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            # A closed loop has already torn down its sockets
+            for stale in [other for other in self.connections if other.is_closed()]:
+                del self.connections[stale]
+
+            connections = self.connections.setdefault(loop, {})
+            connection = connections.get(node_url)
+            if connection is None:
+                connection = connections[node_url] = RelayConnection(node_url)
+            return connection
+
+    def _all_connections(self) -> List[RelayConnection]:
+        with self._lock:
+            return [c for connections in self.connections.values() for c in connections.values()]
+
+    def _backoff_delay(self, failures: int) -> float:
+        """Exponential backoff with full jitter"""
+        delay = min(self.backoff_max, self.backoff_base * (2 ** max(failures - 1, 0)))
+        return random.uniform(delay / 2, delay)
+
+    async def _get_connection(self, node_url: str) -> RelayConnection:
+        """Get an open connection to a relay node, connecting if needed"""
+        connection = self._loop_connection(node_url)
+        if connection.is_open:
+            return connection
+
+        async with connection.connect_lock:
+            if connection.is_open:
+                return connection
+
+            wait = connection.next_attempt_at - time.monotonic()
+            if wait > 0:
+                raise ConnectionError(f"Relay {node_url} backing off for {wait:.1f}s")
+
+            try:
+                websocket = await asyncio.wait_for(
+                    websockets.connect(node_url), timeout=self.connect_timeout
+                )
+            except Exception as e:
+                connection.consecutive_failures += 1
+                connection.next_attempt_at = time.monotonic() + self._backoff_delay(connection.consecutive_failures)
+                self.connect_failures += 1
+                raise ConnectionError(f"Failed to connect to relay {node_url}: {e}") from e
+
+            if connection.connected_once:
+                self.reconnects += 1
+            connection.connected_once = True
+            connection.consecutive_failures = 0
+            connection.next_attempt_at = 0.0
+            connection.websocket = websocket
+            connection.reader_task = asyncio.create_task(self._read_responses(connection, websocket))
+            if self.health_check_interval and self.health_check_interval > 0:
+                connection.health_task = asyncio.create_task(self._health_check(connection, websocket))
+
+            self.logger.info(f"Relay connection opened: {node_url}")
+            return connection
+
+    async def _read_responses(self, connection: RelayConnection, websocket):
+        """Resolve pending requests from relay responses"""
+        try:
+            async for raw_message in websocket:
+                try:
+                    response = json.loads(raw_message)
+                except (ValueError, TypeError):
+                    self.logger.warning(f"Invalid JSON response from relay {connection.node_url}")
+                    continue
+
+                message_id = None
+                if isinstance(response, dict):
+                    message_id = response.get('message_id', response.get('batch_id'))
+                if message_id is not None:
+                    future = connection.pending.pop(message_id, None)
+                elif connection.pending:
+                    # Relays that do not echo message_id answer in order
+                    _, future = connection.pending.popitem(last=False)
+                else:
+                    future = None
+
+                if future is not None and not future.done():
+                    future.set_result(response)
+
+        except Exception as e:
+            self.logger.warning(f"Relay connection to {connection.node_url} lost: {e}")
+        finally:
+            if connection.websocket is websocket:
+                connection.websocket = None
+            if connection.health_task is not None:
+                connection.health_task.cancel()
+
+            pending = list(connection.pending.values())
+            connection.pending.clear()
+            for future in pending:
+                if not future.done():
+                    future.set_exception(ConnectionError(f"Relay connection to {connection.node_url} closed"))
+
+    async def _health_check(self, connection: RelayConnection, websocket):
+        """Ping the relay periodically and drop the socket when it stops answering"""
+        try:
+            while True:
+                await asyncio.sleep(self.health_check_interval)
+                try:
+                    pong_waiter = await websocket.ping()
+                    await asyncio.wait_for(pong_waiter, timeout=self.connect_timeout)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    self.health_check_failures += 1
+                    self.logger.warning(f"Health check failed for relay {connection.node_url}: {e}")
+                    await websocket.close()
+                    return
+        except asyncio.CancelledError:
+            pass
+
+    async def request(self, node_url: str, payload: Dict[str, Any], message_id: str,
+                      timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Send a payload over the pooled socket and wait for its correlated response"""
+        connection = await self._get_connection(node_url)
+
+        future = asyncio.get_running_loop().create_future()
+        connection.pending[message_id] = future
+
+        try:
+            async with connection.send_lock:
+                await connection.websocket.send(json.dumps(payload))
+            self.requests_sent += 1
+
+            return await asyncio.wait_for(future, timeout=timeout or self.request_timeout)
+
+        except Exception:
+            self.requests_failed += 1
+            raise
+        finally:
+            connection.pending.pop(message_id, None)
+
+    async def _close_connection(self, connection: RelayConnection):
+        if connection.health_task is not None:
+            connection.health_task.cancel()
+        if connection.websocket is not None:
+            try:
+                await connection.websocket.close()
+            except Exception as e:
+                self.logger.warning(f"Error closing relay {connection.node_url}: {e}")
+        if connection.reader_task is not None:
+            await asyncio.gather(connection.reader_task, return_exceptions=True)
+
+    async def close(self):
+        """Close every pooled connection, each on the event loop that owns it"""
+        running = asyncio.get_running_loop()
+        with self._lock:
+            owned = self.connections
+            self.connections = {}
+
+        for loop, connections in owned.items():
+            for connection in connections.values():
+                if loop is running:
+                    await self._close_connection(connection)
+                elif loop.is_running():
+                    future = asyncio.run_coroutine_threadsafe(self._close_connection(connection), loop)
+                    try:
+                        await asyncio.wait_for(asyncio.wrap_future(future), timeout=self.connect_timeout)
+                    except Exception as e:
+                        self.logger.warning(f"Error closing relay {connection.node_url}: {e}")
+                elif connection.is_open:
+                    self.logger.warning(f"Relay {connection.node_url} owned by a stopped event loop left open")
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get pool metrics"""
+        with self._lock:
+            loops = len(self.connections)
+        connections = self._all_connections()
+
+        nodes: Dict[str, Dict[str, Any]] = {}
+        for c in connections:
+            node = nodes.setdefault(c.node_url, {'open': False, 'open_sockets': 0, 'in_flight': 0,
+                                                 'consecutive_failures': 0})
+            node['open'] = node['open'] or c.is_open
+            node['open_sockets'] += int(c.is_open)
+            node['in_flight'] += len(c.pending)
+            node['consecutive_failures'] = max(node['consecutive_failures'], c.consecutive_failures)
+
+        return {
+            'event_loops': loops,
+            'open_sockets': sum(1 for c in connections if c.is_open),
+            'in_flight': sum(len(c.pending) for c in connections),
+            'reconnects': self.reconnects,
+            'connect_failures': self.connect_failures,
+            'health_check_failures': self.health_check_failures,
+            'requests_sent': self.requests_sent,
+            'requests_failed': self.requests_failed,
+            'nodes': nodes
+        }
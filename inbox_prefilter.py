@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Inbox Prefilter - Early rejection of junk, mistargeted and replayed DREDD frames
+Checks raw frames cheapest-first (size and shape, a bounded header scan, envelope header,
+known sigil set, replay Bloom filter) so hostile traffic is dropped before any handler or
+full parser work
+"""
+
+import re
+import json
+import math
+import time
+import hashlib
+import threading
+from typing import Dict, Any, Optional, Iterable, Tuple
+
+# Rejection reasons, in the order the checks run on a fully parsed frame
+REJECT_REASONS = ('oversized_frame', 'not_an_object', 'invalid_json', 'malformed_envelope',
+                  'unknown_sigil', 'replayed_message')
+
+# Header fields as they appear in raw frame text; escaped values are left to the full parse
+HEADER_FIELDS = {
+    'sigil': ('"sigil_target"', re.compile(r'"sigil_target"\s*:\s*"([^"\\]*)"')),
+    'message_id': ('"message_id"', re.compile(r'"message_id"\s*:\s*"([^"\\]+)"')),
+}
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings; false positives at roughly error_rate when full"""
+
+    def __init__(self, capacity: int = 100000, error_rate: float = 0.0001):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str):
+        # Double hashing over one 128-bit digest
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, item: str):
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        bits = self.bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+class ReplayFilter:
+    """Remembers recently seen message ids in two generations of Bloom filters
+
+    When the current generation reaches capacity it becomes the previous one and a fresh
+    filter starts, so at least the last capacity ids are always remembered and memory stays
+    fixed at two filters.
+    """
+
+    def __init__(self, capacity: int = 100000, error_rate: float = 0.0001):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.current = BloomFilter(capacity, error_rate)
+        self.previous: Optional[BloomFilter] = None
+        self.rotations = 0
+
+    def __contains__(self, message_id: str) -> bool:
+        return message_id in self.current or (self.previous is not None and message_id in self.previous)
+
+    def record(self, message_id: str):
+        """Remember message_id, rotating generations when the current one is full"""
+        if self.current.count >= self.capacity:
+            self.previous = self.current
+            self.current = BloomFilter(self.capacity, self.error_rate)
+            self.rotations += 1
+        self.current.add(message_id)
+
+    def seen(self, message_id: str) -> bool:
+        """Check whether message_id was seen recently, recording it if not"""
+        if message_id in self:
+            return True
+        self.record(message_id)
+        return False
+
+
+class InboxPrefilter:
+    """Decides in microseconds whether a raw inbox frame is worth handling
+
+    Accepted frames are returned decoded; rejected ones return None and are counted by
+    reason. Unknown sigils and replayed ids are looked for in the first header_scan_bytes of
+    the raw frame, so most hostile frames never reach json.loads. check() never records a
+    message id: the caller records it once the frame has been accepted for processing, so a
+    frame dropped downstream can still be redelivered and junk cannot crowd out lawful ids.
+    """
+
+    def __init__(self, known_sigils: Iterable[str], max_frame_bytes: int = 1024 * 1024,
+                 replay_capacity: int = 100000, replay_error_rate: float = 0.0001,
+                 header_scan_bytes: int = 4096):
+        self.known_sigils = frozenset(known_sigils)
+        self.max_frame_bytes = max_frame_bytes
+        self.header_scan_bytes = header_scan_bytes
+        self.replays = ReplayFilter(replay_capacity, replay_error_rate)
+        self.lock = threading.Lock()
+
+        # Metrics
+        self.accepted = 0
+        self.parsed = 0
+        self.rejections = {reason: 0 for reason in REJECT_REASONS}
+        self.seconds = 0.0
+
+    def check(self, frame) -> Optional[Dict[str, Any]]:
+        """Return the decoded frame if it passes, otherwise None"""
+        start = time.perf_counter()
+        message_data, reason, parsed = self._check(frame)
+        elapsed = time.perf_counter() - start
+
+        with self.lock:
+            self.seconds += elapsed
+            self.parsed += parsed
+            if reason is None:
+                self.accepted += 1
+            else:
+                self.rejections[reason] += 1
+        return message_data
+
+    def record(self, message_data: Dict[str, Any]):
+        """Remember an accepted frame's message id so later copies are rejected as replays"""
+        header = self.envelope_header(message_data)
+        if header is not None:
+            with self.lock:
+                self.replays.record(header[0])
+
+    def _check(self, frame) -> Tuple[Optional[Dict[str, Any]], Optional[str], bool]:
+        if len(frame) > self.max_frame_bytes:
+            return None, 'oversized_frame', False
+        if frame.lstrip()[:1] not in ('{', b'{'):
+            return None, 'not_an_object', False
+
+        sigil, message_id = self._scan_header(frame)
+        if sigil is not None and sigil not in self.known_sigils:
+            return None, 'unknown_sigil', False
+        if message_id is not None and self._replayed(message_id):
+            return None, 'replayed_message', False
+
+        try:
+            message_data = json.loads(frame)
+        except ValueError:
+            return None, 'invalid_json', True
+
+        header = self.envelope_header(message_data)
+        if header is None:
+            return None, 'malformed_envelope', True
+
+        message_id, sigil = header
+        if sigil not in self.known_sigils:
+            return None, 'unknown_sigil', True
+        if self._replayed(message_id):
+            return None, 'replayed_message', True
+
+        return message_data, None, True
+
+    def _scan_header(self, frame) -> Tuple[Optional[str], Optional[str]]:
+        """(sigil, message_id) read from the raw frame head without decoding the whole frame
+
+        A field is only trusted when its key occurs exactly once in the frame, so a nested
+        or decoy copy can never make the scan disagree with the full parse.
+        """
+        if isinstance(frame, (bytes, bytearray)):
+            head = bytes(frame[:self.header_scan_bytes]).decode('utf-8', 'replace')
+            count = lambda key: frame.count(key.encode())
+        else:
+            head = frame[:self.header_scan_bytes]
+            count = frame.count
+
+        found = {}
+        for field, (key, pattern) in HEADER_FIELDS.items():
+            match = pattern.search(head)
+            found[field] = match.group(1) if match and count(key) == 1 else None
+        return found['sigil'], found['message_id']
+
+    def _replayed(self, message_id: str) -> bool:
+        with self.lock:
+            return message_id in self.replays
+
+    @staticmethod
+    def envelope_header(message_data: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+        """(message_id, target sigil) from an inbox or relay frame, or None if it has neither shape"""
+        if not isinstance(message_data, dict):
+            return None
+
+        dredd_message = message_data.get('dredd_message')
+        if isinstance(dredd_message, dict):
+            metadata = dredd_message.get('metadata')
+            targeting = dredd_message.get('targeting')
+            if not (isinstance(metadata, dict) and isinstance(targeting, dict)):
+                return None
+            message_id, sigil = metadata.get('message_id'), targeting.get('sigil_target')
+        else:
+            # Relay frames carry the DREDDMessage fields flat
+            message = message_data.get('message')
+            if not isinstance(message, dict):
+                return None
+            message_id, sigil = message.get('message_id'), message.get('sigil_target')
+
+        # A sigil envelope, when present, must agree with the message it wraps
+        envelope = message_data.get('envelope')
+        if isinstance(envelope, dict) and envelope.get('target_sigil', sigil) != sigil:
+            return None
+
+        if not (isinstance(message_id, str) and message_id and isinstance(sigil, str)):
+            return None
+        return message_id, sigil
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get acceptance, rejection and timing statistics"""
+        with self.lock:
+            total = self.accepted + sum(self.rejections.values())
+            return {
+                'frames': total,
+                'accepted': self.accepted,
+                'rejected': total - self.accepted,
+                'rejections': dict(self.rejections),
+                'parsed': self.parsed,
+                'mean_us': self.seconds / total * 1e6 if total else 0.0,
+                'known_sigils': len(self.known_sigils),
+                'replay_rotations': self.replays.rotations
+            }
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+JSONL Sink - Buffered append-only JSONL writer
+Batches entries in memory, serializes and flushes them from a background thread on size
+or time thresholds, applies a configurable fsync policy and rotates segments by size or date
+"""
+
+import os
+import json
+import time
+import atexit
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple, Callable
+
+FSYNC_POLICIES = ('never', 'batch', 'always')
+
+
+class JSONLSink:
+    """Append-only JSONL file with an in-memory buffer and a background flusher
+
+    Entries are serialized when they are flushed, so callers hand them over and must not
+    mutate them afterwards. on_flush, when given, is called after each batch is written with
+    (entry, byte offset, byte length) for every line, offsets being into the active segment.
+    """
+
+    def __init__(self, path: str, max_buffer_entries: int = 1000, flush_interval: float = 1.0, fsync_policy: str = 'batch',
+                 rotate_max_bytes: Optional[int] = None, rotate_daily: bool = False,
+                 on_flush: Optional[Callable[[List[Tuple[Dict[str, Any], int, int]]], None]] = None):
+        if fsync_policy not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy: {fsync_policy} (expected one of {', '.join(FSYNC_POLICIES)})")
+
+        self.path = path
+        self.max_buffer_entries = max_buffer_entries
+        self.flush_interval = flush_interval
+        self.fsync_policy = fsync_policy
+        self.rotate_max_bytes = rotate_max_bytes
+        self.rotate_daily = rotate_daily
+        self.on_flush = on_flush
+        self.logger = logging.getLogger('jsonl_sink')
+
+        self._buffer: List[Dict[str, Any]] = []
+        self._buffer_lock = threading.Lock()
+        self._flush_needed = threading.Condition(self._buffer_lock)
+
+        # Serializes file access so batches land in the order they were buffered
+        self._file_lock = threading.Lock()
+        self._file = None
+        self._file_bytes = 0
+        self._file_date = None
+
+        # Metrics
+        self.entries_written = 0
+        self.batches_written = 0
+        self.rotations = 0
+        self.write_errors = 0
+        self.serialization_errors = 0
+
+        # The flusher thread starts with the first buffered entry
+        self._closed = False
+        self._flusher = None
+
+    def write(self, entry: Dict[str, Any]):
+        """Buffer one entry for appending"""
+        with self._buffer_lock:
+            if self._closed:
+                raise ValueError(f"JSONL sink is closed: {self.path}")
+
+            self._buffer.append(entry)
+            if self.fsync_policy != 'always':
+                if self._flusher is None:
+                    self._flusher = threading.Thread(target=self._flush_loop, name=f"jsonl-sink:{self.path}", daemon=True)
+                    self._flusher.start()
+                elif len(self._buffer) >= self.max_buffer_entries:
+                    self._flush_needed.notify()
+
+        if self.fsync_policy == 'always':
+            self.flush()
+
+    def flush(self):
+        """Write every buffered entry to disk"""
+        with self._file_lock:
+            with self._buffer_lock:
+                entries = self._buffer
+                self._buffer = []
+
+            if not entries:
+                return
+
+            lines = []
+            written = []
+            for entry in entries:
+                try:
+                    lines.append(json.dumps(entry))
+                    written.append(entry)
+                except (TypeError, ValueError) as e:
+                    self.serialization_errors += 1
+                    self.logger.error(f"Dropping unserializable entry for {self.path}: {e}")
+            if not lines:
+                return
+
+            data = '\n'.join(lines) + '\n'
+            try:
+                self._maybe_rotate(len(data))
+                self._open()
+                offset = self._file_bytes
+                self._file.write(data)
+                self._file.flush()
+                if self.fsync_policy != 'never':
+                    os.fsync(self._file.fileno())
+                self._file_bytes += len(data)
+
+                self.entries_written += len(lines)
+                self.batches_written += 1
+
+            except Exception as e:
+                # Keep the entries so the next flush retries them
+                self.write_errors += 1
+                self.logger.error(f"Error writing to {self.path}: {e}")
+                with self._buffer_lock:
+                    self._buffer[:0] = entries
+                raise
+
+            if self.on_flush is not None:
+                # json.dumps output is ASCII, so characters are bytes
+                placed = []
+                for entry, line in zip(written, lines):
+                    placed.append((entry, offset, len(line) + 1))
+                    offset += len(line) + 1
+                try:
+                    self.on_flush(placed)
+                except Exception as e:
+                    self.logger.error(f"Error in flush callback for {self.path}: {e}")
+
+    def _open(self):
+        if self._file is None:
+            # No newline translation, so '\r\n' platforms keep the byte offsets reported to on_flush
+            self._file = open(self.path, 'a', newline='')
+            self._file_bytes = self._file.tell()
+            self._file_date = datetime.fromtimestamp(os.fstat(self._file.fileno()).st_mtime).date() \
+                if self._file_bytes else datetime.now().date()
+
+    def _maybe_rotate(self, incoming_bytes: int):
+        """Move the active segment aside when it is too large or from a previous day"""
+        self._open()
+        if self._file_bytes == 0:
+            return
+
+        too_large = self.rotate_max_bytes is not None and self._file_bytes + incoming_bytes > self.rotate_max_bytes
+        new_day = self.rotate_daily and datetime.now().date() != self._file_date
+        if not (too_large or new_day):
+            return
+
+        self._file.close()
+        self._file = None
+
+        root, ext = os.path.splitext(self.path)
+        stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+        segment = f"{root}.{stamp}{ext}"
+        counter = 1
+        while os.path.exists(segment):
+            segment = f"{root}.{stamp}-{counter}{ext}"
+            counter += 1
+
+        os.replace(self.path, segment)
+        self.rotations += 1
+        self.logger.info(f"Rotated {self.path} to {segment}")
+
+    def _flush_loop(self):
+        """Flush on size thresholds or after flush_interval, whichever comes first"""
+        while True:
+            with self._buffer_lock:
+                if not self._closed and len(self._buffer) < self.max_buffer_entries:
+                    self._flush_needed.wait(timeout=self.flush_interval)
+                closed = self._closed
+
+            try:
+                self.flush()
+            except Exception:
+                # Already logged; back off before retrying
+                time.sleep(self.flush_interval)
+
+            if closed:
+                return
+
+    def release(self):
+        """Flush and close the active file so it can be moved; the next write reopens the path"""
+        self.flush()
+        with self._file_lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def close(self):
+        """Flush remaining entries and close the active segment"""
+        with self._buffer_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._flush_needed.notify()
+
+        if self._flusher is not None:
+            self._flusher.join(timeout=max(self.flush_interval, 1.0) * 5)
+        self.flush()
+
+        with self._file_lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get sink statistics"""
+        with self._buffer_lock:
+            buffered = len(self._buffer)
+
+        return {
+            'path': self.path,
+            'buffered_entries': buffered,
+            'entries_written': self.entries_written,
+            'batches_written': self.batches_written,
+            'rotations': self.rotations,
+            'write_errors': self.write_errors,
+            'serialization_errors': self.serialization_errors,
+            'fsync_policy': self.fsync_policy
+        }
+
+
+# Shared sinks, one per file
+_sinks: Dict[str, JSONLSink] = {}
+_sinks_lock = threading.Lock()
+
+
+def get_sink(path: str, **options) -> JSONLSink:
+    """Get the shared sink for a file, creating it with options on first use"""
+    key = os.path.abspath(path)
+    with _sinks_lock:
+        sink = _sinks.get(key)
+        if sink is None or sink._closed:
+            sink = JSONLSink(path, **options)
+            _sinks[key] = sink
+        return sink
+
+
+def close_all_sinks():
+    """Flush and close every shared sink"""
+    with _sinks_lock:
+        sinks = list(_sinks.values())
+        _sinks.clear()
+
+    for sink in sinks:
+        try:
+            sink.close()
+        except Exception as e:
+            logging.getLogger('jsonl_sink').error(f"Error closing sink {sink.path}: {e}")
+
+
+atexit.register(close_all_sinks)
@@ -0,0 +1,1085 @@
+#!/usr/bin/env python3
+"""
+Performance Benchmarks - Micro-benchmarks for DREDD, ticketing and ASR hot paths
+Run a single benchmark by name, or all of them, and print timings as JSON
+"""
+
+import os
+import json
+import time
+import logging
+import argparse
+from typing import Dict, Any, Callable
+
+
+def benchmark_key_derivation(messages: int = 30, sigils: int = 3) -> Dict[str, Any]:
+    """Compare uncached PBKDF2 key derivation with the dispatcher key cache"""
+    from dredd_crypto import derive_quantum_key
+    from dredd_dispatch import DREDDDispatcher
+
+    dispatcher = DREDDDispatcher('missing_dredd_config.json')
+    targets = [f"glyph-hash-{i:02d}" for i in range(sigils)]
+
+    start = time.perf_counter()
+    for i in range(messages):
+        derive_quantum_key(targets[i % sigils], dispatcher.session_key, int(time.time()))
+    uncached = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(messages):
+        dispatcher.create_dredd_message('benchmark payload', targets[i % sigils])
+    cached = time.perf_counter() - start
+
+    return {
+        'messages': messages,
+        'sigils': sigils,
+        'uncached_derivations_per_sec': messages / uncached,
+        'cached_messages_per_sec': messages / cached,
+        'key_cache': dispatcher.get_key_cache_stats()
+    }
+
+
+def benchmark_xor_stream(sizes=(1024, 64 * 1024, 1024 * 1024, 10 * 1024 * 1024)) -> Dict[str, Any]:
+    """Compare the per-byte XOR loop with the shared whole-buffer XOR stream"""
+    from dredd_crypto import xor_with_key
+
+    def legacy_xor(data: bytes, quantum_key: bytes) -> bytes:
+        encrypted = bytearray(len(data))
+        for i in range(len(data)):
+            encrypted[i] = data[i] ^ quantum_key[i % len(quantum_key)]
+        return bytes(encrypted)
+
+    quantum_key = os.urandom(32)
+    results = {}
+
+    for size in sizes:
+        data = os.urandom(size)
+
+        start = time.perf_counter()
+        expected = legacy_xor(data, quantum_key)
+        legacy = time.perf_counter() - start
+
+        start = time.perf_counter()
+        actual = xor_with_key(data, quantum_key)
+        vectorized = time.perf_counter() - start
+
+        results[f"{size}_bytes"] = {
+            'legacy_mb_per_sec': size / legacy / 1e6,
+            'vectorized_mb_per_sec': size / vectorized / 1e6,
+            'speedup': legacy / vectorized,
+            'identical': expected == actual
+        }
+
+    return results
+
+
+def benchmark_dredd_streaming(sizes=(1024 * 1024, 8 * 1024 * 1024, 32 * 1024 * 1024)) -> Dict[str, Any]:
+    """Compare peak memory and time of a one-shot DREDD send with a chunked stream (tracemalloc)"""
+    import asyncio
+    import tracemalloc
+    from dredd_dispatch import DREDDDispatcher
+
+    class WireRelay:
+        """Serializes each frame as the socket would and accepts it"""
+
+        async def request(self, node_url, payload, message_id, timeout=None):
+            json.dumps(payload)
+            return {'status': 'accepted', 'message_id': message_id}
+
+        async def close(self):
+            pass
+
+    dispatcher = DREDDDispatcher('missing_dredd_config.json')
+    dispatcher.relay_pool = WireRelay()
+    dispatcher.relay_nodes = ['ws://relay-a/dredd', 'ws://relay-b/dredd']
+    dispatcher.generate_quantum_key('glyph-hash-01')
+
+    results = {}
+    for size in sizes:
+        payload = json.dumps({'report_id': 'ASR-BENCH', 'padding': 'x' * size}).encode()
+        text = payload.decode()
+        measured = {}
+
+        for label, send in (('one_shot', lambda: dispatcher.send_message(text, 'glyph-hash-01')),
+                            ('streamed', lambda: dispatcher.send_stream(payload, 'glyph-hash-01'))):
+            tracemalloc.start()
+            start = time.perf_counter()
+            assert asyncio.run(send())
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            measured[label] = {'peak_mb': peak / 1e6, 'peak_x_payload': peak / len(payload), 'sec': elapsed}
+
+        results[f"{size}_bytes"] = measured
+
+    return results
+
+
+def benchmark_asr_fan_out(payload_bytes: int = 1024 * 1024, slow_ms: int = 500, fast_ms: int = 20) -> Dict[str, Any]:
+    """Compare sequential per-recipient delivery with the concurrent fan-out, and per-policy vs per-recipient encryption"""
+    import asyncio
+    from dredd_dispatch import DREDDDispatcher
+
+    class LatencyDispatcher(DREDDDispatcher):
+        """Builds each message for real, then waits a per-sigil relay latency"""
+
+        async def send_message(self, content, target_sigil, ttl=3600, resonance_level="medium", shared=None):
+            self.create_dredd_message(content, target_sigil, ttl, resonance_level, shared)
+            await asyncio.sleep((slow_ms if target_sigil == 'glyph-slow' else fast_ms) / 1e3)
+            return True
+
+    dispatcher = LatencyDispatcher('missing_dredd_config.json')
+    # The slow relay serves the first recipient, so sequential delivery holds up the rest
+    recipients = {'djinn_council': ('glyph-slow', 'critical'), 'sovereign_archive': ('glyph-archive', 'high'),
+                  'watch_guard': ('glyph-watch', 'high'), 'lattice_core': ('glyph-lattice', 'critical')}
+    content = json.dumps({'report_id': 'ASR-BENCH', 'padding': 'x' * payload_bytes})
+    for sigil, _ in recipients.values():
+        dispatcher.generate_quantum_key(sigil)
+
+    async def sequential():
+        completed = {}
+        start = time.perf_counter()
+        for name, (sigil, level) in recipients.items():
+            await dispatcher.send_message(content, sigil, 3600, level)
+            completed[name] = time.perf_counter() - start
+        return completed
+
+    async def concurrent():
+        results = await dispatcher.send_to_recipients(content, recipients, timeout=slow_ms / 1e3 * 4)
+        return {name: result['elapsed'] for name, result in results.items()}
+
+    sequential_done = asyncio.run(sequential())
+    concurrent_done = asyncio.run(concurrent())
+
+    start = time.perf_counter()
+    for sigil, level in recipients.values():
+        dispatcher.create_dredd_message(content, sigil, 3600, level)
+    per_recipient = time.perf_counter() - start
+
+    start = time.perf_counter()
+    shared = {policy: dispatcher.encrypt_shared(content) for policy in set(recipients.values())}
+    for sigil, level in recipients.values():
+        dispatcher.create_dredd_message(content, sigil, 3600, level, shared[(sigil, level)])
+    encrypt_once = time.perf_counter() - start
+
+    return {
+        'recipients': len(recipients),
+        'payload_bytes': len(content),
+        'fast_recipient_done_ms': {
+            'sequential_max': max(t for n, t in sequential_done.items() if n != 'djinn_council') * 1e3,
+            'concurrent_max': max(t for n, t in concurrent_done.items() if n != 'djinn_council') * 1e3
+        },
+        'all_done_ms': {'sequential': max(sequential_done.values()) * 1e3,
+                        'concurrent': max(concurrent_done.values()) * 1e3},
+        'key_policies': len(shared),
+        'encryption_ms': {'per_recipient': per_recipient * 1e3, 'per_key_policy': encrypt_once * 1e3}
+    }
+
+
+def benchmark_sigilgram_batch(messages: int = 5000, legacy_messages: int = 100, workers: int = 0) -> Dict[str, Any]:
+    """Compare per-message parsing as before (PBKDF2 per decrypt, full audit copy) with the batch JSONL mode"""
+    import tempfile
+    from cryptography.fernet import Fernet
+    from dredd_crypto import derive_quantum_key
+    from sigilgram_parser import SigilGramParser, parse_sigilgram_batch
+    from benchmark_fixtures import make_sigilgram
+
+    session_key = Fernet.generate_key().decode()
+    parser = SigilGramParser('missing_dredd_config.json', session_key)
+    lines = [json.dumps(make_sigilgram(parser, f"dredd_{i}", f"payload {i}" * 20)) for i in range(messages)]
+
+    # Previous behaviour: a fresh derivation per decrypt and the whole audit log copied into every result
+    legacy = SigilGramParser('missing_dredd_config.json', session_key)
+    legacy.generate_quantum_key = lambda sigil: derive_quantum_key(sigil, session_key, legacy.key_cache.current_bucket())
+    legacy.audit_log = [{'event_type': 'parse_success', 'details': {}}] * (messages * 3)
+    start = time.perf_counter()
+    for line in lines[:legacy_messages]:
+        parsed = legacy.parse_sigilgram(json.loads(line), 'glyph-hash-01')
+        parsed.audit_trail = legacy.audit_log.copy()
+    legacy_rate = legacy_messages / (time.perf_counter() - start)
+
+    results = {'messages': messages, 'legacy_messages_per_sec': legacy_rate}
+    with tempfile.TemporaryDirectory() as directory:
+        input_path = os.path.join(directory, 'sigilgrams.jsonl')
+        with open(input_path, 'w') as f:
+            f.write('\n'.join(lines) + '\n')
+
+        for count in sorted({1, workers or os.cpu_count() or 1}):
+            stats = parse_sigilgram_batch(input_path, os.path.join(directory, 'parsed.jsonl'), 'glyph-hash-01',
+                                          'missing_dredd_config.json', workers=count,
+                                          audit_file=os.path.join(directory, 'audit.jsonl'), session_key=session_key)
+            assert stats['valid'] == messages
+            results[f"batch_{count}_workers_messages_per_sec"] = stats['messages_per_sec']
+
+    return results
+
+
+def benchmark_sigilgram_audit(messages: int = 20000, window: int = 1000) -> Dict[str, Any]:
+    """Parse latency early and late in a long session: unbounded audit list with a copy per message
+    (as before) against the bounded ring spilling to JSONL"""
+    import tempfile
+    from cryptography.fernet import Fernet
+    from sigilgram_parser import SigilGramParser
+    from benchmark_fixtures import make_sigilgram
+
+    session_key = Fernet.generate_key().decode()
+    parser = SigilGramParser('missing_dredd_config.json', session_key)
+    sigilgrams = [make_sigilgram(parser, f"dredd_{i}", f"payload {i}") for i in range(window)]
+
+    def session(parser: SigilGramParser, copy_log: bool) -> Dict[str, float]:
+        latencies = []
+        for i in range(messages):
+            start = time.perf_counter()
+            parsed = parser.parse_sigilgram(sigilgrams[i % window], 'glyph-hash-01')
+            if copy_log:
+                parsed.audit_trail = parser.audit_log.copy()
+            latencies.append(time.perf_counter() - start)
+        return {'first_window_us': sum(latencies[:window]) / window * 1e6,
+                'last_window_us': sum(latencies[-window:]) / window * 1e6}
+
+    legacy = SigilGramParser('missing_dredd_config.json', session_key)
+    legacy.audit_log = []
+    results = {'messages': messages, 'unbounded_copy': session(legacy, True)}
+    del legacy
+
+    with tempfile.TemporaryDirectory() as directory:
+        ring = SigilGramParser('missing_dredd_config.json', session_key)
+        ring.save_audit_log(os.path.join(directory, 'audit.jsonl'))
+        results['ring_spill'] = session(ring, False)
+        sink = ring.audit_log.sink
+        ring.audit_log.close()
+        results['ring_stats'] = dict(ring.audit_log.get_stats(), spill=sink.get_stats())
+
+    return results
+
+
+def benchmark_sigilgram_validation(messages: int = 5000, hostile_ratio: float = 0.9) -> Dict[str, Any]:
+    """Reject throughput of the validation pipeline on mostly hostile traffic, cheapest-first order
+    against the previous check order, with the pipeline's per-check statistics"""
+    import random
+    from cryptography.fernet import Fernet
+    from sigilgram_parser import SigilGramParser, ValidationPipeline
+    from benchmark_fixtures import make_sigilgram
+
+    session_key = Fernet.generate_key().decode()
+    sender = SigilGramParser('missing_dredd_config.json', session_key)
+    rng = random.Random(7)
+
+    sigilgrams = []
+    for i in range(messages):
+        if rng.random() >= hostile_ratio:
+            sigilgrams.append(make_sigilgram(sender, f"dredd_{i}", f"payload {i}"))
+            continue
+        kind = rng.choice(('unknown_sigil', 'forged_echo', 'low_entropy', 'garbled'))
+        if kind == 'unknown_sigil':
+            sigilgrams.append(make_sigilgram(sender, f"probe_{i}", "probe", target_sigil=f"mirror-probe-{i % 50}"))
+        elif kind == 'low_entropy':
+            sigilgrams.append(make_sigilgram(sender, f"probe_{i}", "probe", entropy_score=0.1))
+        else:
+            sigilgram = make_sigilgram(sender, f"probe_{i}", "probe")
+            if kind == 'forged_echo':
+                sigilgram['dredd_message']['resonance_validation']['echo_signature'] = f"{i:016x}"
+            else:
+                sigilgram['dredd_message']['encrypted_content']['encoded'] = 'bm90IGpzb24='
+            sigilgrams.append(sigilgram)
+
+    orders = {
+        'previous_order': ('structure', 'expiry', 'sigil_targeting', 'entropy_header', 'echo_signature', 'decrypt'),
+        'cheapest_first': None
+    }
+    results = {'messages': messages, 'hostile_ratio': hostile_ratio}
+    for name, checks in orders.items():
+        parser = SigilGramParser('missing_dredd_config.json', session_key)
+        if checks is not None:
+            parser.validation_pipeline = ValidationPipeline(parser, checks)
+        start = time.perf_counter()
+        valid = sum(parser.parse_sigilgram(sigilgram, 'glyph-hash-01') is not None for sigilgram in sigilgrams)
+        elapsed = time.perf_counter() - start
+        results[name] = {'messages_per_sec': messages / elapsed, 'valid': valid,
+                         'pipeline': parser.validation_pipeline.get_stats()}
+
+    return results
+
+
+def benchmark_inbox_prefilter(frames: int = 50000, adversarial_ratio: float = 0.9) -> Dict[str, Any]:
+    """Inbox frame handling with a mostly adversarial mix, with and without the prefilter"""
+    import queue
+    import random
+    import asyncio
+    from dredd_inbox_watch import DREDDInboxWatcher
+    from benchmark_fixtures import make_frame, make_adversarial_frames
+
+    rng = random.Random(23)
+    lawful_count = round(frames * (1 - adversarial_ratio))
+    lawful = [make_frame(f"dredd_{i}") for i in range(lawful_count)]
+    mix = lawful[:50] + rng.sample(lawful[50:] + make_adversarial_frames(frames - lawful_count,
+                                                                        [f"dredd_{i}" for i in range(50)], rng),
+                                   frames - 50)
+
+    async def unfiltered(watcher: DREDDInboxWatcher):
+        # Previous listener body: full decode and dispatch of every frame
+        for frame in mix:
+            try:
+                message_data = json.loads(frame)
+                if watcher._is_asr_message(message_data):
+                    await watcher._handle_asr_message(message_data)
+                else:
+                    await watcher._handle_generic_message(message_data)
+            except Exception:
+                pass
+
+    async def prefiltered(watcher: DREDDInboxWatcher):
+        for frame in mix:
+            await watcher._handle_frame(frame, 'ws://benchmark')
+
+    logging.disable(logging.CRITICAL)
+    results = {'frames': frames, 'adversarial_ratio': adversarial_ratio}
+    try:
+        for name, run in (('unfiltered', unfiltered), ('prefiltered', prefiltered)):
+            watcher = DREDDInboxWatcher('missing_inbox_config.json')
+            watcher.inbox_queue = queue.Queue()
+            start = time.perf_counter()
+            asyncio.run(run(watcher))
+            elapsed = time.perf_counter() - start
+            results[name] = {'frames_per_sec': frames / elapsed, 'inbox_messages': len(watcher.inbox_messages)}
+        results['prefilter'] = watcher.prefilter.get_stats()
+    finally:
+        logging.disable(logging.NOTSET)
+
+    return results
+
+
+def benchmark_inbox_listeners(endpoints: int = 48, frames_per_endpoint: int = 200) -> Dict[str, Any]:
+    """Many relay endpoints watched from one process: threads used, aggregate frame rate and lag"""
+    import threading
+    from dredd_inbox_watch import DREDDInboxWatcher
+    from benchmark_fixtures import RecordingDispatcher, RelayServers
+
+    relays = RelayServers(endpoints, frames_per_endpoint, age=0.0)
+    watcher = DREDDInboxWatcher('missing_inbox_config.json', dredd_dispatcher=RecordingDispatcher())
+    watcher.config['listener_endpoints'] = relays.endpoints
+    # Only first connections count towards the total, so reconnects back off past the run
+    watcher.reconnect_backoff_base = watcher.reconnect_backoff_max = 60
+
+    logging.disable(logging.CRITICAL)
+    start = time.perf_counter()
+    watcher.start_watching()
+    try:
+        expected = endpoints * frames_per_endpoint
+        deadline = time.time() + 120
+        while len(watcher.inbox_messages) < expected and time.time() < deadline:
+            time.sleep(0.01)
+        elapsed = time.perf_counter() - start
+        listener_threads = [t.name for t in threading.enumerate()].count('dredd-inbox-listeners')
+        status = watcher.get_inbox_status()
+    finally:
+        watcher.stop_watching()
+        relays.close()
+        logging.disable(logging.NOTSET)
+
+    listeners = status['listeners'].values()
+    return {
+        'endpoints': endpoints,
+        'frames': len(watcher.inbox_messages),
+        'frames_per_sec': len(watcher.inbox_messages) / elapsed,
+        'listener_threads': listener_threads,
+        'lag_mean_ms': sum(l['lag_mean'] for l in listeners) / endpoints * 1e3,
+        'lag_max_ms': max(l['lag_max'] for l in listeners) * 1e3,
+        'handoff_drops': status['handoff_drops']
+    }
+
+
+def benchmark_inbox_store(messages: int = 200000, queries: int = 100) -> Dict[str, Any]:
+    """Inbox memory and status/recent/report query cost: unbounded lists with scans against the ring stores"""
+    import tracemalloc
+    from datetime import datetime
+    from dredd_inbox_watch import DREDDInboxWatcher
+
+    def make_entry(i: int) -> Dict[str, Any]:
+        return {'message_id': f"dredd_{i}", 'received_at': datetime.now().isoformat(),
+                'asr_data': {'report_id': f"ASR-{i}"}, 'source_sigil': 'glyph-hash-watch-guard',
+                'status': 'received' if i % 3 else 'processed'}
+
+    results = {'messages': messages}
+
+    # Previous behaviour: every entry kept, status and recency answered by scanning
+    tracemalloc.start()
+    legacy = [make_entry(i) for i in range(messages)]
+    legacy_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    start = time.perf_counter()
+    for q in range(queries):
+        len([m for m in legacy if m['status'] == 'received'])
+        sorted(legacy, key=lambda x: x['received_at'], reverse=True)[:10]
+        [m for m in legacy if m['asr_data']['report_id'] == f"ASR-{messages - q - 1}"]
+    results['unbounded'] = {'memory_mb': legacy_memory / 1e6,
+                            'query_us': (time.perf_counter() - start) / queries * 1e6}
+    del legacy
+
+    watcher = DREDDInboxWatcher('missing_inbox_config.json')
+    tracemalloc.start()
+    for i in range(messages):
+        watcher.inbox_messages.add(make_entry(i))
+    store_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    start = time.perf_counter()
+    for q in range(queries):
+        watcher.inbox_messages.count('received')
+        watcher.get_recent_messages(10)
+        watcher.inbox_messages.for_report(f"ASR-{messages - q - 1}")
+    results['ring_store'] = {'memory_mb': store_memory / 1e6,
+                             'query_us': (time.perf_counter() - start) / queries * 1e6,
+                             'stored': len(watcher.inbox_messages)}
+
+    return results
+
+
+def _make_benchmark_tickets(count: int, sessions: int = 1000, action_types: int = 20):
+    """Build synthetic sovereign tickets spread over the last 48 hours"""
+    from datetime import datetime, timedelta
+    from ticket_generator import SovereignTicket
+
+    start = datetime.now() - timedelta(hours=48)
+    step = 48 * 3600 / max(count, 1)
+
+    for i in range(count):
+        yield SovereignTicket(
+            ticket_id=f"TKT-BENCH-{i:08d}",
+            action_type=f"action_type_{i % action_types}",
+            performed_by="purveyor",
+            timestamp=(start + timedelta(seconds=i * step)).isoformat(),
+            entropy_hash="0" * 16,
+            interface_context="BenchmarkPanel > Action",
+            resonance_signature="valid",
+            intent_hash="1" * 16,
+            sovereign_fingerprint="2" * 24,
+            linked_effects=[],
+            causal_certainty=(i % 100) / 100,
+            system_impact="medium",
+            mirror_depth=1,
+            chronicle_status="active",
+            session_id=f"SESSION-{i % sessions:05d}"
+        )
+
+
+def benchmark_ticket_ledger(tickets: int = 200000, lookups: int = 200) -> Dict[str, Any]:
+    """Compare list scans with the indexed ticket ledger (use --param tickets=1000000 for 1M)"""
+    import random
+    from datetime import datetime, timedelta
+    from ticket_generator import TicketLedger
+
+    ticket_list = []
+    ledger = TicketLedger()
+
+    start = time.perf_counter()
+    for ticket in _make_benchmark_tickets(tickets):
+        ticket_list.append(ticket)
+        ledger.append(ticket)
+    build = time.perf_counter() - start
+
+    targets = [f"TKT-BENCH-{random.randrange(tickets):08d}" for _ in range(lookups)]
+    cutoff = datetime.now() - timedelta(hours=1)
+
+    start = time.perf_counter()
+    for ticket_id in targets:
+        next((t for t in ticket_list if t.ticket_id == ticket_id), None)
+    list_lookup = (time.perf_counter() - start) / lookups
+
+    start = time.perf_counter()
+    for ticket_id in targets:
+        ledger.get(ticket_id)
+    ledger_lookup = (time.perf_counter() - start) / lookups
+
+    start = time.perf_counter()
+    [t for t in ticket_list if t.session_id == "SESSION-00042"]
+    list_session = time.perf_counter() - start
+
+    start = time.perf_counter()
+    ledger.by_session("SESSION-00042")
+    ledger_session = time.perf_counter() - start
+
+    start = time.perf_counter()
+    [t for t in ticket_list if datetime.fromisoformat(t.timestamp) > cutoff]
+    list_window = time.perf_counter() - start
+
+    start = time.perf_counter()
+    ledger.in_window(cutoff.timestamp())
+    ledger_window = time.perf_counter() - start
+
+    return {
+        'tickets': tickets,
+        'ledger_build_sec': build,
+        'lookup_by_id_us': {'list_scan': list_lookup * 1e6, 'ledger': ledger_lookup * 1e6},
+        'lookup_by_session_ms': {'list_scan': list_session * 1e3, 'ledger': ledger_session * 1e3},
+        'last_hour_window_ms': {'list_scan': list_window * 1e3, 'ledger': ledger_window * 1e3}
+    }
+
+
+def benchmark_asr_session_build(tickets: int = 1000000, session_tickets: int = 20, repeats: int = 20) -> Dict[str, Any]:
+    """Time building one session's ASR as the ledger grows, against per-section full scans"""
+    from itertools import islice
+    from dataclasses import replace
+    from ticket_generator import SovereignDataTicketingSystem
+    from chronicle_linker import ChronicleLinker
+    from asr_generator import ASRGenerator, ASRTrigger
+
+    dts = SovereignDataTicketingSystem('missing_dts_config.json')
+    linker = ChronicleLinker('missing_chronicle_config.json')
+    asr = ASRGenerator('missing_asr_config.json', ticket_system=dts, chronicle_linker=linker)
+    for component in (dts, linker, asr):
+        component.logger.disabled = True
+
+    # The reported session, with two causal links per ticket
+    for i, ticket in enumerate(_make_benchmark_tickets(session_tickets)):
+        dts.ticket_ledger.append(replace(ticket, ticket_id=f"TKT-TARGET-{i:04d}", session_id="SESSION-TARGET"))
+    for i, link in enumerate(_make_benchmark_records('causal_link', session_tickets * 2)):
+        linker.causal_links.add(replace(link, link_id=f"LINK-TARGET-{i}", ticket_id=f"TKT-TARGET-{i // 2:04d}"),
+                                'watchguard')
+    for link in _make_benchmark_records('causal_link', 10000):
+        linker.causal_links.add(link, 'mkp')
+
+    trigger = ASRTrigger("TRIGGER-BENCH", "manual_trigger", "SESSION-TARGET", None, "", "benchmark", {})
+
+    def full_scans():
+        ledger = dts.ticket_ledger
+        session = [t for t in ledger if t.session_id == "SESSION-TARGET"]
+        chronicle = [t for t in ledger if t.session_id == "SESSION-TARGET"]
+        ticket_ids = {t.ticket_id for t in session}
+        links = [l for l in linker.causal_links if l.ticket_id in ticket_ids]
+        return session, chronicle, links
+
+    bulk = _make_benchmark_tickets(tickets)
+    results = {}
+    for size in (10000, 100000, 1000000, tickets):
+        if size > tickets or str(size) in results:
+            continue
+        for ticket in islice(bulk, size - (len(dts.ticket_ledger) - session_tickets)):
+            dts.ticket_ledger.append(ticket)
+
+        start = time.perf_counter()
+        for _ in range(repeats):
+            report = asr.generate_asr(trigger)
+        indexed = (time.perf_counter() - start) / repeats
+
+        start = time.perf_counter()
+        full_scans()
+        scans = time.perf_counter() - start
+
+        results[str(size)] = {
+            'generate_asr_ms': indexed * 1e3,
+            'full_scan_sections_ms': scans * 1e3,
+            'sovereign_actions': len(report.sovereign_actions),
+            'observational_matches': len(report.observational_matches)
+        }
+
+    return {'session_tickets': session_tickets, 'ledger_sizes': results}
+
+
+def benchmark_asr_archive(reports: int = 1000000, lookups: int = 1000, scans: int = 3) -> Dict[str, Any]:
+    """Compare linear-scan status lookups with the offset-indexed ASR archive, and time index rebuilds"""
+    import random
+    import tempfile
+    from asr_archive import ASRArchive
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'asr_archive.jsonl')
+        archive = ASRArchive(path, max_buffer_entries=10000, fsync_policy='never')
+
+        start = time.perf_counter()
+        for i in range(reports):
+            archive.append({
+                'asr': {
+                    'report_id': f"ASR-SESSION-{i:08d}-1750700000",
+                    'session_id': f"SESSION-{i:08d}",
+                    'trigger_type': 'session_based',
+                    'summary_statistics': {'total_sovereign_actions': i % 50, 'total_causal_matches': i % 7,
+                                           'avg_response_time': (i % 300) / 10, 'security_posture': 'enhanced'}
+                },
+                'archived_at': '2025-06-23T20:45:01',
+                'archive_id': f"ARCHIVE-ASR-SESSION-{i:08d}-1750700000"
+            })
+        archive.flush()
+        write = time.perf_counter() - start
+        archive_bytes = os.path.getsize(path)
+
+        targets = [f"ASR-SESSION-{random.randrange(reports):08d}-1750700000" for _ in range(lookups)]
+        start = time.perf_counter()
+        for report_id in targets:
+            archive.get(report_id)
+        indexed = (time.perf_counter() - start) / lookups
+
+        # The previous lookup: parse lines until the report is found (average case is half the file)
+        start = time.perf_counter()
+        for report_id in targets[:scans]:
+            with open(path, 'r') as f:
+                for line in f:
+                    if json.loads(line)['asr']['report_id'] == report_id:
+                        break
+        linear = (time.perf_counter() - start) / scans
+
+        archive.close()
+
+        start = time.perf_counter()
+        ASRArchive(path).close()
+        load = time.perf_counter() - start
+
+        os.remove(archive.index_path)
+        start = time.perf_counter()
+        rebuilt = ASRArchive(path)
+        rebuild = time.perf_counter() - start
+        assert len(rebuilt.offsets) == reports
+        rebuilt.close()
+
+    return {
+        'reports': reports,
+        'archive_mb': archive_bytes / 1e6,
+        'append_per_sec': reports / write,
+        'lookup_ms': {'linear_scan': linear * 1e3, 'indexed': indexed * 1e3},
+        'index_load_sec': load,
+        'index_rebuild_mmap_sec': rebuild
+    }
+
+
+def benchmark_asr_archive_segments(reports: int = 300000, days: int = 30, lookups: int = 1000) -> Dict[str, Any]:
+    """Compare a single-file ASR archive with day-sealed gzip segments: disk use, a one-week range query and sealed lookups"""
+    import random
+    import tempfile
+    from datetime import datetime, timedelta
+    from asr_archive import ASRArchive
+
+    first_day = datetime(2025, 6, 1)
+    step = timedelta(days=days) / reports
+
+    def entry(i: int) -> Dict[str, Any]:
+        return {
+            'asr': {
+                'report_id': f"ASR-SESSION-{i:08d}-1750700000",
+                'session_id': f"SESSION-{i:08d}",
+                'trigger_type': 'session_based',
+                'sovereign_actions': [{'ticket_id': f"TKT-{i}-{j}", 'action_type': 'override_watchguard_threshold',
+                                       'interface_context': 'GuardianControlPanel > AnomalyOverride',
+                                       'causal_certainty': 0.96} for j in range(i % 5)],
+                'summary_statistics': {'total_sovereign_actions': i % 5, 'total_causal_matches': i % 7,
+                                       'avg_response_time': (i % 300) / 10, 'security_posture': 'enhanced'}
+            },
+            'archived_at': (first_day + step * i).isoformat(),
+            'archive_id': f"ARCHIVE-ASR-SESSION-{i:08d}-1750700000"
+        }
+
+    results = {'reports': reports, 'days': days}
+    week = (first_day + timedelta(days=days - 7), None)
+    with tempfile.TemporaryDirectory() as directory:
+        for label, period in (('single_file', None), ('day_segments', 'day')):
+            path = os.path.join(directory, label, 'asr_archive.jsonl')
+            os.makedirs(os.path.dirname(path))
+            archive = ASRArchive(path, segment_period=period, max_buffer_entries=10000, fsync_policy='never')
+
+            start = time.perf_counter()
+            for i in range(reports):
+                archive.append(entry(i))
+            archive.flush()
+            write = time.perf_counter() - start
+
+            disk = os.path.getsize(path) + sum(segment['compressed_bytes'] for segment in archive.segments)
+            start = time.perf_counter()
+            matched = sum(1 for _ in archive.query(*week))
+            query = time.perf_counter() - start
+
+            targets = [f"ASR-SESSION-{random.randrange(reports):08d}-1750700000" for _ in range(lookups)]
+            start = time.perf_counter()
+            for report_id in targets:
+                archive.get(report_id)
+            lookup = (time.perf_counter() - start) / lookups
+
+            results[label] = {
+                'append_per_sec': reports / write,
+                'disk_mb': disk / 1e6,
+                'segments': len(archive.segments),
+                'last_week_query_sec': query,
+                'last_week_reports': matched,
+                'lookup_ms': lookup * 1e3
+            }
+            archive.close()
+
+    return results
+
+
+def benchmark_influence_report(tickets: int = 200000, polls: int = 20) -> Dict[str, Any]:
+    """Time the 24-hour influence report against a ledger-scan baseline"""
+    from datetime import datetime, timedelta
+    from ticket_generator import SovereignDataTicketingSystem
+
+    dts = SovereignDataTicketingSystem()
+    dts.running = False
+
+    for ticket in _make_benchmark_tickets(tickets):
+        dts.ticket_ledger.append(ticket)
+        dts.influence_aggregates.record_ticket(ticket, dts.ticket_ledger.get_epoch(ticket.ticket_id))
+
+    start = time.perf_counter()
+    for _ in range(polls):
+        cutoff = datetime.now() - timedelta(hours=24)
+        recent = [t for t in dts.ticket_ledger if datetime.fromisoformat(t.timestamp) > cutoff]
+        stats = {}
+        for ticket in recent:
+            entry = stats.setdefault(ticket.action_type, [0, 0.0, 0])
+            entry[0] += 1
+            entry[1] += ticket.causal_certainty
+            entry[2] += bool(ticket.linked_effects)
+    scan = (time.perf_counter() - start) / polls
+
+    start = time.perf_counter()
+    for _ in range(polls):
+        report = dts.get_sovereign_influence_report(24)
+    aggregated = (time.perf_counter() - start) / polls
+
+    return {
+        'tickets': tickets,
+        'report_actions': report['total_actions'],
+        'ledger_scan_ms': scan * 1e3,
+        'aggregated_ms': aggregated * 1e3,
+        'speedup': scan / aggregated
+    }
+
+
+def benchmark_jsonl_sink(entries: int = 50000) -> Dict[str, Any]:
+    """Compare open-append-per-entry writes with the buffered JSONL sink"""
+    import tempfile
+    from dataclasses import asdict
+    from jsonl_sink import JSONLSink
+
+    stream_entries = [
+        {'type': 'sovereign_ticket', 'ticket': asdict(ticket), 'stream_id': f"stream_{i}"}
+        for i, ticket in enumerate(_make_benchmark_tickets(entries))
+    ]
+    results = {'entries': entries}
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'per_entry.jsonl')
+        start = time.perf_counter()
+        for entry in stream_entries:
+            with open(path, 'a') as f:
+                f.write(json.dumps(entry) + '\n')
+        results['per_entry_open_per_sec'] = entries / (time.perf_counter() - start)
+
+        for policy in ('never', 'batch'):
+            sink = JSONLSink(os.path.join(directory, f"sink_{policy}.jsonl"), fsync_policy=policy)
+            start = time.perf_counter()
+            for entry in stream_entries:
+                sink.write(entry)
+            ingest = time.perf_counter() - start
+            sink.close()
+            results[f"sink_{policy}_ingest_per_sec"] = entries / ingest
+            results[f"sink_{policy}_durable_per_sec"] = entries / (time.perf_counter() - start)
+
+    results['ingest_speedup'] = results['sink_batch_ingest_per_sec'] / results['per_entry_open_per_sec']
+    return results
+
+
+def _make_benchmark_records(record_type: str, count: int):
+    """Build synthetic dataclass records with freshly allocated field values, as parsed from JSON"""
+    from datetime import datetime, timedelta
+    from ticket_generator import SovereignTicket, CausalMatch, IntentMirror
+    from chronicle_linker import EffectEvent, CausalLink
+    from blockchain_logger import ResonanceAnomaly, AnomalySeverity
+
+    if record_type == 'ticket':
+        yield from _make_benchmark_tickets(count)
+        return
+
+    start = datetime.now() - timedelta(hours=48)
+    severities = list(AnomalySeverity)
+    for i in range(count):
+        timestamp = (start + timedelta(microseconds=i * 1731)).isoformat()
+        if record_type == 'intent_mirror':
+            yield IntentMirror(f"INTENT-{i:08d}", f"action_type_{i % 20}", f"{i:016x}", timestamp,
+                               f"{i * 7:016x}", ['low', 'medium', 'high'][i % 3], f"TKT-BENCH-{i:08d}", [])
+        elif record_type == 'causal_match':
+            yield CausalMatch(f"MATCH-TKT-BENCH-{i:08d}-{i}", f"TKT-BENCH-{i:08d}", f"effect_type_{i % 50}",
+                              (i % 300) / 10, (i % 100) / 100, (i % 97) / 97, f"{i:016x}", timestamp)
+        elif record_type == 'effect_event':
+            yield EffectEvent(f"EFFECT-{i:08d}", f"effect_type_{i % 50}", ['watchguard', 'mkp', 'portfolio'][i % 3],
+                              timestamp, f"Effect event {i % 50}", [f"entity_{i % 10}"],
+                              ['low', 'medium', 'high'][i % 3], f"{i:016x}", ['low', 'medium', 'high'][i % 3])
+        elif record_type == 'causal_link':
+            yield CausalLink(f"LINK-{i:08d}", f"TKT-BENCH-{i:08d}", f"EFFECT-{i:08d}", (i % 300) / 10,
+                             (i % 100) / 100, (i % 97) / 97, f"{i:016x}", (i % 89) / 89, timestamp)
+        elif record_type == 'resonance_anomaly':
+            yield ResonanceAnomaly(timestamp, f"gate_{i % 16}", f"anomaly_type_{i % 8}", severities[i % 4],
+                                   (i % 100) / 100, ['low', 'medium', 'high'][i % 3], f"{i:016x}", i % 5,
+                                   f"Anomaly reason {i % 8}", {})
+        else:
+            raise ValueError(f"Unknown record type: {record_type}")
+
+
+def benchmark_record_memory(records: int = 1000000) -> Dict[str, Any]:
+    """Measure bytes per record for dataclass and compact variants (tracemalloc)"""
+    import gc
+    import tracemalloc
+    from compact_records import compact
+
+    results = {'records': records}
+    for record_type in ('ticket', 'intent_mirror', 'causal_match', 'effect_event', 'causal_link', 'resonance_anomaly'):
+        sizes = {}
+        for variant in ('dataclass', 'compact'):
+            gc.collect()
+            tracemalloc.start()
+            baseline = tracemalloc.get_traced_memory()[0]
+            if variant == 'dataclass':
+                stored = list(_make_benchmark_records(record_type, records))
+            else:
+                stored = [compact(record) for record in _make_benchmark_records(record_type, records)]
+            sizes[variant] = (tracemalloc.get_traced_memory()[0] - baseline) / records
+            tracemalloc.stop()
+            del stored
+
+        results[record_type] = {
+            'dataclass_bytes': round(sizes['dataclass']),
+            'compact_bytes': round(sizes['compact']),
+            'reduction': 1 - sizes['compact'] / sizes['dataclass']
+        }
+
+    return results
+
+
+def benchmark_causal_matching(effects: int = 50000, tickets: int = 20000) -> Dict[str, Any]:
+    """Measure streaming causal matching throughput against a full ticket window"""
+    from datetime import datetime
+    from chronicle_linker import ChronicleLinker, EffectEvent, WindowTicket, context_tokens
+
+    linker = ChronicleLinker()
+    linker.running = False
+    linker.logger.disabled = True
+
+    action_types = list(linker.effect_mapping)
+    effect_kinds = [(action_type, effect_kind) for action_type, kinds in linker.effect_mapping.items()
+                    for effect_kind in kinds]
+    tokens = context_tokens("GuardianControlPanel > AnomalyOverride")
+
+    # Tickets spread evenly over the matching window
+    now = time.time()
+    window = linker.ticket_window.window_seconds
+    for i in range(tickets):
+        linker.ticket_window.add(WindowTicket(
+            f"TKT-BENCH-{i:08d}", action_types[i % len(action_types)], now - window + window * i / tickets, tokens
+        ))
+
+    timestamp = datetime.now().isoformat()
+    stream = [
+        EffectEvent(f"WATCHGUARD-{i}", effect_kinds[i % len(effect_kinds)][1], 'watchguard', timestamp,
+                    f"ANOM-{i} resolved", ["wallet-0x123"], 'high', "0" * 16, 'high')
+        for i in range(effects)
+    ]
+
+    # Keep the candidate set realistic: only tickets from the last few seconds
+    linker.ticket_window.window_seconds = 5.0
+
+    start = time.perf_counter()
+    linked = sum(1 for effect in stream if linker.match_effect(effect) is not None)
+    elapsed = time.perf_counter() - start
+
+    return {
+        'effects': effects,
+        'window_tickets': len(linker.ticket_window),
+        'linked': linked,
+        'effects_per_sec': effects / elapsed,
+        'recent_effects_held': len(linker.recent_effects),
+        'causal_links_held': len(linker.causal_links)
+    }
+
+
+def benchmark_link_store(links: int = 100000, queries: int = 100) -> Dict[str, Any]:
+    """Compare list scans with the indexed causal-link store"""
+    from datetime import datetime, timedelta
+    from chronicle_linker import CausalLinkStore
+
+    systems = ['watchguard', 'mkp', 'dredd', 'lattice']
+    store = CausalLinkStore(max_links=links)
+    link_list = []
+    start_time = datetime.now() - timedelta(hours=48)
+    for i, link in enumerate(_make_benchmark_records('causal_link', links)):
+        link.created_at = (start_time + timedelta(seconds=i * 48 * 3600 / links)).isoformat()
+        link_list.append(link)
+        store.add(link, systems[i % len(systems)])
+
+    def timed(func):
+        start = time.perf_counter()
+        for _ in range(queries):
+            func()
+        return (time.perf_counter() - start) / queries * 1e3
+
+    cutoff = datetime.now() - timedelta(hours=24)
+    return {
+        'links': links,
+        'by_ticket_ms': {
+            'list_scan': timed(lambda: [l for l in link_list if l.ticket_id == "TKT-BENCH-00000042"]),
+            'store': timed(lambda: store.for_ticket("TKT-BENCH-00000042"))
+        },
+        'top_10_ms': {
+            'list_sort': timed(lambda: sorted(link_list, key=lambda l: l.link_strength, reverse=True)[:10]),
+            'store': timed(lambda: store.top(10))
+        },
+        'strength_above_0_98_ms': {
+            'list_scan': timed(lambda: [l for l in link_list if l.link_strength >= 0.98]),
+            'store': timed(lambda: store.above(0.98))
+        },
+        'report_24h_ms': {
+            'list_scan': timed(lambda: [l for l in link_list if datetime.fromisoformat(l.created_at) > cutoff]),
+            'store': timed(lambda: store.system_totals(cutoff.timestamp()))
+        }
+    }
+
+
+def benchmark_asr_worker_pool(triggers: int = 200, delivery_ms: int = 20) -> Dict[str, Any]:
+    """Compare a burst of session-end ASRs through one worker and through the pool
+
+    Delivery goes to a dispatcher that only waits delivery_ms per send, standing in for relay latency.
+    """
+    import asyncio
+    from datetime import datetime
+    from asr_generator import ASRGenerator, ASRTrigger
+
+    class LatencyDispatcher:
+        async def send_message(self, content, target_sigil, ttl=3600, resonance_level="medium"):
+            await asyncio.sleep(delivery_ms / 1e3)
+            return True
+
+    results = {}
+    for workers in (1, 4, 8):
+        asr = ASRGenerator(dredd_dispatcher=LatencyDispatcher())
+        asr.logger.disabled = True
+        asr.archive_asr = lambda report: None
+        asr.worker_pool.workers = workers
+        asr.worker_pool.triggers.maxsize = triggers
+
+        burst = [ASRTrigger(f"TRIGGER-BENCH-{i}", "session_based", f"SESSION-BENCH-{i}", None,
+                            datetime.now().isoformat(), "benchmark", {}) for i in range(triggers)]
+
+        start = time.perf_counter()
+        for trigger in burst:
+            asr.submit_trigger(trigger)
+        asr.worker_pool.drain()
+        elapsed = time.perf_counter() - start
+
+        stats = asr.get_worker_stats()
+        asr.shutdown()
+        results[f"{workers}_workers"] = {
+            'reports_per_sec': triggers / elapsed,
+            'generate_p95_ms': stats['latency']['generate']['p95_ms'],
+            'deliver_p95_ms': stats['latency']['deliver']['p95_ms'],
+            'total_p95_ms': stats['latency']['total']['p95_ms']
+        }
+
+    return {'triggers': triggers, 'delivery_ms': delivery_ms, 'pools': results}
+
+
+STARTUP_SCENARIOS = {
+    'import': "import dredd_inbox_watch",
+    'construct': "import dredd_inbox_watch\nwatcher = dredd_inbox_watch.DREDDInboxWatcher()",
+    'construct_full_stack': (
+        "import dredd_inbox_watch\n"
+        "watcher = dredd_inbox_watch.DREDDInboxWatcher()\n"
+        "asr = watcher.asr_generator\n"
+        "asr.dredd_dispatcher; asr.ticket_system.ensure_processing(); asr.chronicle_linker.ensure_processing()\n"
+        "asr.ensure_processing()"
+    ),
+}
+
+
+def benchmark_startup(runs: int = 5) -> Dict[str, Any]:
+    """Measure cold start (import plus construct) of the inbox watcher in fresh interpreters
+
+    'construct' is what a CLI or worker process pays now that collaborators and threads
+    start on first use; 'construct_full_stack' forces the whole stack up, as construction
+    used to.
+    """
+    import sys
+    import statistics
+    import subprocess
+
+    probe = (
+        "import time, threading, json\n"
+        "start = time.perf_counter()\n"
+        "{scenario}\n"
+        "print(json.dumps({{'seconds': time.perf_counter() - start, 'threads': threading.active_count()}}))"
+    )
+    directory = os.path.dirname(os.path.abspath(__file__))
+    results = {}
+
+    for name, scenario in STARTUP_SCENARIOS.items():
+        samples = []
+        for _ in range(runs):
+            output = subprocess.run(
+                [sys.executable, '-c', probe.format(scenario=scenario)],
+                cwd=directory, capture_output=True, text=True, check=True
+            ).stdout
+            samples.append(json.loads(output.strip().splitlines()[-1]))
+
+        results[name] = {
+            'median_ms': statistics.median(sample['seconds'] for sample in samples) * 1e3,
+            'threads': samples[-1]['threads']
+        }
+
+    return {'runs': runs, 'scenarios': results}
+
+
+BENCHMARKS: Dict[str, Callable[..., Dict[str, Any]]] = {
+    'key_derivation': benchmark_key_derivation,
+    'xor_stream': benchmark_xor_stream,
+    'dredd_streaming': benchmark_dredd_streaming,
+    'ticket_ledger': benchmark_ticket_ledger,
+    'asr_session_build': benchmark_asr_session_build,
+    'asr_archive': benchmark_asr_archive,
+    'asr_archive_segments': benchmark_asr_archive_segments,
+    'influence_report': benchmark_influence_report,
+    'jsonl_sink': benchmark_jsonl_sink,
+    'record_memory': benchmark_record_memory,
+    'causal_matching': benchmark_causal_matching,
+    'link_store': benchmark_link_store,
+    'startup': benchmark_startup,
+    'asr_worker_pool': benchmark_asr_worker_pool,
+    'asr_fan_out': benchmark_asr_fan_out,
+    'sigilgram_batch': benchmark_sigilgram_batch,
+    'sigilgram_audit': benchmark_sigilgram_audit,
+    'sigilgram_validation': benchmark_sigilgram_validation,
+    'inbox_prefilter': benchmark_inbox_prefilter,
+    'inbox_listeners': benchmark_inbox_listeners,
+    'inbox_store': benchmark_inbox_store,
+}
+
+
+def main():
+    """Main CLI interface for performance benchmarks"""
+    parser = argparse.ArgumentParser(description='Performance Benchmarks - DREDD, ticketing and ASR hot paths')
+    parser.add_argument('benchmark', nargs='?', default='all', choices=['all'] + list(BENCHMARKS),
+                       help='Benchmark to run')
+    parser.add_argument('--output', help='Write results to a JSON file')
+    parser.add_argument('--param', action='append', default=[], metavar='KEY=VALUE',
+                       help='Integer benchmark parameter, e.g. --param tickets=1000000')
+
+    args = parser.parse_args()
+
+    params = {}
+    for param in args.param:
+        key, _, value = param.partition('=')
+        params[key] = int(value)
+
+    names = list(BENCHMARKS) if args.benchmark == 'all' else [args.benchmark]
+    results = {}
+
+    for name in names:
+        print(f"⏱️ Running benchmark: {name}")
+        benchmark = BENCHMARKS[name]
+        accepted = benchmark.__code__.co_varnames[:benchmark.__code__.co_argcount]
+        results[name] = benchmark(**{k: v for k, v in params.items() if k in accepted})
+
+    print(json.dumps(results, indent=2))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n💾 Benchmark results saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,7 +7,8 @@ Provides quantum-secure encryption and sigil-bound delivery for ASR reports
 import json
 import asyncio
 import logging
-from typing import Dict, List, Any, Optional
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 import hashlib
 import base64
@@ -22,6 +23,10 @@ class ASRDREDDSender:
         self.dredd_dispatcher = DREDDDispatcher()
         self.logger = logging.getLogger('asr_dredd_sender')
         
+        # Prepared payloads by report_id, so repeat sends of one ASR reuse its hash and signature
+        self.prepared_payloads: "OrderedDict[str, Tuple[Dict[str, Any], str]]" = OrderedDict()
+        self.max_prepared_payloads = 64
+        
     def load_config(self, config_file: str) -> Dict[str, Any]:
         """Load ASR-DREDD configuration"""
         try:
@@ -31,6 +36,8 @@ class ASRDREDDSender:
             return {
                 'dredd_settings': {
                     'default_ttl': 7200,  # 2 hours
+                    'recipient_timeout': 30,  # per-recipient deadline, retries included
+                    'retries': 2,
                     'encryption_level': 'high',
                     'mirror_protection': True,
                     'quantum_encryption': True
@@ -69,6 +76,17 @@ class ASRDREDDSender:
                                recipients: List[str] = None) -> Dict[str, bool]:
         """Send ASR via DREDD infrastructure"""
         
+        deliveries = await self.deliver_asr(asr, recipients)
+        return {recipient: delivery['accepted'] for recipient, delivery in deliveries.items()}
+        
+    async def deliver_asr(self, asr: AcclimationSequencingReport,
+                          recipients: List[str] = None) -> Dict[str, Dict[str, Any]]:
+        """Deliver ASR to recipients concurrently and report each recipient's outcome
+        
+        The payload is prepared, signed and encrypted once; every recipient has its own
+        deadline and retries, so a slow relay does not hold up the others.
+        """
+        
         try:
             results = {}
             
@@ -77,36 +95,68 @@ class ASRDREDDSender:
                 recipients = list(self.config['recipients'].keys())
                 
             # Prepare ASR payload
-            asr_payload = self.prepare_asr_payload(asr)
+            asr_payload, payload_json = self.prepare_asr_delivery(asr)
+            dredd_settings = self.config['dredd_settings']
             
-            # Send to each recipient
+            targets = {}
             for recipient_name in recipients:
                 if recipient_name in self.config['recipients']:
                     recipient_config = self.config['recipients'][recipient_name]
-                    
-                    success = await self.send_to_recipient(
-                        asr_payload, 
-                        recipient_name, 
-                        recipient_config
-                    )
-                    
-                    results[recipient_name] = success
-                    
-                    if success:
-                        self.logger.info(f"ASR sent to {recipient_name} via {recipient_config['sigil']}")
-                    else:
-                        self.logger.error(f"Failed to send ASR to {recipient_name}")
-                        
+                    targets[recipient_name] = (recipient_config['sigil'], recipient_config['encryption_level'])
                 else:
                     self.logger.warning(f"Unknown recipient: {recipient_name}")
-                    results[recipient_name] = False
+                    results[recipient_name] = {'recipient': recipient_name, 'target_sigil': None, 'accepted': False,
+                                               'attempts': 0, 'elapsed': 0.0, 'reason': 'unknown_recipient'}
+                    
+            deliveries = await self.dredd_dispatcher.send_to_recipients(
+                payload_json,
+                targets,
+                ttl=dredd_settings['default_ttl'],
+                timeout=dredd_settings.get('recipient_timeout'),
+                retries=dredd_settings.get('retries')
+            ) if targets else {}
+            
+            ack_items = []
+            for recipient_name, delivery in deliveries.items():
+                results[recipient_name] = delivery
+                
+                if delivery['accepted']:
+                    self.logger.info(f"ASR sent to {recipient_name} via {delivery['target_sigil']}")
+                    if self.config['recipients'][recipient_name].get('auto_acknowledge', False):
+                        ack_items.append(self.create_acknowledgment_item(recipient_name, asr_payload['payload_hash']))
+                else:
+                    self.logger.error(f"Failed to send ASR to {recipient_name}: {delivery['reason']}")
                     
+            # Acknowledgments share a single batch
+            if ack_items:
+                ack_results = await self.dredd_dispatcher.send_batch(ack_items)
+                acknowledged = sum(1 for ack_result in ack_results if ack_result['accepted'])
+                self.logger.info(f"Acknowledgments sent: {acknowledged}/{len(ack_items)}")
+                
             return results
             
         except Exception as e:
             self.logger.error(f"Error sending ASR via DREDD: {e}")
-            return {recipient: False for recipient in recipients or []}
+            return {recipient: {'recipient': recipient, 'target_sigil': None, 'accepted': False,
+                                'attempts': 0, 'elapsed': 0.0, 'reason': 'error'}
+                    for recipient in recipients or []}
+            
+    def prepare_asr_delivery(self, asr: AcclimationSequencingReport) -> Tuple[Dict[str, Any], str]:
+        """Get the prepared payload and its JSON for an ASR, reusing them across sends of the same report"""
+        
+        prepared = self.prepared_payloads.get(asr.report_id)
+        if prepared is not None:
+            self.prepared_payloads.move_to_end(asr.report_id)
+            return prepared
             
+        payload = self.prepare_asr_payload(asr)
+        prepared = (payload, json.dumps(payload, default=str))
+        if payload:
+            self.prepared_payloads[asr.report_id] = prepared
+            while len(self.prepared_payloads) > self.max_prepared_payloads:
+                self.prepared_payloads.popitem(last=False)
+        return prepared
+        
     def prepare_asr_payload(self, asr: AcclimationSequencingReport) -> Dict[str, Any]:
         """Prepare ASR payload for DREDD transmission"""
         
@@ -192,12 +242,14 @@ class ASRDREDDSender:
         
     async def send_to_recipient(self, payload: Dict[str, Any], 
                               recipient_name: str, 
-                              recipient_config: Dict[str, Any]) -> bool:
+                              recipient_config: Dict[str, Any],
+                              payload_json: Optional[str] = None) -> bool:
         """Send ASR to specific recipient"""
         
         try:
-            # Convert payload to JSON
-            payload_json = json.dumps(payload, default=str)
+            # Convert payload to JSON unless the caller already did
+            if payload_json is None:
+                payload_json = json.dumps(payload, default=str)
             
             # Get recipient configuration
             sigil_target = recipient_config['sigil']
@@ -222,27 +274,32 @@ class ASRDREDDSender:
             self.logger.error(f"Error sending to recipient {recipient_name}: {e}")
             return False
             
+    def create_acknowledgment_item(self, recipient_name: str, payload_hash: str) -> Tuple[str, str, int, str]:
+        """Create a batch item acknowledging a delivered ASR"""
+        
+        ack_payload = {
+            'message_type': 'ASR_ACKNOWLEDGMENT',
+            'recipient': recipient_name,
+            'payload_hash': payload_hash,
+            'acknowledged_at': datetime.now().isoformat(),
+            'status': 'received'
+        }
+        
+        # Use sovereign sigil for acknowledgment
+        return (json.dumps(ack_payload), 'glyph-hash-sovereign-archive', 3600, 'medium')
+        
     async def send_acknowledgment(self, recipient_name: str, payload_hash: str):
         """Send acknowledgment for received ASR"""
         
         try:
-            ack_payload = {
-                'message_type': 'ASR_ACKNOWLEDGMENT',
-                'recipient': recipient_name,
-                'payload_hash': payload_hash,
-                'acknowledged_at': datetime.now().isoformat(),
-                'status': 'received'
-            }
+            ack_json, ack_sigil, ack_ttl, ack_level = self.create_acknowledgment_item(recipient_name, payload_hash)
             
             # Send acknowledgment back to sender
-            ack_json = json.dumps(ack_payload)
-            
-            # Use sovereign sigil for acknowledgment
             success = await self.dredd_dispatcher.send_message(
                 ack_json,
-                'glyph-hash-sovereign-archive',  # Acknowledgment target
-                ttl=3600,  # 1 hour
-                resonance_level='medium'
+                ack_sigil,
+                ttl=ack_ttl,
+                resonance_level=ack_level
             )
             
             if success:
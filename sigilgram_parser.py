@@ -11,7 +11,7 @@ import time
 import secrets
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Iterable, Iterator
 from dataclasses import dataclass
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
@@ -19,6 +19,14 @@ from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.primitives.asymmetric import rsa, padding
 import argparse
 import sys
+import os
+import threading
+from collections import deque
+from functools import cached_property
+from concurrent.futures import ProcessPoolExecutor
+
+from dredd_crypto import QuantumKeyCache, xor_with_key, ChunkDecryptor, CHUNKED_FORMAT
+from jsonl_sink import get_sink
 
 @dataclass
 class ParsedMessage:
@@ -32,19 +40,206 @@ class ParsedMessage:
     security_checks: Dict[str, bool]
     audit_trail: List[Dict[str, Any]]
 
+class AuditRing:
+    """Bounded in-memory audit log with optional spill to a rotating JSONL file
+    
+    The ring keeps the most recent max_events entries, so appends and memory stay constant
+    however long a session runs. Once spill() attaches a sink every event is also handed to
+    it and written by the sink's background flusher; without one, evicted events are dropped.
+    """
+    
+    def __init__(self, max_events: int = 10000):
+        self.max_events = max_events
+        self.events = deque(maxlen=max_events)
+        self.sink = None
+        self.lock = threading.Lock()
+        
+        # Metrics
+        self.logged = 0
+        self.dropped = 0
+        
+    def append(self, event: Dict[str, Any]):
+        """Record one event"""
+        with self.lock:
+            sink = self.sink
+            if sink is None and len(self.events) == self.max_events:
+                self.dropped += 1
+            self.events.append(event)
+            self.logged += 1
+        if sink is not None:
+            sink.write(event)
+            
+    def spill(self, path: str, **sink_options):
+        """Spill the retained events, and every later one, to a JSONL file"""
+        with self.lock:
+            if self.sink is not None and self.sink.path == path:
+                return self.sink
+            previous = self.sink
+            self.sink = get_sink(path, **sink_options)
+            for event in self.events:
+                self.sink.write(event)
+                
+        if previous is not None:
+            previous.close()
+        return self.sink
+        
+    def flush(self):
+        """Write spilled events still buffered in the sink"""
+        if self.sink is not None:
+            self.sink.flush()
+            
+    def close(self):
+        """Flush and detach the spill sink"""
+        with self.lock:
+            sink, self.sink = self.sink, None
+        if sink is not None:
+            sink.close()
+            
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Copy of the retained events, oldest first"""
+        with self.lock:
+            return list(self.events)
+            
+    def clear(self):
+        with self.lock:
+            self.events.clear()
+            
+    def __len__(self) -> int:
+        return len(self.events)
+        
+    def __iter__(self):
+        return iter(self.snapshot())
+        
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.snapshot()[index]
+        return self.events[index]
+        
+    def get_stats(self) -> Dict[str, Any]:
+        """Get ring and spill statistics"""
+        return {
+            'retained_events': len(self.events),
+            'max_events': self.max_events,
+            'logged_events': self.logged,
+            'dropped_events': self.dropped,
+            'spill': self.sink.get_stats() if self.sink is not None else None
+        }
+
+# Pipeline checks, cheapest first so most rejects never reach the key derivation in decrypt
+VALIDATION_CHECKS = ('structure', 'sigil_targeting', 'expiry', 'echo_signature',
+                     'entropy_header', 'content_envelope', 'decrypt')
+
+class SigilGramView:
+    """One sigilgram's fields, each decoded at most once however many checks read them"""
+    
+    def __init__(self, sigilgram_data: Dict[str, Any], target_sigil: str):
+        self.target_sigil = target_sigil
+        self.dredd_message = sigilgram_data.get('dredd_message', {})
+        self.envelope = sigilgram_data.get('envelope', {})
+        self.validation = sigilgram_data.get('validation', {})
+        
+        # Filled in by the checks
+        self.entropy_score = 0.0
+        self.content: Optional[str] = None
+        
+    @cached_property
+    def message_id(self) -> Optional[str]:
+        return self.dredd_message.get('metadata', {}).get('message_id')
+        
+    @cached_property
+    def created_at(self) -> datetime:
+        return datetime.fromisoformat(self.dredd_message['metadata']['created_at'].replace('Z', '+00:00'))
+        
+    @cached_property
+    def entropy_data(self) -> Dict[str, Any]:
+        return json.loads(base64.b64decode(self.dredd_message['entropy_header']['encoded']).decode())
+        
+    @cached_property
+    def combined_content(self) -> Dict[str, Any]:
+        return json.loads(base64.b64decode(self.dredd_message['encrypted_content']['encoded']).decode())
+
+class ValidationPipeline:
+    """Runs a parser's checks over a SigilGramView in a fixed order, stopping at the first reject
+    
+    Each name in checks resolves once to the parser's _check_<name> method, which returns None
+    to pass or the failure details to log. Per-check run counts, rejections and time are kept.
+    """
+    
+    def __init__(self, parser, checks: Tuple[str, ...] = VALIDATION_CHECKS):
+        self.checks = [(name, getattr(parser, f"_check_{name}")) for name in checks]
+        self.runs = {name: 0 for name in checks}
+        self.rejections = {name: 0 for name in checks}
+        self.seconds = {name: 0.0 for name in checks}
+        self.passed = 0
+        self.lock = threading.Lock()
+        
+    def run(self, view: SigilGramView) -> Optional[Dict[str, Any]]:
+        """Validate view; returns the first failure's details, or None if every check passed"""
+        timings = []
+        failure = None
+        for name, check in self.checks:
+            start = time.perf_counter()
+            failure = check(view)
+            timings.append((name, time.perf_counter() - start))
+            if failure is not None:
+                break
+                
+        with self.lock:
+            for name, elapsed in timings:
+                self.runs[name] += 1
+                self.seconds[name] += elapsed
+            if failure is not None:
+                self.rejections[timings[-1][0]] += 1
+            else:
+                self.passed += 1
+        return failure
+        
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-check run, rejection and timing statistics"""
+        with self.lock:
+            checks = {
+                name: {
+                    'runs': self.runs[name],
+                    'rejections': self.rejections[name],
+                    'total_ms': self.seconds[name] * 1e3,
+                    'mean_us': self.seconds[name] / self.runs[name] * 1e6 if self.runs[name] else 0.0
+                }
+                for name, _ in self.checks
+            }
+            return {
+                'passed': self.passed,
+                'rejected': sum(self.rejections.values()),
+                'checks': checks
+            }
+
 class SigilGramParser:
-    def __init__(self, config_file: str = "dredd_config.json"):
+    def __init__(self, config_file: str = "dredd_config.json", session_key: Optional[str] = None):
         self.config = self.load_config(config_file)
-        self.session_key = self.generate_session_key()
+        self.session_key = session_key or self.generate_session_key()
         self.sigil_registry = self.config.get('sigil_registry', {})
         self.logger = logging.getLogger('sigilgram_parser')
-        self.audit_log = []
+        
+        # Recent audit events; save_audit_log spills them to disk
+        self.audit_config = self.config.get('performance', {}).get('audit', {})
+        self.audit_log = AuditRing(self.audit_config.get('ring_size', 10000))
+        
+        # Quantum key cache, bucketed like the dispatcher's so both derive the same keys
+        cache_config = self.config.get('performance', {}).get('caching', {})
+        self.key_cache = QuantumKeyCache(
+            max_size=cache_config.get('max_size', 1000),
+            bucket_seconds=cache_config.get('key_bucket_seconds', 60),
+            enabled=cache_config.get('enabled', True)
+        )
+        
+        self.validation_pipeline = ValidationPipeline(self)
         
     def load_config(self, config_file: str) -> Dict[str, Any]:
         """Load DREDD configuration"""
         try:
             with open(config_file, 'r') as f:
-                return json.load(f)
+                config = json.load(f)
+            # dredd_config.json nests its settings under a top-level "dredd_config" key
+            return config.get('dredd_config', config)
         except FileNotFoundError:
             # Default configuration
             return {
@@ -75,86 +270,114 @@ class SigilGramParser:
         """Generate a new session key for parsing operations"""
         return Fernet.generate_key().decode()
         
-    def parse_sigilgram(self, sigilgram_data: Dict[str, Any], target_sigil: str) -> Optional[ParsedMessage]:
-        """Parse and decrypt a sigilgram message"""
+    def parse_sigilgram(self, sigilgram_data: Dict[str, Any], target_sigil: str,
+                        trail: Optional[List[Dict[str, Any]]] = None) -> Optional[ParsedMessage]:
+        """Parse and decrypt a sigilgram message
+        
+        The audit events this parse logs are also appended to trail, when given, and become
+        the parsed message's audit_trail.
+        """
+        
+        # This parse's audit entries, referenced by the parsed message
+        if trail is None:
+            trail = []
         
         try:
-            # Extract DREDD message
-            dredd_message = sigilgram_data.get('dredd_message', {})
-            envelope = sigilgram_data.get('envelope', {})
-            validation = sigilgram_data.get('validation', {})
+            view = SigilGramView(sigilgram_data, target_sigil)
             
             # Log parsing attempt
             self.log_audit_event('parse_attempt', {
-                'message_id': dredd_message.get('metadata', {}).get('message_id'),
+                'message_id': view.message_id,
                 'target_sigil': target_sigil,
                 'timestamp': datetime.now().isoformat()
-            })
+            }, trail)
             
-            # Validate message structure
-            if not self.validate_message_structure(dredd_message, envelope):
-                self.log_audit_event('parse_failed', {'reason': 'invalid_structure'})
-                return None
-                
-            # Check if message is expired
-            if self.is_message_expired(dredd_message):
-                self.log_audit_event('parse_failed', {'reason': 'message_expired'})
-                return None
-                
-            # Validate sigil targeting
-            if not self.validate_sigil_targeting(dredd_message, target_sigil):
-                self.log_audit_event('parse_failed', {'reason': 'invalid_sigil_targeting'})
-                return None
-                
-            # Validate entropy header
-            entropy_validation = self.validate_entropy_header(dredd_message)
-            if not entropy_validation['valid']:
-                self.log_audit_event('parse_failed', {
-                    'reason': 'entropy_validation_failed',
-                    'details': entropy_validation['details']
-                })
-                return None
-                
-            # Validate echo signature
-            if not self.validate_echo_signature(dredd_message, target_sigil):
-                self.log_audit_event('parse_failed', {'reason': 'invalid_echo_signature'})
-                return None
-                
-            # Decrypt content
-            decrypted_content = self.decrypt_message_content(dredd_message, target_sigil)
-            if not decrypted_content:
-                self.log_audit_event('parse_failed', {'reason': 'decryption_failed'})
+            # Validate and decrypt, cheapest checks first
+            failure = self.validation_pipeline.run(view)
+            if failure is not None:
+                self.log_audit_event('parse_failed', failure, trail)
                 return None
                 
+            dredd_message = view.dredd_message
+            
             # Perform security checks
-            security_checks = self.perform_security_checks(dredd_message, validation)
+            security_checks = self.perform_security_checks(dredd_message, view.validation)
             
             # Create parsed message
             parsed_message = ParsedMessage(
                 message_id=dredd_message['metadata']['message_id'],
-                content=decrypted_content,
+                content=view.content,
                 target_sigil=target_sigil,
                 timestamp=dredd_message['metadata']['created_at'],
                 resonance_level=dredd_message['metadata']['resonance_level'],
-                entropy_score=entropy_validation['entropy_score'],
+                entropy_score=view.entropy_score,
                 validation_status='valid',
                 security_checks=security_checks,
-                audit_trail=self.audit_log.copy()
+                audit_trail=[]
             )
             
             # Log successful parse
             self.log_audit_event('parse_success', {
                 'message_id': parsed_message.message_id,
                 'resonance_level': parsed_message.resonance_level
-            })
+            }, trail)
+            parsed_message.audit_trail = trail
             
             return parsed_message
             
         except Exception as e:
             self.logger.error(f"Error parsing sigilgram: {e}")
-            self.log_audit_event('parse_error', {'error': str(e)})
+            self.log_audit_event('parse_error', {'error': str(e)}, trail)
             return None
             
+    def _check_structure(self, view: SigilGramView) -> Optional[Dict[str, Any]]:
+        if not self.validate_message_structure(view.dredd_message, view.envelope):
+            return {'reason': 'invalid_structure'}
+        return None
+        
+    def _check_sigil_targeting(self, view: SigilGramView) -> Optional[Dict[str, Any]]:
+        if not self.validate_sigil_targeting(view.dredd_message, view.target_sigil):
+            return {'reason': 'invalid_sigil_targeting'}
+        return None
+        
+    def _check_expiry(self, view: SigilGramView) -> Optional[Dict[str, Any]]:
+        if self.is_message_expired(view.dredd_message, view):
+            return {'reason': 'message_expired'}
+        return None
+        
+    def _check_echo_signature(self, view: SigilGramView) -> Optional[Dict[str, Any]]:
+        if not self.validate_echo_signature(view.dredd_message, view.target_sigil):
+            return {'reason': 'invalid_echo_signature'}
+        return None
+        
+    def _check_entropy_header(self, view: SigilGramView) -> Optional[Dict[str, Any]]:
+        entropy_validation = self.validate_entropy_header(view.dredd_message, view)
+        view.entropy_score = entropy_validation['entropy_score']
+        if not entropy_validation['valid']:
+            return {'reason': 'entropy_validation_failed', 'details': entropy_validation['details']}
+        return None
+        
+    def _check_content_envelope(self, view: SigilGramView) -> Optional[Dict[str, Any]]:
+        # Decode the ciphertext envelope before paying for key derivation
+        try:
+            encrypted_content = view.dredd_message['encrypted_content']
+            if encrypted_content.get('format') == CHUNKED_FORMAT:
+                valid = isinstance(encrypted_content.get('descriptor'), dict) and 'chunks' in encrypted_content
+            else:
+                combined_data = view.combined_content
+                valid = 'encrypted_key' in combined_data and 'encrypted_content' in combined_data
+        except Exception:
+            valid = False
+        if not valid:
+            return {'reason': 'decryption_failed', 'details': 'invalid_content_envelope'}
+        return None
+        
+    def _check_decrypt(self, view: SigilGramView) -> Optional[Dict[str, Any]]:
+        view.content = self.decrypt_message_content(view.dredd_message, view.target_sigil, view)
+        if not view.content:
+            return {'reason': 'decryption_failed'}
+        return None
+        
     def validate_message_structure(self, dredd_message: Dict[str, Any], envelope: Dict[str, Any]) -> bool:
         """Validate the structure of a DREDD message"""
         
@@ -177,11 +400,14 @@ class SigilGramParser:
                 
         return True
         
-    def is_message_expired(self, dredd_message: Dict[str, Any]) -> bool:
+    def is_message_expired(self, dredd_message: Dict[str, Any], view: Optional[SigilGramView] = None) -> bool:
         """Check if message has expired"""
         
         try:
-            created_at = datetime.fromisoformat(dredd_message['metadata']['created_at'].replace('Z', '+00:00'))
+            if view is not None:
+                created_at = view.created_at
+            else:
+                created_at = datetime.fromisoformat(dredd_message['metadata']['created_at'].replace('Z', '+00:00'))
             ttl = dredd_message['delivery_config']['ttl']
             expires_at = created_at + timedelta(seconds=ttl)
             
@@ -224,15 +450,15 @@ class SigilGramParser:
         # For now, just check if it exists in our local registry
         return True
         
-    def validate_entropy_header(self, dredd_message: Dict[str, Any]) -> Dict[str, Any]:
+    def validate_entropy_header(self, dredd_message: Dict[str, Any], view: Optional[SigilGramView] = None) -> Dict[str, Any]:
         """Validate entropy header"""
         
         try:
-            entropy_header = dredd_message['entropy_header']
-            encoded_entropy = entropy_header['encoded']
-            
             # Decode entropy data
-            entropy_data = json.loads(base64.b64decode(encoded_entropy).decode())
+            if view is not None:
+                entropy_data = view.entropy_data
+            else:
+                entropy_data = json.loads(base64.b64decode(dredd_message['entropy_header']['encoded']).decode())
             
             # Validate timestamp
             timestamp = entropy_data.get('timestamp', 0)
@@ -302,15 +528,25 @@ class SigilGramParser:
         data = f"{message_id}:{target_sigil}:{entropy_header}:{self.session_key}"
         return hashlib.sha256(data.encode()).hexdigest()[:16]
         
-    def decrypt_message_content(self, dredd_message: Dict[str, Any], target_sigil: str) -> Optional[str]:
+    def decrypt_message_content(self, dredd_message: Dict[str, Any], target_sigil: str,
+                                view: Optional[SigilGramView] = None) -> Optional[str]:
         """Decrypt message content"""
         
         try:
             encrypted_content = dredd_message['encrypted_content']
-            encoded_content = encrypted_content['encoded']
-            
+            if encrypted_content.get('format') == CHUNKED_FORMAT:
+                # Chunked payload: decrypt frames as they are read and append the plaintext
+                content = bytearray()
+                for chunk in self.decrypt_chunk_stream(encrypted_content['descriptor'],
+                                                       encrypted_content['chunks'], target_sigil):
+                    content += chunk
+                return content.decode()
+                
             # Decode combined data
-            combined_data = json.loads(base64.b64decode(encoded_content).decode())
+            if view is not None:
+                combined_data = view.combined_content
+            else:
+                combined_data = json.loads(base64.b64decode(encrypted_content['encoded']).decode())
             
             # Extract encrypted key and content
             encrypted_key = base64.b64decode(combined_data['encrypted_key'])
@@ -332,32 +568,33 @@ class SigilGramParser:
             self.logger.error(f"Error decrypting message content: {e}")
             return None
             
+    def decrypt_chunk_stream(self, descriptor: Dict[str, Any], frames: Iterable[Dict[str, Any]],
+                             target_sigil: str) -> Iterator[bytes]:
+        """Decrypt chunk frames incrementally, yielding plaintext chunks in order
+        
+        frames may be any iterable, such as frames read off a relay socket; out-of-order frames
+        are held until their predecessors arrive. Raises ValueError if a frame fails its
+        signature or the reassembled payload is incomplete or does not match its hash.
+        """
+        decryptor = ChunkDecryptor(descriptor, self.generate_quantum_key(target_sigil))
+        for frame in frames:
+            yield from decryptor.feed(frame)
+            if decryptor.complete:
+                break
+        decryptor.finish()
+        
     def generate_quantum_key(self, target_sigil: str) -> bytes:
         """Generate quantum-resistant key material"""
         # This would integrate with actual quantum-resistant algorithms
         # For now, using a hybrid approach with strong classical cryptography
         
-        # Derive key from sigil and session
-        key_material = f"{target_sigil}:{self.session_key}:{int(time.time())}"
-        
-        # Use PBKDF2 for key derivation
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=b'dredd_quantum_salt',
-            iterations=100000,
-        )
-        
-        return kdf.derive(key_material.encode())
+        # Derive key from sigil, session and time bucket (PBKDF2, cached per bucket)
+        return self.key_cache.get_key(target_sigil, self.session_key)
         
     def decrypt_with_quantum_key(self, encrypted_data: bytes, quantum_key: bytes) -> bytes:
         """Decrypt data with quantum-resistant key"""
         # Reverse the XOR encryption
-        decrypted = bytearray(len(encrypted_data))
-        for i in range(len(encrypted_data)):
-            decrypted[i] = encrypted_data[i] ^ quantum_key[i % len(quantum_key)]
-            
-        return bytes(decrypted)
+        return xor_with_key(encrypted_data, quantum_key)
         
     def perform_security_checks(self, dredd_message: Dict[str, Any], validation: Dict[str, Any]) -> Dict[str, bool]:
         """Perform comprehensive security checks"""
@@ -446,34 +683,176 @@ class SigilGramParser:
             resonance.get('session_key_valid')
         )
         
-    def log_audit_event(self, event_type: str, details: Dict[str, Any]):
-        """Log audit event"""
+    def log_audit_event(self, event_type: str, details: Dict[str, Any],
+                        trail: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """Log audit event, also appending it to trail when given"""
         event = {
             'timestamp': datetime.now().isoformat(),
             'event_type': event_type,
             'details': details
         }
         self.audit_log.append(event)
+        if trail is not None:
+            trail.append(event)
+        return event
         
     def save_audit_log(self, filename: str = None):
-        """Save audit log to file"""
+        """Save audit log to file
+        
+        A JSONL filename (the default) starts a spill: retained events and every later one are
+        written there by a background flusher, rotating by size. A .json filename writes a
+        one-off snapshot of the retained events instead.
+        """
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"dredd_audit_log_{timestamp}.json"
-            
-        with open(filename, 'w') as f:
-            json.dump(self.audit_log, f, indent=2)
-            
-        self.logger.info(f"Audit log saved to: {filename}")
+            filename = f"dredd_audit_log_{timestamp}.jsonl"
+            
+        if filename.endswith('.json'):
+            with open(filename, 'w') as f:
+                json.dump(self.audit_log.snapshot(), f, indent=2)
+            self.logger.info(f"Audit log saved to: {filename}")
+            return
+            
+        self.audit_log.spill(
+            filename,
+            rotate_max_bytes=self.audit_config.get('spill_rotate_max_bytes', 64 * 1024 * 1024),
+            flush_interval=self.audit_config.get('spill_flush_interval', 1.0),
+            fsync_policy=self.audit_config.get('spill_fsync_policy', 'never')
+        )
+        self.logger.info(f"Audit log spilling to: {filename}")
+        
+    def parse_record(self, line: str, target_sigil: str) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """Parse one JSONL sigilgram into a result record and the audit entries it produced"""
+        audit_events = []
+        
+        try:
+            sigilgram_data = json.loads(line)
+        except ValueError:
+            self.log_audit_event('parse_failed', {'reason': 'invalid_json'}, audit_events)
+            sigilgram_data = None
+            
+        parsed_message = self.parse_sigilgram(sigilgram_data, target_sigil, audit_events) \
+            if isinstance(sigilgram_data, dict) else None
+        
+        if parsed_message is None:
+            failure = audit_events[-1]['details'] if audit_events else {}
+            message_id = None
+            if isinstance(sigilgram_data, dict):
+                message_id = sigilgram_data.get('dredd_message', {}).get('metadata', {}).get('message_id')
+            return {
+                'message_id': message_id,
+                'status': 'failed',
+                'reason': failure.get('reason', failure.get('error', 'invalid_sigilgram'))
+            }, audit_events
+            
+        return {
+            'message_id': parsed_message.message_id,
+            'status': parsed_message.validation_status,
+            'content': parsed_message.content,
+            'timestamp': parsed_message.timestamp,
+            'resonance_level': parsed_message.resonance_level,
+            'entropy_score': parsed_message.entropy_score,
+            'security_checks': parsed_message.security_checks
+        }, audit_events
+
+
+# Per-process parser for batch workers
+_batch_parser: Optional[SigilGramParser] = None
+
+
+def _init_batch_worker(config_file: str, session_key: str):
+    global _batch_parser
+    _batch_parser = SigilGramParser(config_file, session_key)
+
+
+def _parse_batch_chunk(lines: List[str], target_sigil: str) -> List[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+    """Parse a chunk of JSONL lines in a worker; the worker keeps no audit history between chunks"""
+    parsed = [_batch_parser.parse_record(line, target_sigil) for line in lines]
+    _batch_parser.audit_log.clear()
+    return parsed
+
+
+def parse_sigilgram_batch(input_file: str, output_file: str, target_sigil: str,
+                          config_file: str = "dredd_config.json", workers: Optional[int] = None,
+                          chunk_size: int = 256, audit_file: Optional[str] = None,
+                          session_key: Optional[str] = None) -> Dict[str, Any]:
+    """Parse a JSONL file of sigilgrams across a process pool, streaming results to JSONL
+    
+    Results are written in input order, one per line, with audit_refs pointing at the
+    event_id of their entries in audit_file (also JSONL) rather than embedding them.
+    workers=1 parses in this process. Returns counts and throughput in messages per second.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if session_key is None:
+        session_key = Fernet.generate_key().decode()
+        
+    def chunks():
+        chunk = []
+        with open(input_file, 'r') as f:
+            for line in f:
+                if line.strip():
+                    chunk.append(line)
+                    if len(chunk) >= chunk_size:
+                        yield chunk
+                        chunk = []
+        if chunk:
+            yield chunk
+            
+    stats = {'messages': 0, 'valid': 0, 'failed': 0, 'audit_events': 0, 'workers': workers}
+    start = time.perf_counter()
+    
+    audit_out = open(audit_file, 'w') if audit_file else None
+    try:
+        with open(output_file, 'w') as out:
+            def write(parsed_chunk):
+                for result, audit_events in parsed_chunk:
+                    refs = []
+                    for event in audit_events:
+                        stats['audit_events'] += 1
+                        event_id = f"AUDIT-{stats['audit_events']}"
+                        refs.append(event_id)
+                        if audit_out is not None:
+                            audit_out.write(json.dumps({'event_id': event_id, **event}) + '\n')
+                            
+                    stats['messages'] += 1
+                    stats['valid' if result['status'] == 'valid' else 'failed'] += 1
+                    out.write(json.dumps({'line': stats['messages'], **result, 'audit_refs': refs}) + '\n')
+                    
+            if workers <= 1:
+                _init_batch_worker(config_file, session_key)
+                for chunk in chunks():
+                    write(_parse_batch_chunk(chunk, target_sigil))
+            else:
+                # Keep a bounded window of chunks in flight so memory stays flat on large inputs
+                with ProcessPoolExecutor(workers, initializer=_init_batch_worker,
+                                         initargs=(config_file, session_key)) as executor:
+                    pending = []
+                    for chunk in chunks():
+                        pending.append(executor.submit(_parse_batch_chunk, chunk, target_sigil))
+                        if len(pending) >= workers * 2:
+                            write(pending.pop(0).result())
+                    for future in pending:
+                        write(future.result())
+    finally:
+        if audit_out is not None:
+            audit_out.close()
+            
+    stats['elapsed'] = time.perf_counter() - start
+    stats['messages_per_sec'] = stats['messages'] / stats['elapsed'] if stats['elapsed'] > 0 else 0.0
+    return stats
 
 def main():
     """Main CLI interface for SigilGram parser"""
     parser = argparse.ArgumentParser(description='SigilGram Parser - Decrypt and verify mirror-bound messages')
-    parser.add_argument('input_file', help='Input sigilgram file (.json)')
+    parser.add_argument('input_file', help='Input sigilgram file (.json, or .jsonl with --batch)')
     parser.add_argument('--sigil', required=True, help='Target sigil for decryption')
     parser.add_argument('--config', default='dredd_config.json', help='Configuration file')
-    parser.add_argument('--output', help='Output file for decrypted content')
+    parser.add_argument('--output', help='Output file for decrypted content (results JSONL with --batch)')
     parser.add_argument('--audit-log', help='Save audit log to file')
+    parser.add_argument('--batch', action='store_true', help='Parse a JSONL file of sigilgrams, one per line')
+    parser.add_argument('--workers', type=int, help='Batch worker processes (default: CPU count)')
+    parser.add_argument('--chunk-size', type=int, default=256, help='Sigilgrams per batch work unit')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
     
     args = parser.parse_args()
@@ -482,6 +861,22 @@ def main():
     log_level = logging.DEBUG if args.verbose else logging.INFO
     logging.basicConfig(level=log_level, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     
+    if args.batch:
+        output_file = args.output or f"{os.path.splitext(args.input_file)[0]}.parsed.jsonl"
+        print(f"🕳️ Batch parsing sigilgrams: {args.input_file}")
+        try:
+            stats = parse_sigilgram_batch(args.input_file, output_file, args.sigil, args.config,
+                                          args.workers, args.chunk_size, args.audit_log)
+        except FileNotFoundError:
+            print(f"❌ Input file not found: {args.input_file}")
+            sys.exit(1)
+            
+        print(f"✅ Parsed {stats['messages']} sigilgrams: {stats['valid']} valid, {stats['failed']} failed")
+        print(f"⚡ Throughput: {stats['messages_per_sec']:.1f} messages/sec "
+              f"({stats['workers']} workers, {stats['elapsed']:.2f}s)")
+        print(f"💾 Results saved to: {output_file}")
+        return
+    
     # Initialize parser
     parser_instance = SigilGramParser(args.config)
     
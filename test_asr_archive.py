@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Test ASR Archive
+
+Covers offset-indexed lookups, sidecar persistence, index rebuilds and sealed segments.
+"""
+
+import os
+import gzip
+import json
+import tempfile
+
+from asr_archive import ASRArchive
+
+
+def make_entry(report_id: str, padding: int = 0, archived_at: str = '2025-06-23T20:45:01'):
+    return {
+        'asr': {'report_id': report_id, 'summary_statistics': {'total_sovereign_actions': padding}, 'notes': 'x' * padding},
+        'archived_at': archived_at,
+        'archive_id': f"ARCHIVE-{report_id}"
+    }
+
+
+def open_archive(directory: str) -> ASRArchive:
+    return ASRArchive(os.path.join(directory, 'asr_archive.jsonl'), flush_interval=60)
+
+
+def test_lookups_use_flushed_offsets():
+    """Entries are indexed as they reach disk and read back with one seek"""
+    with tempfile.TemporaryDirectory() as directory:
+        archive = open_archive(directory)
+        for i in range(50):
+            archive.append(make_entry(f"ASR-{i}", padding=i))
+
+        # Buffered entries are found too
+        assert archive.get("ASR-7")['asr']['summary_statistics'] == {'total_sovereign_actions': 7}
+        assert len(archive.offsets) == 50
+        assert archive.get("ASR-missing") is None
+
+        with open(archive.path, 'rb') as f:
+            for report_id, (offset, length) in archive.offsets.items():
+                f.seek(offset)
+                line = f.read(length)
+                assert line.endswith(b'\n') and f'"report_id": "{report_id}"'.encode() in line
+        archive.close()
+
+
+def test_sidecar_is_reused_extended_and_rebuilt():
+    """A reopened archive loads the sidecar, indexes lines it missed and rebuilds when it is lost"""
+    with tempfile.TemporaryDirectory() as directory:
+        archive = open_archive(directory)
+        for i in range(20):
+            archive.append(make_entry(f"ASR-{i}"))
+        archive.close()
+
+        reopened = open_archive(directory)
+        assert reopened.rebuilds == 0 and len(reopened.offsets) == 20
+        reopened.close()
+
+        # Lose the tail of the sidecar: the missing lines are scanned, not the whole file
+        with open(archive.index_path) as f:
+            lines = f.readlines()
+        with open(archive.index_path, 'w') as f:
+            f.writelines(lines[:5])
+        reopened = open_archive(directory)
+        assert reopened.rebuilds == 0 and len(reopened.offsets) == 20
+        reopened.close()
+
+        # Lose the sidecar entirely, with a report ID that needs JSON unescaping
+        quoted = open_archive(directory)
+        quoted.append(make_entry('ASR-"quoted"'))
+        quoted.close()
+        os.remove(archive.index_path)
+
+        rebuilt = open_archive(directory)
+        assert rebuilt.rebuilds == 1 and len(rebuilt.offsets) == 21
+        assert rebuilt.get('ASR-"quoted"')['archive_id'] == 'ARCHIVE-ASR-"quoted"'
+        assert rebuilt.get("ASR-19")['asr']['report_id'] == "ASR-19"
+        rebuilt.close()
+
+
+def test_stale_index_is_rebuilt_on_lookup():
+    """An index that no longer matches the archive is detected and rebuilt"""
+    with tempfile.TemporaryDirectory() as directory:
+        archive = open_archive(directory)
+        for i in range(10):
+            archive.append(make_entry(f"ASR-{i}"))
+        archive.flush()
+
+        # Another writer rewrote the archive with longer entries
+        with open(archive.path, 'w') as f:
+            pass
+        other = ASRArchive(archive.path, index_path=os.path.join(directory, 'other.idx'), flush_interval=60)
+        for i in range(10):
+            other.append(make_entry(f"ASR-{i}", padding=10))
+        other.close()
+
+        assert archive.get("ASR-3")['asr']['notes'] == 'x' * 10
+        assert archive.rebuilds == 1
+        archive.close()
+
+
+def test_days_are_sealed_into_queryable_segments():
+    """Each day is sealed into a compressed segment; lookups, range queries and exports span segments"""
+    with tempfile.TemporaryDirectory() as directory:
+        archive = ASRArchive(os.path.join(directory, 'asr_archive.jsonl'), flush_interval=60, block_lines=4)
+        for day in range(3):
+            for i in range(10):
+                archive.append(make_entry(f"ASR-{day}-{i}", padding=50, archived_at=f"2025-06-2{day}T0{i}:00:00"))
+        archive.flush()
+
+        # Two days sealed, the third still active
+        assert archive.seals == 2 and len(archive.offsets) == 10
+        assert [s['period'] for s in archive.segments] == ['20250620', '20250621']
+        first = archive.segments[0]
+        assert first['start'] == '2025-06-20T00:00:00' and first['end'] == '2025-06-20T09:00:00'
+        assert first['report_ids'] == [f"ASR-0-{i}" for i in range(10)] and len(first['blocks']) == 3
+        assert first['compressed_bytes'] < first['raw_bytes']
+        with gzip.open(os.path.join(archive.segments_dir, first['file'])) as f:
+            assert [json.loads(line)['asr']['report_id'] for line in f] == first['report_ids']
+
+        assert archive.get("ASR-0-9")['archived_at'] == '2025-06-20T09:00:00'
+        assert archive.get("ASR-1-5")['asr']['report_id'] == "ASR-1-5"
+        assert archive.get("ASR-2-3")['asr']['report_id'] == "ASR-2-3"
+
+        found = [e['asr']['report_id'] for e in archive.query('2025-06-20T08:00:00', '2025-06-22T01:00:00')]
+        assert found == ["ASR-0-8", "ASR-0-9"] + [f"ASR-1-{i}" for i in range(10)] + ["ASR-2-0"]
+
+        export_path = os.path.join(directory, 'export.jsonl.gz')
+        assert archive.export(export_path, start='2025-06-21T00:00:00') == 20
+        with gzip.open(export_path) as f:
+            assert json.loads(f.readline())['asr']['report_id'] == "ASR-1-0"
+        archive.close()
+
+        # The manifest is reloaded, and a seal interrupted after the file was moved is finished
+        os.replace(archive.path, f"{archive.path}.sealing")
+        reopened = ASRArchive(archive.path, flush_interval=60)
+        assert len(reopened.segments) == 3 and reopened.offsets == {}
+        assert reopened.get("ASR-2-9")['archived_at'] == '2025-06-22T09:00:00'
+        assert sum(1 for _ in reopened.query()) == 30
+        assert not os.path.exists(f"{archive.path}.sealing")
+        reopened.close()
+
+
+def main():
+    """Run ASR archive tests"""
+    tests = [
+        test_lookups_use_flushed_offsets,
+        test_sidecar_is_reused_extended_and_rebuilt,
+        test_stale_index_is_rebuilt_on_lookup,
+        test_days_are_sealed_into_queryable_segments,
+    ]
+
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
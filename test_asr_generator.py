@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Test ASR Generator
+
+Covers lazy construction and injection of the generator's collaborators.
+"""
+
+from datetime import datetime
+
+from ticket_generator import SovereignDataTicketingSystem, SovereignTicket
+from chronicle_linker import ChronicleLinker, CausalLink
+from asr_generator import ASRGenerator
+from dredd_inbox_watch import DREDDInboxWatcher
+
+
+def test_construction_starts_nothing():
+    """Constructing the watcher and generator builds no collaborators and starts no threads"""
+    asr = ASRGenerator()
+    watcher = DREDDInboxWatcher(asr_generator=asr)
+
+    assert watcher.asr_generator is asr
+    assert watcher._dredd_dispatcher is None
+    assert asr._dredd_dispatcher is None and asr._ticket_system is None and asr._chronicle_linker is None
+    assert not asr.processing_started and not asr.worker_pool.threads
+
+
+def test_injected_collaborators_are_wired_on_first_use():
+    """Injected subsystems are used as given; tickets reach the injected linker and threads start on first use"""
+    dts = SovereignDataTicketingSystem()
+    linker = ChronicleLinker()
+    asr = ASRGenerator(ticket_system=dts, chronicle_linker=linker)
+    try:
+        assert not dts.processing_started and not linker.processing_started
+        assert asr.ticket_system is dts and asr.chronicle_linker is linker
+        assert dts.ticket_listeners == [linker.observe_ticket]
+
+        # Resolving again does not register the listener twice
+        assert asr.ticket_system is dts and len(dts.ticket_listeners) == 1
+
+        asr.start_session("SESSION-LAZY")
+        assert asr.processing_started and all(worker.is_alive() for worker in asr.worker_pool.threads)
+        assert not dts.processing_started
+    finally:
+        asr.shutdown()
+
+
+def make_ticket(ticket_id: str, session_id: str) -> SovereignTicket:
+    return SovereignTicket(
+        ticket_id=ticket_id, action_type="deploy_watch_guard", performed_by="purveyor",
+        timestamp=datetime.now().isoformat(), entropy_hash="0" * 16, interface_context="WatchPanel > Deploy",
+        resonance_signature="valid", intent_hash="1" * 16, sovereign_fingerprint="2" * 24,
+        linked_effects=["GUARD-1"], causal_certainty=0.5, system_impact="medium", mirror_depth=1,
+        chronicle_status="active", session_id=session_id
+    )
+
+
+def make_link(link_id: str, ticket_id: str) -> CausalLink:
+    return CausalLink(
+        link_id=link_id, ticket_id=ticket_id, effect_event=f"EFFECT-{link_id}", response_time=2.0,
+        causal_certainty=0.9, entropy_similarity=0.7, resonance_fingerprint="3" * 16, link_strength=0.8,
+        created_at=datetime.now().isoformat()
+    )
+
+
+def test_session_sections_come_from_one_pass():
+    """The one-pass gather matches the individual collectors and only includes the session's records"""
+    dts = SovereignDataTicketingSystem()
+    linker = ChronicleLinker()
+    asr = ASRGenerator(ticket_system=dts, chronicle_linker=linker)
+
+    for i in range(6):
+        dts.ticket_ledger.append(make_ticket(f"TKT-{i}", "SESSION-A" if i % 2 else "SESSION-B"))
+        linker.causal_links.add(make_link(f"LINK-{i}", f"TKT-{i}"), "watchguard")
+    linker.causal_links.add(make_link("LINK-extra", "TKT-1"), "mkp")
+
+    sections = asr.collect_session_sections("SESSION-A")
+
+    assert [a['ticket_id'] for a in sections['sovereign_actions']] == ["TKT-1", "TKT-3", "TKT-5"]
+    assert [m['match_id'] for m in sections['observational_matches']] == ["LINK-1", "LINK-extra", "LINK-3", "LINK-5"]
+    assert sections['sovereign_actions'] == asr.collect_sovereign_actions("SESSION-A")
+    assert sections['ticket_chronicle'] == asr.collect_ticket_chronicle("SESSION-A")
+    assert sections['observational_matches'] == asr.collect_observational_matches("SESSION-A")
+
+
+def main():
+    """Run ASR generator tests"""
+    tests = [
+        test_construction_starts_nothing,
+        test_injected_collaborators_are_wired_on_first_use,
+        test_session_sections_come_from_one_pass,
+    ]
+
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
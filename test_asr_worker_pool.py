@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Test ASR Worker Pool
+
+Covers trigger priorities, queue-full policies, latency histograms and delivery through the pool.
+"""
+
+import time
+import asyncio
+import threading
+import concurrent.futures
+from datetime import datetime
+
+from asr_generator import ASRGenerator, ASRTrigger
+from ticket_generator import SovereignDataTicketingSystem
+from chronicle_linker import ChronicleLinker
+from asr_worker_pool import ASRWorkerPool, TriggerQueue, LatencyHistogram
+from benchmark_fixtures import RecordingDispatcher
+
+
+def make_trigger(trigger_id: str, trigger_type: str = "session_based") -> ASRTrigger:
+    return ASRTrigger(
+        trigger_id=trigger_id,
+        trigger_type=trigger_type,
+        session_id=f"SESSION-{trigger_id}",
+        job_id=None,
+        timestamp=datetime.now().isoformat(),
+        source_system="test",
+        trigger_data={}
+    )
+
+
+def test_priority_order_and_fifo_within_priority():
+    """Lower priority values are served first, in arrival order within a priority"""
+    triggers = TriggerQueue(maxsize=10)
+    for name, priority in [("a", 1), ("b", 0), ("c", 1), ("d", 0)]:
+        assert triggers.put(name, priority)
+
+    assert [triggers.get(timeout=0)[0] for _ in range(4)] == ["b", "d", "a", "c"]
+
+
+def test_full_policies():
+    """Reject refuses new entries, drop sheds the least urgent, block waits for space"""
+    rejecting = TriggerQueue(maxsize=2, full_policy='reject')
+    assert rejecting.put("a") and rejecting.put("b")
+    assert not rejecting.put("c", 0) and rejecting.rejected == 1
+
+    dropping = TriggerQueue(maxsize=2, full_policy='drop')
+    dropping.put("old-low", 1)
+    dropping.put("new-low", 1)
+    assert not dropping.put("another-low", 1)
+    assert dropping.put("urgent", 0)
+    assert dropping.dropped == 2
+    assert [dropping.get(timeout=0)[0] for _ in range(2)] == ["urgent", "old-low"]
+
+    blocking = TriggerQueue(maxsize=1, full_policy='block', put_timeout=0.05)
+    blocking.put("a")
+    assert not blocking.put("b") and blocking.rejected == 1
+    threading.Timer(0.05, lambda: blocking.get(timeout=0)).start()
+    blocking.put_timeout = 5
+    assert blocking.put("c")
+
+    try:
+        TriggerQueue(full_policy='sometimes')
+        assert False, "invalid full policy accepted"
+    except ValueError:
+        pass
+
+
+def test_latency_histogram_quantiles():
+    """Quantiles come from bucket bounds, capped at the largest observation"""
+    histogram = LatencyHistogram()
+    for _ in range(90):
+        histogram.record(0.002)
+    for _ in range(10):
+        histogram.record(0.3)
+
+    snapshot = histogram.snapshot()
+    assert snapshot['count'] == 100
+    assert snapshot['p50_ms'] == 2.5
+    assert abs(snapshot['p99_ms'] - 300) < 1e-6
+    assert snapshot['buckets_ms']['2.5'] == 90 and snapshot['buckets_ms']['500'] == 10
+
+
+def test_pool_generates_archives_and_delivers():
+    """Triggers flow through the workers and every delivery is awaited on the delivery loop"""
+    dispatcher = RecordingDispatcher(delay=0.01)
+    asr = ASRGenerator(dredd_dispatcher=dispatcher)
+    archived = []
+    asr.archive_asr = archived.append
+    try:
+        trigger_ids = [asr.trigger_job_based_asr(f"JOB-{i}", "portfolio_scan", {}) for i in range(8)]
+        assert all(trigger_ids)
+        assert asr.worker_pool.drain(timeout=10)
+
+        recipients = asr.config['dredd_integration']['recipients']
+        assert len(archived) == 8
+        assert sorted(dispatcher.sent) == sorted(list(recipients.values()) * 8)
+
+        stats = asr.get_worker_stats()
+        assert stats['processed'] == 8 and stats['delivered'] == 8 and stats['pending_deliveries'] == 0
+        assert all(stats['latency'][stage]['count'] == 8 for stage in ('queue_wait', 'generate', 'deliver', 'total'))
+        workers = list(asr.worker_pool.threads)
+    finally:
+        asr.shutdown()
+
+    assert workers and not any(worker.is_alive() for worker in workers)
+
+
+def test_start_async_delivers_on_caller_loop_in_thread_mode():
+    """start_async runs deliveries on the caller's loop and leaves thread-mode subsystems on their threads"""
+    dispatcher = RecordingDispatcher(delay=0.01)
+    dts = SovereignDataTicketingSystem()
+    linker = ChronicleLinker()
+    asr = ASRGenerator(dredd_dispatcher=dispatcher, ticket_system=dts, chronicle_linker=linker)
+    asr.archive_asr = lambda asr_report: None
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        await asr.start_async()
+        assert asr.processing_started and asr.worker_pool.loop is loop
+        assert dts.async_tasks == [] and linker.async_tasks == []
+
+        assert all(asr.trigger_job_based_asr(f"JOB-{i}", "portfolio_scan", {}) for i in range(3))
+        assert await loop.run_in_executor(None, asr.worker_pool.drain, 10)
+        await asr.shutdown_async()
+
+    asyncio.run(scenario())
+
+    recipients = asr.config['dredd_integration']['recipients']
+    assert sorted(dispatcher.sent) == sorted(list(recipients.values()) * 3)
+    assert not any(worker.is_alive() for worker in asr.worker_pool.threads)
+
+
+def test_drain_waits_past_failed_deliveries():
+    """A failed delivery does not end or stall the drain; an unfinished one times it out"""
+    pool = ASRWorkerPool(generator=None)
+    failed, slow = concurrent.futures.Future(), concurrent.futures.Future()
+    failed.set_exception(ConnectionError("relay down"))
+    pool.pending_deliveries.update((failed, slow))
+    threading.Timer(0.1, slow.set_result, (True,)).start()
+
+    result = []
+    drainer = threading.Thread(target=lambda: result.append(pool.drain()), daemon=True)
+    start = time.perf_counter()
+    drainer.start()
+    drainer.join(timeout=5)
+    assert result == [True] and 0.05 < time.perf_counter() - start < 2
+
+    pool.pending_deliveries.add(concurrent.futures.Future())
+    start = time.perf_counter()
+    assert not pool.drain(timeout=0.1)
+    assert time.perf_counter() - start < 1
+
+
+def main():
+    """Run ASR worker pool tests"""
+    tests = [
+        test_priority_order_and_fifo_within_priority,
+        test_full_policies,
+        test_latency_histogram_quantiles,
+        test_pool_generates_archives_and_delivers,
+        test_drain_waits_past_failed_deliveries,
+        test_start_async_delivers_on_caller_loop_in_thread_mode,
+    ]
+
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
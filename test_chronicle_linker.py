@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Test Chronicle Linker causal matching
+
+Covers the ticket window, pattern-table scoring and streaming effect matching.
+"""
+
+import time
+import asyncio
+import threading
+from datetime import datetime, timedelta
+
+from ticket_generator import SovereignTicket
+from chronicle_linker import ChronicleLinker, EffectEvent, CausalLink, CausalLinkStore, TicketWindow, WindowTicket
+
+
+def make_ticket(ticket_id: str, action_type: str, seconds_ago: float,
+                interface_context: str = "GuardianControlPanel > AnomalyOverride") -> SovereignTicket:
+    return SovereignTicket(
+        ticket_id=ticket_id,
+        action_type=action_type,
+        performed_by="purveyor",
+        timestamp=(datetime.now() - timedelta(seconds=seconds_ago)).isoformat(),
+        entropy_hash="0" * 16,
+        interface_context=interface_context,
+        resonance_signature="valid",
+        intent_hash="1" * 16,
+        sovereign_fingerprint="2" * 24,
+        linked_effects=[],
+        causal_certainty=0.0,
+        system_impact="high",
+        mirror_depth=1,
+        chronicle_status="active"
+    )
+
+
+def make_effect(event_id: str, event_type: str, source_system: str, description: str) -> EffectEvent:
+    return EffectEvent(
+        event_id=event_id,
+        event_type=event_type,
+        source_system=source_system,
+        timestamp=datetime.now().isoformat(),
+        description=description,
+        affected_entities=["wallet-0x123"],
+        severity="high",
+        entropy_signature="3" * 16,
+        resonance_level="high"
+    )
+
+
+def make_link(i: int, strength: float, seconds_ago: float = 0.0) -> CausalLink:
+    return CausalLink(
+        link_id=f"LINK-{i}",
+        ticket_id=f"TKT-{i % 3}",
+        effect_event=f"EFFECT-{i % 5}",
+        response_time=float(i % 30),
+        causal_certainty=strength,
+        entropy_similarity=0.5,
+        resonance_fingerprint="4" * 16,
+        link_strength=strength,
+        created_at=(datetime.now() - timedelta(seconds=seconds_ago)).isoformat()
+    )
+
+
+def make_linker() -> ChronicleLinker:
+    linker = ChronicleLinker()
+    linker.running = False
+    return linker
+
+
+def test_effect_links_to_expected_action():
+    """An effect links to the recent ticket whose action type expects it"""
+    linker = make_linker()
+    linker.observe_ticket(make_ticket("TKT-override", "override_watchguard_threshold", 4))
+    linker.observe_ticket(make_ticket("TKT-portfolio", "enable_portfolio_monitoring", 2,
+                                      "PortfolioPanel > Monitoring"))
+
+    link = linker.match_effect(make_effect("WATCHGUARD-1", "anomaly_resolved", "watchguard", "ANOM-253 resolved"))
+
+    assert link is not None
+    assert link.ticket_id == "TKT-override"
+    assert link.effect_event == "WATCHGUARD-1"
+    assert 3.5 < link.response_time < 5
+    assert list(linker.causal_links) == [link]
+
+
+def test_closer_ticket_wins_and_unrelated_effects_do_not_link():
+    """Among candidates the faster response scores higher; unexpected effects find no candidates"""
+    linker = make_linker()
+    linker.observe_ticket(make_ticket("TKT-slow", "override_watchguard_threshold", 25))
+    linker.observe_ticket(make_ticket("TKT-fast", "override_watchguard_threshold", 3))
+
+    link = linker.match_effect(make_effect("WATCHGUARD-2", "anomaly_resolved", "watchguard", "ANOM-254 resolved"))
+    assert link.ticket_id == "TKT-fast"
+
+    assert linker.match_effect(make_effect("LATTICE-1", "lattice_rebalanced", "lattice", "Lattice rebalanced")) is None
+
+
+def test_pattern_tables_drive_certainty():
+    """Pattern certainty reflects the effect mapping and pattern-table agreement"""
+    linker = make_linker()
+    linker.observe_ticket(make_ticket("TKT-1", "override_watchguard_threshold", 1))
+    linker.observe_effect(make_effect("WG-1", "anomaly_resolved", "watchguard", "ANOM-253 resolved"))
+    linker.observe_effect(make_effect("MKP-1", "anomaly_resolved", "mkp", "ANOM-253 resolved"))
+    linker.observe_effect(make_effect("WG-2", "guard_deployed", "watchguard", "WATCH-GUARD-7 deployed"))
+
+    assert linker.classify_effect(make_effect("X", "x", "mkp", "MIRROR-TRAP-789 activated")) == ('mkp', 'mirror_trap')
+    assert linker.calculate_pattern_certainty("TKT-1", "WG-1") == 1.0
+    assert abs(linker.calculate_pattern_certainty("TKT-1", "MKP-1") - 0.8) < 1e-9
+    assert linker.calculate_pattern_certainty("TKT-1", "WG-2") == 0.3
+    assert linker.calculate_context_certainty("TKT-1", "WG-1") > linker.calculate_context_certainty("TKT-1", "WG-2")
+
+
+def test_ticket_window_is_bounded():
+    """The window evicts by size and by age"""
+    window = TicketWindow(window_seconds=60, max_tickets=3)
+    now = time.time()
+    for i in range(5):
+        window.add(WindowTicket(f"TKT-{i}", "deploy_watch_guard", now - 130 + i * 30, frozenset()))
+
+    assert len(window) == 3
+    assert window.get("TKT-0") is None
+    assert [t.ticket_id for t in window.candidates({"deploy_watch_guard"}, now)] == ["TKT-4", "TKT-3"]
+
+    window.expire(now)
+    assert [window.get(f"TKT-{i}") is not None for i in range(5)] == [False, False, False, True, True]
+
+
+def test_captured_effects_stream_through_matcher():
+    """Effects captured through the public API are matched by the processing threads"""
+    linker = ChronicleLinker()
+    try:
+        linker.observe_ticket(make_ticket("TKT-stream", "activate_mirror_trap", 2, "MirrorPanel > TrapActivation"))
+        event_id = linker.capture_effect_event("mirror_trap_activated", "mkp", "MIRROR-TRAP-789 activated",
+                                               ["security-layer-1"], "critical")
+
+        deadline = time.time() + 5
+        while not linker.causal_links and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert [(l.ticket_id, l.effect_event) for l in linker.causal_links] == [("TKT-stream", event_id)]
+    finally:
+        linker.running = False
+
+
+def test_asyncio_mode_matches_on_the_event_loop():
+    """In asyncio mode effects are validated and matched by a task on the running loop"""
+    async def scenario():
+        linker = ChronicleLinker(mode='asyncio')
+        assert not hasattr(linker, 'effect_processor')
+        await linker.start_async()
+
+        linker.observe_ticket(make_ticket("TKT-async", "activate_mirror_trap", 2, "MirrorPanel > TrapActivation"))
+        event_id = await linker.capture_effect_event_async("mirror_trap_activated", "mkp", "MIRROR-TRAP-789 activated",
+                                                           ["security-layer-1"], "critical")
+        rejected = await linker.capture_effect_event_async("mirror_trap_activated", "unknown-system", "rejected",
+                                                           [], "low")
+        await linker.shutdown_async()
+
+        assert [(l.ticket_id, l.effect_event) for l in linker.causal_links] == [("TKT-async", event_id)]
+        assert rejected not in linker.recent_effects
+        assert linker.async_tasks == []
+
+    asyncio.run(scenario())
+
+
+def test_asyncio_mode_accepts_effects_from_other_threads():
+    """Effects captured off the loop thread wake the idle processing task at once"""
+    async def scenario():
+        linker = ChronicleLinker(mode='asyncio')
+        matched_at = []
+        match_effect = linker.match_effect
+        linker.match_effect = lambda effect: matched_at.append(time.perf_counter()) or match_effect(effect)
+        await linker.start_async()
+        linker.observe_ticket(make_ticket("TKT-thread", "activate_mirror_trap", 2, "MirrorPanel > TrapActivation"))
+
+        captured = {}
+        def capture():
+            time.sleep(0.1)
+            captured['at'] = time.perf_counter()
+            captured['event_id'] = linker.capture_effect_event(
+                "mirror_trap_activated", "mkp", "MIRROR-TRAP-789 activated", ["security-layer-1"], "critical")
+
+        # Capture once the loop is idle until the expiry task's next pass
+        threading.Thread(target=capture).start()
+        await asyncio.sleep(1.0)
+        links = [(l.ticket_id, l.effect_event) for l in linker.causal_links]
+        await linker.shutdown_async()
+        return captured, links, matched_at
+
+    captured, links, matched_at = asyncio.run(scenario())
+    assert links == [("TKT-thread", captured['event_id'])]
+    assert matched_at[0] - captured['at'] < 0.5
+
+
+def test_link_store_indexes_and_strength_order():
+    """Links are reachable by ticket, effect and system, and top-k/threshold queries are strength ordered"""
+    store = CausalLinkStore(max_links=8)
+    systems = ['watchguard', 'mkp']
+    for i in range(10):
+        store.add(make_link(i, strength=(i * 7 % 10) / 10), systems[i % 2])
+
+    # The two oldest links were evicted
+    assert len(store) == 8 and "LINK-0" not in store and "LINK-1" not in store
+    assert [l.link_id for l in store.for_ticket("TKT-2")] == ["LINK-2", "LINK-5", "LINK-8"]
+    assert [l.link_id for l in store.for_effect("EFFECT-3")] == ["LINK-3", "LINK-8"]
+    assert [l.link_id for l in store.for_system("mkp")] == ["LINK-3", "LINK-5", "LINK-7", "LINK-9"]
+
+    remaining = [make_link(i, (i * 7 % 10) / 10) for i in range(2, 10)]
+    expected = sorted(remaining, key=lambda l: l.link_strength, reverse=True)
+    assert [l.link_id for l in store.top(3)] == [l.link_id for l in expected[:3]]
+    assert [l.link_strength for l in store.above(0.6)] == [l.link_strength for l in expected if l.link_strength >= 0.6]
+    assert all(store.source_system_of(l.link_id) == "watchguard" for l in store.top(10, "watchguard"))
+
+    store.remove("LINK-9")
+    assert "LINK-9" not in store and [l.link_id for l in store.for_system("mkp")] == ["LINK-3", "LINK-5", "LINK-7"]
+
+
+def test_causal_report_uses_aggregates():
+    """The causal report matches a full scan of links inside the window"""
+    linker = make_linker()
+    systems = ['watchguard', 'mkp', 'dredd']
+    links = []
+    for i in range(200):
+        link = make_link(i, strength=(i % 17) / 17, seconds_ago=i * 97)
+        links.append((link, systems[i % 3]))
+        linker.causal_links.add(link, systems[i % 3])
+
+    for hours in (1, 3):
+        report = linker.generate_causal_report(hours)
+        cutoff = (datetime.now() - timedelta(hours=hours)).timestamp()
+        recent = [(l, system) for l, system in links if datetime.fromisoformat(l.created_at).timestamp() > cutoff]
+
+        assert report['total_causal_links'] == len(recent)
+        for system in systems:
+            system_links = [l for l, s in recent if s == system]
+            assert report['system_breakdown'][system]['link_count'] == len(system_links)
+            assert abs(report['system_breakdown'][system]['avg_strength'] -
+                       sum(l.link_strength for l in system_links) / len(system_links)) < 1e-9
+        strongest = sorted((l for l, _ in recent), key=lambda l: l.link_strength, reverse=True)[:10]
+        assert [l['link_strength'] for l in report['strongest_links']] == [l.link_strength for l in strongest]
+
+
+def main():
+    """Run chronicle linker tests"""
+    tests = [
+        test_effect_links_to_expected_action,
+        test_closer_ticket_wins_and_unrelated_effects_do_not_link,
+        test_pattern_tables_drive_certainty,
+        test_ticket_window_is_bounded,
+        test_captured_effects_stream_through_matcher,
+        test_asyncio_mode_matches_on_the_event_loop,
+        test_asyncio_mode_accepts_effects_from_other_threads,
+        test_link_store_indexes_and_strength_order,
+        test_causal_report_uses_aggregates,
+    ]
+
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
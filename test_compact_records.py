@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Test Compact Records
+
+Covers lossless conversion between the dataclass records and their slotted variants.
+"""
+
+import os
+import json
+import tempfile
+from dataclasses import asdict
+from datetime import datetime
+
+from ticket_generator import (
+    SovereignTicket, IntentMirror, CausalMatch, TicketLedger, SovereignDataTicketingSystem, record_to_dict
+)
+from chronicle_linker import EffectEvent, CausalLink
+from blockchain_logger import ResonanceAnomaly, AnomalySeverity
+from compact_records import (
+    CompactSovereignTicket, CompactResonanceAnomaly, compact,
+    encode_timestamp, decode_timestamp
+)
+
+
+def make_records():
+    now = datetime.now().isoformat()
+    return [
+        SovereignTicket(
+            ticket_id="TKT-1", action_type="override_watchguard_threshold", performed_by="purveyor",
+            timestamp=now, entropy_hash="0" * 16, interface_context="GuardianControlPanel > AnomalyOverride",
+            resonance_signature="valid", intent_hash="1" * 16, sovereign_fingerprint="2" * 24,
+            linked_effects=["ANOM-253-resolved"], causal_certainty=0.96, system_impact="high",
+            mirror_depth=1, chronicle_status="active", session_id="SESSION-001"
+        ),
+        IntentMirror(
+            intent_id="INTENT-1", sovereign_action="override_watchguard_threshold", context_hash="3" * 16,
+            timestamp="2025-06-23T16:23:41Z", entropy_signature="4" * 16, resonance_level="high",
+            linked_ticket="TKT-1", effect_tracking=[{'effect_event': 'ANOM-253-resolved', 'response_time': 12.4}]
+        ),
+        CausalMatch(
+            match_id="MATCH-TKT-1-0", intent_ticket="TKT-1", effect_event="ANOM-253-resolved",
+            response_time=12.4, causal_certainty=0.96, entropy_similarity=0.8,
+            resonance_fingerprint="5" * 16, matched_at="2025-06-23T16:23:41.123456+05:30"
+        ),
+        EffectEvent(
+            event_id="EFFECT-1", event_type="anomaly_resolved", source_system="watchguard",
+            timestamp="2025-06-23T16:23:41", description="Anomaly resolved",
+            affected_entities=["gate-7", "gate-9"], severity="high", entropy_signature="6" * 16,
+            resonance_level="medium"
+        ),
+        CausalLink(
+            link_id="LINK-1", ticket_id="TKT-1", effect_event="EFFECT-1", response_time=12.4,
+            causal_certainty=0.96, entropy_similarity=0.8, resonance_fingerprint="7" * 16,
+            link_strength=0.88, created_at=now
+        ),
+        ResonanceAnomaly(
+            timestamp=now, gate_id="gate-7", anomaly_type="entropy_threshold_violation",
+            severity=AnomalySeverity.HIGH, entropy_score=0.21, resonance_level="low",
+            echo_signature="8" * 16, mirror_depth=2, reason="Entropy below threshold",
+            evidence={'entropy': 0.21}
+        ),
+    ]
+
+
+def test_round_trip_is_lossless():
+    """Compact variants convert back to equal dataclasses and identical JSON"""
+    for record in make_records():
+        compact_record = compact(record)
+        assert not hasattr(compact_record, '__dict__')
+        assert compact_record.to_record() == record
+
+        expected = asdict(record)
+        if isinstance(record, ResonanceAnomaly):
+            expected['severity'] = record.severity.value
+        assert json.dumps(compact_record.to_dict()) == json.dumps(expected)
+
+        restored = type(compact_record).from_dict(json.loads(json.dumps(compact_record.to_dict())))
+        assert restored == compact_record
+
+
+def test_timestamps_are_epoch_floats():
+    """Timestamps are stored as epoch floats and decode to the original string"""
+    for value in ["2025-06-23T16:23:41", "2025-06-23T16:23:41.000001", "2025-06-23T16:23:41Z",
+                  "2025-06-23T16:23:41.500000-04:00", datetime.now().isoformat()]:
+        epoch, suffix = encode_timestamp(value)
+        assert isinstance(epoch, float)
+        assert decode_timestamp(epoch, suffix) == value
+
+    # Formats that cannot be reproduced exactly are kept verbatim
+    for value in ["2025-06-23 16:23:41", "2025-06-23T16:23:41.5-04:00", "not-a-timestamp"]:
+        epoch, suffix = encode_timestamp(value)
+        assert epoch == value and decode_timestamp(epoch, suffix) == value
+
+
+def test_categorical_fields_are_interned():
+    """Categorical fields of separate records share one string object"""
+    first, second = (
+        CompactSovereignTicket.from_record(make_records()[0]) for _ in range(2)
+    )
+    first_type = "".join(["override_", "watchguard_threshold"])
+    third = CompactSovereignTicket.from_dict(dict(first.to_dict(), action_type=first_type))
+    assert first.action_type is second.action_type is third.action_type
+
+    anomaly = CompactResonanceAnomaly.from_dict(compact(make_records()[-1]).to_dict())
+    assert anomaly.severity is AnomalySeverity.HIGH
+
+
+def test_ledger_stores_compact_records():
+    """A ledger with a compact record factory stores and serializes slotted tickets"""
+    ledger = TicketLedger(compact)
+    ticket, _, match = make_records()[:3]
+
+    stored = ledger.append(ticket)
+    ledger.attach_match(match)
+
+    assert isinstance(stored, CompactSovereignTicket)
+    assert ledger.get("TKT-1") is stored
+    assert ledger.get_epoch("TKT-1") == stored.epoch
+    assert record_to_dict(stored) == asdict(ticket)
+    assert [record_to_dict(m) for m in ledger.matches_for("TKT-1")] == [asdict(match)]
+
+
+def test_processed_compact_tickets_reach_live_stream():
+    """With compact_records on, processed tickets are still emitted to the live stream"""
+    with tempfile.TemporaryDirectory() as directory:
+        config = SovereignDataTicketingSystem('missing_dts_config.json').config
+        config['ticket_settings']['compact_records'] = True
+        config_path = os.path.join(directory, 'dts_config.json')
+        with open(config_path, 'w') as f:
+            json.dump(config, f)
+        dts = SovereignDataTicketingSystem(config_path)
+
+    written = []
+    dts.write_to_live_stream = written.append
+    ticket = make_records()[0]
+
+    dts.process_ticket(ticket)
+
+    assert isinstance(dts.ticket_ledger.get("TKT-1"), CompactSovereignTicket)
+    assert written == dts.observational_relay and len(written) == 1
+    assert written[0]['ticket'] == dict(asdict(ticket), chronicle_status="active")
+
+
+def main():
+    """Run compact record tests"""
+    tests = [
+        test_round_trip_is_lossless,
+        test_timestamps_are_epoch_floats,
+        test_categorical_fields_are_interned,
+        test_ledger_stores_compact_records,
+        test_processed_compact_tickets_reach_live_stream,
+    ]
+
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
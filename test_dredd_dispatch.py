@@ -0,0 +1,590 @@
+#!/usr/bin/env python3
+"""
+Test DREDD Dispatch performance paths
+
+Covers the quantum key cache, XOR stream and relay connection pool used by
+DREDDDispatcher and SigilGramParser. Relay tests run against a local websockets server.
+"""
+
+import os
+import json
+import time
+import base64
+import asyncio
+import tempfile
+import threading
+from datetime import datetime
+
+import websockets
+
+from dredd_crypto import QuantumKeyCache, derive_quantum_key, xor_with_key
+from dredd_dispatch import DREDDDispatcher
+from dredd_relay_pool import DREDDRelayPool
+from sigilgram_parser import SigilGramParser
+from send_asr_via_dredd import ASRDREDDSender
+from asr_generator import AcclimationSequencingReport
+
+
+def test_key_cache_hits_within_bucket():
+    """Repeated derivations for one sigil and bucket hit the cache"""
+    cache = QuantumKeyCache(max_size=10, bucket_seconds=60)
+    now = 1_700_000_000.0
+
+    first = cache.get_key('glyph-hash-01', 'session-a', now)
+    second = cache.get_key('glyph-hash-01', 'session-a', now + 30)
+
+    assert first == second
+    assert first == derive_quantum_key('glyph-hash-01', 'session-a', cache.current_bucket(now))
+    stats = cache.get_stats()
+    assert stats['hits'] == 1
+    assert stats['misses'] == 1
+
+
+def test_key_cache_matches_per_second_derivation():
+    """One-second buckets derive the same key material as before caching"""
+    cache = QuantumKeyCache(bucket_seconds=1)
+    now = time.time()
+
+    assert cache.get_key('glyph-hash-02', 'session-b', now) == derive_quantum_key(
+        'glyph-hash-02', 'session-b', int(now)
+    )
+
+
+def test_key_cache_lru_eviction():
+    """Least recently used keys are evicted once the cache is full"""
+    cache = QuantumKeyCache(max_size=2, bucket_seconds=60)
+    now = 1_700_000_000.0
+
+    cache.get_key('sigil-1', 'session', now)
+    cache.get_key('sigil-2', 'session', now)
+    cache.get_key('sigil-1', 'session', now)
+    cache.get_key('sigil-3', 'session', now)
+
+    stats = cache.get_stats()
+    assert stats['size'] == 2
+    assert stats['evictions'] == 1
+
+    cache.get_key('sigil-1', 'session', now)
+    assert cache.get_stats()['hits'] == 2
+
+
+def test_session_rotation_invalidates_cached_keys():
+    """Rotating the dispatcher session key drops keys derived from the old one"""
+    dispatcher = DREDDDispatcher('missing_dredd_config.json')
+    old_key = dispatcher.generate_quantum_key('glyph-hash-01')
+
+    dispatcher.rotate_session_key()
+    new_key = dispatcher.generate_quantum_key('glyph-hash-01')
+
+    stats = dispatcher.get_key_cache_stats()
+    assert old_key != new_key
+    assert stats['invalidations'] == 1
+    assert stats['size'] == 1
+
+
+def test_broadcast_reuses_derived_keys():
+    """Creating several messages for one sigil derives its key once"""
+    dispatcher = DREDDDispatcher('missing_dredd_config.json')
+
+    for _ in range(5):
+        dispatcher.create_dredd_message('ASR payload', 'glyph-hash-01')
+
+    stats = dispatcher.get_key_cache_stats()
+    assert stats['misses'] + stats['hits'] == 5
+    # At most one bucket boundary can fall inside the loop
+    assert stats['misses'] <= 2
+
+
+def test_shipped_config_configures_key_cache():
+    """Caching settings under dredd_config.json's top-level block reach the dispatcher and parser"""
+    with open('dredd_config.json') as f:
+        caching = json.load(f)['dredd_config']['performance']['caching']
+
+    dispatcher = DREDDDispatcher('dredd_config.json')
+    parser = SigilGramParser('dredd_config.json', dispatcher.session_key)
+    for stats in (dispatcher.get_key_cache_stats(), parser.key_cache.get_stats()):
+        assert stats['enabled'] and stats['max_size'] == caching['max_size']
+        assert stats['bucket_seconds'] == caching['key_bucket_seconds']
+    assert 'glyph-hash-01' in dispatcher.sigil_registry and dispatcher.relay_nodes
+
+
+def test_disabled_key_cache_derives_every_key():
+    """With caching disabled every lookup derives its key and nothing is stored"""
+    with tempfile.TemporaryDirectory() as directory:
+        config = {'dredd_config': {'performance': {'caching': {'enabled': False, 'key_bucket_seconds': 60}}}}
+        config_path = os.path.join(directory, 'dredd_config.json')
+        with open(config_path, 'w') as f:
+            json.dump(config, f)
+        dispatcher = DREDDDispatcher(config_path)
+
+    now = 1_700_000_000.0
+    first = dispatcher.key_cache.get_key('glyph-hash-01', dispatcher.session_key, now)
+    second = dispatcher.key_cache.get_key('glyph-hash-01', dispatcher.session_key, now + 30)
+
+    stats = dispatcher.get_key_cache_stats()
+    assert not stats['enabled'] and stats['misses'] == 2 and stats['size'] == 0
+    assert first == second == derive_quantum_key('glyph-hash-01', dispatcher.session_key,
+                                                 dispatcher.key_cache.current_bucket(now))
+
+
+def legacy_xor(data: bytes, quantum_key: bytes) -> bytes:
+    """Byte-at-a-time XOR as originally implemented"""
+    encrypted = bytearray(len(data))
+    for i in range(len(data)):
+        encrypted[i] = data[i] ^ quantum_key[i % len(quantum_key)]
+    return bytes(encrypted)
+
+
+def test_xor_stream_matches_legacy_loop():
+    """Whole-buffer XOR is byte-identical to the per-byte loop"""
+    quantum_key = os.urandom(32)
+
+    for size in [0, 1, 31, 32, 33, 1000, 4097]:
+        data = os.urandom(size)
+        assert xor_with_key(data, quantum_key) == legacy_xor(data, quantum_key)
+
+    # Trailing zero bytes must survive the integer round trip
+    assert xor_with_key(bytes(64), bytes(32)) == bytes(64)
+
+
+def test_quantum_encrypt_decrypt_round_trip():
+    """Dispatcher encryption reverses through the shared XOR stream"""
+    dispatcher = DREDDDispatcher('missing_dredd_config.json')
+    quantum_key = dispatcher.generate_quantum_key('glyph-hash-01')
+    data = os.urandom(5000)
+
+    encrypted = dispatcher.encrypt_with_quantum_key(data, quantum_key)
+    assert encrypted == legacy_xor(data, quantum_key)
+    assert dispatcher.decrypt_with_quantum_key(encrypted, quantum_key) == data
+
+
+async def start_relay_server(connections: list, reverse_delay: float = 0.0, frames: list = None):
+    """Start a local relay that accepts every DREDD message and echoes its message_id"""
+    if frames is None:
+        frames = []
+
+    async def handler(websocket):
+        connections.append(websocket)
+
+        async def reply(request, delay):
+            await asyncio.sleep(delay)
+            await websocket.send(json.dumps({
+                'status': 'accepted',
+                'message_id': request['message']['message_id']
+            }))
+
+        tasks = []
+        async for raw_message in websocket:
+            request = json.loads(raw_message)
+            if request.get('type') == 'dredd_batch':
+                frames.append(request)
+                await websocket.send(json.dumps({
+                    'batch_id': request['batch_id'],
+                    'results': [
+                        {
+                            'message_id': item['message']['message_id'],
+                            'status': 'rejected' if item['message']['sigil_target'] == 'glyph-hash-rejected' else 'accepted'
+                        }
+                        for item in request['messages']
+                    ]
+                }))
+                continue
+            if request.get('type') in ('dredd_stream_start', 'dredd_chunk'):
+                frames.append(request)
+                message_id = request['message']['message_id'] if 'message' in request else request['message_id']
+                await websocket.send(json.dumps({'status': 'accepted', 'message_id': message_id}))
+                continue
+            # Later messages answer first when reverse_delay is set
+            delay = max(reverse_delay - len(tasks) * reverse_delay / 10, 0)
+            tasks.append(asyncio.create_task(reply(request, delay)))
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    server = await websockets.serve(handler, 'localhost', 0)
+    port = server.sockets[0].getsockname()[1]
+    return server, f"ws://localhost:{port}/dredd"
+
+
+def test_relay_pool_shares_one_socket_per_node():
+    """Concurrent dispatches to one relay share a single pooled socket"""
+
+    async def scenario():
+        connections = []
+        server, node_url = await start_relay_server(connections, reverse_delay=0.05)
+        dispatcher = DREDDDispatcher('missing_dredd_config.json')
+        dispatcher.relay_nodes = [node_url]
+
+        try:
+            messages = [dispatcher.create_dredd_message(f"payload {i}", 'glyph-hash-01') for i in range(8)]
+            results = await asyncio.gather(*[
+                dispatcher.dispatch_to_nodes(message, dispatcher.create_sigil_envelope(message))
+                for message in messages
+            ])
+            metrics = dispatcher.get_pool_metrics()
+        finally:
+            await dispatcher.close()
+            server.close()
+            await server.wait_closed()
+
+        assert all(results)
+        assert len(connections) == 1
+        assert metrics['open_sockets'] == 1
+        assert metrics['in_flight'] == 0
+        assert metrics['requests_sent'] == 8
+
+    asyncio.run(scenario())
+
+
+def start_loop_thread(name: str) -> asyncio.AbstractEventLoop:
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name=name, daemon=True).start()
+    return loop
+
+
+def test_relay_pool_keeps_one_socket_per_loop():
+    """Sends alternating between two loop threads reuse one socket per loop and close closes both"""
+    relay_loop, delivery_loop, listener_loop = (
+        start_loop_thread(name) for name in ('relay', 'asr-delivery', 'dredd-inbox-listeners'))
+    connections = []
+    server, node_url = asyncio.run_coroutine_threadsafe(start_relay_server(connections), relay_loop).result()
+    dispatcher = DREDDDispatcher('missing_dredd_config.json')
+    dispatcher.relay_nodes = [node_url]
+
+    def send(i: int, loop) -> bool:
+        message = dispatcher.create_dredd_message(f"payload {i}", 'glyph-hash-01')
+        envelope = dispatcher.create_sigil_envelope(message)
+        return asyncio.run_coroutine_threadsafe(dispatcher.dispatch_to_nodes(message, envelope), loop).result(10)
+
+    try:
+        assert all(send(i, (delivery_loop, listener_loop)[i % 2]) for i in range(20))
+        metrics = dispatcher.get_pool_metrics()
+        assert len(connections) == 2 and metrics['event_loops'] == 2 and metrics['open_sockets'] == 2
+        assert metrics['nodes'][node_url]['open_sockets'] == 2
+
+        # Closing from one loop also closes the socket owned by the other
+        asyncio.run_coroutine_threadsafe(dispatcher.close(), delivery_loop).result(10)
+        deadline = time.time() + 5
+        while any(ws.state.name != 'CLOSED' for ws in connections) and time.time() < deadline:
+            time.sleep(0.01)
+        assert all(ws.state.name == 'CLOSED' for ws in connections)
+        assert dispatcher.get_pool_metrics()['open_sockets'] == 0
+    finally:
+        server.close()
+        asyncio.run_coroutine_threadsafe(server.wait_closed(), relay_loop).result(5)
+        for loop in (relay_loop, delivery_loop, listener_loop):
+            loop.call_soon_threadsafe(loop.stop)
+
+
+def test_relay_pool_correlates_out_of_order_responses():
+    """Responses are matched to requests by message_id, not arrival order"""
+
+    async def scenario():
+        connections = []
+        server, node_url = await start_relay_server(connections, reverse_delay=0.1)
+        pool = DREDDRelayPool(health_check_interval=0)
+
+        try:
+            responses = await asyncio.gather(*[
+                pool.request(node_url, {'message': {'message_id': f"msg-{i}"}}, f"msg-{i}")
+                for i in range(5)
+            ])
+        finally:
+            await pool.close()
+            server.close()
+            await server.wait_closed()
+
+        assert [r['message_id'] for r in responses] == [f"msg-{i}" for i in range(5)]
+
+    asyncio.run(scenario())
+
+
+def test_relay_pool_reconnects_after_drop():
+    """A dropped relay socket is replaced on the next request"""
+
+    async def scenario():
+        connections = []
+        server, node_url = await start_relay_server(connections)
+        pool = DREDDRelayPool(health_check_interval=0)
+
+        try:
+            await pool.request(node_url, {'message': {'message_id': 'first'}}, 'first')
+            await connections[0].close()
+            await asyncio.sleep(0.05)
+
+            response = await pool.request(node_url, {'message': {'message_id': 'second'}}, 'second')
+            metrics = pool.get_metrics()
+        finally:
+            await pool.close()
+            server.close()
+            await server.wait_closed()
+
+        assert response['status'] == 'accepted'
+        assert len(connections) == 2
+        assert metrics['reconnects'] == 1
+
+    asyncio.run(scenario())
+
+
+def test_relay_pool_backs_off_unreachable_nodes():
+    """Failed connects put the node into backoff instead of retrying immediately"""
+
+    async def scenario():
+        pool = DREDDRelayPool(connect_timeout=1, backoff_base=5, health_check_interval=0)
+        errors = []
+
+        for _ in range(2):
+            try:
+                await pool.request('ws://localhost:1/dredd', {}, 'unreachable')
+            except ConnectionError as e:
+                errors.append(str(e))
+
+        assert len(errors) == 2
+        assert 'backing off' in errors[1]
+        assert pool.get_metrics()['connect_failures'] == 1
+
+    asyncio.run(scenario())
+
+
+def test_relay_pool_settings_come_from_config_file():
+    """connection_pooling settings in dredd_config.json configure the dispatcher's relay pool"""
+    pooling = {'enabled': True, 'connection_timeout': 4, 'request_timeout': 7, 'health_check_interval': 3,
+               'backoff_base': 0.25, 'backoff_max': 12}
+
+    with tempfile.TemporaryDirectory() as directory:
+        config_path = os.path.join(directory, 'dredd_config.json')
+        dispatchers = []
+        for enabled in (True, False):
+            with open(config_path, 'w') as f:
+                json.dump({'dredd_config': {'performance': {
+                    'connection_pooling': dict(pooling, enabled=enabled)}}}, f)
+            dispatchers.append(DREDDDispatcher(config_path))
+
+    pool = dispatchers[0].relay_pool
+    assert (pool.connect_timeout, pool.request_timeout, pool.health_check_interval,
+            pool.backoff_base, pool.backoff_max) == (4, 7, 3, 0.25, 12)
+    assert dispatchers[1].relay_pool is None
+
+
+def test_send_batch_ships_one_frame_per_node():
+    """A batch is grouped per relay node and reports per-message results"""
+
+    async def scenario():
+        frames_a, frames_b = [], []
+        server_a, node_a = await start_relay_server([], frames=frames_a)
+        server_b, node_b = await start_relay_server([], frames=frames_b)
+        dispatcher = DREDDDispatcher('missing_dredd_config.json')
+        dispatcher.relay_nodes = [node_a, node_b]
+
+        try:
+            results = await dispatcher.send_batch([
+                ('council payload', 'glyph-hash-01', 3600),
+                ('archive payload', 'glyph-hash-02', 7200, 'high'),
+                ('hostile payload', 'glyph-hash-rejected', 600),
+            ])
+        finally:
+            await dispatcher.close()
+            for server in (server_a, server_b):
+                server.close()
+                await server.wait_closed()
+
+        assert len(frames_a) == 1 and len(frames_b) == 1
+        assert len(frames_a[0]['messages']) == 3
+        assert [r['accepted'] for r in results] == [True, True, False]
+        assert results[2]['reason'] == 'rejected'
+        assert results[0]['nodes'] == {node_a: 'accepted', node_b: 'accepted'}
+
+    asyncio.run(scenario())
+
+
+def test_send_batch_reports_unreachable_relays():
+    """Messages routed only to unreachable relays come back rejected"""
+
+    async def scenario():
+        dispatcher = DREDDDispatcher('missing_dredd_config.json')
+        dispatcher.relay_nodes = ['ws://localhost:1/dredd']
+
+        try:
+            return await dispatcher.send_batch([('payload', 'glyph-hash-01', 60)])
+        finally:
+            await dispatcher.close()
+
+    results = asyncio.run(scenario())
+    assert results[0]['accepted'] is False
+    assert results[0]['reason'] == 'relay_unavailable'
+
+
+def test_stream_frames_reassemble_in_parser():
+    """A streamed payload arrives as chunk frames the parser decrypts incrementally, in any order"""
+
+    async def scenario(frames):
+        server, node_url = await start_relay_server([], frames=frames)
+        dispatcher = DREDDDispatcher('missing_dredd_config.json')
+        dispatcher.relay_nodes = [node_url]
+        try:
+            sent = await dispatcher.send_stream(payload, 'glyph-hash-01', chunk_size=64 * 1024)
+        finally:
+            await dispatcher.close()
+            server.close()
+            await server.wait_closed()
+        return dispatcher, sent
+
+    payload = json.dumps({'report_id': 'ASR-STREAM', 'sections': ['x' * 1000] * 300}).encode()
+    frames = []
+    dispatcher, sent = asyncio.run(scenario(frames))
+
+    assert sent
+    start, chunks = frames[0], frames[1:]
+    assert start['type'] == 'dredd_stream_start' and len(chunks) == 5
+    assert all(len(chunk['data']) < 100 * 1024 for chunk in chunks)
+    descriptor = json.loads(base64.b64decode(start['message']['encrypted_content']))
+    assert descriptor['chunk_count'] == 5 and descriptor['total_bytes'] == len(payload)
+
+    parser = SigilGramParser('missing_dredd_config.json')
+    parser.generate_quantum_key = dispatcher.generate_quantum_key
+    content = {'format': 'chunked', 'descriptor': descriptor, 'chunks': iter(chunks[::-1])}
+    assert parser.decrypt_message_content({'encrypted_content': content}, 'glyph-hash-01') == payload.decode()
+
+    # A tampered or missing chunk fails the whole payload
+    tampered = [dict(chunk) for chunk in chunks]
+    tampered[2]['data'] = chunks[3]['data']
+    for damaged in (tampered, chunks[:-1]):
+        content = {'format': 'chunked', 'descriptor': descriptor, 'chunks': damaged}
+        assert parser.decrypt_message_content({'encrypted_content': content}, 'glyph-hash-01') is None
+
+
+class FlakyRelayDispatcher(DREDDDispatcher):
+    """Dispatcher whose sends behave per sigil: slow ones stall, flaky ones fail once"""
+
+    def __init__(self, slow=(), flaky=()):
+        super().__init__('missing_dredd_config.json')
+        self.config['performance']['delivery'].update(retry_backoff_base=0.01, retry_backoff_max=0.02)
+        self.slow, self.flaky = set(slow), set(flaky)
+        self.messages = []
+        self.shared_used = set()
+
+    async def send_message(self, content, target_sigil, ttl=3600, resonance_level="medium", shared=None):
+        self.messages.append(self.create_dredd_message(content, target_sigil, ttl, resonance_level, shared))
+        self.shared_used.add(id(shared))
+        if target_sigil in self.slow:
+            await asyncio.sleep(5)
+        if target_sigil in self.flaky:
+            self.flaky.discard(target_sigil)
+            return False
+        return True
+
+    async def send_batch(self, items, resonance_level="medium"):
+        return [{'message_id': None, 'target_sigil': item[1], 'accepted': True, 'reason': None, 'nodes': {}}
+                for item in items]
+
+
+def test_fan_out_isolates_slow_recipients():
+    """Recipients are delivered concurrently with their own deadline and jittered retries"""
+    dispatcher = FlakyRelayDispatcher(slow={'glyph-slow'}, flaky={'glyph-flaky'})
+    recipients = {
+        'djinn_council': ('glyph-council', 'critical'),
+        'watch_guard': ('glyph-flaky', 'high'),
+        'lattice_core': ('glyph-slow', 'high'),
+    }
+
+    start = time.monotonic()
+    results = asyncio.run(dispatcher.send_to_recipients('ASR payload', recipients, timeout=0.3, retries=2))
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 1.0
+    assert results['djinn_council']['accepted'] and results['djinn_council']['attempts'] == 1
+    assert results['watch_guard']['accepted'] and results['watch_guard']['attempts'] == 2
+    assert not results['lattice_core']['accepted'] and results['lattice_core']['reason'] == 'timeout'
+
+    # Content was encrypted once per recipient key and each recipient decrypts its own message
+    assert len(dispatcher.shared_used) == 3
+    for message in dispatcher.messages:
+        assert dispatcher.decrypt_message(message, message.sigil_target) == 'ASR payload'
+
+
+def test_fan_out_shares_classical_keys_only_within_a_key_policy():
+    """Recipients share encrypted content only when they share a sigil and resonance level"""
+    dispatcher = FlakyRelayDispatcher()
+    recipients = {
+        'djinn_council': ('glyph-council', 'critical'),
+        'council_mirror': ('glyph-council', 'critical'),
+        'council_archive': ('glyph-council', 'high'),
+        'sovereign_archive': ('glyph-archive', 'high'),
+    }
+
+    results = asyncio.run(dispatcher.send_to_recipients('ASR payload', recipients))
+    assert all(result['accepted'] for result in results.values())
+
+    classical_keys = []
+    for message in dispatcher.messages:
+        combined = json.loads(base64.b64decode(message.encrypted_content))
+        quantum_key = dispatcher.generate_quantum_key(message.sigil_target)
+        classical_keys.append(xor_with_key(base64.b64decode(combined['encrypted_key']), quantum_key))
+    keys = {(m.sigil_target, m.resonance_level): key for m, key in zip(dispatcher.messages, classical_keys)}
+
+    assert len(set(classical_keys)) == 3 and len(keys) == 3
+    assert keys[('glyph-council', 'critical')] != keys[('glyph-council', 'high')]
+    assert keys[('glyph-council', 'high')] != keys[('glyph-archive', 'high')]
+
+
+def test_asr_sender_prepares_each_report_once():
+    """Sends of one report to different recipients reuse its prepared, signed payload"""
+    sender = ASRDREDDSender('missing_asr_dredd_config.json')
+    sender.dredd_dispatcher = FlakyRelayDispatcher()
+    prepared = []
+    prepare = sender.prepare_asr_payload
+    sender.prepare_asr_payload = lambda asr: prepared.append(asr.report_id) or prepare(asr)
+
+    asr = AcclimationSequencingReport(
+        report_id="ASR-FANOUT", session_id="SESSION-1", trigger_type="manual_trigger",
+        generated_at=datetime.now().isoformat(), sovereign_actions=[], security_evolution=[],
+        resonance_performance=[], observational_matches=[], entropy_stability_index={},
+        ticket_chronicle=[], attached_glyphs=[], summary_statistics={}, drd_signature="0" * 16
+    )
+
+    async def scenario():
+        return [await sender.send_asr_to_council(asr), await sender.send_asr_to_archive(asr),
+                await sender.send_asr_via_dredd(asr, ['watch_guard', 'unknown'])]
+
+    council, archive, results = asyncio.run(scenario())
+    assert council and archive and results == {'watch_guard': True, 'unknown': False}
+    assert prepared == ["ASR-FANOUT"]
+
+    # Every recipient received the same signed payload
+    dispatcher = sender.dredd_dispatcher
+    payloads = {dispatcher.decrypt_message(m, m.sigil_target) for m in dispatcher.messages}
+    assert len(dispatcher.messages) == 3 and len(payloads) == 1
+    assert json.loads(payloads.pop())['signature']
+
+
+def main():
+    """Run DREDD dispatch tests"""
+    tests = [
+        test_key_cache_hits_within_bucket,
+        test_key_cache_matches_per_second_derivation,
+        test_key_cache_lru_eviction,
+        test_session_rotation_invalidates_cached_keys,
+        test_broadcast_reuses_derived_keys,
+        test_shipped_config_configures_key_cache,
+        test_disabled_key_cache_derives_every_key,
+        test_xor_stream_matches_legacy_loop,
+        test_quantum_encrypt_decrypt_round_trip,
+        test_relay_pool_shares_one_socket_per_node,
+        test_relay_pool_keeps_one_socket_per_loop,
+        test_relay_pool_correlates_out_of_order_responses,
+        test_relay_pool_reconnects_after_drop,
+        test_relay_pool_backs_off_unreachable_nodes,
+        test_relay_pool_settings_come_from_config_file,
+        test_send_batch_ships_one_frame_per_node,
+        test_send_batch_reports_unreachable_relays,
+        test_stream_frames_reassemble_in_parser,
+        test_fan_out_isolates_slow_recipients,
+        test_fan_out_shares_classical_keys_only_within_a_key_policy,
+        test_asr_sender_prepares_each_report_once,
+    ]
+
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
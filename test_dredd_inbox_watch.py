@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Test DREDD Inbox Watch
+
+Covers the shared listener loop against local relays, reconnect backoff, per-endpoint
+metrics, the bounded handoff into the processing queues and the bounded inbox stores.
+"""
+
+import os
+import json
+import time
+import queue
+import socket
+import tempfile
+import asyncio
+import threading
+from jsonl_sink import get_sink
+from dredd_inbox_watch import DREDDInboxWatcher
+from benchmark_fixtures import RecordingDispatcher, RelayServers, make_frame
+
+
+def unused_endpoint() -> str:
+    with socket.socket() as s:
+        s.bind(('localhost', 0))
+        return f"ws://localhost:{s.getsockname()[1]}/dredd/inbox"
+
+
+def test_endpoints_share_one_loop_and_reconnect():
+    """Every endpoint runs on one loop, reconnects after closes and reports rate and lag"""
+    relays = RelayServers(3)
+    dead = unused_endpoint()
+    dispatcher = RecordingDispatcher()
+    watcher = DREDDInboxWatcher('missing_inbox_config.json', dredd_dispatcher=dispatcher)
+    watcher.config['listener_endpoints'] = relays.endpoints + [dead]
+    watcher.reconnect_backoff_base = 0.05
+    watcher.reconnect_backoff_max = 0.2
+
+    expected = {f"relay{r}_conn{c}_{i}" for r in range(3) for c in (1, 2, 3) for i in range(3)}
+
+    def settled() -> bool:
+        listeners = watcher.get_inbox_status()['listeners']
+        relay_stats = [listeners.get(endpoint, {}) for endpoint in relays.endpoints]
+        return (all(stats.get('frames', 0) >= 9 and stats.get('disconnects', 0) >= 2 for stats in relay_stats)
+                and listeners.get(dead, {}).get('errors', 0) >= 2 and len(dispatcher.sent) >= 9
+                and expected <= {m['message_id'] for m in watcher.inbox_messages})
+
+    watcher.start_watching()
+    try:
+        deadline = time.time() + 10
+        while not settled() and time.time() < deadline:
+            time.sleep(0.02)
+
+        # One listener loop, however many endpoints
+        assert [t.name for t in threading.enumerate()].count('dredd-inbox-listeners') == 1
+        status = watcher.get_inbox_status()
+    finally:
+        watcher.stop_watching()
+        relays.close()
+
+    for endpoint in relays.endpoints:
+        stats = status['listeners'][endpoint]
+        assert stats['connects'] >= 3 and stats['disconnects'] >= 2 and stats['errors'] == 0
+        assert stats['frames'] >= 9 and stats['frames_per_sec'] > 0
+        assert 1.5 < stats['lag_mean'] < 5
+    assert status['listeners'][dead]['connects'] == 0 and status['listeners'][dead]['errors'] >= 2
+
+    assert expected <= {m['message_id'] for m in watcher.inbox_messages}
+    assert set(dispatcher.sent) == {'glyph-hash-sovereign-archive'}
+    assert watcher.loop_thread is None and watcher.loop.is_closed()
+    assert all(stats['state'] == 'stopped' for stats in
+               (s.snapshot() for s in watcher.active_listeners.values()))
+
+
+def test_handoff_is_bounded():
+    """A full processing queue holds its listener back, then drops once the handoff times out"""
+    watcher = DREDDInboxWatcher('missing_inbox_config.json')
+    watcher.inbox_queue = queue.Queue(2)
+    watcher.handoff_timeout = 0.05
+
+    async def handle(count: int, offset: int):
+        return [await watcher._handle_frame(make_frame(f"dredd_{offset + i}"), 'ws://relay') for i in range(count)]
+
+    asyncio.run(handle(4, 0))
+    assert watcher.inbox_queue.qsize() == 2 and watcher.handoff_drops == 2
+    # Dropped entries are not left behind as received but never processed
+    assert watcher.get_message('dredd_2') is None and watcher.get_message('dredd_3') is None
+    assert len(watcher.inbox_messages) == 2 and watcher.get_inbox_status()['unprocessed_messages'] == 2
+
+    # Room made within the timeout is used instead of dropping
+    watcher.handoff_timeout = 2.0
+    consumer = threading.Timer(0.1, lambda: [watcher.inbox_queue.get() for _ in range(2)])
+    consumer.start()
+    start = time.perf_counter()
+    asyncio.run(handle(2, 10))
+    consumer.join()
+    assert 0.05 < time.perf_counter() - start < 1.5
+    assert watcher.handoff_drops == 2
+    assert [watcher.inbox_queue.get_nowait()['message_id'] for _ in range(2)] == ['dredd_10', 'dredd_11']
+
+    # A dropped message is accepted when its relay redelivers it
+    asyncio.run(handle(2, 2))
+    assert [watcher.inbox_queue.get_nowait()['message_id'] for _ in range(2)] == ['dredd_2', 'dredd_3']
+    assert watcher.get_message('dredd_2')['status'] == 'received'
+
+
+def test_stores_are_bounded_and_indexed():
+    """Inbox and response stores keep fixed capacity, answer lookups directly and spill evicted responses"""
+    with tempfile.TemporaryDirectory() as directory:
+        config = DREDDInboxWatcher('missing_inbox_config.json').config
+        config['inbox_settings'].update(inbox_capacity=5, response_capacity=3,
+                                        archive_file=os.path.join(directory, 'responses.jsonl'))
+        config_path = os.path.join(directory, 'inbox_config.json')
+        with open(config_path, 'w') as f:
+            json.dump(config, f)
+        watcher = DREDDInboxWatcher(config_path)
+
+        async def scenario():
+            for i in range(8):
+                await watcher._handle_frame(make_frame(f"dredd_{i}"), 'ws://relay')
+            # Duplicates that get past the prefilter are not stored twice
+            await watcher._handle_asr_message(json.loads(make_frame("dredd_7")))
+            # Processing records a watch guard auto-response
+            watcher._process_asr(watcher.get_message("dredd_5"))
+
+            for i in range(3):
+                await watcher._handle_asr_response({'payload': {
+                    'payload_hash': 'ASR-dredd_7', 'recipient': f"recipient-{i}", 'response_type': 'review'}})
+            watcher._process_response(watcher.response_queue.get_nowait())
+            await watcher._handle_asr_acknowledgment({'payload': {'payload_hash': 'ASR-dredd_6', 'recipient': 'council'}})
+            await watcher._handle_asr_escalation({'payload': {'payload_hash': 'ASR-dredd_7', 'reason': 'drift'}})
+
+        asyncio.run(scenario())
+        get_sink(watcher.archive_file).flush()
+        with open(watcher.archive_file) as f:
+            archived = [json.loads(line) for line in f]
+
+    assert len(watcher.inbox_messages) == 5 and watcher.get_message("dredd_2") is None
+    assert [m['message_id'] for m in watcher.get_recent_messages(3)] == ["dredd_7", "dredd_6", "dredd_5"]
+    status = watcher.get_inbox_status()
+    assert status['unprocessed_messages'] == 4 and watcher.get_message("dredd_5")['status'] == 'processed'
+    assert status['message_store']['evicted'] == 3 and status['message_store']['duplicates'] == 1
+
+    # Auto-response and three responses, one processed, then two more evict the three oldest
+    assert len(watcher.asr_responses) == 3 and status['unprocessed_responses'] == 1
+    activity = watcher.get_report_activity('ASR-dredd_7')
+    assert [m['message_id'] for m in activity['messages']] == ["dredd_7"]
+    assert [r.get('responding_recipient', r.get('escalating_recipient')) for r in activity['responses']] == \
+        ['recipient-2', None]
+    assert [r['acknowledging_recipient'] for r in watcher.get_report_activity('ASR-dredd_6')['responses']] == ['council']
+
+    # The processed response was archived when processed and not again on eviction
+    assert [(a['archive_reason'], a['response']['responding_recipient']) for a in archived] == [
+        ('evicted', 'watch_guard'), ('processed', 'recipient-0'), ('evicted', 'recipient-1')]
+
+
+def test_responses_are_archived_once_as_snapshots():
+    """Archive entries keep the status at archive time and each response is archived only once"""
+    with tempfile.TemporaryDirectory() as directory:
+        config = DREDDInboxWatcher('missing_inbox_config.json').config
+        config['inbox_settings'].update(response_capacity=2, archive_file=os.path.join(directory, 'responses.jsonl'))
+        config_path = os.path.join(directory, 'inbox_config.json')
+        with open(config_path, 'w') as f:
+            json.dump(config, f)
+        watcher = DREDDInboxWatcher(config_path)
+
+        async def respond(recipient: str):
+            await watcher._handle_asr_response({'payload': {
+                'payload_hash': 'ASR-dredd_1', 'recipient': recipient, 'response_type': 'review'}})
+
+        # recipient-0 is evicted while still queued, then processed
+        for i in range(3):
+            asyncio.run(respond(f"recipient-{i}"))
+        queued = [watcher.response_queue.get_nowait() for _ in range(3)]
+        for response in queued:
+            watcher._process_response(response)
+
+        # Later status changes do not reach the archive, and evicting an archived response adds nothing
+        watcher.asr_responses.set_status(queued[1], 'sent')
+        asyncio.run(respond("recipient-3"))
+
+        get_sink(watcher.archive_file).flush()
+        with open(watcher.archive_file) as f:
+            archived = [json.loads(line) for line in f]
+
+    assert [(a['archive_reason'], a['response']['responding_recipient'], a['response']['status'])
+            for a in archived] == [('evicted', 'recipient-0', 'received'), ('processed', 'recipient-1', 'processed'),
+                                   ('processed', 'recipient-2', 'processed')]
+    assert all('archived_at' in response for response in queued)
+
+
+def main():
+    """Run DREDD inbox watch tests"""
+    tests = [
+        test_endpoints_share_one_loop_and_reconnect,
+        test_handoff_is_bounded,
+        test_stores_are_bounded_and_indexed,
+        test_responses_are_archived_once_as_snapshots,
+    ]
+
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
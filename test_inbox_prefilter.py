@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Test Inbox Prefilter
+
+Covers early rejection by reason, the replay Bloom filters and a mostly adversarial load
+through the inbox watcher.
+"""
+
+import json
+import time
+import random
+import asyncio
+
+from inbox_prefilter import InboxPrefilter, ReplayFilter, BloomFilter
+from dredd_inbox_watch import DREDDInboxWatcher, SIGIL_RECIPIENT_TYPES
+from benchmark_fixtures import PROBE_PAYLOADS, make_frame, make_adversarial_frames
+
+def test_prefilter_rejects_by_reason():
+    """Each cheap check rejects its kind of frame and counts it"""
+    prefilter = InboxPrefilter(SIGIL_RECIPIENT_TYPES, max_frame_bytes=4096)
+    relay_frame = json.dumps({'type': 'dredd_message',
+                              'message': {'message_id': 'dredd_relay', 'sigil_target': 'glyph-hash-mkp'},
+                              'envelope': {'target_sigil': 'glyph-hash-mkp'}})
+    mismatched = json.loads(make_frame('dredd_mismatch'))
+    mismatched['envelope']['target_sigil'] = 'glyph-hash-mkp'
+
+    accepted = prefilter.check(make_frame('dredd_1'))
+    assert accepted['dredd_message']['metadata']['message_id'] == 'dredd_1'
+    assert prefilter.check(make_frame('dredd_1')) is not None
+    prefilter.record(accepted)
+    assert prefilter.check(relay_frame.encode()) is not None
+    for frame in ['x' * 5000, b'\x00\x01', '[1, 2]', '{"dredd_message": ', json.dumps(PROBE_PAYLOADS[0]),
+                  json.dumps(mismatched), make_frame('dredd_2', 'invalid-sigil'), make_frame('dredd_1')]:
+        assert prefilter.check(frame) is None
+
+    stats = prefilter.get_stats()
+    assert stats['accepted'] == 3 and stats['rejected'] == 8
+    assert stats['rejections'] == {'oversized_frame': 1, 'not_an_object': 2, 'invalid_json': 1,
+                                   'malformed_envelope': 2, 'unknown_sigil': 1, 'replayed_message': 1}
+    # The bad sigil and the replay are caught by the header scan, before any decode
+    assert stats['parsed'] == 3 + 3
+
+
+def test_header_scan_skips_the_full_decode():
+    """Large hostile frames are rejected from their header; decoy keys defer to the full parse"""
+    prefilter = InboxPrefilter(SIGIL_RECIPIENT_TYPES)
+    padding = 'x' * 500000
+    bulky = json.loads(make_frame('dredd_bulky', 'invalid-sigil'))
+    bulky['dredd_message']['asr_payload']['padding'] = padding
+    lawful = json.loads(make_frame('dredd_lawful'))
+    lawful['dredd_message']['asr_payload']['padding'] = padding
+
+    prefilter.record(prefilter.check(json.dumps(lawful)))
+    for _ in range(100):
+        assert prefilter.check(json.dumps(bulky)) is None
+        assert prefilter.check(json.dumps(lawful).encode()) is None
+    assert prefilter.get_stats()['parsed'] == 1
+
+    # A decoy sigil key ahead of the real one must not decide the frame
+    decoy = json.loads(make_frame('dredd_decoy'))
+    decoy = {'decoy': {'sigil_target': 'invalid-sigil', 'message_id': 'dredd_lawful'}, **decoy}
+    assert prefilter.check(json.dumps(decoy)) is not None
+    assert prefilter.get_stats()['rejections']['unknown_sigil'] == 100
+
+
+def test_replay_filter_keeps_recent_ids_in_fixed_memory():
+    """Ids are remembered for at least one generation and the filters never grow"""
+    bloom = BloomFilter(capacity=1000, error_rate=0.001)
+    for i in range(1000):
+        bloom.add(f"dredd_{i}")
+    assert all(f"dredd_{i}" in bloom for i in range(1000))
+    assert sum(f"other_{i}" in bloom for i in range(10000)) < 50
+
+    replays = ReplayFilter(capacity=100)
+    size = len(replays.current.bits)
+    assert not any(replays.seen(f"dredd_{i}") for i in range(250))
+    assert all(replays.seen(f"dredd_{i}") for i in range(150, 250))
+    assert replays.rotations == 2 and len(replays.current.bits) == size
+
+
+def test_adversarial_load_is_dropped_before_handling():
+    """With 90% probe traffic every lawful ASR is handled and every probe frame dropped early"""
+    watcher = DREDDInboxWatcher('missing_inbox_config.json')
+    rng = random.Random(23)
+    lawful = [make_frame(f"dredd_{i}") for i in range(500)]
+    lawful_ids = [f"dredd_{i}" for i in range(500)]
+    adversarial = make_adversarial_frames(4500, lawful_ids[:50], rng)
+
+    # Lawful frames first in the mix where their ids are replayed later
+    frames = lawful[:50] + rng.sample(lawful[50:] + adversarial, 4950)
+
+    async def run():
+        start = time.perf_counter()
+        handled = [await watcher._handle_frame(frame, 'ws://probe') for frame in frames]
+        return handled, time.perf_counter() - start
+
+    handled, elapsed = asyncio.run(run())
+
+    assert sum(handled) == 500 and len(watcher.inbox_messages) == 500
+    assert sorted(m['message_id'] for m in watcher.inbox_messages) == sorted(lawful_ids)
+    stats = watcher.get_inbox_status()['prefilter']
+    assert stats['rejected'] == 4500 and stats['rejections']['replayed_message'] == 900
+    assert stats['mean_us'] < 1000 and elapsed < 10
+
+
+def main():
+    """Run inbox prefilter tests"""
+    tests = [
+        test_prefilter_rejects_by_reason,
+        test_header_scan_skips_the_full_decode,
+        test_replay_filter_keeps_recent_ids_in_fixed_memory,
+        test_adversarial_load_is_dropped_before_handling,
+    ]
+
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
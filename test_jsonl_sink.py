@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Test JSONL Sink
+
+Covers buffering, threshold and timed flushes, fsync policies and segment rotation.
+"""
+
+import os
+import glob
+import json
+import time
+import _pyio
+import tempfile
+
+import jsonl_sink
+from jsonl_sink import JSONLSink, get_sink, close_all_sinks
+
+
+def read_entries(path: str):
+    with open(path, 'r') as f:
+        return [json.loads(line) for line in f]
+
+
+def test_close_flushes_buffered_entries_in_order():
+    """Entries buffered below every threshold are written on close"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'stream.jsonl')
+        sink = JSONLSink(path, max_buffer_entries=10000, flush_interval=60)
+
+        for i in range(500):
+            sink.write({'seq': i})
+
+        assert not os.path.exists(path)
+        sink.close()
+
+        assert [entry['seq'] for entry in read_entries(path)] == list(range(500))
+        assert sink.get_stats()['buffered_entries'] == 0
+
+
+def test_size_and_time_thresholds_trigger_flush():
+    """The background flusher writes when the buffer fills or the interval passes"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'stream.jsonl')
+        sink = JSONLSink(path, max_buffer_entries=5, flush_interval=60)
+        for i in range(5):
+            sink.write({'seq': i})
+
+        deadline = time.time() + 5
+        while sink.entries_written < 5 and time.time() < deadline:
+            time.sleep(0.01)
+        assert len(read_entries(path)) == 5
+        sink.close()
+
+        path = os.path.join(directory, 'timed.jsonl')
+        sink = JSONLSink(path, max_buffer_entries=10000, flush_interval=0.05)
+        sink.write({'seq': 0})
+
+        deadline = time.time() + 5
+        while sink.entries_written < 1 and time.time() < deadline:
+            time.sleep(0.01)
+        assert len(read_entries(path)) == 1
+        sink.close()
+
+
+def test_always_policy_writes_synchronously():
+    """With fsync_policy='always' every write is on disk when write returns"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'stream.jsonl')
+        sink = JSONLSink(path, fsync_policy='always', flush_interval=60)
+        sink.write({'seq': 0})
+
+        assert read_entries(path) == [{'seq': 0}]
+        sink.close()
+
+        try:
+            JSONLSink(path, fsync_policy='sometimes')
+            assert False, "invalid fsync policy accepted"
+        except ValueError:
+            pass
+
+
+def test_rotation_by_size_keeps_every_entry():
+    """Segments rotate past rotate_max_bytes and no entry is lost"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'stream.jsonl')
+        sink = JSONLSink(path, fsync_policy='always', rotate_max_bytes=200)
+        for i in range(50):
+            sink.write({'seq': i, 'padding': 'x' * 20})
+        sink.close()
+
+        segments = sorted(glob.glob(os.path.join(directory, 'stream.*.jsonl')))
+        assert sink.rotations == len(segments) > 0
+        assert all(os.path.getsize(segment) <= 200 for segment in segments)
+
+        entries = []
+        for segment in segments + [path]:
+            entries.extend(read_entries(segment))
+        assert sorted(entry['seq'] for entry in entries) == list(range(50))
+
+
+def test_shared_sink_per_path():
+    """Writers of the same file share one sink"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'shared.jsonl')
+        first = get_sink(path)
+        second = get_sink(os.path.join(directory, '.', 'shared.jsonl'))
+        assert first is second
+
+        first.write({'writer': 'first'})
+        second.write({'writer': 'second'})
+        close_all_sinks()
+
+        assert [entry['writer'] for entry in read_entries(path)] == ['first', 'second']
+
+
+def test_flush_offsets_are_byte_offsets_with_crlf_line_endings():
+    """Offsets passed to on_flush address the written lines where text mode would write '\\r\\n'"""
+    placed = []
+    linesep = os.linesep
+    # The pure-Python io module reads os.linesep when opening, so it can stand in for Windows
+    jsonl_sink.open, os.linesep = _pyio.open, '\r\n'
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'archive.jsonl')
+            sink = JSONLSink(path, on_flush=placed.extend, flush_interval=60)
+            for batch in range(3):
+                for i in range(4):
+                    sink.write({'seq': batch * 4 + i})
+                sink.flush()
+            sink.close()
+
+            with open(path, 'rb') as f:
+                data = f.read()
+    finally:
+        del jsonl_sink.open
+        os.linesep = linesep
+
+    assert b'\r' not in data and len(placed) == 12
+    for entry, offset, length in placed:
+        assert json.loads(data[offset:offset + length]) == entry
+
+
+def main():
+    """Run JSONL sink tests"""
+    tests = [
+        test_close_flushes_buffered_entries_in_order,
+        test_size_and_time_thresholds_trigger_flush,
+        test_always_policy_writes_synchronously,
+        test_rotation_by_size_keeps_every_entry,
+        test_shared_sink_per_path,
+        test_flush_offsets_are_byte_offsets_with_crlf_line_endings,
+    ]
+
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
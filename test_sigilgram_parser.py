@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Test SigilGram Parser
+
+Covers parsing of generated sigilgrams, cached key derivation, the validation pipeline, the bounded audit log and the batch JSONL mode.
+"""
+
+import os
+import json
+import tempfile
+from cryptography.fernet import Fernet
+
+from sigilgram_parser import SigilGramParser, AuditRing, parse_sigilgram_batch
+from benchmark_fixtures import make_sigilgram
+
+SESSION_KEY = Fernet.generate_key().decode()
+
+
+def test_parse_derives_keys_once_and_references_audit_entries():
+    """Parses reuse the cached quantum key and carry only their own audit entries"""
+    parser = SigilGramParser('missing_dredd_config.json', SESSION_KEY)
+    sigilgrams = [make_sigilgram(parser, f"dredd_{i}", f"payload {i}") for i in range(20)]
+
+    parsed = [parser.parse_sigilgram(sigilgram, 'glyph-hash-01') for sigilgram in sigilgrams]
+
+    assert [p.content for p in parsed] == [f"payload {i}" for i in range(20)]
+    assert parser.key_cache.get_stats()['misses'] <= 2
+    assert all(len(p.audit_trail) == 2 for p in parsed)
+    assert parsed[-1].audit_trail[0] is parser.audit_log[-2]
+    assert [e['event_type'] for e in parsed[-1].audit_trail] == ['parse_attempt', 'parse_success']
+
+
+def test_validation_pipeline_rejects_before_decrypt():
+    """Cheap checks reject hostile sigilgrams before key derivation, with per-check counts"""
+    sender = SigilGramParser('missing_dredd_config.json', SESSION_KEY)
+    parser = SigilGramParser('missing_dredd_config.json', SESSION_KEY)
+
+    unknown_sigil = make_sigilgram(sender, "dredd_unknown", "payload", target_sigil='mirror-trap-probe')
+    forged = make_sigilgram(sender, "dredd_forged", "payload")
+    forged['dredd_message']['resonance_validation']['echo_signature'] = '0' * 16
+    low_entropy = make_sigilgram(sender, "dredd_low", "payload", entropy_score=0.1)
+    garbled = make_sigilgram(sender, "dredd_garbled", "payload")
+    garbled['dredd_message']['encrypted_content']['encoded'] = 'bm90IGpzb24='
+
+    trail = []
+    for sigilgram in (unknown_sigil, forged, low_entropy, garbled):
+        assert parser.parse_sigilgram(sigilgram, 'glyph-hash-01', trail) is None
+    assert parser.parse_sigilgram(make_sigilgram(sender, "dredd_ok", "payload"), 'glyph-hash-01').content == "payload"
+
+    assert [e['details']['reason'] for e in trail if e['event_type'] == 'parse_failed'] == [
+        'invalid_sigil_targeting', 'invalid_echo_signature', 'entropy_validation_failed', 'decryption_failed']
+    assert parser.key_cache.get_stats()['misses'] == 1
+
+    stats = parser.validation_pipeline.get_stats()
+    assert stats['passed'] == 1 and stats['rejected'] == 4
+    assert {name: check['rejections'] for name, check in stats['checks'].items() if check['rejections']} == {
+        'sigil_targeting': 1, 'echo_signature': 1, 'entropy_header': 1, 'content_envelope': 1}
+    assert [stats['checks'][name]['runs'] for name in ('structure', 'echo_signature', 'decrypt')] == [5, 4, 1]
+
+
+def test_audit_ring_is_bounded_and_spills_to_rotating_jsonl():
+    """The ring keeps only recent events while the spill file receives every one of them"""
+    parser = SigilGramParser('missing_dredd_config.json', SESSION_KEY)
+    parser.audit_log = AuditRing(max_events=8)
+    parser.audit_config = {'spill_rotate_max_bytes': 2048, 'spill_flush_interval': 0.05}
+    sigilgrams = [make_sigilgram(parser, f"dredd_{i}", f"payload {i}") for i in range(30)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        parsed = [parser.parse_sigilgram(sigilgrams[0], 'glyph-hash-01')]
+        parser.save_audit_log(os.path.join(directory, 'audit.jsonl'))
+        for sigilgram in sigilgrams[1:]:
+            parsed.append(parser.parse_sigilgram(sigilgram, 'glyph-hash-01'))
+            if len(parsed) % 10 == 0:
+                parser.audit_log.flush()
+        parser.log_audit_event('parse_failed', {'reason': 'invalid_json'})
+        parser.audit_log.close()
+
+        events = []
+        for name in sorted(os.listdir(directory)):
+            with open(os.path.join(directory, name)) as f:
+                events += [json.loads(line) for line in f]
+        segments = len(os.listdir(directory))
+
+    assert len(parser.audit_log) == 8 and parser.audit_log.get_stats()['logged_events'] == 61
+    assert parser.audit_log.get_stats()['dropped_events'] == 0
+    assert all([e['event_type'] for e in p.audit_trail] == ['parse_attempt', 'parse_success'] for p in parsed)
+    assert parsed[-1].audit_trail[-1] is parser.audit_log[-2]
+    assert segments > 1 and len(events) == 61
+    assert sorted(e['details']['message_id'] for e in events if e['event_type'] == 'parse_success') == \
+        sorted(f"dredd_{i}" for i in range(30))
+
+
+def test_batch_mode_streams_results_in_order():
+    """Batch mode parses JSONL across processes and writes ordered results with audit references"""
+    parser = SigilGramParser('missing_dredd_config.json', SESSION_KEY)
+    lines = []
+    for i in range(40):
+        if i % 10 == 3:
+            lines.append('{"not json')
+        else:
+            score = 0.1 if i % 10 == 7 else 0.9
+            lines.append(json.dumps(make_sigilgram(parser, f"dredd_{i}", f"payload {i}", entropy_score=score)))
+
+    with tempfile.TemporaryDirectory() as directory:
+        input_path = os.path.join(directory, 'sigilgrams.jsonl')
+        output_path = os.path.join(directory, 'parsed.jsonl')
+        audit_path = os.path.join(directory, 'audit.jsonl')
+        with open(input_path, 'w') as f:
+            f.write('\n'.join(lines) + '\n')
+
+        stats = parse_sigilgram_batch(input_path, output_path, 'glyph-hash-01', 'missing_dredd_config.json',
+                                      workers=2, chunk_size=7, audit_file=audit_path, session_key=SESSION_KEY)
+
+        with open(output_path) as f:
+            results = [json.loads(line) for line in f]
+        with open(audit_path) as f:
+            audit = {event['event_id']: event for event in map(json.loads, f)}
+
+    assert stats['messages'] == 40 and stats['valid'] == 32 and stats['failed'] == 8
+    assert stats['messages_per_sec'] > 0
+    assert [r['line'] for r in results] == list(range(1, 41))
+    assert results[0]['content'] == 'payload 0' and results[39]['content'] == 'payload 39'
+    assert results[3]['status'] == 'failed' and results[3]['reason'] == 'invalid_json'
+    assert results[7]['reason'] == 'entropy_validation_failed' and results[7]['message_id'] == 'dredd_7'
+    assert [audit[ref]['event_type'] for ref in results[7]['audit_refs']] == ['parse_attempt', 'parse_failed']
+    assert len(audit) == stats['audit_events']
+
+
+def main():
+    """Run SigilGram parser tests"""
+    tests = [
+        test_parse_derives_keys_once_and_references_audit_entries,
+        test_validation_pipeline_rejects_before_decrypt,
+        test_audit_ring_is_bounded_and_spills_to_rotating_jsonl,
+        test_batch_mode_streams_results_in_order,
+    ]
+
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Test Sovereign Data Ticketing System ledger
+
+Covers the indexed ticket ledger used for ticket lookups, causal matches and window queries.
+"""
+
+import time
+import asyncio
+import threading
+from datetime import datetime, timedelta
+
+from ticket_generator import SovereignTicket, CausalMatch, TicketLedger, SovereignDataTicketingSystem
+
+
+def make_ticket(ticket_id: str, action_type: str = "override_watchguard_threshold",
+                timestamp: datetime = None, session_id: str = None) -> SovereignTicket:
+    """Create a ticket without going through the processing threads"""
+    return SovereignTicket(
+        ticket_id=ticket_id,
+        action_type=action_type,
+        performed_by="purveyor",
+        timestamp=(timestamp or datetime.now()).isoformat(),
+        entropy_hash="0" * 16,
+        interface_context="GuardianControlPanel > AnomalyOverride",
+        resonance_signature="valid",
+        intent_hash="1" * 16,
+        sovereign_fingerprint="2" * 24,
+        linked_effects=[],
+        causal_certainty=0.0,
+        system_impact="medium",
+        mirror_depth=1,
+        chronicle_status="active",
+        session_id=session_id
+    )
+
+
+def make_match(ticket_id: str, effect_event: str) -> CausalMatch:
+    return CausalMatch(
+        match_id=f"MATCH-{ticket_id}-{effect_event}",
+        intent_ticket=ticket_id,
+        effect_event=effect_event,
+        response_time=1.0,
+        causal_certainty=0.9,
+        entropy_similarity=0.8,
+        resonance_fingerprint="3" * 16,
+        matched_at=datetime.now().isoformat()
+    )
+
+
+def test_ledger_indexes_tickets():
+    """Tickets are reachable by ID, action type and session"""
+    ledger = TicketLedger()
+    ledger.append(make_ticket("TKT-1", "override_watchguard_threshold", session_id="SESSION-A"))
+    ledger.append(make_ticket("TKT-2", "enable_portfolio_monitoring", session_id="SESSION-A"))
+    ledger.append(make_ticket("TKT-3", "override_watchguard_threshold", session_id="SESSION-B"))
+
+    assert len(ledger) == 3
+    assert ledger.get("TKT-2").action_type == "enable_portfolio_monitoring"
+    assert ledger.get("TKT-404") is None
+    assert [t.ticket_id for t in ledger.by_action_type("override_watchguard_threshold")] == ["TKT-1", "TKT-3"]
+    assert [t.ticket_id for t in ledger.by_session("SESSION-A")] == ["TKT-1", "TKT-2"]
+
+
+def test_ledger_window_queries_are_time_ordered():
+    """Window queries return tickets inside the window, oldest first"""
+    ledger = TicketLedger()
+    now = datetime.now()
+    ledger.append(make_ticket("TKT-new", timestamp=now))
+    ledger.append(make_ticket("TKT-old", timestamp=now - timedelta(hours=30)))
+    ledger.append(make_ticket("TKT-mid", timestamp=now - timedelta(hours=2)))
+
+    recent = ledger.in_window((now - timedelta(hours=24)).timestamp())
+    assert [t.ticket_id for t in recent] == ["TKT-mid", "TKT-new"]
+
+    older = ledger.in_window((now - timedelta(hours=48)).timestamp(), (now - timedelta(hours=1)).timestamp())
+    assert [t.ticket_id for t in older] == ["TKT-old", "TKT-mid"]
+
+
+def test_ledger_remove_drops_every_index():
+    """Removed tickets disappear from all indexes and their matches are released"""
+    ledger = TicketLedger()
+    ledger.append(make_ticket("TKT-1", session_id="SESSION-A"))
+    ledger.attach_match(make_match("TKT-1", "ANOM-253-resolved"))
+
+    ledger.remove("TKT-1")
+
+    assert "TKT-1" not in ledger
+    assert ledger.by_session("SESSION-A") == []
+    assert ledger.by_action_type("override_watchguard_threshold") == []
+    assert ledger.matches_for("TKT-1") == []
+    assert ledger.in_window(0) == []
+
+
+def test_linked_effects_attach_to_ticket():
+    """Linking an effect attaches the causal match to its ticket"""
+    dts = SovereignDataTicketingSystem()
+    dts.write_to_live_stream = lambda stream_entry: None
+    try:
+        ticket_id = dts.capture_sovereign_action(
+            "override_watchguard_threshold", "GuardianControlPanel > AnomalyOverride", "high",
+            session_id="SESSION-001"
+        )
+
+        deadline = time.time() + 5
+        while ticket_id not in dts.ticket_ledger and time.time() < deadline:
+            time.sleep(0.05)
+
+        assert dts.link_effect_to_ticket(ticket_id, "ANOM-253-resolved", 12.4, 0.96)
+        status = dts.get_ticket_status(ticket_id)
+
+        assert status['ticket']['session_id'] == "SESSION-001"
+        assert [m['effect_event'] for m in status['causal_matches']] == ["ANOM-253-resolved"]
+        assert dts.ticket_ledger.by_session("SESSION-001")[0].ticket_id == ticket_id
+    finally:
+        dts.running = False
+
+
+def test_influence_report_merges_minute_buckets():
+    """Influence reports built from minute buckets match a full ledger scan"""
+    dts = SovereignDataTicketingSystem()
+    dts.write_to_live_stream = lambda stream_entry: None
+    try:
+        now = datetime.now()
+        action_types = ["override_watchguard_threshold", "enable_portfolio_monitoring", "rebalance_treasury"]
+        for i in range(300):
+            ticket = make_ticket(f"TKT-{i}", action_types[i % 3], timestamp=now - timedelta(minutes=i * 7 + 0.5))
+            ticket.causal_certainty = (i % 10) / 10
+            dts.ticket_ledger.append(ticket)
+            dts.influence_aggregates.record_ticket(ticket, dts.ticket_ledger.get_epoch(ticket.ticket_id))
+            
+        for i in range(0, 300, 4):
+            dts.link_effect_to_ticket(f"TKT-{i}", f"EFFECT-{i}", 3.0, 0.95)
+            
+        for hours in (1, 6, 24):
+            report = dts.get_sovereign_influence_report(hours)
+            cutoff = (datetime.now() - timedelta(hours=hours)).timestamp()
+            expected = [t for t in dts.ticket_ledger if dts.ticket_ledger.get_epoch(t.ticket_id) > cutoff]
+            
+            assert report['total_actions'] == len(expected)
+            assert report['actions_with_effects'] == len([t for t in expected if t.linked_effects])
+            assert abs(report['avg_causal_certainty'] -
+                       sum(t.causal_certainty for t in expected) / len(expected)) < 1e-9
+            
+            for action_type in action_types:
+                typed = [t for t in expected if t.action_type == action_type]
+                assert report['action_types'][action_type]['count'] == len(typed)
+                assert abs(report['action_types'][action_type]['avg_certainty'] -
+                           sum(t.causal_certainty for t in typed) / len(typed)) < 1e-9
+    finally:
+        dts.running = False
+
+
+def test_due_tickets_archive_and_leave_ledger():
+    """Tickets are archived once their deadline passes and leave the hot ledger"""
+    dts = SovereignDataTicketingSystem()
+    dts.write_to_live_stream = lambda stream_entry: None
+    archived = []
+    dts.write_to_chronicle = archived.append
+    dts.archive_after = 0.3
+    try:
+        ticket_id = dts.capture_sovereign_action(
+            "override_watchguard_threshold", "GuardianControlPanel > AnomalyOverride", "high"
+        )
+        deadline = time.time() + 5
+        while ticket_id not in dts.ticket_ledger and time.time() < deadline:
+            time.sleep(0.01)
+        assert dts.link_effect_to_ticket(ticket_id, "ANOM-253-resolved", 1.2, 0.9)
+        
+        # A long-lived ticket must not hold up the due one
+        dts.schedule_archive("TKT-later", time.time() + 3600)
+        
+        deadline = time.time() + 5
+        while ticket_id in dts.ticket_ledger and time.time() < deadline:
+            time.sleep(0.01)
+            
+        assert ticket_id not in dts.ticket_ledger
+        assert ticket_id not in dts.intent_mirrors
+        assert [entry['ticket']['ticket_id'] for entry in archived] == [ticket_id]
+        assert archived[0]['ticket']['chronicle_status'] == "archived"
+        assert [m['effect_event'] for m in archived[0]['causal_matches']] == ["ANOM-253-resolved"]
+        assert dts.archive_heap == [(dts.archive_heap[0][0], "TKT-later")]
+    finally:
+        dts.shutdown()
+
+
+def test_influence_report_counts_archived_tickets():
+    """Long reports still count tickets that have been archived out of the ledger"""
+    dts = SovereignDataTicketingSystem()
+    dts.write_to_live_stream = lambda stream_entry: None
+    dts.write_to_chronicle = lambda chronicle_entry: None
+    now = datetime.now()
+    ages = [timedelta(hours=1), timedelta(hours=30), timedelta(hours=48, seconds=-1),
+            timedelta(hours=100), timedelta(hours=150)]
+    for i, age in enumerate(ages):
+        ticket = make_ticket(f"TKT-{i}", timestamp=now - age)
+        dts.ticket_ledger.append(ticket)
+        dts.influence_aggregates.record_ticket(ticket, dts.ticket_ledger.get_epoch(ticket.ticket_id))
+        
+    for i in range(1, len(ages)):
+        assert dts.archive_ticket(f"TKT-{i}")
+    assert len(dts.ticket_ledger) == 1
+    
+    # The ticket just inside the 48 hour cutoff is archived and still counted
+    assert [dts.get_sovereign_influence_report(hours)['total_actions'] for hours in (24, 40, 48, 120, 168, 200)] == \
+        [1, 2, 3, 4, 5, 5]
+
+
+def test_asyncio_mode_applies_backpressure_and_drains():
+    """In asyncio mode captures wait for queue space and shutdown drains queued tickets"""
+    async def scenario():
+        dts = SovereignDataTicketingSystem(mode='asyncio')
+        dts.write_to_live_stream = lambda stream_entry: None
+        archived = []
+        dts.write_to_chronicle = archived.append
+        dts.archive_after = 0.2
+        dts.ticket_queue = asyncio.Queue(maxsize=2)
+        assert not hasattr(dts, 'ticket_processor')
+
+        # Without a consumer the bounded queue rejects synchronous captures once full
+        first = dts.capture_sovereign_action("deploy_watch_guard", "WatchPanel > Deploy")
+        second = dts.capture_sovereign_action("deploy_watch_guard", "WatchPanel > Deploy")
+        assert first and second
+        assert dts.capture_sovereign_action("deploy_watch_guard", "WatchPanel > Deploy") is None
+
+        pending = asyncio.ensure_future(dts.capture_sovereign_action_async("deploy_watch_guard", "WatchPanel > Deploy"))
+        await asyncio.sleep(0.05)
+        assert not pending.done()
+
+        await dts.start_async()
+        ticket_ids = [first, second, await pending]
+        ticket_ids += [await dts.capture_sovereign_action_async("deploy_watch_guard", "WatchPanel > Deploy")
+                       for _ in range(5)]
+
+        deadline = time.time() + 5
+        while len(archived) < len(ticket_ids) and time.time() < deadline:
+            await asyncio.sleep(0.01)
+        assert sorted(entry['ticket']['ticket_id'] for entry in archived) == sorted(ticket_ids)
+
+        # Tickets still queued at shutdown are processed before the tasks stop
+        dts.archive_after = 3600
+        late = [dts.capture_sovereign_action("deploy_watch_guard", "WatchPanel > Deploy") for _ in range(2)]
+        await dts.shutdown_async()
+        assert all(ticket_id in dts.ticket_ledger for ticket_id in late)
+        assert dts.async_tasks == [] and dts.ticket_queue.empty()
+
+    asyncio.run(scenario())
+
+
+def test_asyncio_mode_accepts_captures_from_other_threads():
+    """Tickets captured off the loop thread wake the idle processing task at once"""
+    async def scenario():
+        dts = SovereignDataTicketingSystem(mode='asyncio')
+        dts.write_to_live_stream = lambda stream_entry: None
+        dts.archive_after = 3600
+        processed_at = {}
+        dts.add_ticket_listener(lambda ticket: processed_at.setdefault(ticket.ticket_id, time.perf_counter()))
+        await dts.start_async()
+
+        captured = {}
+        def capture():
+            time.sleep(0.1)
+            captured['at'] = time.perf_counter()
+            captured['ticket_id'] = dts.capture_sovereign_action("deploy_watch_guard", "WatchPanel > Deploy")
+
+        # Capture once the loop is idle; nothing else would wake it for a second
+        threading.Thread(target=capture).start()
+        await asyncio.sleep(1.0)
+        await dts.shutdown_async()
+        return captured, processed_at
+
+    captured, processed_at = asyncio.run(scenario())
+    assert processed_at[captured['ticket_id']] - captured['at'] < 0.5
+
+
+def main():
+    """Run sovereign ticketing tests"""
+    tests = [
+        test_ledger_indexes_tickets,
+        test_ledger_window_queries_are_time_ordered,
+        test_ledger_remove_drops_every_index,
+        test_linked_effects_attach_to_ticket,
+        test_influence_report_merges_minute_buckets,
+        test_due_tickets_archive_and_leave_ledger,
+        test_influence_report_counts_archived_tickets,
+        test_asyncio_mode_applies_backpressure_and_drains,
+        test_asyncio_mode_accepts_captures_from_other_threads,
+    ]
+
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
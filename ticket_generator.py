@@ -11,14 +11,18 @@ import uuid
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Any, Optional, Tuple, Callable
+from dataclasses import dataclass, asdict, is_dataclass
 from dataclasses_json import dataclass_json
 import threading
 import queue
 import os
 import base64
+import bisect
+import heapq
+from collections import deque
 from cryptography.fernet import Fernet
+from jsonl_sink import get_sink
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
@@ -39,6 +43,7 @@ class SovereignTicket:
     system_impact: str
     mirror_depth: int
     chronicle_status: str
+    session_id: Optional[str] = None
 
 @dataclass_json
 @dataclass
@@ -64,23 +69,285 @@ class CausalMatch:
     resonance_fingerprint: str
     matched_at: str
 
+def record_to_dict(record) -> Dict[str, Any]:
+    """Serialize a ticketing record, dataclass or compact variant, to its JSON shape"""
+    return asdict(record) if is_dataclass(record) else record.to_dict()
+    
+class TicketLedger:
+    """Ticket ledger indexed by ticket_id, action_type, session and time"""
+    
+    def __init__(self, record_factory: Optional[Callable[[Any], Any]] = None):
+        # Optional conversion applied to stored tickets and matches (e.g. compact records)
+        self._record_factory = record_factory
+        self._lock = threading.RLock()
+        self._tickets: Dict[str, SovereignTicket] = {}
+        self._by_action_type: Dict[str, Dict[str, None]] = {}
+        self._by_session: Dict[str, Dict[str, None]] = {}
+        self._matches: Dict[str, List[CausalMatch]] = {}
+        self._epochs: Dict[str, float] = {}
+        
+        # Time index of (epoch, ticket_id), kept sorted; removed tickets are skipped lazily
+        self._time_index: List[Tuple[float, str]] = []
+        self._stale_time_entries = 0
+        
+    @staticmethod
+    def parse_epoch(timestamp: str) -> float:
+        """Convert an ISO timestamp to epoch seconds"""
+        return datetime.fromisoformat(timestamp.replace('Z', '+00:00')).timestamp()
+        
+    def append(self, ticket: SovereignTicket) -> SovereignTicket:
+        """Add a ticket to the ledger and every index, returning the stored record"""
+        if self._record_factory is not None:
+            ticket = self._record_factory(ticket)
+            
+        with self._lock:
+            if ticket.ticket_id in self._tickets:
+                self.remove(ticket.ticket_id)
+                
+            epoch = ticket.epoch if hasattr(ticket, 'epoch') else self.parse_epoch(ticket.timestamp)
+            self._tickets[ticket.ticket_id] = ticket
+            self._epochs[ticket.ticket_id] = epoch
+            self._by_action_type.setdefault(ticket.action_type, {})[ticket.ticket_id] = None
+            if ticket.session_id:
+                self._by_session.setdefault(ticket.session_id, {})[ticket.ticket_id] = None
+                
+            entry = (epoch, ticket.ticket_id)
+            if not self._time_index or self._time_index[-1] <= entry:
+                self._time_index.append(entry)
+            else:
+                bisect.insort(self._time_index, entry)
+                
+            return ticket
+            
+    def remove(self, ticket_id: str) -> Optional[SovereignTicket]:
+        """Remove a ticket and its causal matches from the ledger"""
+        with self._lock:
+            ticket = self._tickets.pop(ticket_id, None)
+            if ticket is None:
+                return None
+                
+            self._epochs.pop(ticket_id, None)
+            self._matches.pop(ticket_id, None)
+            self._discard(self._by_action_type, ticket.action_type, ticket_id)
+            if ticket.session_id:
+                self._discard(self._by_session, ticket.session_id, ticket_id)
+                
+            self._stale_time_entries += 1
+            if self._stale_time_entries > len(self._time_index) // 2:
+                self._time_index = [entry for entry in self._time_index if self._epochs.get(entry[1]) == entry[0]]
+                self._stale_time_entries = 0
+                
+            return ticket
+            
+    @staticmethod
+    def _discard(index: Dict[str, Dict[str, None]], key: str, ticket_id: str):
+        bucket = index.get(key)
+        if bucket is not None:
+            bucket.pop(ticket_id, None)
+            if not bucket:
+                del index[key]
+                
+    def get(self, ticket_id: str) -> Optional[SovereignTicket]:
+        """Get a ticket by ID"""
+        return self._tickets.get(ticket_id)
+        
+    def get_epoch(self, ticket_id: str) -> Optional[float]:
+        """Get a ticket's timestamp as epoch seconds"""
+        return self._epochs.get(ticket_id)
+        
+    def by_action_type(self, action_type: str) -> List[SovereignTicket]:
+        """Get tickets for an action type"""
+        with self._lock:
+            return [self._tickets[ticket_id] for ticket_id in self._by_action_type.get(action_type, {})]
+            
+    def by_session(self, session_id: str) -> List[SovereignTicket]:
+        """Get tickets captured during a session"""
+        with self._lock:
+            return [self._tickets[ticket_id] for ticket_id in self._by_session.get(session_id, {})]
+            
+    def in_window(self, start: float, end: Optional[float] = None) -> List[SovereignTicket]:
+        """Get tickets with start < timestamp <= end (epoch seconds), oldest first"""
+        with self._lock:
+            lo = bisect.bisect_right(self._time_index, (start, chr(0x10FFFF)))
+            hi = len(self._time_index) if end is None else bisect.bisect_right(self._time_index, (end, chr(0x10FFFF)))
+            
+            return [
+                self._tickets[ticket_id]
+                for epoch, ticket_id in self._time_index[lo:hi]
+                if self._epochs.get(ticket_id) == epoch
+            ]
+            
+    def attach_match(self, causal_match: CausalMatch):
+        """Attach a causal match to its ticket"""
+        if self._record_factory is not None:
+            causal_match = self._record_factory(causal_match)
+            
+        with self._lock:
+            self._matches.setdefault(causal_match.intent_ticket, []).append(causal_match)
+            
+    def matches_for(self, ticket_id: str) -> List[CausalMatch]:
+        """Get causal matches attached to a ticket"""
+        with self._lock:
+            return list(self._matches.get(ticket_id, []))
+            
+    def __contains__(self, ticket_id: str) -> bool:
+        return ticket_id in self._tickets
+        
+    def __len__(self) -> int:
+        return len(self._tickets)
+        
+    def __iter__(self):
+        with self._lock:
+            return iter(list(self._tickets.values()))
+            
+class InfluenceAggregates:
+    """Rolling per-minute influence aggregates by action_type, rolled up per hour"""
+    
+    BUCKET_SECONDS = 60
+    MINUTES_PER_HOUR = 60
+    
+    def __init__(self, retention_hours: int = 168):
+        self.retention_hours = retention_hours
+        self._lock = threading.RLock()
+        
+        # minute (or hour) -> action_type -> [count, certainty_sum, effects_linked]
+        self._minute_buckets: Dict[int, Dict[str, List[float]]] = {}
+        self._minute_keys: List[int] = []
+        self._hour_buckets: Dict[int, Dict[str, List[float]]] = {}
+        self._hour_keys: List[int] = []
+        
+    @staticmethod
+    def _bucket_stats(buckets: Dict[int, Dict[str, List[float]]], keys: List[int],
+                      key: int, action_type: str) -> List[float]:
+        bucket = buckets.get(key)
+        if bucket is None:
+            bucket = buckets[key] = {}
+            if not keys or keys[-1] < key:
+                keys.append(key)
+            else:
+                bisect.insort(keys, key)
+                
+        stats = bucket.get(action_type)
+        if stats is None:
+            stats = bucket[action_type] = [0, 0.0, 0]
+        return stats
+        
+    @staticmethod
+    def _prune_level(buckets: Dict[int, Dict[str, List[float]]], keys: List[int], oldest: int):
+        expired = bisect.bisect_left(keys, oldest)
+        if expired:
+            for key in keys[:expired]:
+                del buckets[key]
+            del keys[:expired]
+            
+    @staticmethod
+    def _merge_level(merged: Dict[str, List[float]], buckets: Dict[int, Dict[str, List[float]]],
+                     keys: List[int], first: int, last: Optional[int] = None):
+        lo = bisect.bisect_left(keys, first)
+        hi = len(keys) if last is None else bisect.bisect_left(keys, last)
+        for key in keys[lo:hi]:
+            for action_type, stats in buckets[key].items():
+                total = merged.get(action_type)
+                if total is None:
+                    merged[action_type] = list(stats)
+                else:
+                    total[0] += stats[0]
+                    total[1] += stats[1]
+                    total[2] += stats[2]
+                    
+    def record_ticket(self, ticket: SovereignTicket, epoch: float):
+        """Count a newly ledgered ticket"""
+        minute = int(epoch // self.BUCKET_SECONDS)
+        with self._lock:
+            for stats in (
+                self._bucket_stats(self._minute_buckets, self._minute_keys, minute, ticket.action_type),
+                self._bucket_stats(self._hour_buckets, self._hour_keys, minute // self.MINUTES_PER_HOUR, ticket.action_type)
+            ):
+                stats[0] += 1
+                stats[1] += ticket.causal_certainty
+                if ticket.linked_effects:
+                    stats[2] += 1
+                    
+            # Drop buckets older than the retention window
+            oldest = int((time.time() - self.retention_hours * 3600) // self.BUCKET_SECONDS)
+            self._prune_level(self._minute_buckets, self._minute_keys, oldest)
+            self._prune_level(self._hour_buckets, self._hour_keys, oldest // self.MINUTES_PER_HOUR)
+            
+    def record_effect(self, action_type: str, epoch: float, previous_certainty: float,
+                      causal_certainty: float, first_effect: bool):
+        """Apply an effect link to the buckets of its ticket"""
+        minute = int(epoch // self.BUCKET_SECONDS)
+        with self._lock:
+            for stats in (
+                self._minute_buckets.get(minute, {}).get(action_type),
+                self._hour_buckets.get(minute // self.MINUTES_PER_HOUR, {}).get(action_type)
+            ):
+                if stats is None:
+                    continue
+                stats[1] += causal_certainty - previous_certainty
+                if first_effect:
+                    stats[2] += 1
+                    
+    def merge(self, first_minute: int) -> Dict[str, List[float]]:
+        """Merge every bucket from first_minute onwards, using hour rollups for whole hours"""
+        first_hour = -(-first_minute // self.MINUTES_PER_HOUR)
+        merged: Dict[str, List[float]] = {}
+        with self._lock:
+            self._merge_level(merged, self._minute_buckets, self._minute_keys,
+                              first_minute, first_hour * self.MINUTES_PER_HOUR)
+            self._merge_level(merged, self._hour_buckets, self._hour_keys, first_hour)
+        return merged
+        
+PROCESSING_MODES = ('thread', 'asyncio')
+
 class SovereignDataTicketingSystem:
-    def __init__(self, config_file: str = "dts_config.json"):
+    def __init__(self, config_file: str = "dts_config.json", mode: Optional[str] = None):
         self.config = self.load_config(config_file)
+        processing = self.config.get('processing', {})
+        self.mode = mode or processing.get('mode', 'thread')
+        if self.mode not in PROCESSING_MODES:
+            raise ValueError(f"Unknown processing mode: {self.mode}")
+        self.queue_size = processing.get('queue_size', 10000)
         self.session_key = self.generate_session_key()
-        self.ticket_queue = queue.Queue()
+        self.ticket_queue = asyncio.Queue(maxsize=self.queue_size) if self.mode == 'asyncio' else queue.Queue()
         self.intent_mirrors = {}
-        self.causal_matches = []
+        self.causal_matches = deque(maxlen=self.config.get('causal_matching', {}).get('recent_matches', 10000))
+        self.causal_match_count = 0
         self.observational_relay = []
+        self.ticket_listeners: List[Callable[[SovereignTicket], None]] = []
         self.logger = logging.getLogger('sovereign_dts')
         self.running = False
         
         # Initialize storage
-        self.ticket_ledger = []
-        self.chronicle_entries = []
+        record_factory = None
+        if self.config.get('ticket_settings', {}).get('compact_records', False):
+            from compact_records import compact
+            record_factory = compact
+        self.ticket_ledger = TicketLedger(record_factory)
+        self.chronicle_entries = deque(maxlen=self.config.get('chronicle', {}).get('recent_entries', 1000))
+        
+        # Archive deadlines as a min-heap of (deadline epoch, ticket_id)
+        archive_after_hours = self.config.get('chronicle', {}).get('archive_after_hours', 24)
+        self.archive_after = archive_after_hours * 3600
+        
+        # Aggregates outlive the hot ledger so archived tickets stay in influence reports
+        self.influence_aggregates = InfluenceAggregates(max(
+            self.config.get('reporting', {}).get('aggregate_retention_hours', 168), archive_after_hours
+        ))
+        self.archive_heap: List[Tuple[float, str]] = []
+        self.archive_condition = threading.Condition()
         
-        # Start processing threads
-        self.start_processing()
+        # Buffered JSONL output
+        sink_options = self.config.get('jsonl_sink', {})
+        self.live_stream_sink = get_sink('live_ticket_stream.jsonl', **sink_options)
+        self.chronicle_sink = get_sink('sovereign_chronicle.jsonl', **sink_options)
+        
+        # Processing threads start on the first capture; asyncio mode starts with start_async()
+        self.processing_started = False
+        self.start_lock = threading.Lock()
+        self.async_tasks: List[asyncio.Task] = []
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.archive_wakeup = asyncio.Event() if self.mode == 'asyncio' else None
         
     def load_config(self, config_file: str) -> Dict[str, Any]:
         """Load DTS configuration"""
@@ -93,7 +360,8 @@ class SovereignDataTicketingSystem:
                     'auto_generate': True,
                     'entropy_validation': True,
                     'resonance_tracking': True,
-                    'causal_linking': True
+                    'causal_linking': True,
+                    'compact_records': False
                 },
                 'intent_mirror': {
                     'capture_all_actions': True,
@@ -104,12 +372,29 @@ class SovereignDataTicketingSystem:
                 'causal_matching': {
                     'response_time_threshold': 30.0,
                     'certainty_threshold': 0.7,
-                    'entropy_similarity_threshold': 0.6
+                    'entropy_similarity_threshold': 0.6,
+                    'recent_matches': 10000
                 },
                 'chronicle': {
                     'auto_archive': True,
                     'retention_days': 90,
-                    'encryption_enabled': True
+                    'encryption_enabled': True,
+                    'archive_after_hours': 24,
+                    'recent_entries': 1000
+                },
+                'reporting': {
+                    'aggregate_retention_hours': 168
+                },
+                'processing': {
+                    'mode': 'thread',
+                    'queue_size': 10000
+                },
+                'jsonl_sink': {
+                    'max_buffer_entries': 1000,
+                    'flush_interval': 1.0,
+                    'fsync_policy': 'batch',
+                    'rotate_max_bytes': None,
+                    'rotate_daily': False
                 }
             }
             
@@ -117,8 +402,17 @@ class SovereignDataTicketingSystem:
         """Generate session key for sovereign operations"""
         return Fernet.generate_key().decode()
         
+    def ensure_processing(self):
+        """Start the processing threads once, on first use (thread mode)"""
+        if self.processing_started or self.mode != 'thread':
+            return
+        with self.start_lock:
+            if not self.processing_started:
+                self.start_processing()
+                
     def start_processing(self):
         """Start ticket processing threads"""
+        self.processing_started = True
         self.running = True
         
         # Start ticket processor
@@ -134,62 +428,98 @@ class SovereignDataTicketingSystem:
         self.chronicle_archiver.start()
         
     def capture_sovereign_action(self, action_type: str, interface_context: str, 
-                               system_impact: str = "medium", mirror_depth: int = 1) -> str:
+                               system_impact: str = "medium", mirror_depth: int = 1,
+                               session_id: Optional[str] = None) -> str:
         """Capture a sovereign action and generate ticket"""
         
         try:
-            # Generate ticket ID
-            ticket_id = f"TKT-{datetime.now().strftime('%Y%m%d')}-{str(uuid.uuid4())[:8].upper()}"
-            
-            # Create entropy hash
-            entropy_data = {
-                'timestamp': int(time.time()),
-                'action_type': action_type,
-                'interface_context': interface_context,
-                'session_key': self.session_key,
-                'random_seed': str(uuid.uuid4())
-            }
-            entropy_hash = self.generate_entropy_hash(entropy_data)
-            
-            # Generate intent hash
-            intent_hash = self.generate_intent_hash(action_type, interface_context)
-            
-            # Create sovereign fingerprint
-            sovereign_fingerprint = self.generate_sovereign_fingerprint(action_type, interface_context)
-            
-            # Create ticket
-            ticket = SovereignTicket(
-                ticket_id=ticket_id,
-                action_type=action_type,
-                performed_by="purveyor",
-                timestamp=datetime.now().isoformat(),
-                entropy_hash=entropy_hash,
-                interface_context=interface_context,
-                resonance_signature="valid",
-                intent_hash=intent_hash,
-                sovereign_fingerprint=sovereign_fingerprint,
-                linked_effects=[],
-                causal_certainty=0.0,
-                system_impact=system_impact,
-                mirror_depth=mirror_depth,
-                chronicle_status="pending"
-            )
+            ticket = self.build_ticket(action_type, interface_context, system_impact, mirror_depth, session_id)
             
             # Add to queue for processing
-            self.ticket_queue.put(ticket)
-            
+            if self.mode == 'asyncio':
+                self.enqueue_async(ticket)
+            else:
+                self.ensure_processing()
+                self.ticket_queue.put(ticket)
+                
             # Create intent mirror
             self.create_intent_mirror(ticket)
             
             # Log capture
-            self.logger.info(f"Sovereign action captured: {ticket_id} - {action_type}")
+            self.logger.info(f"Sovereign action captured: {ticket.ticket_id} - {action_type}")
             
-            return ticket_id
+            return ticket.ticket_id
             
         except Exception as e:
             self.logger.error(f"Error capturing sovereign action: {e}")
             return None
             
+    def enqueue_async(self, ticket: SovereignTicket):
+        """Queue a ticket in asyncio mode from the loop thread or any other thread
+        
+        On the loop (or before start_async) a full queue raises asyncio.QueueFull; other
+        threads hand the ticket to the loop, which logs and drops it if the queue is full.
+        """
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+            
+        if self.loop is None or running is self.loop:
+            self.ticket_queue.put_nowait(ticket)
+        else:
+            self.loop.call_soon_threadsafe(self._put_from_thread, ticket)
+            
+    def _put_from_thread(self, ticket: SovereignTicket):
+        try:
+            self.ticket_queue.put_nowait(ticket)
+        except asyncio.QueueFull:
+            self.logger.error(f"Ticket queue full, dropped ticket: {ticket.ticket_id}")
+            
+    def build_ticket(self, action_type: str, interface_context: str, system_impact: str = "medium",
+                     mirror_depth: int = 1, session_id: Optional[str] = None) -> SovereignTicket:
+        """Build a pending ticket for a sovereign action"""
+        
+        # Generate ticket ID
+        ticket_id = f"TKT-{datetime.now().strftime('%Y%m%d')}-{str(uuid.uuid4())[:8].upper()}"
+        
+        # Create entropy hash
+        entropy_data = {
+            'timestamp': int(time.time()),
+            'action_type': action_type,
+            'interface_context': interface_context,
+            'session_key': self.session_key,
+            'random_seed': str(uuid.uuid4())
+        }
+        entropy_hash = self.generate_entropy_hash(entropy_data)
+        
+        # Generate intent hash
+        intent_hash = self.generate_intent_hash(action_type, interface_context)
+        
+        # Create sovereign fingerprint
+        sovereign_fingerprint = self.generate_sovereign_fingerprint(action_type, interface_context)
+        
+        # Create ticket
+        ticket = SovereignTicket(
+            ticket_id=ticket_id,
+            action_type=action_type,
+            performed_by="purveyor",
+            timestamp=datetime.now().isoformat(),
+            entropy_hash=entropy_hash,
+            interface_context=interface_context,
+            resonance_signature="valid",
+            intent_hash=intent_hash,
+            sovereign_fingerprint=sovereign_fingerprint,
+            linked_effects=[],
+            causal_certainty=0.0,
+            system_impact=system_impact,
+            mirror_depth=mirror_depth,
+            chronicle_status="pending",
+            session_id=session_id
+        )
+        
+        return ticket
+            
     def generate_entropy_hash(self, data: Dict[str, Any]) -> str:
         """Generate entropy hash from data"""
         data_str = json.dumps(data, sort_keys=True)
@@ -234,29 +564,51 @@ class SovereignDataTicketingSystem:
             try:
                 # Get ticket from queue
                 ticket = self.ticket_queue.get(timeout=1)
+                self.process_ticket(ticket)
                 
-                # Validate ticket
-                if self.validate_ticket(ticket):
-                    # Add to ledger
-                    self.ticket_ledger.append(ticket)
-                    
-                    # Update chronicle status
-                    ticket.chronicle_status = "active"
-                    
-                    # Log processing
-                    self.logger.info(f"Ticket processed: {ticket.ticket_id}")
-                    
-                    # Emit to live stream
-                    self.emit_to_live_stream(ticket)
-                    
-                else:
-                    self.logger.warning(f"Invalid ticket rejected: {ticket.ticket_id}")
-                    
             except queue.Empty:
                 continue
             except Exception as e:
                 self.logger.error(f"Error processing ticket: {e}")
                 
+    def process_ticket(self, ticket: SovereignTicket):
+        """Validate a captured ticket and add it to the ledger"""
+        
+        # Validate ticket
+        if self.validate_ticket(ticket):
+            # Add to ledger
+            ticket = self.ticket_ledger.append(ticket)
+            epoch = self.ticket_ledger.get_epoch(ticket.ticket_id)
+            self.influence_aggregates.record_ticket(ticket, epoch)
+            
+            # Update chronicle status and schedule archiving
+            ticket.chronicle_status = "active"
+            self.schedule_archive(ticket.ticket_id, epoch + self.archive_after)
+            self.notify_ticket_listeners(ticket)
+            
+            # Log processing
+            self.logger.info(f"Ticket processed: {ticket.ticket_id}")
+            
+            # Emit to live stream
+            self.emit_to_live_stream(ticket)
+            
+        else:
+            self.logger.warning(f"Invalid ticket rejected: {ticket.ticket_id}")
+            
+
+    def add_ticket_listener(self, listener: Callable[[SovereignTicket], None]):
+        """Register a callback invoked with every ticket added to the ledger"""
+        if listener not in self.ticket_listeners:
+            self.ticket_listeners.append(listener)
+        
+    def notify_ticket_listeners(self, ticket: SovereignTicket):
+        """Pass a ledgered ticket to every listener"""
+        for listener in self.ticket_listeners:
+            try:
+                listener(ticket)
+            except Exception as e:
+                self.logger.error(f"Error in ticket listener: {e}")
+                
     def validate_ticket(self, ticket: SovereignTicket) -> bool:
         """Validate sovereign ticket"""
         
@@ -285,7 +637,7 @@ class SovereignDataTicketingSystem:
             # Create live stream entry
             stream_entry = {
                 'type': 'sovereign_ticket',
-                'ticket': asdict(ticket),
+                'ticket': record_to_dict(ticket),
                 'emitted_at': datetime.now().isoformat(),
                 'stream_id': f"stream_{int(time.time())}"
             }
@@ -303,8 +655,7 @@ class SovereignDataTicketingSystem:
         """Write to live stream file"""
         
         try:
-            with open('live_ticket_stream.jsonl', 'a') as f:
-                f.write(json.dumps(stream_entry) + '\n')
+            self.live_stream_sink.write(stream_entry)
         except Exception as e:
             self.logger.error(f"Error writing to live stream: {e}")
             
@@ -314,18 +665,27 @@ class SovereignDataTicketingSystem:
         
         try:
             # Find ticket
-            ticket = next((t for t in self.ticket_ledger if t.ticket_id == ticket_id), None)
+            ticket = self.ticket_ledger.get(ticket_id)
             if not ticket:
                 self.logger.warning(f"Ticket not found: {ticket_id}")
                 return False
                 
             # Add effect to ticket
+            previous_certainty = ticket.causal_certainty
+            first_effect = not ticket.linked_effects
             ticket.linked_effects.append(effect_event)
             ticket.causal_certainty = max(ticket.causal_certainty, causal_certainty)
             
+            # Keep the rolling influence aggregates in step
+            epoch = self.ticket_ledger.get_epoch(ticket_id)
+            if epoch is not None:
+                self.influence_aggregates.record_effect(
+                    ticket.action_type, epoch, previous_certainty, ticket.causal_certainty, first_effect
+                )
+            
             # Create causal match
             causal_match = CausalMatch(
-                match_id=f"MATCH-{ticket_id}-{len(self.causal_matches)}",
+                match_id=f"MATCH-{ticket_id}-{self.causal_match_count}",
                 intent_ticket=ticket_id,
                 effect_event=effect_event,
                 response_time=response_time,
@@ -335,8 +695,10 @@ class SovereignDataTicketingSystem:
                 matched_at=datetime.now().isoformat()
             )
             
-            # Add to causal matches
+            # Add to recent causal matches and attach to its ticket
+            self.causal_match_count += 1
             self.causal_matches.append(causal_match)
+            self.ticket_ledger.attach_match(causal_match)
             
             # Update intent mirror
             if ticket_id in self.intent_mirrors:
@@ -411,102 +773,130 @@ class SovereignDataTicketingSystem:
             except Exception as e:
                 self.logger.error(f"Error processing causal matches: {e}")
                 
+    def schedule_archive(self, ticket_id: str, deadline: float):
+        """Schedule a ticket for archiving at deadline (epoch seconds)"""
+        with self.archive_condition:
+            heapq.heappush(self.archive_heap, (deadline, ticket_id))
+            if self.archive_heap[0][1] == ticket_id:
+                self.archive_condition.notify()
+                if self.archive_wakeup is not None:
+                    self.archive_wakeup.set()
+                
     def _archive_chronicle(self):
-        """Archive chronicle entries"""
+        """Archive tickets as their deadlines come due"""
         while self.running:
             try:
-                # Archive completed tickets
-                current_time = datetime.now()
-                
-                for ticket in self.ticket_ledger:
-                    if ticket.chronicle_status == "active":
-                        ticket_time = datetime.fromisoformat(ticket.timestamp.replace('Z', '+00:00'))
+                due = []
+                with self.archive_condition:
+                    now = time.time()
+                    while self.archive_heap and self.archive_heap[0][0] <= now:
+                        due.append(heapq.heappop(self.archive_heap)[1])
                         
-                        # Archive after 24 hours
-                        if (current_time - ticket_time) > timedelta(hours=24):
-                            ticket.chronicle_status = "archived"
-                            
-                            # Add to chronicle
-                            chronicle_entry = {
-                                'ticket': asdict(ticket),
-                                'archived_at': current_time.isoformat(),
-                                'causal_matches': [m for m in self.causal_matches if m.intent_ticket == ticket.ticket_id]
-                            }
-                            
-                            self.chronicle_entries.append(chronicle_entry)
-                            
-                            # Write to chronicle file
-                            self.write_to_chronicle(chronicle_entry)
-                            
-                time.sleep(3600)  # Check every hour
-                
+                    if not due:
+                        # Wake for the next deadline, new earlier deadlines or shutdown
+                        wait = self.archive_heap[0][0] - now if self.archive_heap else 1.0
+                        self.archive_condition.wait(timeout=min(wait, 1.0))
+                        continue
+                        
+                for ticket_id in due:
+                    self.archive_ticket(ticket_id)
+                    
             except Exception as e:
                 self.logger.error(f"Error archiving chronicle: {e}")
                 
+    def archive_ticket(self, ticket_id: str) -> bool:
+        """Write a ticket to the chronicle and release it from the hot ledger"""
+        
+        ticket = self.ticket_ledger.get(ticket_id)
+        if not ticket or ticket.chronicle_status != "active":
+            return False
+            
+        ticket.chronicle_status = "archived"
+        
+        # Add to chronicle
+        chronicle_entry = {
+            'ticket': record_to_dict(ticket),
+            'archived_at': datetime.now().isoformat(),
+            'causal_matches': [record_to_dict(m) for m in self.ticket_ledger.matches_for(ticket_id)]
+        }
+        
+        self.chronicle_entries.append(chronicle_entry)
+        
+        # Write to chronicle file
+        self.write_to_chronicle(chronicle_entry)
+        
+        # Release from the hot ledger
+        self.ticket_ledger.remove(ticket_id)
+        self.intent_mirrors.pop(ticket_id, None)
+        
+        return True
+        
     def write_to_chronicle(self, chronicle_entry: Dict[str, Any]):
         """Write to chronicle file"""
         
         try:
-            with open('sovereign_chronicle.jsonl', 'a') as f:
-                f.write(json.dumps(chronicle_entry) + '\n')
+            self.chronicle_sink.write(chronicle_entry)
         except Exception as e:
             self.logger.error(f"Error writing to chronicle: {e}")
             
     def get_ticket_status(self, ticket_id: str) -> Optional[Dict[str, Any]]:
         """Get status of a specific ticket"""
         
-        ticket = next((t for t in self.ticket_ledger if t.ticket_id == ticket_id), None)
+        ticket = self.ticket_ledger.get(ticket_id)
         if not ticket:
             return None
             
         # Get causal matches
-        matches = [m for m in self.causal_matches if m.intent_ticket == ticket_id]
+        matches = self.ticket_ledger.matches_for(ticket_id)
         
         # Get intent mirror
         intent_mirror = self.intent_mirrors.get(ticket_id)
         
         return {
-            'ticket': asdict(ticket),
-            'causal_matches': [asdict(m) for m in matches],
+            'ticket': record_to_dict(ticket),
+            'causal_matches': [record_to_dict(m) for m in matches],
             'intent_mirror': asdict(intent_mirror) if intent_mirror else None
         }
         
     def get_sovereign_influence_report(self, hours: int = 24) -> Dict[str, Any]:
         """Generate sovereign influence report"""
         
-        cutoff_time = datetime.now() - timedelta(hours=hours)
+        now = time.time()
+        cutoff = now - hours * 3600
         
-        # Filter tickets by time
-        recent_tickets = [
-            t for t in self.ticket_ledger 
-            if datetime.fromisoformat(t.timestamp.replace('Z', '+00:00')) > cutoff_time
-        ]
-        
-        # Calculate statistics
-        total_actions = len(recent_tickets)
-        actions_with_effects = len([t for t in recent_tickets if t.linked_effects])
-        avg_causal_certainty = sum(t.causal_certainty for t in recent_tickets) / max(total_actions, 1)
-        
-        # Group by action type
-        action_types = {}
-        for ticket in recent_tickets:
-            action_type = ticket.action_type
-            if action_type not in action_types:
-                action_types[action_type] = {
-                    'count': 0,
-                    'avg_certainty': 0.0,
-                    'effects_linked': 0
-                }
+        # Merge whole minute buckets and scan only the partial minute at the cutoff
+        bucket_seconds = InfluenceAggregates.BUCKET_SECONDS
+        first_minute = int(cutoff // bucket_seconds) + 1
+        if cutoff < now - self.archive_after:
+            # Tickets at the cutoff may already be archived, so take its whole minute from the buckets
+            first_minute -= 1
+            edge_tickets = []
+        else:
+            edge_tickets = self.ticket_ledger.in_window(cutoff, first_minute * bucket_seconds - 1e-6)
             
-            action_types[action_type]['count'] += 1
-            action_types[action_type]['avg_certainty'] += ticket.causal_certainty
+        # Group by action type: [count, certainty_sum, effects_linked]
+        totals = self.influence_aggregates.merge(first_minute)
+        
+        for ticket in edge_tickets:
+            stats = totals.setdefault(ticket.action_type, [0, 0.0, 0])
+            stats[0] += 1
+            stats[1] += ticket.causal_certainty
             if ticket.linked_effects:
-                action_types[action_type]['effects_linked'] += 1
+                stats[2] += 1
                 
-        # Calculate averages
-        for action_type in action_types:
-            count = action_types[action_type]['count']
-            action_types[action_type]['avg_certainty'] /= count
+        action_types = {
+            action_type: {
+                'count': stats[0],
+                'avg_certainty': stats[1] / stats[0],
+                'effects_linked': stats[2]
+            }
+            for action_type, stats in totals.items() if stats[0]
+        }
+        
+        # Calculate statistics
+        total_actions = sum(stats['count'] for stats in action_types.values())
+        actions_with_effects = sum(stats['effects_linked'] for stats in action_types.values())
+        avg_causal_certainty = sum(stats[1] for stats in totals.values()) / max(total_actions, 1)
             
         return {
             'report_period': f"Last {hours} hours",
@@ -518,9 +908,87 @@ class SovereignDataTicketingSystem:
             'generated_at': datetime.now().isoformat()
         }
         
+    async def start_async(self):
+        """Start ticket processing as tasks on the running event loop (asyncio mode)"""
+        if self.mode != 'asyncio':
+            raise RuntimeError("start_async requires asyncio processing mode")
+            
+        self.running = True
+        self.loop = asyncio.get_running_loop()
+        self.async_tasks = [
+            asyncio.create_task(self._process_tickets_async()),
+            asyncio.create_task(self._archive_chronicle_async())
+        ]
+        
+    async def capture_sovereign_action_async(self, action_type: str, interface_context: str,
+                                             system_impact: str = "medium", mirror_depth: int = 1,
+                                             session_id: Optional[str] = None) -> str:
+        """Capture a sovereign action, waiting for queue space when processing falls behind"""
+        
+        ticket = self.build_ticket(action_type, interface_context, system_impact, mirror_depth, session_id)
+        await self.ticket_queue.put(ticket)
+        self.create_intent_mirror(ticket)
+        
+        self.logger.info(f"Sovereign action captured: {ticket.ticket_id} - {action_type}")
+        return ticket.ticket_id
+        
+    async def _process_tickets_async(self):
+        """Process tickets from the asyncio queue"""
+        while True:
+            ticket = await self.ticket_queue.get()
+            try:
+                self.process_ticket(ticket)
+            except Exception as e:
+                self.logger.error(f"Error processing ticket: {e}")
+            finally:
+                self.ticket_queue.task_done()
+                
+    async def _archive_chronicle_async(self):
+        """Archive tickets as their deadlines come due, sleeping until the next deadline"""
+        while True:
+            try:
+                due = []
+                with self.archive_condition:
+                    now = time.time()
+                    while self.archive_heap and self.archive_heap[0][0] <= now:
+                        due.append(heapq.heappop(self.archive_heap)[1])
+                    wait = self.archive_heap[0][0] - now if self.archive_heap else None
+                    
+                for ticket_id in due:
+                    self.archive_ticket(ticket_id)
+                    
+                if not due:
+                    self.archive_wakeup.clear()
+                    try:
+                        await asyncio.wait_for(self.archive_wakeup.wait(), timeout=wait)
+                    except asyncio.TimeoutError:
+                        pass
+                        
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"Error archiving chronicle: {e}")
+                
+    async def shutdown_async(self, drain: bool = True):
+        """Drain queued tickets, stop the processing tasks and flush output (asyncio mode)"""
+        if drain and self.async_tasks:
+            await self.ticket_queue.join()
+            
+        self.running = False
+        for task in self.async_tasks:
+            task.cancel()
+        await asyncio.gather(*self.async_tasks, return_exceptions=True)
+        self.async_tasks = []
+        
+        # Flush buffered stream and chronicle entries
+        self.live_stream_sink.flush()
+        self.chronicle_sink.flush()
+        
     def shutdown(self):
         """Shutdown the ticketing system"""
         self.running = False
+        with self.archive_condition:
+            self.archive_condition.notify_all()
         
         # Wait for threads to finish
         if hasattr(self, 'ticket_processor'):
@@ -529,9 +997,14 @@ class SovereignDataTicketingSystem:
             self.causal_matcher.join(timeout=5)
         if hasattr(self, 'chronicle_archiver'):
             self.chronicle_archiver.join(timeout=5)
+            
+        # Flush buffered stream and chronicle entries
+        self.live_stream_sink.flush()
+        self.chronicle_sink.flush()
 
 # Global instance
 dts_system = None
+_dts_lock = threading.Lock()
 
 def initialize_dts():
     """Initialize the global DTS system"""
@@ -539,12 +1012,21 @@ def initialize_dts():
     dts_system = SovereignDataTicketingSystem()
     return dts_system
 
+def get_dts() -> SovereignDataTicketingSystem:
+    """Get the shared DTS system, creating it on first use"""
+    if dts_system is None:
+        with _dts_lock:
+            if dts_system is None:
+                initialize_dts()
+    return dts_system
+
 def capture_action(action_type: str, interface_context: str, 
-                  system_impact: str = "medium", mirror_depth: int = 1) -> str:
+                  system_impact: str = "medium", mirror_depth: int = 1,
+                  session_id: Optional[str] = None) -> str:
     """Capture a sovereign action"""
     if dts_system is None:
         initialize_dts()
-    return dts_system.capture_sovereign_action(action_type, interface_context, system_impact, mirror_depth)
+    return dts_system.capture_sovereign_action(action_type, interface_context, system_impact, mirror_depth, session_id)
 
 def link_effect(ticket_id: str, effect_event: str, 
                response_time: float, causal_certainty: float) -> bool: